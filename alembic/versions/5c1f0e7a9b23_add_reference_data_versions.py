@@ -0,0 +1,95 @@
+"""add reference data versions
+
+Revision ID: 5c1f0e7a9b23
+Revises: 836ec781c709
+Create Date: 2026-10-18
+
+Changes:
+- Create reference_data_versions table (one version counter per table)
+- Seed counters for account_types and financial_institutions
+- Add bump_reference_data_version() trigger function
+- Add statement-level triggers bumping the counter on every write to the
+  reference tables (INSERT, UPDATE, DELETE, TRUNCATE)
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "5c1f0e7a9b23"
+down_revision: Union[str, Sequence[str], None] = "836ec781c709"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose changes invalidate HTTP caches (ETags)
+REFERENCE_TABLES = ("account_types", "financial_institutions")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+
+    # 1. Create reference_data_versions table
+    op.create_table(
+        "reference_data_versions",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("table_name", sa.String(length=63), nullable=False),
+        sa.Column(
+            "version", sa.BigInteger(), nullable=False, server_default=sa.text("1")
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_reference_data_versions")),
+        sa.UniqueConstraint(
+            "table_name", name=op.f("uq_reference_data_versions_table_name")
+        ),
+    )
+
+    # 2. Seed one counter per reference table
+    for table in REFERENCE_TABLES:
+        conn.execute(
+            sa.text("INSERT INTO reference_data_versions (table_name) VALUES (:table)"),
+            {"table": table},
+        )
+
+    # 3. Trigger function: upsert and increment the counter of TG_TABLE_NAME
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_reference_data_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO reference_data_versions (table_name, version, updated_at)
+            VALUES (TG_TABLE_NAME, 1, now())
+            ON CONFLICT (table_name) DO UPDATE
+            SET version = reference_data_versions.version + 1, updated_at = now();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    # 4. Statement-level triggers (one bump per statement, not per row)
+    for table in REFERENCE_TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_reference_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_reference_data_version()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in REFERENCE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_reference_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_reference_data_version()")
+    op.drop_table("reference_data_versions")
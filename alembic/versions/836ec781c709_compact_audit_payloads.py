@@ -0,0 +1,129 @@
+"""compact audit payloads
+
+Revision ID: 836ec781c709
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18
+
+Changes:
+- Create audit_user_agents lookup table (dictionary-encoded user agents)
+- Add audit_logs.user_agent_id referencing audit_user_agents
+- Add audit_logs.is_compact flag for changed-fields-only diffs
+- Move existing inline user agents into the lookup table
+- Switch JSONB/text payload columns of audit_logs to lz4 TOAST compression
+
+Note:
+    audit_logs is not partitioned, so compression is applied to the whole
+    table. SET COMPRESSION only affects newly written values; run
+    VACUUM FULL audit_logs during a maintenance window to recompress
+    existing cold rows.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "836ec781c709"
+down_revision: Union[str, Sequence[str], None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Payload columns that benefit from lz4 TOAST compression
+COMPRESSED_COLUMNS = ("old_values", "new_values", "extra_metadata", "description")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+
+    # 1. Create audit_user_agents lookup table
+    op.create_table(
+        "audit_user_agents",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("user_agent", sa.String(length=500), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_audit_user_agents")),
+        sa.UniqueConstraint("user_agent", name=op.f("uq_audit_user_agents_user_agent")),
+    )
+
+    # 2. Add user_agent_id and is_compact columns
+    op.add_column(
+        "audit_logs",
+        sa.Column("user_agent_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_foreign_key(
+        op.f("fk_audit_logs_user_agent_id_audit_user_agents"),
+        "audit_logs",
+        "audit_user_agents",
+        ["user_agent_id"],
+        ["id"],
+        ondelete="RESTRICT",
+    )
+    op.add_column(
+        "audit_logs",
+        sa.Column(
+            "is_compact",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+    )
+
+    # 3. Intern existing user agents and clear the inline copies
+    conn.execute(
+        sa.text(
+            "INSERT INTO audit_user_agents (user_agent) "
+            "SELECT DISTINCT user_agent FROM audit_logs WHERE user_agent IS NOT NULL "
+            "ON CONFLICT (user_agent) DO NOTHING"
+        )
+    )
+    conn.execute(
+        sa.text(
+            "UPDATE audit_logs SET user_agent_id = ua.id, user_agent = NULL "
+            "FROM audit_user_agents ua WHERE audit_logs.user_agent = ua.user_agent"
+        )
+    )
+
+    # 4. Compress payload columns with lz4 (PostgreSQL 14+)
+    for column in COMPRESSED_COLUMNS:
+        op.execute(f"ALTER TABLE audit_logs ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+
+    # 1. Restore default compression
+    for column in COMPRESSED_COLUMNS:
+        op.execute(
+            f"ALTER TABLE audit_logs ALTER COLUMN {column} SET COMPRESSION DEFAULT"
+        )
+
+    # 2. Inline user agents again
+    conn.execute(
+        sa.text(
+            "UPDATE audit_logs SET user_agent = ua.user_agent "
+            "FROM audit_user_agents ua WHERE audit_logs.user_agent_id = ua.id"
+        )
+    )
+
+    # 3. Drop new columns and lookup table
+    op.drop_column("audit_logs", "is_compact")
+    op.drop_constraint(
+        op.f("fk_audit_logs_user_agent_id_audit_user_agents"),
+        "audit_logs",
+        type_="foreignkey",
+    )
+    op.drop_column("audit_logs", "user_agent_id")
+    op.drop_table("audit_user_agents")
@@ -0,0 +1,75 @@
+"""defer reference version bumps
+
+Revision ID: b7e41d2c9a03
+Revises: 5c1f0e7a9b23
+Create Date: 2026-10-18
+
+Changes:
+- bump_reference_data_version() skips the bump while the transaction-local
+  setting emerald.defer_reference_version is 'on', so a bulk load made of
+  several statements bumps the counter once, explicitly, at the end
+  (see core.reference_data.single_version_bump)
+- Add IMPORT_FINANCIAL_INSTITUTIONS audit action enum value
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e41d2c9a03"
+down_revision: Union[str, Sequence[str], None] = "5c1f0e7a9b23"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. Trigger function: honour the deferral setting
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_reference_data_version() RETURNS trigger AS $$
+        BEGIN
+            IF current_setting('emerald.defer_reference_version', true) = 'on' THEN
+                RETURN NULL;
+            END IF;
+            INSERT INTO reference_data_versions (table_name, version, updated_at)
+            VALUES (TG_TABLE_NAME, 1, now())
+            ON CONFLICT (table_name) DO UPDATE
+            SET version = reference_data_versions.version + 1, updated_at = now();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    # 2. Audit action for bulk imports (enum values are added outside a
+    # transaction)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TYPE audit_action_enum "
+            "ADD VALUE IF NOT EXISTS 'IMPORT_FINANCIAL_INSTITUTIONS'"
+        )
+
+
+def downgrade() -> None:
+    """
+    Downgrade schema.
+
+    Restores the unconditional trigger function. PostgreSQL does not
+    support removing enum values, so IMPORT_FINANCIAL_INSTITUTIONS stays.
+    """
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_reference_data_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO reference_data_versions (table_name, version, updated_at)
+            VALUES (TG_TABLE_NAME, 1, now())
+            ON CONFLICT (table_name) DO UPDATE
+            SET version = reference_data_versions.version + 1, updated_at = now();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
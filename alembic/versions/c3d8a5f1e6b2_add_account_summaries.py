@@ -0,0 +1,120 @@
+"""add account summaries
+
+Revision ID: c3d8a5f1e6b2
+Revises: b7e41d2c9a03
+Create Date: 2026-10-18
+
+Changes:
+- Create account_summaries table (per-account transaction statistics,
+  maintained incrementally by the transaction write paths)
+- Backfill one summary per active account from the transactions table
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d8a5f1e6b2"
+down_revision: Union[str, Sequence[str], None] = "b7e41d2c9a03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 1. Create account_summaries table
+    op.create_table(
+        "account_summaries",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("account_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "transaction_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "to_review_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column("last_transaction_date", sa.Date(), nullable=True),
+        sa.Column("month_start", sa.Date(), nullable=False),
+        sa.Column(
+            "month_inflow",
+            sa.Numeric(precision=15, scale=2),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "month_outflow",
+            sa.Numeric(precision=15, scale=2),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.id"],
+            name=op.f("fk_account_summaries_account_id_accounts"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_account_summaries")),
+        sa.UniqueConstraint("account_id", name=op.f("uq_account_summaries_account_id")),
+    )
+    op.create_index(
+        op.f("ix_account_summaries_id"), "account_summaries", ["id"], unique=False
+    )
+
+    # 2. Backfill: one GROUP BY over the transactions (split children only
+    # count as to review; month totals cover the current UTC month)
+    op.execute(
+        """
+        INSERT INTO account_summaries (
+            account_id, transaction_count, to_review_count,
+            last_transaction_date, month_start, month_inflow, month_outflow
+        )
+        SELECT
+            a.id,
+            count(t.id) FILTER (WHERE t.parent_transaction_id IS NULL),
+            count(t.id) FILTER (WHERE t.review_status = 'to_review'),
+            max(t.transaction_date) FILTER (WHERE t.parent_transaction_id IS NULL),
+            date_trunc('month', now() AT TIME ZONE 'UTC')::date,
+            coalesce(sum(t.amount) FILTER (
+                WHERE t.parent_transaction_id IS NULL AND t.amount > 0
+                AND date_trunc('month', t.transaction_date)
+                    = date_trunc('month', now() AT TIME ZONE 'UTC')
+            ), 0),
+            coalesce(-sum(t.amount) FILTER (
+                WHERE t.parent_transaction_id IS NULL AND t.amount < 0
+                AND date_trunc('month', t.transaction_date)
+                    = date_trunc('month', now() AT TIME ZONE 'UTC')
+            ), 0)
+        FROM accounts a
+        LEFT JOIN transactions t
+            ON t.account_id = a.id AND t.deleted_at IS NULL
+        WHERE a.deleted_at IS NULL
+        GROUP BY a.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_account_summaries_id"), table_name="account_summaries")
+    op.drop_table("account_summaries")
@@ -0,0 +1,40 @@
+"""add verify account balances audit action
+
+Revision ID: d9f2b6c4a817
+Revises: c3d8a5f1e6b2
+Create Date: 2026-10-18
+
+Changes:
+- Add VERIFY_ACCOUNT_BALANCES audit action enum value (one audit row per
+  fleet-wide balance verification)
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d9f2b6c4a817"
+down_revision: Union[str, Sequence[str], None] = "c3d8a5f1e6b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Enum values are added outside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TYPE audit_action_enum "
+            "ADD VALUE IF NOT EXISTS 'VERIFY_ACCOUNT_BALANCES'"
+        )
+
+
+def downgrade() -> None:
+    """
+    Downgrade schema.
+
+    PostgreSQL does not support removing enum values, so
+    VERIFY_ACCOUNT_BALANCES stays.
+    """
@@ -6,7 +6,7 @@ This module provides:
 - Active user verification
 - Admin role checking
 - Permission-based access control
-- Database session management
+- Database session management (primary and read-replica routing)
 """
 
 import logging
@@ -15,10 +15,20 @@ from typing import Annotated, AsyncGenerator
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
+from jose import JWTError, jwt
+from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
+from core.database import (
+    LAST_WRITE_COOKIE,
+    LAST_WRITE_HEADER,
+    SESSION_HAS_WRITES,
+    RoutingSessionmaker,
+    UnitOfWorkSession,
+    release_connection,
+)
+from core.deadlines import REQUEST_BUDGET, get_request_budget
 from core.security import TOKEN_TYPE_ACCESS, decode_token, verify_token_type
 from models import User
 from repositories import UserRepository
@@ -47,14 +57,23 @@ async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     Dependency function to provide database session to FastAPI routes.
 
     Gets the sessionmaker from app state and yields a session.
-    Ensures proper session cleanup with commit/rollback handling.
+    Ensures proper session cleanup with commit/rollback handling. In
+    unit-of-work mode, service commits only flush and this is the single
+    COMMIT of the request.
+
+    Must be declared with scope="function" (as every dependency here does):
+    the session then closes when the route returns, before the response is
+    sent. With the default request scope, the COMMIT would run after the
+    client received its response: a failed COMMIT could no longer turn into
+    an error response, and the connection and row locks would be held while
+    the response is transmitted.
 
     Args:
         request: FastAPI request object (provides access to app.state)
 
     Usage in FastAPI routes:
         @app.get("/users")
-        async def get_users(db: AsyncSession = Depends(get_db)):
+        async def get_users(db: AsyncSession = Depends(get_db, scope="function")):
             # Use db session here
             ...
 
@@ -66,12 +85,117 @@ async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     sessionmaker = request.app.state.sessionmaker
     async with sessionmaker() as session:
+        # Route statement timeout / client deadline (see core.deadlines)
+        session.info[REQUEST_BUDGET] = get_request_budget(request)
         try:
             yield session
-            await session.commit()
+            if isinstance(session, UnitOfWorkSession):
+                await session.commit_unit_of_work()
+            else:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
+        finally:
+            if session.info.get(SESSION_HAS_WRITES) and isinstance(
+                sessionmaker, RoutingSessionmaker
+            ):
+                sessionmaker.mark_write(get_read_principal(request))
+            await session.close()
+
+
+def get_read_principal(request: Request) -> str:
+    """
+    Identify who is reading or writing, for read-your-writes stickiness.
+
+    Uses the unverified "sub" claim of the Bearer token so every token of a
+    user shares one key; falls back to the client address. The key is only
+    a routing hint - authentication still happens in get_current_user.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        Principal key string
+    """
+    authorization = request.headers.get("Authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            subject = jwt.get_unverified_claims(token).get("sub")
+        except JWTError:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+    return f"client:{request.client.host if request.client else 'unknown'}"
+
+
+def get_last_write(request: Request) -> float | None:
+    """
+    Read the last-write marker the client returned, if any.
+
+    The marker is set by ReadYourWritesMiddleware after a write, as a cookie
+    and a response header; clients without a cookie jar echo the header.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        Unix timestamp of the client's last write, or None
+    """
+    marker = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(
+        LAST_WRITE_COOKIE
+    )
+    if not marker:
+        return None
+    try:
+        return float(marker)
+    except ValueError:
+        return None
+
+
+async def get_read_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency providing a session for read-only routes.
+
+    Routes to a read replica when one is configured and healthy, and the
+    caller has not written within the read-your-writes window (on this
+    worker, or per the last-write marker it sent back). Otherwise
+    yields the request's primary session. Routes using this dependency
+    must not write.
+
+    Args:
+        request: FastAPI request object (provides access to app.state)
+        db: Primary database session (fallback)
+
+    Yields:
+        AsyncSession: Replica or primary session for the request
+    """
+    sessionmaker = request.app.state.sessionmaker
+    replica_session = None
+    if isinstance(sessionmaker, RoutingSessionmaker):
+        replica_session = await sessionmaker.read_session(
+            get_read_principal(request), get_last_write(request)
+        )
+
+    if replica_session is None:
+        yield db
+        return
+
+    # Reads go to the replica; don't hold a primary connection meanwhile
+    await release_connection(db)
+
+    async with replica_session as session:
+        session.info[REQUEST_BUDGET] = get_request_budget(request)
+        try:
+            yield session
+        except DBAPIError as e:
+            if e.connection_invalidated or isinstance(e, OperationalError):
+                sessionmaker.mark_failed(session)
+            raise
         finally:
             await session.close()
 
@@ -81,7 +205,9 @@ async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
 # ============================================================================
 
 
-def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
+def get_auth_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> AuthService:
     """
     Dependency to get AuthService instance.
 
@@ -103,7 +229,9 @@ def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
     return AuthService(db)
 
 
-def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+def get_user_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> UserService:
     """
     Dependency to get UserService instance.
 
@@ -125,7 +253,9 @@ def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
     return UserService(db)
 
 
-def get_audit_service(db: AsyncSession = Depends(get_db)) -> AuditService:
+def get_audit_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> AuditService:
     """
     Dependency to get AuditService instance.
 
@@ -147,7 +277,9 @@ def get_audit_service(db: AsyncSession = Depends(get_db)) -> AuditService:
     return AuditService(db)
 
 
-def get_account_service(db: AsyncSession = Depends(get_db)) -> AccountService:
+def get_account_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> AccountService:
     """
     Dependency to get AccountService instance.
 
@@ -170,7 +302,9 @@ def get_account_service(db: AsyncSession = Depends(get_db)) -> AccountService:
     return AccountService(db)
 
 
-def get_transaction_service(db: AsyncSession = Depends(get_db)) -> TransactionService:
+def get_transaction_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> TransactionService:
     """
     Dependency to get TransactionService instance.
 
@@ -193,7 +327,7 @@ def get_transaction_service(db: AsyncSession = Depends(get_db)) -> TransactionSe
 
 
 def get_financial_institution_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> FinancialInstitutionService:
     """
     Dependency to get FinancialInstitutionService instance.
@@ -216,7 +350,9 @@ def get_financial_institution_service(
     return FinancialInstitutionService(db)
 
 
-def get_account_type_service(db: AsyncSession = Depends(get_db)) -> AccountTypeService:
+def get_account_type_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> AccountTypeService:
     """
     Dependency to get AccountTypeService instance.
 
@@ -238,7 +374,9 @@ def get_account_type_service(db: AsyncSession = Depends(get_db)) -> AccountTypeS
     return AccountTypeService(db)
 
 
-def get_card_service(db: AsyncSession = Depends(get_db)) -> CardService:
+def get_card_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> CardService:
     """
     Dependency to get CardService instance.
 
@@ -260,16 +398,12 @@ def get_card_service(db: AsyncSession = Depends(get_db)) -> CardService:
     return CardService(db)
 
 
-def get_currency_service(db: AsyncSession = Depends(get_db)) -> CurrencyService:
+def get_currency_service() -> CurrencyService:
     """
     Dependency to get CurrencyService instance.
 
-    This dependency provides a CurrencyService with an active database session.
-    Note: CurrencyService currently serves static data and doesn't use the session,
-    but accepts it for pattern consistency and future extensibility.
-
-    Args:
-        db: Database session
+    CurrencyService serves the in-memory ISO 4217 registry, so no database
+    session is opened for currency metadata.
 
     Returns:
         CurrencyService instance
@@ -281,7 +415,107 @@ def get_currency_service(db: AsyncSession = Depends(get_db)) -> CurrencyService:
         ):
             return service.get_all()
     """
-    return CurrencyService(db)
+    return CurrencyService()
+
+
+# ============================================================================
+# Read-Only Service Dependencies
+# ============================================================================
+# Same services bound to get_read_db: may be served by a read replica, so
+# only use them in routes that never write. Identical concurrent reads are
+# coalesced (core.single_flight), so results must not be modified.
+
+
+def get_read_account_service(
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+) -> AccountService:
+    """
+    Dependency to get a read-only AccountService instance.
+
+    Args:
+        db: Read session (replica or primary)
+
+    Returns:
+        AccountService instance for read-only use
+
+    Usage:
+        @app.get("/api/v1/accounts")
+        async def list_accounts(
+            account_service: AccountService = Depends(get_read_account_service)
+        ):
+            return await account_service.list_user_accounts(...)
+    """
+    return AccountService(db, coalesce_reads=True)
+
+
+def get_read_transaction_service(
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+) -> TransactionService:
+    """
+    Dependency to get a read-only TransactionService instance.
+
+    Args:
+        db: Read session (replica or primary)
+
+    Returns:
+        TransactionService instance for read-only use
+
+    Usage:
+        @app.get("/api/v1/transactions")
+        async def list_transactions(
+            transaction_service: TransactionService = Depends(
+                get_read_transaction_service
+            )
+        ):
+            return await transaction_service.list_user_transactions(...)
+    """
+    return TransactionService(db)
+
+
+def get_read_financial_institution_service(
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+) -> FinancialInstitutionService:
+    """
+    Dependency to get a read-only FinancialInstitutionService instance.
+
+    Args:
+        db: Read session (replica or primary)
+
+    Returns:
+        FinancialInstitutionService instance for read-only use
+
+    Usage:
+        @app.get("/api/v1/financial-institutions")
+        async def list_institutions(
+            service: FinancialInstitutionService = Depends(
+                get_read_financial_institution_service
+            )
+        ):
+            return await service.list_institutions(...)
+    """
+    return FinancialInstitutionService(db, coalesce_reads=True)
+
+
+def get_read_account_type_service(
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+) -> AccountTypeService:
+    """
+    Dependency to get a read-only AccountTypeService instance.
+
+    Args:
+        db: Read session (replica or primary)
+
+    Returns:
+        AccountTypeService instance for read-only use
+
+    Usage:
+        @app.get("/api/v1/metadata/account-types")
+        async def list_account_types(
+            service: AccountTypeService = Depends(get_read_account_type_service)
+        ):
+            return await service.list_account_types(...)
+    """
+    return AccountTypeService(db, coalesce_reads=True)
 
 
 # ============================================================================
@@ -289,6 +523,9 @@ def get_currency_service(db: AsyncSession = Depends(get_db)) -> CurrencyService:
 # ============================================================================
 
 
+# Request state key holding the user authenticated once by a batch request
+BATCH_USER = "batch_user"
+
 # Security scheme for Swagger UI - this adds the padlock icon
 security = HTTPBearer(
     scheme_name="Bearer",
@@ -298,8 +535,9 @@ security = HTTPBearer(
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> User:
     """
     Dependency to extract and validate current user from JWT access token.
@@ -311,7 +549,11 @@ async def get_current_user(
     4. Retrieves user from database
     5. Returns User instance
 
+    Sub-requests of a batch skip steps 1-4: the user authenticated by the
+    batch is merged into the sub-request's session without a query.
+
     Args:
+        request: FastAPI request object
         credentials: HTTP Bearer credentials from security scheme
         db: Database session
 
@@ -328,6 +570,11 @@ async def get_current_user(
         ):
             return {"email": current_user.email}
     """
+    # Batch sub-request: reuse the batch's user (see core.batch)
+    batch_user = getattr(request.state, BATCH_USER, None)
+    if batch_user is not None:
+        return await db.merge(batch_user, load=False)
+
     # Check if credentials are present
     if not credentials:
         logger.warning("Authentication failed: missing Bearer token")
@@ -435,7 +682,8 @@ async def require_admin(
 
 # Convenience type aliases for common dependencies
 # Database
-DbSession = Annotated[AsyncSession, Depends(get_db)]
+DbSession = Annotated[AsyncSession, Depends(get_db, scope="function")]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db, scope="function")]
 # Service
 AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
@@ -448,6 +696,17 @@ FinancialInstitutionServiceDep = Annotated[
 AccountTypeServiceDep = Annotated[AccountTypeService, Depends(get_account_type_service)]
 CardServiceDep = Annotated[CardService, Depends(get_card_service)]
 CurrencyServiceDep = Annotated[CurrencyService, Depends(get_currency_service)]
+# Read-only service (may be served by a read replica)
+ReadAccountServiceDep = Annotated[AccountService, Depends(get_read_account_service)]
+ReadTransactionServiceDep = Annotated[
+    TransactionService, Depends(get_read_transaction_service)
+]
+ReadFinancialInstitutionServiceDep = Annotated[
+    FinancialInstitutionService, Depends(get_read_financial_institution_service)
+]
+ReadAccountTypeServiceDep = Annotated[
+    AccountTypeService, Depends(get_read_account_type_service)
+]
 # Security
 CurrentUser = Annotated[User, Depends(get_current_user)]
 AdminUser = Annotated[User, Depends(require_admin)]
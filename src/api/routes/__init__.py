@@ -2,27 +2,40 @@
 API routes for Emerald Finance Platform.
 
 This package contains all API endpoint definitions organized by feature.
+
+Route modules are imported on first access (main includes every router at
+startup), so importing one route module - from a test, a script or the
+CLI - does not load the others and the services and schemas behind them.
 """
 
-from . import (
-    account_shares,
-    accounts,
-    audit_logs,
-    auth,
-    cards,
-    financial_institutions,
-    health,
-    metadata,
-    root,
-    transactions,
-    users,
-)
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import (
+        account_shares,
+        accounts,
+        admin,
+        audit_logs,
+        auth,
+        batch,
+        cards,
+        financial_institutions,
+        health,
+        metadata,
+        root,
+        transactions,
+        users,
+    )
 
 __all__ = [
     "account_shares",
     "accounts",
+    "admin",
     "audit_logs",
     "auth",
+    "batch",
     "cards",
     "financial_institutions",
     "health",
@@ -31,3 +44,10 @@ __all__ = [
     "transactions",
     "users",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a route module on first access."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,6 +12,7 @@ import uuid
 
 from fastapi import APIRouter, Request, status
 
+from core.idempotency import IdempotentRoute
 from schemas import (
     AccountShareCreate,
     AccountShareListResponse,
@@ -20,7 +21,11 @@ from schemas import (
 )
 from ..dependencies import AccountServiceDep, CurrentUser
 
-router = APIRouter(prefix="/accounts/{account_id}/shares", tags=["Accounts Shares"])
+router = APIRouter(
+    prefix="/accounts/{account_id}/shares",
+    tags=["Accounts Shares"],
+    route_class=IdempotentRoute,
+)
 
 
 @router.post(
@@ -45,6 +50,8 @@ router = APIRouter(prefix="/accounts/{account_id}/shares", tags=["Accounts Share
     - Cannot share if already shared with user
 
     **Audit:** Creates audit log entry
+    **Idempotency:** Retries with the same `Idempotency-Key` header replay
+    the first response
     """,
 )
 async def create_share(
@@ -14,6 +14,9 @@ import uuid
 
 from fastapi import APIRouter, Depends, Request, status
 
+from core.catalog import CATALOG_CONTEXT
+from core.query_recorder import QueryBudget
+from core.responses import PydanticJSONResponse, paginated_response
 from schemas import (
     AccountCreate,
     AccountFilterParams,
@@ -22,10 +25,9 @@ from schemas import (
     AccountSortParams,
     AccountUpdate,
     PaginatedResponse,
-    PaginationMeta,
     PaginationParams,
 )
-from ..dependencies import AccountServiceDep, CurrentUser
+from ..dependencies import AccountServiceDep, CurrentUser, ReadAccountServiceDep
 
 logger = logging.getLogger(__name__)
 
@@ -116,17 +118,19 @@ async def create_account(
         user_agent=user_agent,
     )
 
-    return AccountResponse.model_validate(account)
+    return AccountResponse.model_validate(account, context=CATALOG_CONTEXT)
 
 
 @router.get(
     "",
     response_model=PaginatedResponse[AccountListResponse],
+    dependencies=[Depends(QueryBudget(20))],
     summary="List user's accounts",
     description="""
     List all accounts for the authenticated user with pagination and filtering.
 
     Supports filtering by account type and financial institution.
+    Each account includes its transaction statistics (summary).
     Results are ordered by created_at descending (newest first).
 
     **Permission:** Authenticated user (can only list own accounts)
@@ -145,6 +149,13 @@ async def create_account(
                                 "currency": "USD",
                                 "current_balance": "1234.56",
                                 "created_at": "2025-11-04T00:00:00Z",
+                                "summary": {
+                                    "transaction_count": 128,
+                                    "to_review_count": 3,
+                                    "last_transaction_date": "2025-11-03",
+                                    "month_inflow": "2500.00",
+                                    "month_outflow": "1432.18",
+                                },
                             }
                         ],
                         "meta": {
@@ -163,11 +174,11 @@ async def create_account(
 async def list_accounts(
     request: Request,
     current_user: CurrentUser,
-    account_service: AccountServiceDep,
+    account_service: ReadAccountServiceDep,
     filters: AccountFilterParams = Depends(),
     pagination: PaginationParams = Depends(),
     sorting: AccountSortParams = Depends(),
-) -> PaginatedResponse[AccountListResponse]:
+) -> PydanticJSONResponse:
     """
     List user's accounts with pagination and filtering.
 
@@ -191,13 +202,8 @@ async def list_accounts(
         sorting=sorting,
     )
 
-    return PaginatedResponse(
-        data=[AccountListResponse.model_validate(a) for a in accounts],
-        meta=PaginationMeta(
-            total=count,
-            page=pagination.page,
-            page_size=pagination.page_size,
-        ),
+    return paginated_response(
+        accounts, AccountListResponse, count, pagination, context=CATALOG_CONTEXT
     )
 
 
@@ -240,7 +246,7 @@ async def get_account(
     request: Request,
     current_user: CurrentUser,
     account_id: uuid.UUID,
-    account_service: AccountServiceDep,
+    account_service: ReadAccountServiceDep,
 ) -> AccountResponse:
     """
     Get account details by ID.
@@ -272,7 +278,7 @@ async def get_account(
         user_agent=user_agent,
     )
 
-    return AccountResponse.model_validate(account)
+    return AccountResponse.model_validate(account, context=CATALOG_CONTEXT)
 
 
 @router.patch(
@@ -351,7 +357,7 @@ async def update_account(
         user_agent=user_agent,
     )
 
-    return AccountResponse.model_validate(account)
+    return AccountResponse.model_validate(account, context=CATALOG_CONTEXT)
 
 
 @router.delete(
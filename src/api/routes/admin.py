@@ -0,0 +1,149 @@
+"""
+Admin operational API routes.
+
+This module provides:
+- GET /api/v1/admin/db-pool - Database connection pool telemetry (admin only)
+- GET /api/v1/admin/slow-queries - Recent slow SQL statements (admin only)
+- GET /api/v1/admin/caches - Cache hit/miss/eviction counters (admin only)
+- POST /api/v1/admin/balances/verify - Verify and fix all account balances
+  (admin only)
+"""
+
+import logging
+from dataclasses import asdict
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Request
+
+from core.cache import cache_stats
+from core.deadlines import StatementTimeout
+from core.pool_metrics import get_pool_stats
+from core.slow_queries import slow_query_log
+from schemas import BalanceVerificationResult
+from ..dependencies import AccountServiceDep, AdminUser
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get(
+    "/db-pool",
+    summary="Get database pool telemetry",
+    description="Connection pool gauges, counters and wait/hold/lifetime "
+    "histograms per engine (admin only)",
+)
+async def get_db_pool_stats(current_user: AdminUser) -> dict[str, Any]:
+    """
+    Get database connection pool telemetry.
+
+    Reports, for the primary and each read replica pool:
+    - Gauges: size, capacity, in_use, idle, overflow, saturated
+    - Counters: connects, checkouts, timeouts, invalidations
+    - Histograms: checkout wait, connection hold time, connection lifetime
+
+    Args:
+        current_user: Authenticated admin user
+
+    Returns:
+        Pool name -> telemetry snapshot
+    """
+    return get_pool_stats()
+
+
+@router.get(
+    "/slow-queries",
+    summary="Get recent slow queries",
+    description="Most recent statements slower than the slow query threshold, "
+    "with sampled EXPLAIN plans (admin only)",
+)
+async def get_slow_queries(
+    current_user: AdminUser,
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum entries"),
+) -> list[dict[str, Any]]:
+    """
+    Get recent slow queries, newest first.
+
+    Each entry holds the statement shape, bound parameter types (never
+    values), duration, request ID and, when sampled, the
+    EXPLAIN (ANALYZE, BUFFERS) plan.
+
+    Args:
+        current_user: Authenticated admin user
+        limit: Maximum entries to return
+
+    Returns:
+        List of slow query entries
+    """
+    return [asdict(entry) for entry in slow_query_log.recent(limit)]
+
+
+@router.get(
+    "/caches",
+    summary="Get cache statistics",
+    description="Hit, miss, load and eviction counters of every cache in this "
+    "worker (admin only)",
+)
+async def get_cache_stats(current_user: AdminUser) -> dict[str, dict[str, Any]]:
+    """
+    Get cache statistics of this worker.
+
+    Reports, for each cache: local and Redis hits, misses, loads, early
+    refreshes, local evictions, Redis errors, hit ratio and local size.
+
+    Args:
+        current_user: Authenticated admin user
+
+    Returns:
+        Cache name -> counters snapshot
+    """
+    return cache_stats()
+
+
+@router.post(
+    "/balances/verify",
+    response_model=BalanceVerificationResult,
+    # One pass over all accounts and transactions
+    dependencies=[Depends(StatementTimeout(300_000))],
+    summary="Verify all account balances",
+    description="Compare every account balance with its transactions and fix "
+    "mismatches in one set-based pass (admin only)",
+)
+async def verify_balances(
+    request: Request,
+    current_user: AdminUser,
+    account_service: AccountServiceDep,
+    dry_run: bool = Query(
+        default=False, description="Only report mismatches, do not fix them"
+    ),
+) -> BalanceVerificationResult:
+    """
+    Verify the cached balance of every active account.
+
+    The expected balance is opening_balance plus the sum of the account's
+    non-deleted top-level transactions (split children are parts of their
+    parent). Mismatches are corrected unless dry_run is set; accounts
+    written while the verification runs are skipped. The run is recorded
+    as one audit log entry.
+
+    Args:
+        request: FastAPI request object
+        current_user: Authenticated admin user
+        account_service: Injected AccountService instance
+        dry_run: Only report mismatches
+
+    Returns:
+        Counts, throughput and the first mismatches found
+    """
+    # Extract client info
+    request_id = getattr(request.state, "request_id", None)
+    ip_address = request.client.host if request.client else None
+    user_agent = request.headers.get("User-Agent")
+
+    return await account_service.verify_all_balances(
+        fix=not dry_run,
+        current_user=current_user,
+        request_id=request_id,
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
@@ -10,12 +10,13 @@ import logging
 
 from fastapi import APIRouter, Depends, Request
 
+from core.deadlines import StatementTimeout
+from core.responses import PydanticJSONResponse, paginated_response
 from schemas import (
     AuditLogFilterParams,
     AuditLogListResponse,
     AuditLogSortParams,
     PaginatedResponse,
-    PaginationMeta,
     PaginationParams,
 )
 from ..dependencies import AdminUser, AuditServiceDep
@@ -28,6 +29,7 @@ router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
 @router.get(
     "/users",
     response_model=PaginatedResponse[AuditLogListResponse],
+    dependencies=[Depends(StatementTimeout(5000))],
     summary="Get all audit logs",
     description="Get all audit logs with filtering (admin only)",
 )
@@ -38,7 +40,7 @@ async def get_all_audit_logs(
     filters: AuditLogFilterParams = Depends(),
     pagination: PaginationParams = Depends(),
     sorting: AuditLogSortParams = Depends(),
-) -> PaginatedResponse[AuditLogListResponse]:
+) -> PydanticJSONResponse:
     """
     Get all audit logs with filtering (admin only).
 
@@ -70,11 +72,4 @@ async def get_all_audit_logs(
         sorting=sorting,
     )
 
-    return PaginatedResponse(
-        data=[AuditLogListResponse.model_validate(log) for log in logs],
-        meta=PaginationMeta(
-            total=count,
-            page=pagination.page,
-            page_size=pagination.page_size,
-        ),
-    )
+    return paginated_response(logs, AuditLogListResponse, count, pagination)
@@ -0,0 +1,68 @@
+"""
+Batch request API routes.
+
+This module provides:
+- POST /api/v1/batch - Execute several GET requests in one round trip
+
+Mobile clients load a screen from many small endpoints (accounts, recent
+transactions per account, cards, account types). A batch authenticates
+once, then runs the sub-requests concurrently in-process, each on its own
+database session, and returns every response in one body.
+"""
+
+import logging
+
+from fastapi import APIRouter, Request
+
+from core.batch import execute_batch
+from core.database import release_connection
+from core.exceptions import InvalidInputError
+from schemas import BatchRequest, BatchResponse
+from ..dependencies import BATCH_USER, CurrentUser, DbSession
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+
+
+@router.post(
+    "",
+    response_model=BatchResponse,
+    summary="Execute a batch of requests",
+    description=(
+        "Execute up to 20 independent GET requests concurrently with the "
+        "caller's credentials. Each sub-request gets its own status and body."
+    ),
+)
+async def execute_batch_requests(
+    request: Request,
+    batch: BatchRequest,
+    current_user: CurrentUser,
+    db: DbSession,
+) -> BatchResponse:
+    """
+    Execute a batch of GET requests.
+
+    Request body:
+        - requests: List of {id, method, path}; path may carry a query string
+
+    Returns:
+        BatchResponse with one {id, status, body} per sub-request, in
+        request order. A failing sub-request does not fail the batch.
+
+    Requires:
+        - Valid access token (checked once for the whole batch)
+
+    Raises:
+        InvalidInputError (422): If a sub-request targets the batch endpoint
+    """
+    if any(item.path.partition("?")[0] == request.url.path for item in batch.requests):
+        raise InvalidInputError(field="path", message="Batches cannot be nested")
+
+    # The user is loaded; sub-requests use their own sessions
+    await release_connection(db)
+
+    responses = await execute_batch(
+        request, batch.requests, state={BATCH_USER: current_user}
+    )
+    return BatchResponse(responses=responses)
@@ -13,6 +13,7 @@ import uuid
 
 from fastapi import APIRouter, Depends, Request, status
 
+from core.responses import PydanticJSONResponse, paginated_response
 from schemas import (
     CardCreate,
     CardFilterParams,
@@ -21,7 +22,6 @@ from schemas import (
     CardSortParams,
     CardUpdate,
     PaginatedResponse,
-    PaginationMeta,
     PaginationParams,
 )
 from ..dependencies import CardServiceDep, CurrentUser
@@ -36,7 +36,7 @@ async def list_cards(
     filters: CardFilterParams = Depends(),
     pagination: PaginationParams = Depends(),
     sorting: CardSortParams = Depends(),
-) -> PaginatedResponse[CardListResponse]:
+) -> PydanticJSONResponse:
     """
     List all cards for the authenticated user.
 
@@ -67,14 +67,7 @@ async def list_cards(
         sorting=sorting,
     )
 
-    return PaginatedResponse(
-        data=[CardListResponse.model_validate(c) for c in cards],
-        meta=PaginationMeta(
-            total=count,
-            page=pagination.page,
-            page_size=pagination.page_size,
-        ),
-    )
+    return paginated_response(cards, CardListResponse, count, pagination)
 
 
 @router.get("/{card_id}", response_model=CardResponse)
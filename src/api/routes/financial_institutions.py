@@ -3,7 +3,9 @@ Financial institution API routes.
 
 This module provides:
 - POST /api/v1/financial-institutions - Create institution (admin only)
+- POST /api/v1/financial-institutions/import - Bulk upsert from a file (admin only)
 - GET /api/v1/financial-institutions - List institutions with filtering
+- GET /api/v1/financial-institutions/autocomplete - Typeahead suggestions
 - GET /api/v1/financial-institutions/{id} - Get institution by ID
 - GET /api/v1/financial-institutions/swift/{code} - Get by SWIFT code
 - GET /api/v1/financial-institutions/routing/{number} - Get by routing number
@@ -13,21 +15,32 @@ This module provides:
 
 import logging
 import uuid
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Request, UploadFile, status
 
+from core.deadlines import StatementTimeout
+from core.reference_data import ReferenceDataETag
+from core.responses import PydanticJSONResponse, paginated_response
 from schemas import (
+    FinancialInstitutionAutocompleteParams,
     FinancialInstitutionCreate,
     FinancialInstitutionFilterParams,
+    FinancialInstitutionImportResult,
     FinancialInstitutionListResponse,
     FinancialInstitutionResponse,
     FinancialInstitutionSortParams,
     FinancialInstitutionUpdate,
+    ImportFormat,
     PaginatedResponse,
-    PaginationMeta,
     PaginationParams,
 )
-from ..dependencies import AdminUser, CurrentUser, FinancialInstitutionServiceDep
+from ..dependencies import (
+    AdminUser,
+    CurrentUser,
+    FinancialInstitutionServiceDep,
+    ReadFinancialInstitutionServiceDep,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +100,65 @@ async def create_institution(
     return FinancialInstitutionResponse.model_validate(institution)
 
 
+@router.post(
+    "/import",
+    response_model=FinancialInstitutionImportResult,
+    # COPY lasts as long as the file takes to parse
+    dependencies=[Depends(StatementTimeout(300_000))],
+    summary="Import financial institutions",
+    description="Insert or update institutions in bulk from a CSV or JSON file (admin only)",
+)
+async def import_institutions(
+    request: Request,
+    file: UploadFile,
+    current_user: AdminUser,
+    service: FinancialInstitutionServiceDep,
+    file_format: ImportFormat = ImportFormat.CSV,
+) -> FinancialInstitutionImportResult:
+    """
+    Insert or update financial institutions from a directory file.
+
+    Request body (multipart/form-data):
+        - file: UTF-8 file with one institution per row, using the fields
+          of POST /financial-institutions (CSV header row, JSON array or
+          JSON Lines)
+
+    Query parameters:
+        - file_format: csv or json (default: csv)
+
+    Rows are matched to existing institutions by swift_code, or by
+    routing_number when they have no SWIFT code; one of the two is
+    required. Matched institutions are updated (and restored if
+    deleted), blank optional fields keep their stored value. The import
+    is all-or-nothing and bumps the reference data version once.
+
+    Returns:
+        FinancialInstitutionImportResult with inserted/updated counts
+
+    Requires:
+        - Valid access token
+        - Admin privileges
+
+    Raises:
+        - 409 Conflict: If a row's SWIFT code and routing number belong to
+          different institutions
+        - 422 Unprocessable Entity: If the file or any row is invalid
+    """
+    # Extract client info
+    request_id = getattr(request.state, "request_id", None)
+    ip_address = request.client.host if request.client else None
+    user_agent = request.headers.get("User-Agent")
+
+    return await service.import_institutions(
+        stream=file.file,
+        file_format=file_format,
+        current_user=current_user,
+        request_id=request_id,
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
+
+
 @router.get(
     "",
     response_model=PaginatedResponse[FinancialInstitutionListResponse],
@@ -94,12 +166,15 @@ async def create_institution(
     description="List financial institutions with optional filtering, pagination, and sorting",
 )
 async def list_institutions(
+    cache_headers: Annotated[
+        dict[str, str], Depends(ReferenceDataETag("financial_institutions"))
+    ],
     current_user: CurrentUser,
-    service: FinancialInstitutionServiceDep,
+    service: ReadFinancialInstitutionServiceDep,
     filters: FinancialInstitutionFilterParams = Depends(),
     pagination: PaginationParams = Depends(),
     sorting: FinancialInstitutionSortParams = Depends(),
-) -> PaginatedResponse[FinancialInstitutionListResponse]:
+) -> PydanticJSONResponse:
     """
     List financial institutions with filtering.
 
@@ -128,19 +203,54 @@ async def list_institutions(
         sorting=sorting,
     )
 
-    return PaginatedResponse(
-        data=[
-            FinancialInstitutionListResponse.model_validate(fi)
-            for fi in financial_institutions
-        ],
-        meta=PaginationMeta(
-            total=count,
-            page=pagination.page,
-            page_size=pagination.page_size,
-        ),
+    return paginated_response(
+        financial_institutions,
+        FinancialInstitutionListResponse,
+        count,
+        pagination,
+        headers=cache_headers,
     )
 
 
+@router.get(
+    "/autocomplete",
+    response_model=list[FinancialInstitutionListResponse],
+    summary="Autocomplete financial institutions",
+    description="Suggest institutions matching a partially typed name",
+)
+async def autocomplete_institutions(
+    cache_headers: Annotated[
+        dict[str, str], Depends(ReferenceDataETag("financial_institutions"))
+    ],
+    current_user: CurrentUser,
+    service: ReadFinancialInstitutionServiceDep,
+    params: FinancialInstitutionAutocompleteParams = Depends(),
+) -> PydanticJSONResponse:
+    """
+    Suggest financial institutions for a bank picker.
+
+    Query parameters:
+        - q: Text typed so far (case- and accent-insensitive, max 100 chars)
+        - country_code: Rank institutions of this country first (optional)
+        - limit: Maximum number of suggestions (default: 10, max: 50)
+
+    Returns:
+        Institutions matching q in name or short_name, best match first
+        (whole name, start of name, start of a word, anywhere). One- and
+        two-character queries match the start of words only.
+
+    Requires:
+        - Valid access token
+        - Active user account
+
+    Served from memory (core.catalog); soft-deleted institutions are
+    excluded.
+    """
+    suggestions = await service.autocomplete(params)
+
+    return PydanticJSONResponse(suggestions, headers=cache_headers)
+
+
 @router.get(
     "/{institution_id}",
     response_model=FinancialInstitutionResponse,
@@ -150,7 +260,7 @@ async def list_institutions(
 async def get_institution(
     institution_id: uuid.UUID,
     current_user: CurrentUser,
-    service: FinancialInstitutionServiceDep,
+    service: ReadFinancialInstitutionServiceDep,
 ) -> FinancialInstitutionResponse:
     """
     Get financial institution by ID.
@@ -184,7 +294,7 @@ async def get_institution(
 async def get_by_swift_code(
     swift_code: str,
     current_user: CurrentUser,
-    service: FinancialInstitutionServiceDep,
+    service: ReadFinancialInstitutionServiceDep,
 ) -> FinancialInstitutionResponse:
     """
     Get financial institution by SWIFT/BIC code.
@@ -217,7 +327,7 @@ async def get_by_swift_code(
 async def get_by_routing_number(
     routing_number: str,
     current_user: CurrentUser,
-    service: FinancialInstitutionServiceDep,
+    service: ReadFinancialInstitutionServiceDep,
 ) -> FinancialInstitutionResponse:
     """
     Get financial institution by ABA routing number.
@@ -5,10 +5,12 @@ Health Check Endpoints
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response, status
 from sqlalchemy import text
 
 from core.config import settings
+from core.pool_metrics import get_pool_stats
+from core.redis import redis_manager
 from ..dependencies import DbSession
 
 logger = logging.getLogger(__name__)
@@ -35,17 +37,33 @@ async def health_check() -> dict[str, str]:
 @router.get("/ready")
 async def readiness_check(
     request: Request,
+    response: Response,
     db: DbSession,
 ) -> dict[str, Any]:
     """
     Readiness check endpoint.
 
     Checks if the application is ready to serve requests.
-    This verifies database connectivity and other critical dependencies.
+    Returns 503 until the startup warm-up has finished, then verifies
+    database and Redis connectivity and reports connection pool
+    occupancy and Redis latency. Returns 503 when the database is
+    unreachable, so load balancers stop routing to this worker.
+
+    Redis is optional (rate limiting and caching fall back to in-process
+    state): while it is down the status is "degraded" but the check still
+    returns 200, unless REDIS_REQUIRED makes it a hard dependency.
 
     Returns:
         Detailed readiness status
     """
+    if not getattr(request.app.state, "ready", True):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {
+            "status": "warming_up",
+            "app": settings.app_name,
+            "version": settings.version,
+        }
+
     try:
         await db.execute(text("SELECT 1"))
         db_healthy = True
@@ -53,12 +71,37 @@ async def readiness_check(
         logger.error(f"Database health check failed: {e}")
         db_healthy = False
 
+    pool_stats = get_pool_stats()
+    pools = {
+        name: {
+            "in_use": stats["in_use"],
+            "capacity": stats["capacity"],
+            "overflow": stats["overflow"],
+            "timeouts": stats["timeouts"],
+            "saturated": stats["saturated"],
+        }
+        for name, stats in pool_stats.items()
+    }
+    pool_saturated = any(pool["saturated"] for pool in pools.values())
+
+    # PING through the circuit breaker (fails fast while it is open)
+    redis_healthy = await redis_manager.ping() is not None
+    if not redis_healthy:
+        logger.error(f"Redis health check failed: {redis_manager.stats()}")
+
+    ready = db_healthy and (redis_healthy or not settings.redis_required)
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
     return {
-        "status": "ready" if db_healthy else "degraded",
+        "status": "ready" if db_healthy and redis_healthy else "degraded",
         "app": settings.app_name,
         "version": settings.version,
         "checks": {
             "database": "ok" if db_healthy else "ko",
-            "redis": "-",  # TODO: Add Redis check
+            "database_pool": "saturated" if pool_saturated else "ok",
+            "redis": "ok" if redis_healthy else "ko",
         },
+        "pools": pools,
+        "redis": redis_manager.stats(),
     }
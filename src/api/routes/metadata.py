@@ -7,16 +7,20 @@ This module provides:
 - Transaction types metadata (for dropdowns)
 
 These endpoints serve as the authoritative source for business data,
-ensuring frontend and backend stay in sync.
+ensuring frontend and backend stay in sync. Currency and account type
+listings support conditional GET (ETag / If-None-Match, see
+core.reference_data).
 """
 
 import logging
 import uuid
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from starlette import status
 from starlette.requests import Request
 
+from core.currencies import currency_data_version
+from core.reference_data import ReferenceDataETag
 from schemas import (
     AccountTypeCreate,
     AccountTypeListResponse,
@@ -29,6 +33,7 @@ from ..dependencies import (
     AdminUser,
     CurrencyServiceDep,
     CurrentUser,
+    ReadAccountTypeServiceDep,
 )
 
 logger = logging.getLogger(__name__)
@@ -39,6 +44,9 @@ router = APIRouter(prefix="/metadata", tags=["Metadata"])
 @router.get(
     "/currencies",
     response_model=CurrenciesResponse,
+    dependencies=[
+        Depends(ReferenceDataETag(data_version=currency_data_version(), public=True))
+    ],
     summary="Get supported currencies",
     description="Returns list of supported currencies with ISO 4217 codes and symbols.",
 )
@@ -117,12 +125,13 @@ async def create_account_type(
 @router.get(
     "/account-types",
     response_model=list[AccountTypeListResponse],
+    dependencies=[Depends(ReferenceDataETag("account_types"))],
     summary="List account types",
     description="List account types with optional filtering by active status",
 )
 async def list_account_types(
     current_user: CurrentUser,
-    service: AccountTypeServiceDep,
+    service: ReadAccountTypeServiceDep,
 ) -> list[AccountTypeListResponse]:
     """
     List all account types.
@@ -151,7 +160,7 @@ async def list_account_types(
 async def get_account_type(
     current_user: CurrentUser,
     account_type_id: uuid.UUID,
-    service: AccountTypeServiceDep,
+    service: ReadAccountTypeServiceDep,
 ) -> AccountTypeResponse:
     """
     Get account type by ID.
@@ -185,7 +194,7 @@ async def get_account_type(
 async def get_by_key(
     current_user: CurrentUser,
     key: str,
-    service: AccountTypeServiceDep,
+    service: ReadAccountTypeServiceDep,
 ) -> AccountTypeResponse:
     """
     Get account type by key.
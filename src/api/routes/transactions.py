@@ -16,9 +16,12 @@ import uuid
 
 from fastapi import APIRouter, Depends, Path, Request, status
 
+from core.deadlines import StatementTimeout
+from core.idempotency import IdempotentRoute
+from core.query_recorder import QueryBudget
+from core.responses import PydanticJSONResponse, paginated_response
 from schemas import (
     PaginatedResponse,
-    PaginationMeta,
     PaginationParams,
     TransactionCreate,
     TransactionFilterParams,
@@ -28,11 +31,19 @@ from schemas import (
     TransactionSplitCreate,
     TransactionUpdate,
 )
-from ..dependencies import CurrentUser, TransactionServiceDep
+from ..dependencies import (
+    CurrentUser,
+    ReadTransactionServiceDep,
+    TransactionServiceDep,
+)
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/accounts/{account_id}/transactions", tags=["Transactions"])
+router = APIRouter(
+    prefix="/accounts/{account_id}/transactions",
+    tags=["Transactions"],
+    route_class=IdempotentRoute,
+)
 
 
 @router.post(
@@ -49,6 +60,8 @@ router = APIRouter(prefix="/accounts/{account_id}/transactions", tags=["Transact
 
     **Permission:** EDITOR or OWNER
     **Audit:** Creates audit log entry with transaction details
+    **Idempotency:** Retries with the same `Idempotency-Key` header replay
+    the first response
     """,
     responses={
         201: {"description": "Transaction created successfully"},
@@ -106,6 +119,7 @@ async def create_transaction(
 @router.get(
     "",
     response_model=PaginatedResponse[TransactionListResponse],
+    dependencies=[Depends(QueryBudget(20)), Depends(StatementTimeout(5000))],
     summary="List and search transactions",
     description="""
     List transactions for an account with advanced search and filtering.
@@ -130,12 +144,12 @@ async def create_transaction(
 async def list_transactions(
     request: Request,
     current_user: CurrentUser,
-    transaction_service: TransactionServiceDep,
+    transaction_service: ReadTransactionServiceDep,
     account_id: uuid.UUID = Path(description="Account UUID"),
     pagination: PaginationParams = Depends(),
     filters: TransactionFilterParams = Depends(),
     sorting: TransactionSortParams = Depends(),
-) -> PaginatedResponse[TransactionListResponse]:
+) -> PydanticJSONResponse:
     """
     List and search transactions for an account.
 
@@ -169,14 +183,7 @@ async def list_transactions(
         sorting=sorting,
     )
 
-    return PaginatedResponse(
-        data=[TransactionListResponse.model_validate(t) for t in transactions],
-        meta=PaginationMeta(
-            total=count,
-            page=pagination.page,
-            page_size=pagination.page_size,
-        ),
-    )
+    return paginated_response(transactions, TransactionListResponse, count, pagination)
 
 
 @router.get(
@@ -200,7 +207,7 @@ async def list_transactions(
 async def get_transaction(
     request: Request,
     current_user: CurrentUser,
-    transaction_service: TransactionServiceDep,
+    transaction_service: ReadTransactionServiceDep,
     transaction_id: uuid.UUID = Path(description="Transaction UUID"),
 ) -> TransactionResponse:
     """
@@ -352,6 +359,8 @@ async def delete_transaction(
 
     **Permission:** EDITOR or higher
     **Audit:** Logs split with details
+    **Idempotency:** Retries with the same `Idempotency-Key` header replay
+    the first response
     """,
     responses={
         200: {"description": "Transaction split successfully"},
@@ -415,6 +424,8 @@ async def split_transaction(
 
     **Permission:** EDITOR or higher
     **Audit:** Logs join with child details
+    **Idempotency:** Retries with the same `Idempotency-Key` header replay
+    the first response
     """,
     responses={
         200: {"description": "Split joined successfully"},
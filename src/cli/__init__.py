@@ -0,0 +1,8 @@
+"""
+Command-line maintenance tools.
+
+Run from src/ with the application's environment, e.g.:
+    python -m cli.institutions import bic_directory.csv
+    python -m cli.accounts rebuild-summaries
+    python -m cli.accounts verify-balances
+"""
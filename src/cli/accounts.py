@@ -0,0 +1,99 @@
+"""
+Account maintenance commands.
+
+This module provides:
+- rebuild-summaries: Recompute every account summary from the transactions
+  table (repairs drift; picks up future-dated transactions whose month has
+  started)
+- verify-balances: Compare every account balance with its transactions and
+  fix mismatches (same rules as POST /api/v1/admin/balances/verify); exits
+  with status 1 when balances are left wrong
+
+Usage:
+    python -m cli.accounts rebuild-summaries
+    python -m cli.accounts verify-balances [--dry-run]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from core.database import (
+    close_database_connection,
+    create_database_engine,
+    create_sessionmaker,
+)
+from core.logging import setup_logging
+from schemas import BalanceVerificationResult
+from services import AccountService, AccountSummaryService
+
+
+async def rebuild_summaries() -> int:
+    """
+    Rebuild all account summaries in the primary database.
+
+    Returns:
+        Number of summaries created or corrected
+    """
+    engine = create_database_engine()
+    try:
+        async with create_sessionmaker(engine)() as session:
+            return await AccountSummaryService(session).rebuild()
+    finally:
+        await close_database_connection(engine)
+
+
+async def verify_balances(fix: bool) -> BalanceVerificationResult:
+    """
+    Verify (and fix) all account balances in the primary database.
+
+    Args:
+        fix: Correct mismatches
+
+    Returns:
+        Counts, throughput and the first mismatches found
+    """
+    engine = create_database_engine()
+    try:
+        async with create_sessionmaker(engine)() as session:
+            return await AccountService(session).verify_all_balances(fix=fix)
+    finally:
+        await close_database_connection(engine)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run a command.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m cli.accounts")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "rebuild-summaries", help="recompute account summaries from transactions"
+    )
+    verify_parser = commands.add_parser(
+        "verify-balances", help="verify and fix all account balances"
+    )
+    verify_parser.add_argument(
+        "--dry-run", action="store_true", help="only report mismatches"
+    )
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    if args.command == "verify-balances":
+        result = asyncio.run(verify_balances(fix=not args.dry_run))
+        print(result.model_dump_json())
+        return 1 if result.mismatched > result.fixed else 0
+
+    written = asyncio.run(rebuild_summaries())
+    print(f"{written} account summaries rebuilt")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
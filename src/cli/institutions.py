@@ -0,0 +1,100 @@
+"""
+Financial institution maintenance commands.
+
+This module provides:
+- import: Insert or update institutions from a CSV or JSON directory file
+  (same rules as POST /api/v1/financial-institutions/import)
+
+Usage:
+    python -m cli.institutions import bic_directory.csv
+    python -m cli.institutions import bic_directory.jsonl --format json
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from core.database import (
+    close_database_connection,
+    create_database_engine,
+    create_sessionmaker,
+)
+from core.exceptions import AppException
+from core.logging import setup_logging
+from schemas import FinancialInstitutionImportResult, ImportFormat
+from services import FinancialInstitutionService
+
+# File extensions read as JSON when --format is not given
+JSON_SUFFIXES = frozenset({".json", ".jsonl", ".ndjson"})
+
+
+async def import_file(
+    path: Path, file_format: ImportFormat
+) -> FinancialInstitutionImportResult:
+    """
+    Import an institution directory file into the primary database.
+
+    Args:
+        path: File to import
+        file_format: Format of the file
+
+    Returns:
+        Counts of received, inserted, updated and unchanged rows
+    """
+    engine = create_database_engine()
+    try:
+        async with create_sessionmaker(engine)() as session:
+            with path.open("rb") as file:
+                return await FinancialInstitutionService(session).import_institutions(
+                    file, file_format
+                )
+    finally:
+        await close_database_connection(engine)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run a command.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m cli.institutions")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser(
+        "import", help="insert or update institutions from a file"
+    )
+    import_parser.add_argument("path", type=Path, help="CSV or JSON file")
+    import_parser.add_argument(
+        "--format",
+        choices=[file_format.value for file_format in ImportFormat],
+        help="file format (default: from the file extension, else csv)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.format:
+        file_format = ImportFormat(args.format)
+    elif args.path.suffix.lower() in JSON_SUFFIXES:
+        file_format = ImportFormat.JSON
+    else:
+        file_format = ImportFormat.CSV
+
+    setup_logging()
+    try:
+        result = asyncio.run(import_file(args.path, file_format))
+    except AppException as e:
+        print(f"Import failed: {e.message}", file=sys.stderr)
+        for error in e.details.get("errors", []):
+            print(f"  line {error['line']}: {error['error']}", file=sys.stderr)
+        return 1
+
+    print(result.model_dump_json())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+In-process execution of batched sub-requests.
+
+This module provides:
+- execute_batch: Run sub-requests concurrently against the app's router
+
+Sub-requests are dispatched straight to the router, skipping the
+middleware stack (request ID, logging, security headers, compression)
+that the enclosing batch request already went through. Each sub-request
+resolves its own dependencies, so it gets its own database session;
+concurrency is capped by BATCH_MAX_CONCURRENCY to keep the connection
+pool available to other requests. Request state passed by the caller
+(e.g. the authenticated user) is shared with every sub-request.
+
+Skipping the middleware also skips RateLimitMiddleware, so each
+sub-request is charged to the global rate limit here, as if it had been
+sent on its own; sub-requests over the limit get a 429 response.
+"""
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.middleware.asyncexitstack import AsyncExitStackMiddleware
+from pydantic_core import from_json
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Message, Scope
+
+from core.config import settings
+from core.handlers import general_exception_handler
+from core.rate_limit import rate_limit_error, rate_limit_key, rate_limiter
+from schemas.batch import BatchRequestItem, BatchResponseItem
+
+logger = logging.getLogger(__name__)
+
+# Scope keys a sub-request inherits from the batch request
+_INHERITED_SCOPE_KEYS = (
+    "type",
+    "asgi",
+    "http_version",
+    "scheme",
+    "server",
+    "client",
+    "root_path",
+    "app",
+    "starlette.exception_handlers",
+)
+
+# Request headers describing the batch body or its response, not sub-requests
+_DROPPED_HEADERS = frozenset(
+    {
+        b"content-length",
+        b"content-type",
+        b"transfer-encoding",
+        b"accept-encoding",
+        b"if-none-match",
+        b"if-modified-since",
+    }
+)
+
+
+async def execute_batch(
+    request: Request,
+    items: Sequence[BatchRequestItem],
+    state: dict[str, Any] | None = None,
+) -> list[BatchResponseItem]:
+    """
+    Execute sub-requests concurrently.
+
+    Args:
+        request: The batch request (provides app, headers and client)
+        items: Sub-requests to execute
+        state: Extra request state shared with every sub-request
+
+    Returns:
+        One response per sub-request, in request order
+    """
+    logger.debug(f"Executing batch of {len(items)} sub-requests")
+    semaphore = asyncio.Semaphore(settings.batch_max_concurrency)
+    headers = [
+        (name, value)
+        for name, value in request.scope["headers"]
+        if name not in _DROPPED_HEADERS
+    ]
+    request_id = getattr(request.state, "request_id", None)
+    shared_state = {"request_id": request_id, **(state or {})}
+
+    # One token of the global limit per sub-request, charged in request order
+    limited: set[str] = set()
+    if settings.rate_limit_enabled:
+        key = rate_limit_key(request.scope)
+        limited = {item.id for item in items if rate_limiter.hit(key)}
+        if limited:
+            logger.warning(
+                f"Rate limit exceeded: {key}, {len(limited)} batched "
+                f"sub-requests rejected (request_id={request_id})"
+            )
+
+    async def run(item: BatchRequestItem) -> BatchResponseItem:
+        if item.id in limited:
+            return BatchResponseItem(
+                id=item.id, status=429, body=rate_limit_error(request_id)
+            )
+        async with semaphore:
+            return await _execute(request, item, headers, shared_state)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+async def _execute(
+    request: Request,
+    item: BatchRequestItem,
+    headers: list[tuple[bytes, bytes]],
+    state: dict[str, Any],
+) -> BatchResponseItem:
+    """Run one sub-request through the router and collect its response."""
+    path, _, query = item.path.partition("?")
+    inherited = {
+        key: request.scope[key] for key in _INHERITED_SCOPE_KEYS if key in request.scope
+    }
+    scope: Scope = {
+        **inherited,
+        "method": item.method,
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+        "state": dict(state),
+    }
+    status_code = 500
+    body = bytearray()
+    request_sent = False
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Sub-requests never disconnect; wait until the response is done
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    error_response: Response | None = None
+    try:
+        # The exit stack FastAPI's own middleware stack would provide
+        await AsyncExitStackMiddleware(request.app.router)(scope, receive, send)
+    except HTTPException as e:
+        # Raised by the router itself (unknown path, method not allowed)
+        error_response = await http_exception_handler(Request(scope), e)
+    except Exception as e:
+        # Unhandled errors normally reach ServerErrorMiddleware; answer
+        # this sub-request like the global handler would
+        error_response = await general_exception_handler(Request(scope), e)
+
+    if error_response is not None:
+        status_code = error_response.status_code
+        body = bytearray(error_response.body)
+
+    return BatchResponseItem(id=item.id, status=status_code, body=_decode(body))
+
+
+def _decode(body: bytes | bytearray) -> Any:
+    """Decode a JSON body, falling back to text."""
+    if not body:
+        return None
+    try:
+        return from_json(body)
+    except ValueError:
+        return body.decode(errors="replace")
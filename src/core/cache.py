@@ -0,0 +1,375 @@
+"""
+Two-tier cache: in-process LRU backed by Redis.
+
+This module provides:
+- Cache: Named cache of one value type with local and Redis tiers
+- Cache.get_or_load / Cache.cached: Read-through API and decorator
+- Cache.get / set / invalidate / clear: Explicit API
+- cache_stats: Hit, miss and eviction counters of every cache
+
+Lookups first check a bounded per-worker LRU (no I/O); entries live there
+for at most CACHE_LOCAL_TTL seconds. On a local miss the value is read
+from Redis, and on a Redis miss the loader runs - once per worker, since
+concurrent loads of a key are coalesced - and the result is written to
+both tiers. Values are (de)serialised with a Pydantic TypeAdapter of the
+cache's value type, so cache schemas (not ORM instances).
+
+Invalidation:
+- invalidate(key) drops one key from Redis and the local tier
+- clear() bumps the cache's version: Redis keys embed the version, so
+  every previous entry becomes unreachable at once. Other workers pick
+  the new version up within CACHE_LOCAL_TTL seconds.
+
+Stampedes: Redis entries record how long their load took. Each read-
+through lookup may refresh an entry before it expires, with a probability
+rising as expiry approaches and with the load time (probabilistic early
+expiration, "XFetch"), so one worker recomputes a hot key while the
+others keep using the current value.
+
+When Redis is unavailable the cache degrades to its local tier.
+
+Example:
+    account_types_cache = Cache("account_types", list[AccountTypeResponse], 300)
+
+    @account_types_cache.cached(key=lambda self: "all")
+    async def list_account_types(self) -> list[AccountTypeResponse]: ...
+"""
+
+import functools
+import logging
+import math
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, ParamSpec, TypeVar
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json
+
+from core.config import settings
+from core.redis import RedisManager, RedisUnavailableError, redis_manager
+from core.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+# Returned by lookups that found nothing (None is a cacheable value)
+MISSING: Any = object()
+
+# Every cache by name (for cache_stats)
+_caches: dict[str, "Cache[Any]"] = {}
+
+
+@dataclass
+class _Entry:
+    """Local tier entry."""
+
+    value: Any
+    expires: float  # time.monotonic() deadline
+
+
+class Cache(Generic[T]):
+    """
+    Named two-tier cache of values of one type.
+
+    Values handed out are shared between requests and must not be
+    modified.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        value_type: Any,
+        ttl: float,
+        maxsize: int | None = None,
+        local_ttl: float | None = None,
+        redis: RedisManager | None = redis_manager,
+    ):
+        """
+        Initialize Cache.
+
+        Args:
+            name: Cache name (Redis key namespace, stats label)
+            value_type: Type of the cached values (Pydantic-serialisable)
+            ttl: Seconds a value is kept in Redis
+            maxsize: Local tier capacity (default: CACHE_LOCAL_MAX_ENTRIES)
+            local_ttl: Seconds a value is kept locally (default:
+                CACHE_LOCAL_TTL, capped at ttl)
+            redis: Shared Redis pool (None for a local-only cache)
+        """
+        self.name = name
+        self.adapter: TypeAdapter[T] = TypeAdapter(value_type)
+        self.ttl = ttl
+        self.maxsize = maxsize or settings.cache_local_max_entries
+        self.local_ttl = min(ttl, local_ttl or settings.cache_local_ttl)
+        self.redis = redis
+        self._local: OrderedDict[str, _Entry] = OrderedDict()
+        self._version = 0
+        self._version_checked = -math.inf
+        self._loads = SingleFlight()
+        self._counters = dict.fromkeys(
+            (
+                "local_hits",
+                "redis_hits",
+                "misses",
+                "loads",
+                "early_refreshes",
+                "evictions",
+                "redis_errors",
+            ),
+            0,
+        )
+        _caches[name] = self
+
+    # ------------------------------------------------------------------------
+    # Read-through API
+    # ------------------------------------------------------------------------
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Get a value, loading and caching it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function computing the value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        if not settings.cache_enabled:
+            return await loader()
+        value = self._get_local(key)
+        if value is not MISSING:
+            return value
+        return await self._loads.do(key, functools.partial(self._load, key, loader))
+
+    def cached(
+        self, key: Callable[P, Hashable]
+    ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+        """
+        Decorate a coroutine function to read through this cache.
+
+        Args:
+            key: Function of the decorated function's arguments returning
+                the cache key
+
+        Returns:
+            Decorator
+        """
+
+        def decorator(fn: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+            @functools.wraps(fn)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                return await self.get_or_load(
+                    str(key(*args, **kwargs)), functools.partial(fn, *args, **kwargs)
+                )
+
+            return wrapper
+
+        return decorator
+
+    # ------------------------------------------------------------------------
+    # Explicit API
+    # ------------------------------------------------------------------------
+
+    async def get(self, key: str) -> T:
+        """
+        Get a cached value without loading it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or MISSING
+        """
+        value = self._get_local(key)
+        if value is MISSING:
+            value = await self._get_redis(key, early_refresh=False)
+        if value is MISSING:
+            self._counters["misses"] += 1
+        return value
+
+    async def set(self, key: str, value: T, load_time: float = 0.0) -> None:
+        """
+        Cache a value in both tiers.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            load_time: Seconds the value took to compute (weights early
+                refresh)
+        """
+        envelope = b"%s\n%s" % (
+            to_json({"load_time": load_time, "expires": time.time() + self.ttl}),
+            self.adapter.dump_json(value),
+        )
+        await self._redis_call(
+            lambda client, redis_key: client.set(
+                redis_key, envelope, ex=math.ceil(self.ttl)
+            ),
+            key,
+        )
+        self._set_local(key, value)
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Drop one key from both tiers.
+
+        Other workers may serve their local copy for up to local_ttl seconds.
+
+        Args:
+            key: Cache key
+        """
+        self._local.pop(key, None)
+        await self._redis_call(lambda client, redis_key: client.delete(redis_key), key)
+
+    async def clear(self) -> None:
+        """Invalidate every key by bumping the cache version."""
+        self._local.clear()
+        if self.redis is None:
+            return
+        try:
+            version = await self.redis.execute(
+                lambda client: client.incr(self._version_key)
+            )
+        except RedisUnavailableError as e:
+            # Other workers keep serving old entries until they expire
+            self._counters["redis_errors"] += 1
+            logger.warning(f"Cache {self.name}: version bump failed: {e}")
+            return
+        self._version = int(version)
+        self._version_checked = time.monotonic()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of this cache's counters.
+
+        Returns:
+            Hit/miss/load/eviction counters, hit ratio and local tier size
+        """
+        hits = self._counters["local_hits"] + self._counters["redis_hits"]
+        lookups = hits + self._counters["misses"]
+        return {
+            **self._counters,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+            "local_entries": len(self._local),
+            "version": self._version,
+        }
+
+    # ------------------------------------------------------------------------
+    # Tiers
+    # ------------------------------------------------------------------------
+
+    @property
+    def _version_key(self) -> str:
+        """Redis key of this cache's version counter."""
+        return f"cache:{self.name}:version"
+
+    def _get_local(self, key: str) -> Any:
+        """Look a key up in the local tier."""
+        entry = self._local.get(key)
+        if entry is None:
+            return MISSING
+        if entry.expires <= time.monotonic():
+            del self._local[key]
+            return MISSING
+        self._local.move_to_end(key)
+        self._counters["local_hits"] += 1
+        return entry.value
+
+    def _set_local(self, key: str, value: Any) -> None:
+        """Store a value in the local tier, evicting the least recently used."""
+        self._local[key] = _Entry(value, time.monotonic() + self.local_ttl)
+        self._local.move_to_end(key)
+        while len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    async def _get_redis(self, key: str, early_refresh: bool) -> Any:
+        """
+        Look a key up in Redis (and copy a hit to the local tier).
+
+        Args:
+            key: Cache key
+            early_refresh: Report a hit as a miss when XFetch elects this
+                lookup to refresh the entry ahead of its expiry
+        """
+        raw = await self._redis_call(
+            lambda client, redis_key: client.get(redis_key), key
+        )
+        if raw is None or raw is MISSING:
+            return MISSING
+
+        header, _, body = raw.partition(b"\n")
+        meta = from_json(header)
+        if early_refresh and meta["load_time"] > 0:
+            # XFetch: refresh early with probability growing near expiry
+            gap = meta["load_time"] * settings.cache_early_refresh_beta
+            if time.time() - gap * math.log(1 - random.random()) >= meta["expires"]:
+                self._counters["early_refreshes"] += 1
+                return MISSING
+
+        value = self.adapter.validate_json(body)
+        self._counters["redis_hits"] += 1
+        self._set_local(key, value)
+        return value
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """Read a key through Redis, running the loader on a miss."""
+        value = await self._get_redis(key, early_refresh=True)
+        if value is not MISSING:
+            return value
+
+        self._counters["misses"] += 1
+        self._counters["loads"] += 1
+        start = time.perf_counter()
+        value = await loader()
+        await self.set(key, value, load_time=time.perf_counter() - start)
+        return value
+
+    async def _redis_call(
+        self, operation: Callable[[Any, str], Awaitable[Any]], key: str
+    ) -> Any:
+        """
+        Run a Redis command on the versioned key of a cache key.
+
+        Returns:
+            The command's result, or MISSING if Redis is unavailable
+        """
+        if self.redis is None:
+            return MISSING
+        try:
+            await self._refresh_version(self.redis)
+            redis_key = f"cache:{self.name}:v{self._version}:{key}"
+            return await self.redis.execute(lambda client: operation(client, redis_key))
+        except RedisUnavailableError as e:
+            self._counters["redis_errors"] += 1
+            logger.debug(f"Cache {self.name}: Redis unavailable: {e}")
+            return MISSING
+
+    async def _refresh_version(self, redis: RedisManager) -> None:
+        """Re-read the cache version once it is older than local_ttl."""
+        now = time.monotonic()
+        if now - self._version_checked < self.local_ttl:
+            return
+        raw = await redis.execute(lambda client: client.get(self._version_key))
+        version = int(raw or 0)
+        if version != self._version:
+            # Entries cached under the previous version are stale
+            self._local.clear()
+            self._version = version
+        self._version_checked = now
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    """
+    Get the counters of every cache.
+
+    Returns:
+        Cache name -> stats snapshot
+    """
+    return {name: cache.stats() for name, cache in sorted(_caches.items())}
@@ -0,0 +1,346 @@
+"""
+In-memory catalog of account types and financial institutions.
+
+This module provides:
+- ReferenceCatalog: Process-wide copy of the reference tables used to
+  validate account references, embed them in account responses and
+  answer institution typeahead searches
+- reference_catalog: Process-wide ReferenceCatalog
+- CATALOG_CONTEXT: Validation context embedding from reference_catalog
+
+Both tables are tiny and change rarely, yet every account write checked
+its references with a query and every account read loaded both rows. The
+catalog keeps them in memory instead: it is loaded during warm-up and
+reloaded whenever reference_data_versions reports a change (so within
+REFERENCE_DATA_VERSION_TTL seconds of a write on any worker).
+
+An id the catalog does not know (an entry created moments ago on another
+worker, or an invalid id) is looked up on the caller's session before the
+lookup is answered, so a stale catalog never rejects a valid reference.
+Only the unknown ids are queried; ids that turn out not to exist are
+remembered as missing until the next version change reloads the catalog,
+so repeated requests with an invalid id do not reach the database.
+
+Soft-deleted institutions stay in the catalog: existing accounts still
+embed them, but institution_exists() rejects them for new references and
+search_institutions() does not return them.
+
+Example:
+    await reference_catalog.ensure(session, [type_id], [institution_id])
+    if reference_catalog.account_type(type_id) is None:
+        raise NotFoundError("Account type not found")
+"""
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Callable, Iterable
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.reference_data import REFERENCE_TABLES, reference_data_versions
+from core.typeahead import TypeaheadIndex
+from models import AccountType, FinancialInstitution
+from schemas import (
+    AccountTypeEmbeddedResponse,
+    FinancialInstitutionEmbeddedResponse,
+    FinancialInstitutionListResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+_ACCOUNT_TYPE_COLUMNS = (AccountType.id, AccountType.key, AccountType.name)
+_INSTITUTION_COLUMNS = (
+    FinancialInstitution.id,
+    FinancialInstitution.name,
+    FinancialInstitution.short_name,
+    FinancialInstitution.swift_code,
+    FinancialInstitution.country_code,
+    FinancialInstitution.institution_type,
+    FinancialInstitution.logo_url,
+    FinancialInstitution.deleted_at,
+)
+
+
+class ReferenceCatalog:
+    """
+    Account types and financial institutions, kept in memory.
+
+    Entries are embedded response schemas shared between requests; they
+    must not be modified.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty catalog (loaded on first use)."""
+        self._sessionmaker: Callable[[], AsyncSession] | None = None
+        self._versions: dict[str, int] | None = None
+        self._account_types: dict[uuid.UUID, AccountTypeEmbeddedResponse] = {}
+        self._institutions: dict[uuid.UUID, FinancialInstitutionEmbeddedResponse] = {}
+        self._deleted_institutions: set[uuid.UUID] = set()
+        self._listings: dict[
+            uuid.UUID, tuple[FinancialInstitutionListResponse, tuple[str, ...]]
+        ] = {}
+        self._institution_index: TypeaheadIndex[FinancialInstitutionListResponse] = (
+            TypeaheadIndex(())
+        )
+        # Ids known not to exist, until the next (version-driven) reload
+        self._missing_account_types: set[uuid.UUID] = set()
+        self._missing_institutions: set[uuid.UUID] = set()
+        self._lock = asyncio.Lock()
+        self.loads = 0
+        self.lookups = 0  # Point queries of unknown ids
+
+    def start(self, sessionmaker: Callable[[], AsyncSession]) -> None:
+        """
+        Attach the session factory used for version-driven reloads.
+
+        Args:
+            sessionmaker: Factory of primary sessions
+        """
+        self._sessionmaker = sessionmaker
+        self._versions = None
+
+    async def refresh(self) -> None:
+        """Reload the catalog if the reference tables changed since it loaded."""
+        if self._sessionmaker is None:
+            return
+        versions = await reference_data_versions.get(
+            self._sessionmaker, tuple(sorted(REFERENCE_TABLES))
+        )
+        if versions is None or versions == self._versions:
+            return
+        async with self._lock:
+            if versions == self._versions:
+                return
+            try:
+                async with self._sessionmaker() as session:
+                    await self._load(session)
+            except Exception as e:
+                # Keep serving the previous copy; misses still reload
+                logger.warning(f"Could not reload reference catalog: {e}")
+                return
+            self._versions = versions
+
+    async def ensure(
+        self,
+        session: AsyncSession,
+        account_type_ids: Iterable[uuid.UUID] = (),
+        institution_ids: Iterable[uuid.UUID] = (),
+    ) -> None:
+        """
+        Make the catalog current, loaded and covering the given ids.
+
+        Loads on the caller's session when the catalog was never loaded,
+        and queries ids it does not know (neither loaded nor known to be
+        missing), so entries created on another worker are found before
+        versions are re-read.
+
+        Args:
+            session: Session of the current request
+            account_type_ids: Account type ids about to be looked up
+            institution_ids: Institution ids about to be looked up
+        """
+        account_type_ids, institution_ids = set(account_type_ids), set(institution_ids)
+        await self.refresh()
+        if self._covers(account_type_ids, institution_ids):
+            return
+        async with self._lock:
+            if self.loads == 0:
+                await self._load(session)
+                # Whatever the full load did not find does not exist
+                self._missing_account_types |= account_type_ids
+                self._missing_institutions |= institution_ids
+                self._forget_known()
+                return
+            unknown_types, unknown_institutions = self._unknown(
+                account_type_ids, institution_ids
+            )
+            if unknown_types or unknown_institutions:
+                await self._load_ids(session, unknown_types, unknown_institutions)
+
+    def account_type(self, id: uuid.UUID) -> AccountTypeEmbeddedResponse | None:
+        """
+        Look an account type up.
+
+        Args:
+            id: Account type id
+
+        Returns:
+            The account type, or None if it does not exist
+        """
+        return self._account_types.get(id)
+
+    def institution(self, id: uuid.UUID) -> FinancialInstitutionEmbeddedResponse | None:
+        """
+        Look a financial institution up (soft-deleted ones included).
+
+        Args:
+            id: Institution id
+
+        Returns:
+            The institution, or None if it does not exist
+        """
+        return self._institutions.get(id)
+
+    def institution_exists(self, id: uuid.UUID) -> bool:
+        """
+        Check that an institution exists and is not soft-deleted.
+
+        Args:
+            id: Institution id
+
+        Returns:
+            True if new accounts may reference the institution
+        """
+        return id in self._institutions and id not in self._deleted_institutions
+
+    def search_institutions(
+        self, query: str, country_code: str | None = None, limit: int = 10
+    ) -> list[FinancialInstitutionListResponse]:
+        """
+        Typeahead search of institutions by name and short name.
+
+        Args:
+            query: Text typed so far
+            country_code: Country whose institutions rank first among
+                equally good matches
+            limit: Maximum number of results
+
+        Returns:
+            Matching institutions (soft-deleted excluded), best first
+        """
+        return self._institution_index.search(
+            query,
+            limit=limit,
+            prefer=lambda institution: institution.country_code == country_code,
+        )
+
+    def stats(self) -> dict[str, object]:
+        """
+        Snapshot of the catalog.
+
+        Returns:
+            Entry counts, number of loads and the versions loaded
+        """
+        return {
+            "account_types": len(self._account_types),
+            "financial_institutions": len(self._institutions),
+            "searchable_institutions": len(self._institution_index),
+            "loads": self.loads,
+            "lookups": self.lookups,
+            "known_missing": len(self._missing_account_types)
+            + len(self._missing_institutions),
+            "versions": self._versions,
+        }
+
+    def _unknown(
+        self, account_type_ids: set[uuid.UUID], institution_ids: set[uuid.UUID]
+    ) -> tuple[set[uuid.UUID], set[uuid.UUID]]:
+        """Ids with neither an entry nor a known-missing mark."""
+        return (
+            account_type_ids - self._account_types.keys() - self._missing_account_types,
+            institution_ids - self._institutions.keys() - self._missing_institutions,
+        )
+
+    def _covers(
+        self, account_type_ids: set[uuid.UUID], institution_ids: set[uuid.UUID]
+    ) -> bool:
+        """Check that the catalog is loaded and every id is accounted for."""
+        return self.loads > 0 and not any(
+            self._unknown(account_type_ids, institution_ids)
+        )
+
+    def _forget_known(self) -> None:
+        """Drop known-missing marks of ids that now have an entry."""
+        self._missing_account_types -= self._account_types.keys()
+        self._missing_institutions -= self._institutions.keys()
+
+    async def _load(self, session: AsyncSession) -> None:
+        """Read both tables and swap the in-memory copy."""
+        account_types = await session.execute(select(*_ACCOUNT_TYPE_COLUMNS))
+        institutions = await session.execute(select(*_INSTITUTION_COLUMNS))
+
+        self._account_types = {}
+        self._institutions = {}
+        self._deleted_institutions = set()
+        self._listings = {}
+        self._missing_account_types = set()
+        self._missing_institutions = set()
+        self._add(account_types.all(), institutions.all())
+        self.loads += 1
+        logger.debug(
+            f"Reference catalog loaded: {len(self._account_types)} account types, "
+            f"{len(self._institutions)} institutions"
+        )
+
+    async def _load_ids(
+        self,
+        session: AsyncSession,
+        account_type_ids: set[uuid.UUID],
+        institution_ids: set[uuid.UUID],
+    ) -> None:
+        """Query unknown ids, adding the rows found and marking the rest missing."""
+        account_types: list[Row] = []
+        institutions: list[Row] = []
+        if account_type_ids:
+            result = await session.execute(
+                select(*_ACCOUNT_TYPE_COLUMNS).where(
+                    AccountType.id.in_(account_type_ids)
+                )
+            )
+            account_types = list(result.all())
+        if institution_ids:
+            result = await session.execute(
+                select(*_INSTITUTION_COLUMNS).where(
+                    FinancialInstitution.id.in_(institution_ids)
+                )
+            )
+            institutions = list(result.all())
+
+        self._add(account_types, institutions)
+        self._missing_account_types |= account_type_ids - self._account_types.keys()
+        self._missing_institutions |= institution_ids - self._institutions.keys()
+        self.lookups += 1
+        logger.debug(
+            f"Reference catalog lookup: {len(account_types)} account types, "
+            f"{len(institutions)} institutions found"
+        )
+
+    def _add(self, account_types: list[Row], institutions: list[Row]) -> None:
+        """Add (or replace) entries from reference table rows."""
+        for row in account_types:
+            self._account_types[row.id] = AccountTypeEmbeddedResponse(
+                id=row.id, key=row.key, name=row.name
+            )
+        for row in institutions:
+            self._institutions[row.id] = FinancialInstitutionEmbeddedResponse(
+                id=row.id,
+                name=row.name,
+                short_name=row.short_name,
+                logo_url=row.logo_url,
+            )
+            if row.deleted_at is not None:
+                self._deleted_institutions.add(row.id)
+                continue
+            self._listings[row.id] = (
+                FinancialInstitutionListResponse(
+                    id=row.id,
+                    name=row.name,
+                    short_name=row.short_name,
+                    swift_code=row.swift_code,
+                    country_code=row.country_code,
+                    institution_type=row.institution_type,
+                    logo_url=row.logo_url,
+                ),
+                (row.name, row.short_name),
+            )
+        if institutions:
+            self._institution_index = TypeaheadIndex(self._listings.values())
+
+
+# Process-wide catalog
+reference_catalog = ReferenceCatalog()
+
+# Validation context of account response schemas (embed from the catalog)
+CATALOG_CONTEXT = {"catalog": reference_catalog}
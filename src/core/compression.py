@@ -0,0 +1,306 @@
+"""
+Negotiated response compression.
+
+This module provides:
+- CompressionMiddleware: Pure ASGI middleware compressing response bodies
+- negotiate_encoding: Pick a content coding from an Accept-Encoding header
+- available_encodings: Content codings supported by this interpreter
+
+gzip is always available. Brotli ("br") is used when the brotli package is
+installed, zstd when the interpreter ships compression.zstd (Python 3.14+)
+or the zstandard package is installed. When a client accepts several
+codings with the same weight, zstd is preferred over br over gzip.
+
+Responses are compressed only when:
+- The client accepts a supported coding
+- The body reaches COMPRESSION_MINIMUM_SIZE (streamed bodies always qualify)
+- The content type is textual (JSON, text, XML, CSV, JavaScript)
+- The response has no Content-Encoding yet and is not a partial response
+
+Streaming responses are compressed chunk by chunk; each chunk is flushed
+so clients receive data as soon as the application produces it.
+Compressed responses get Vary: Accept-Encoding, and a strong ETag is
+turned into a weak one (the bytes now depend on the negotiated coding).
+"""
+
+import logging
+import zlib
+from collections.abc import Callable, Sequence
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    from compression import zstd  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - Python < 3.14
+    zstd = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Server preference when the client weighs several codings equally
+PREFERRED_ENCODINGS = ("zstd", "br", "gzip")
+
+# Content types worth compressing (anything else is likely binary or
+# already compressed: images, archives, PDFs, ...)
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+)
+COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+
+
+# ============================================================================
+# Codecs
+# ============================================================================
+
+
+class Compressor(Protocol):
+    """Incremental compressor of one response body."""
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compress data; flush it, and end the stream when final."""
+        ...
+
+
+class _GzipCompressor:
+    """gzip via zlib."""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return self._compressor.compress(data) + self._compressor.flush(mode)
+
+
+class _BrotliCompressor:
+    """Brotli via the brotli package."""
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        output = self._compressor.process(data)
+        if final:
+            return output + self._compressor.finish()
+        return output + self._compressor.flush()
+
+
+class _ZstdCompressor:
+    """Zstandard via compression.zstd (Python 3.14+)."""
+
+    def __init__(self, level: int):
+        self._compressor = zstd.ZstdCompressor(level=level)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        compressor = zstd.ZstdCompressor
+        mode = compressor.FLUSH_FRAME if final else compressor.FLUSH_BLOCK
+        return self._compressor.compress(data, mode=mode)
+
+
+class _ZstandardCompressor:
+    """Zstandard via the zstandard package."""
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        output = self._compressor.compress(data)
+        if final:
+            return output + self._compressor.flush()
+        return output + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+
+def available_encodings() -> dict[str, Callable[[], Compressor]]:
+    """
+    Get the content codings supported by this interpreter.
+
+    Levels are read from settings (COMPRESSION_*_LEVEL / _QUALITY).
+
+    Returns:
+        Coding name -> compressor factory, in server preference order
+    """
+    factories: dict[str, Callable[[], Compressor]] = {}
+    if zstd is not None:
+        factories["zstd"] = lambda: _ZstdCompressor(settings.compression_zstd_level)
+    elif zstandard is not None:
+        factories["zstd"] = lambda: _ZstandardCompressor(
+            settings.compression_zstd_level
+        )
+    if brotli is not None:
+        factories["br"] = lambda: _BrotliCompressor(settings.compression_brotli_quality)
+    factories["gzip"] = lambda: _GzipCompressor(settings.compression_gzip_level)
+    return {name: factories[name] for name in PREFERRED_ENCODINGS if name in factories}
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    """
+    Pick the content coding to use for a request.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+        encodings: Supported codings, in server preference order
+
+    Returns:
+        The accepted coding with the highest weight (ties broken by server
+        preference), or None to send the body as is
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                continue
+        weights[coding] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for coding in encodings:
+        weight = weights.get(coding, wildcard)
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def _is_compressible(headers: Headers) -> bool:
+    """Check whether a response's headers allow compressing its body."""
+    if "content-encoding" in headers or "content-range" in headers:
+        return False
+    content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or content_type.endswith(
+        COMPRESSIBLE_SUFFIXES
+    )
+
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+
+class CompressionMiddleware:
+    """
+    Middleware compressing response bodies with the client's best coding.
+
+    The response start is held back until the first body chunk so small
+    single-chunk bodies can be sent uncompressed. Content-Length is
+    rewritten for single-chunk bodies and dropped for streamed ones.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int | None = None):
+        """
+        Initialize CompressionMiddleware.
+
+        Args:
+            app: ASGI application
+            minimum_size: Smallest body (bytes) to compress
+                          (default: settings.compression_minimum_size)
+        """
+        self.app = app
+        self.minimum_size = (
+            settings.compression_minimum_size if minimum_size is None else minimum_size
+        )
+        self.encoders = available_encodings()
+        logger.debug(f"Response compression codings: {', '.join(self.encoders)}")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and compress its response.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), tuple(self.encoders)
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        compressor: Compressor | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if passthrough or message["type"] not in (
+                "http.response.start",
+                "http.response.body",
+            ):
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                if not _is_compressible(Headers(raw=message.get("headers", []))):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            body: bytes = message.get("body", b"")
+            more_body: bool = message.get("more_body", False)
+
+            if compressor is None:
+                assert start is not None
+                if not more_body and (not body or len(body) < self.minimum_size):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = self.encoders[encoding]()
+                headers = MutableHeaders(scope=start)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                if more_body:
+                    del headers["Content-Length"]
+                    await send(start)
+                else:
+                    body = compressor.compress(body, final=True)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": compressor.compress(body, final=not more_body),
+                    "more_body": more_body,
+                }
+            )
+
+        await self.app(scope, receive, send_compressed)
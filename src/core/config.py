@@ -68,6 +68,35 @@ class Settings(BaseSettings):
     db_pool_recycle: int = Field(default=3600, ge=300)  # Seconds
     db_pool_pre_ping: bool = Field(default=True)
     db_pool_timeout: int = Field(default=30, ge=1, le=60)
+    db_pool_wait_warning_ms: int = Field(default=100, ge=1)  # Saturation alarm
+    # Default per-request statement timeout (routes may override)
+    db_statement_timeout_ms: int = Field(default=15000, ge=100)
+    # Unit of work: service commits only flush; one real commit per request
+    db_unit_of_work: bool = Field(default=True)
+
+    # Read Replicas (optional - reads stay on the primary when empty)
+    database_replica_urls: list[PostgresDsn] = Field(
+        default=[], description="PostgreSQL read replica connection strings"
+    )
+    # Read-your-writes window. Remembered per worker; other workers rely on
+    # the client returning the last-write cookie/X-Last-Write header
+    db_replica_sticky_seconds: float = Field(default=5.0, ge=0, le=300)
+    db_replica_max_lag_seconds: float = Field(default=5.0, ge=0)
+    db_replica_check_interval: float = Field(default=10.0, ge=1)  # Seconds
+    db_replica_failure_cooldown: float = Field(default=30.0, ge=1)  # Seconds
+
+    # Query Instrumentation
+    query_recorder_enabled: bool = Field(default=True)
+    query_n_plus_one_threshold: int = Field(default=5, ge=2)  # Same statement
+    query_budget_enforced: bool = Field(default=False)  # Raise on budget overrun
+    slow_query_threshold_ms: int = Field(default=500, ge=1)
+    slow_query_explain_sample_rate: float = Field(default=0.0, ge=0, le=1)
+    slow_query_explain_timeout_ms: int = Field(default=10000, ge=100)
+    slow_query_buffer_size: int = Field(default=200, ge=1, le=10000)
+    slow_query_log_path: str = Field(default="logs/slow_queries.jsonl")
+
+    # Startup
+    startup_warmup_enabled: bool = Field(default=True)
 
     # -------------------------------------------------------------------------
     # Redis Configuration
@@ -76,6 +105,19 @@ class Settings(BaseSettings):
         ..., description="Redis connection string for rate limiting and caching"
     )
     redis_max_connections: int = Field(default=10, ge=1, le=100)
+    redis_socket_timeout: float = Field(default=1.0, gt=0)  # Seconds per command
+    redis_probe_interval: float = Field(
+        default=5.0, gt=0
+    )  # Seconds between background PING latency probes
+    redis_breaker_failure_threshold: int = Field(
+        default=3, ge=1
+    )  # Consecutive failures opening the circuit breaker
+    redis_breaker_reset_timeout: float = Field(
+        default=10.0, gt=0
+    )  # Seconds the breaker stays open before a trial call
+    redis_required: bool = Field(
+        default=False
+    )  # Fail readiness (503) while Redis is down instead of reporting degraded
 
     # -------------------------------------------------------------------------
     # CORS Settings
@@ -95,6 +137,59 @@ class Settings(BaseSettings):
     rate_limit_register: str = Field(default="3/hour")
     rate_limit_password_change: str = Field(default="3/hour")
     rate_limit_token_refresh: str = Field(default="10/hour")
+    rate_limit_sync_interval: float = Field(
+        default=0.25, gt=0
+    )  # Seconds between Redis reconciliations of the global limit
+
+    # -------------------------------------------------------------------------
+    # HTTP Caching (reference data: currencies, account types, institutions)
+    # -------------------------------------------------------------------------
+    reference_data_max_age: int = Field(default=300, ge=0)  # Cache-Control max-age (s)
+    reference_data_version_ttl: float = Field(
+        default=5.0, ge=0
+    )  # Seconds a worker reuses table versions before re-reading them
+
+    # -------------------------------------------------------------------------
+    # Response Compression
+    # -------------------------------------------------------------------------
+    compression_enabled: bool = Field(default=True)
+    compression_minimum_size: int = Field(
+        default=1024, ge=0
+    )  # Bodies smaller than this (bytes) are sent uncompressed
+    compression_gzip_level: int = Field(default=6, ge=1, le=9)
+    compression_brotli_quality: int = Field(default=4, ge=0, le=11)  # If installed
+    compression_zstd_level: int = Field(default=3, ge=1, le=22)  # If available
+
+    # -------------------------------------------------------------------------
+    # Batch Requests
+    # -------------------------------------------------------------------------
+    batch_max_concurrency: int = Field(
+        default=4, ge=1, le=20
+    )  # Sub-requests of one batch running at once (one session each)
+
+    # -------------------------------------------------------------------------
+    # Caching (in-process LRU backed by Redis, see core.cache)
+    # -------------------------------------------------------------------------
+    cache_enabled: bool = Field(default=True)
+    cache_local_max_entries: int = Field(
+        default=1024, ge=1
+    )  # Default per-cache capacity of the in-process tier
+    cache_local_ttl: float = Field(
+        default=5.0, gt=0
+    )  # Seconds a worker serves an entry (or cache version) without Redis
+    cache_early_refresh_beta: float = Field(
+        default=1.0, ge=0
+    )  # XFetch eagerness: higher refreshes hot keys earlier (0 disables)
+
+    # -------------------------------------------------------------------------
+    # Idempotency Keys (POST endpoints accepting an Idempotency-Key header)
+    # -------------------------------------------------------------------------
+    idempotency_ttl: int = Field(
+        default=86400, ge=60
+    )  # Seconds a completed response is replayed for retries
+    idempotency_lock_timeout: float = Field(
+        default=30.0, gt=0
+    )  # Seconds a request holds its key (and duplicates wait for it)
 
     # -------------------------------------------------------------------------
     # Logging Configuration
@@ -165,6 +260,11 @@ class Settings(BaseSettings):
         """Get database URL as string."""
         return str(self.database_url)
 
+    @property
+    def database_replica_url_strs(self) -> list[str]:
+        """Get read replica URLs as strings."""
+        return [str(url) for url in self.database_replica_urls]
+
     @property
     def redis_url_str(self) -> str:
         """Get Redis URL as string."""
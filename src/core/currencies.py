@@ -0,0 +1,334 @@
+"""
+ISO 4217 currency registry.
+
+This module provides:
+- CURRENCIES: Immutable code -> Currency mapping of every active currency
+- get_currency / is_supported: O(1) lookups (case-insensitive)
+- minor_units: Decimal places of a currency's minor unit
+- quantize_amount / quantize_amounts: Round amounts to a currency's
+  precision (one amount, or a whole batch for bulk paths)
+- fits_precision: Check an amount has no digits beyond that precision
+- currency_data_version: Fingerprint of the registry (for ETags)
+
+The table is ISO 4217 List One (active codes), built once at import.
+Fund codes (BOV, CLF, USN...), precious metals (XAU...), SDRs and units
+of account (XDR, XSU, XUA, XB*), and the testing / no-currency codes
+(XTS, XXX) are not currencies an account can hold and are left out.
+
+Amounts are stored as NUMERIC(15, 2), so precision is the currency's
+minor units capped at AMOUNT_SCALE: JPY amounts are whole numbers, while
+three-decimal currencies (BHD, KWD...) are kept to two decimals.
+
+Example:
+    if get_currency(code) is None:
+        raise ValidationError(f"Unsupported currency code '{code}'")
+    amounts = quantize_amounts(parsed_amounts, "JPY")
+"""
+
+import hashlib
+from collections.abc import Iterable, Mapping
+from decimal import ROUND_HALF_UP, Decimal
+from types import MappingProxyType
+
+from schemas.currency import Currency
+
+# Decimal places of the amount columns (NUMERIC(15, 2))
+AMOUNT_SCALE = 2
+
+# Rounding applied when quantizing amounts
+ROUNDING = ROUND_HALF_UP
+
+# (code, minor units, symbol, name)
+_ISO_4217: tuple[tuple[str, int, str, str], ...] = (
+    ("AED", 2, "د.إ", "UAE Dirham"),
+    ("AFN", 2, "؋", "Afghani"),
+    ("ALL", 2, "L", "Lek"),
+    ("AMD", 2, "֏", "Armenian Dram"),
+    ("AOA", 2, "Kz", "Kwanza"),
+    ("ARS", 2, "$", "Argentine Peso"),
+    ("AUD", 2, "A$", "Australian Dollar"),
+    ("AWG", 2, "ƒ", "Aruban Florin"),
+    ("AZN", 2, "₼", "Azerbaijan Manat"),
+    ("BAM", 2, "KM", "Convertible Mark"),
+    ("BBD", 2, "$", "Barbados Dollar"),
+    ("BDT", 2, "৳", "Taka"),
+    ("BHD", 3, ".د.ب", "Bahraini Dinar"),
+    ("BIF", 0, "FBu", "Burundi Franc"),
+    ("BMD", 2, "$", "Bermudian Dollar"),
+    ("BND", 2, "$", "Brunei Dollar"),
+    ("BOB", 2, "Bs", "Boliviano"),
+    ("BRL", 2, "R$", "Brazilian Real"),
+    ("BSD", 2, "$", "Bahamian Dollar"),
+    ("BTN", 2, "Nu.", "Ngultrum"),
+    ("BWP", 2, "P", "Pula"),
+    ("BYN", 2, "Br", "Belarusian Ruble"),
+    ("BZD", 2, "$", "Belize Dollar"),
+    ("CAD", 2, "C$", "Canadian Dollar"),
+    ("CDF", 2, "FC", "Congolese Franc"),
+    ("CHF", 2, "CHF", "Swiss Franc"),
+    ("CLP", 0, "$", "Chilean Peso"),
+    ("CNY", 2, "¥", "Chinese Yuan"),
+    ("COP", 2, "$", "Colombian Peso"),
+    ("CRC", 2, "₡", "Costa Rican Colon"),
+    ("CUP", 2, "$", "Cuban Peso"),
+    ("CVE", 2, "$", "Cabo Verde Escudo"),
+    ("CZK", 2, "Kč", "Czech Koruna"),
+    ("DJF", 0, "Fdj", "Djibouti Franc"),
+    ("DKK", 2, "kr", "Danish Krone"),
+    ("DOP", 2, "$", "Dominican Peso"),
+    ("DZD", 2, "د.ج", "Algerian Dinar"),
+    ("EGP", 2, "£", "Egyptian Pound"),
+    ("ERN", 2, "Nfk", "Nakfa"),
+    ("ETB", 2, "Br", "Ethiopian Birr"),
+    ("EUR", 2, "€", "Euro"),
+    ("FJD", 2, "$", "Fiji Dollar"),
+    ("FKP", 2, "£", "Falkland Islands Pound"),
+    ("GBP", 2, "£", "Pound Sterling"),
+    ("GEL", 2, "₾", "Lari"),
+    ("GHS", 2, "₵", "Ghana Cedi"),
+    ("GIP", 2, "£", "Gibraltar Pound"),
+    ("GMD", 2, "D", "Dalasi"),
+    ("GNF", 0, "FG", "Guinean Franc"),
+    ("GTQ", 2, "Q", "Quetzal"),
+    ("GYD", 2, "$", "Guyana Dollar"),
+    ("HKD", 2, "HK$", "Hong Kong Dollar"),
+    ("HNL", 2, "L", "Lempira"),
+    ("HTG", 2, "G", "Gourde"),
+    ("HUF", 2, "Ft", "Forint"),
+    ("IDR", 2, "Rp", "Rupiah"),
+    ("ILS", 2, "₪", "New Israeli Sheqel"),
+    ("INR", 2, "₹", "Indian Rupee"),
+    ("IQD", 3, "ع.د", "Iraqi Dinar"),
+    ("IRR", 2, "﷼", "Iranian Rial"),
+    ("ISK", 0, "kr", "Iceland Krona"),
+    ("JMD", 2, "$", "Jamaican Dollar"),
+    ("JOD", 3, "د.ا", "Jordanian Dinar"),
+    ("JPY", 0, "¥", "Japanese Yen"),
+    ("KES", 2, "KSh", "Kenyan Shilling"),
+    ("KGS", 2, "с", "Som"),
+    ("KHR", 2, "៛", "Riel"),
+    ("KMF", 0, "CF", "Comorian Franc"),
+    ("KPW", 2, "₩", "North Korean Won"),
+    ("KRW", 0, "₩", "Won"),
+    ("KWD", 3, "د.ك", "Kuwaiti Dinar"),
+    ("KYD", 2, "$", "Cayman Islands Dollar"),
+    ("KZT", 2, "₸", "Tenge"),
+    ("LAK", 2, "₭", "Lao Kip"),
+    ("LBP", 2, "ل.ل", "Lebanese Pound"),
+    ("LKR", 2, "Rs", "Sri Lanka Rupee"),
+    ("LRD", 2, "$", "Liberian Dollar"),
+    ("LSL", 2, "L", "Loti"),
+    ("LYD", 3, "ل.د", "Libyan Dinar"),
+    ("MAD", 2, "د.م.", "Moroccan Dirham"),
+    ("MDL", 2, "L", "Moldovan Leu"),
+    ("MGA", 2, "Ar", "Malagasy Ariary"),
+    ("MKD", 2, "ден", "Denar"),
+    ("MMK", 2, "K", "Kyat"),
+    ("MNT", 2, "₮", "Tugrik"),
+    ("MOP", 2, "MOP$", "Pataca"),
+    ("MRU", 2, "UM", "Ouguiya"),
+    ("MUR", 2, "₨", "Mauritius Rupee"),
+    ("MVR", 2, "Rf", "Rufiyaa"),
+    ("MWK", 2, "MK", "Malawi Kwacha"),
+    ("MXN", 2, "$", "Mexican Peso"),
+    ("MYR", 2, "RM", "Malaysian Ringgit"),
+    ("MZN", 2, "MT", "Mozambique Metical"),
+    ("NAD", 2, "$", "Namibia Dollar"),
+    ("NGN", 2, "₦", "Naira"),
+    ("NIO", 2, "C$", "Cordoba Oro"),
+    ("NOK", 2, "kr", "Norwegian Krone"),
+    ("NPR", 2, "Rs", "Nepalese Rupee"),
+    ("NZD", 2, "NZ$", "New Zealand Dollar"),
+    ("OMR", 3, "ر.ع.", "Rial Omani"),
+    ("PAB", 2, "B/.", "Balboa"),
+    ("PEN", 2, "S/", "Sol"),
+    ("PGK", 2, "K", "Kina"),
+    ("PHP", 2, "₱", "Philippine Peso"),
+    ("PKR", 2, "Rs", "Pakistan Rupee"),
+    ("PLN", 2, "zł", "Zloty"),
+    ("PYG", 0, "₲", "Guarani"),
+    ("QAR", 2, "ر.ق", "Qatari Rial"),
+    ("RON", 2, "lei", "Romanian Leu"),
+    ("RSD", 2, "дин.", "Serbian Dinar"),
+    ("RUB", 2, "₽", "Russian Ruble"),
+    ("RWF", 0, "FRw", "Rwanda Franc"),
+    ("SAR", 2, "ر.س", "Saudi Riyal"),
+    ("SBD", 2, "$", "Solomon Islands Dollar"),
+    ("SCR", 2, "₨", "Seychelles Rupee"),
+    ("SDG", 2, "ج.س.", "Sudanese Pound"),
+    ("SEK", 2, "kr", "Swedish Krona"),
+    ("SGD", 2, "S$", "Singapore Dollar"),
+    ("SHP", 2, "£", "Saint Helena Pound"),
+    ("SLE", 2, "Le", "Leone"),
+    ("SOS", 2, "Sh", "Somali Shilling"),
+    ("SRD", 2, "$", "Surinam Dollar"),
+    ("SSP", 2, "£", "South Sudanese Pound"),
+    ("STN", 2, "Db", "Dobra"),
+    ("SVC", 2, "₡", "El Salvador Colon"),
+    ("SYP", 2, "£", "Syrian Pound"),
+    ("SZL", 2, "E", "Lilangeni"),
+    ("THB", 2, "฿", "Baht"),
+    ("TJS", 2, "SM", "Somoni"),
+    ("TMT", 2, "m", "Turkmenistan New Manat"),
+    ("TND", 3, "د.ت", "Tunisian Dinar"),
+    ("TOP", 2, "T$", "Pa'anga"),
+    ("TRY", 2, "₺", "Turkish Lira"),
+    ("TTD", 2, "$", "Trinidad and Tobago Dollar"),
+    ("TWD", 2, "NT$", "New Taiwan Dollar"),
+    ("TZS", 2, "TSh", "Tanzanian Shilling"),
+    ("UAH", 2, "₴", "Hryvnia"),
+    ("UGX", 0, "USh", "Uganda Shilling"),
+    ("USD", 2, "$", "US Dollar"),
+    ("UYU", 2, "$", "Peso Uruguayo"),
+    ("UZS", 2, "soʻm", "Uzbekistan Sum"),
+    ("VED", 2, "Bs.D", "Bolívar Soberano"),
+    ("VES", 2, "Bs.S", "Bolívar Soberano"),
+    ("VND", 0, "₫", "Dong"),
+    ("VUV", 0, "VT", "Vatu"),
+    ("WST", 2, "T", "Tala"),
+    ("XAF", 0, "FCFA", "CFA Franc BEAC"),
+    ("XCD", 2, "$", "East Caribbean Dollar"),
+    ("XCG", 2, "Cg", "Caribbean Guilder"),
+    ("XOF", 0, "CFA", "CFA Franc BCEAO"),
+    ("XPF", 0, "₣", "CFP Franc"),
+    ("YER", 2, "﷼", "Yemeni Rial"),
+    ("ZAR", 2, "R", "Rand"),
+    ("ZMW", 2, "ZK", "Zambian Kwacha"),
+    ("ZWG", 2, "ZiG", "Zimbabwe Gold"),
+)
+
+# Every supported currency by code (read-only)
+CURRENCIES: Mapping[str, Currency] = MappingProxyType(
+    {
+        code: Currency.create(code, symbol, name, minor_units=units)
+        for code, units, symbol, name in _ISO_4217
+    }
+)
+
+# Quantum of each currency's stored precision (e.g. Decimal("0.01"))
+_QUANTA: Mapping[str, Decimal] = MappingProxyType(
+    {
+        code: Decimal(1).scaleb(-min(currency.minor_units, AMOUNT_SCALE))
+        for code, currency in CURRENCIES.items()
+    }
+)
+
+
+def get_currency(code: str) -> Currency | None:
+    """
+    Look a currency up by ISO 4217 code (case-insensitive).
+
+    Args:
+        code: ISO 4217 currency code
+
+    Returns:
+        Currency if supported, None otherwise
+    """
+    return CURRENCIES.get(code.upper())
+
+
+def is_supported(code: str) -> bool:
+    """
+    Check if a currency code is supported (case-insensitive).
+
+    Args:
+        code: ISO 4217 currency code
+
+    Returns:
+        True if the currency is supported
+    """
+    return code.upper() in CURRENCIES
+
+
+def minor_units(code: str) -> int:
+    """
+    Get the number of decimal places of a currency's minor unit.
+
+    Args:
+        code: Supported ISO 4217 currency code
+
+    Returns:
+        Minor units (e.g. 2 for EUR, 0 for JPY, 3 for KWD)
+
+    Raises:
+        KeyError: If the currency is not supported
+    """
+    return CURRENCIES[code.upper()].minor_units
+
+
+def quantize_amount(amount: Decimal, code: str) -> Decimal:
+    """
+    Round an amount to the stored precision of its currency.
+
+    Args:
+        amount: Amount to round
+        code: Supported ISO 4217 currency code
+
+    Returns:
+        Amount rounded half up to min(minor units, AMOUNT_SCALE) places
+
+    Raises:
+        KeyError: If the currency is not supported
+    """
+    return amount.quantize(_QUANTA[code.upper()], ROUNDING)
+
+
+def quantize_amounts(amounts: Iterable[Decimal], code: str) -> list[Decimal]:
+    """
+    Round a batch of amounts of one currency (imports, bulk writes).
+
+    The quantum is looked up once for the whole batch.
+
+    Args:
+        amounts: Amounts to round
+        code: Supported ISO 4217 currency code
+
+    Returns:
+        Rounded amounts, in order
+
+    Raises:
+        KeyError: If the currency is not supported
+    """
+    quantize, quantum = Decimal.quantize, _QUANTA[code.upper()]
+    return [quantize(amount, quantum, ROUNDING) for amount in amounts]
+
+
+def fits_precision(amount: Decimal, code: str) -> bool:
+    """
+    Check an amount has no digits beyond its currency's stored precision.
+
+    Args:
+        amount: Amount to check
+        code: Supported ISO 4217 currency code
+
+    Returns:
+        True if quantizing the amount would not change it
+
+    Raises:
+        KeyError: If the currency is not supported
+    """
+    exponent = amount.as_tuple().exponent
+    return isinstance(exponent, int) and (
+        exponent >= _QUANTA[code.upper()].as_tuple().exponent
+        or amount == quantize_amount(amount, code)
+    )
+
+
+def currency_data_version() -> str:
+    """
+    Get a fingerprint of the currency registry.
+
+    The registry lives in code, so its fingerprint only changes with a
+    deploy that changes the currencies.
+
+    Returns:
+        Short hex digest of the registry
+    """
+    return _DATA_VERSION
+
+
+_DATA_VERSION = hashlib.sha256(
+    "|".join(
+        f"{c.code}:{c.symbol}:{c.name}:{c.minor_units}" for c in CURRENCIES.values()
+    ).encode()
+).hexdigest()[:16]
@@ -2,18 +2,35 @@
 Database connection and session management.
 
 This module provides async database session management using SQLAlchemy 2.0
-with PostgreSQL and asyncpg driver. Implements connection pooling.
+with PostgreSQL and asyncpg driver. Implements connection pooling,
+unit-of-work sessions and read-replica routing:
+- create_database_engine: Pooled engine for the primary or a replica
+- UnitOfWorkSession: AsyncSession committing once per request
+- release_connection: Return a session's connection before slow CPU work
+- RoutingSessionmaker: Session factory that sends read-only work to replicas
+- track_writes: Request-scoped write tracking for the last-write marker
 """
 
+import itertools
 import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.orm import Session
 
 from core.config import settings
+from core.pool_metrics import InstrumentedQueuePool, instrument_engine
+from core.slow_queries import enable_explain
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +40,18 @@ logger = logging.getLogger(__name__)
 # -----------------------------------------------------------------------------
 
 
-def create_database_engine(database_url: str | None = None) -> AsyncEngine:
+def create_database_engine(
+    database_url: str | None = None, name: str = "primary"
+) -> AsyncEngine:
     """
     Create async database engine with connection pooling.
 
+    The pool is instrumented (see core.pool_metrics) and reported as name;
+    sampled slow statements may be explained on it (see core.slow_queries).
+
     Args:
         database_url: Database URL. If None, uses settings.database_url
+        name: Pool name used in telemetry
 
     Returns:
         Configured AsyncEngine instance
@@ -51,7 +74,7 @@ def create_database_engine(database_url: str | None = None) -> AsyncEngine:
         max_overflow=settings.db_max_overflow,
         pool_pre_ping=settings.db_pool_pre_ping,
         pool_recycle=settings.db_pool_recycle,
-        poolclass=AsyncAdaptedQueuePool,
+        poolclass=InstrumentedQueuePool,
         # Additional performance settings
         pool_timeout=settings.db_pool_timeout,  # Wait up for a connection
         connect_args={
@@ -61,14 +84,343 @@ def create_database_engine(database_url: str | None = None) -> AsyncEngine:
         },
     )
 
+    instrument_engine(engine, name)
+    enable_explain(engine)
+
     logger.info(
-        f"Database engine created: pool_size={settings.db_pool_size}, "
+        f"Database engine created ({name}): pool_size={settings.db_pool_size}, "
         f"max_overflow={settings.db_max_overflow}"
     )
 
     return engine
 
 
+# -----------------------------------------------------------------------------
+# Unit of Work
+# -----------------------------------------------------------------------------
+
+# Session.info key enabling unit-of-work mode for a session
+UNIT_OF_WORK = "unit_of_work"
+
+
+class UnitOfWorkSession(AsyncSession):
+    """
+    AsyncSession that commits once per unit of work.
+
+    Services call commit() after each logical step (the entity, then its
+    audit log, ...). While session.info[UNIT_OF_WORK] is set, commit() only
+    flushes: SQL errors still surface at the call site and generated values
+    are populated, but the transaction - and its pooled connection - stays
+    open until get_db calls commit_unit_of_work() once at request end.
+
+    Like any AsyncSession, no connection is checked out until the first SQL
+    statement runs.
+
+    Example:
+        async with UnitOfWorkSession(engine, info={UNIT_OF_WORK: True}) as s:
+            s.add(obj)
+            await s.commit()  # Flush only
+            await s.commit_unit_of_work()  # Single COMMIT
+    """
+
+    async def commit(self) -> None:
+        """Flush in unit-of-work mode, otherwise commit."""
+        if self.info.get(UNIT_OF_WORK):
+            await self.flush()
+            return
+        await super().commit()
+
+    async def commit_unit_of_work(self) -> None:
+        """Commit the current transaction for real."""
+        await super().commit()
+
+
+async def release_connection(session: AsyncSession) -> None:
+    """
+    Return the session's connection to the pool before slow CPU work.
+
+    Ends the current transaction with a real commit (loaded objects stay
+    usable because sessions do not expire on commit); the next statement
+    checks out a connection again. Anything flushed so far becomes durable,
+    so call this before the request's writes - e.g. between loading a user
+    and verifying a password hash.
+
+    Args:
+        session: Session whose connection should be released
+    """
+    if not session.in_transaction():
+        return
+    if isinstance(session, UnitOfWorkSession):
+        await session.commit_unit_of_work()
+    else:
+        await session.commit()
+
+
+# -----------------------------------------------------------------------------
+# Read-Replica Routing
+# -----------------------------------------------------------------------------
+
+# Session.info key set once a session has flushed changes to the primary
+SESSION_HAS_WRITES = "has_writes"
+
+# Replication lag in seconds; 0 when the replica has replayed all received WAL
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+# Upper bound on remembered writers before expired entries are pruned
+_MAX_TRACKED_WRITERS = 10000
+
+# Last-write marker returned to clients (cookie, or echoed as a header), so
+# read-your-writes holds when the next request lands on another worker
+LAST_WRITE_COOKIE = "emerald_last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+
+# Tolerated clock skew between workers for last-write markers (seconds)
+_MARKER_CLOCK_SKEW = 1.0
+
+
+@dataclass
+class WriteTracker:
+    """Wall-clock time of the current request's last write, if any."""
+
+    written_at: float | None = None
+
+
+_write_tracker: ContextVar[WriteTracker | None] = ContextVar(
+    "write_tracker", default=None
+)
+
+
+@contextmanager
+def track_writes() -> Iterator[WriteTracker]:
+    """
+    Track primary writes made in this context (one request).
+
+    Yields:
+        WriteTracker updated whenever a session flushes changes
+    """
+    tracker = WriteTracker()
+    token = _write_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _write_tracker.reset(token)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_session_writes(session: Session, flush_context: object) -> None:
+    """Flag sessions that wrote, so their principal reads from the primary."""
+    session.info[SESSION_HAS_WRITES] = True
+    tracker = _write_tracker.get()
+    if tracker is not None:
+        tracker.written_at = time.time()
+
+
+@dataclass
+class _Replica:
+    """Health state of a single read replica."""
+
+    engine: AsyncEngine
+    sessionmaker: async_sessionmaker[AsyncSession]
+    checked_at: float = 0.0
+    unhealthy_until: float = 0.0
+    lag: float | None = None
+
+
+class RoutingSessionmaker:
+    """
+    Session factory routing read-only work to replicas.
+
+    Calling the instance returns a primary session, so it is a drop-in
+    replacement for async_sessionmaker. Read-only dependencies call
+    read_session() instead, which returns a replica session unless:
+    - No replica is configured
+    - The principal wrote within the sticky window (read-your-writes)
+    - Every replica lags more than max_lag_seconds or recently failed
+
+    Writes are remembered per principal in this process only. Across
+    workers, read-your-writes relies on the client returning the last-write
+    marker (LAST_WRITE_COOKIE or LAST_WRITE_HEADER, a Unix timestamp) that
+    ReadYourWritesMiddleware sets on responses to writing requests.
+
+    Replica lag is probed at most once per check_interval per replica; a
+    failed probe or query takes the replica out of rotation for
+    failure_cooldown seconds.
+
+    Example:
+        factory = RoutingSessionmaker(create_sessionmaker(engine), [replica])
+        session = await factory.read_session(principal="user-id")
+        if session is None:
+            ...  # Use the primary session
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: list[AsyncEngine] | None = None,
+        sticky_seconds: float = 5.0,
+        max_lag_seconds: float = 5.0,
+        check_interval: float = 10.0,
+        failure_cooldown: float = 30.0,
+    ):
+        """
+        Initialize routing sessionmaker.
+
+        Args:
+            primary: Sessionmaker bound to the primary engine
+            replicas: Read replica engines
+            sticky_seconds: Read-your-writes window after a principal's write
+            max_lag_seconds: Maximum tolerated replication lag
+            check_interval: Seconds between lag probes of a replica
+            failure_cooldown: Seconds a failed replica stays out of rotation
+        """
+        self.primary = primary
+        self._replicas = [
+            _Replica(engine=engine, sessionmaker=create_sessionmaker(engine))
+            for engine in replicas or []
+        ]
+        self._next = itertools.cycle(range(len(self._replicas)))
+        self._last_write: dict[str, float] = {}
+        self.sticky_seconds = sticky_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self.failure_cooldown = failure_cooldown
+
+    def __call__(self) -> AsyncSession:
+        """Return a new session bound to the primary."""
+        return self.primary()
+
+    @property
+    def has_replicas(self) -> bool:
+        """Whether any read replica is configured."""
+        return bool(self._replicas)
+
+    def mark_write(self, principal: str) -> None:
+        """
+        Record that principal just wrote to the primary.
+
+        Args:
+            principal: Key identifying the writer (user ID or client address)
+        """
+        now = time.monotonic()
+        if len(self._last_write) >= _MAX_TRACKED_WRITERS:
+            cutoff = now - self.sticky_seconds
+            self._last_write = {
+                key: at for key, at in self._last_write.items() if at > cutoff
+            }
+        self._last_write[principal] = now
+
+    def is_sticky(self, principal: str | None, last_write: float | None = None) -> bool:
+        """
+        Whether the caller must read from the primary to see its own writes.
+
+        Args:
+            principal: Key identifying the reader
+            last_write: Client-returned last-write marker (Unix timestamp)
+        """
+        if last_write is not None:
+            age = time.time() - last_write
+            if -_MARKER_CLOCK_SKEW <= age < self.sticky_seconds:
+                return True
+        if principal is None:
+            return False
+        written_at = self._last_write.get(principal)
+        return (
+            written_at is not None
+            and time.monotonic() - written_at < self.sticky_seconds
+        )
+
+    def mark_failed(self, session: AsyncSession) -> None:
+        """
+        Take the replica behind session out of rotation after a failure.
+
+        Args:
+            session: Session previously returned by read_session()
+        """
+        for replica in self._replicas:
+            if session.bind is replica.engine:
+                replica.unhealthy_until = time.monotonic() + self.failure_cooldown
+                logger.warning(
+                    f"Read replica {replica.engine.url.host} failed, "
+                    f"routing reads elsewhere for {self.failure_cooldown}s"
+                )
+
+    async def read_session(
+        self, principal: str | None = None, last_write: float | None = None
+    ) -> AsyncSession | None:
+        """
+        Return a session on a healthy replica, or None to use the primary.
+
+        Args:
+            principal: Key identifying the reader, used for stickiness
+            last_write: Client-returned last-write marker (Unix timestamp)
+
+        Returns:
+            Replica AsyncSession, or None when reads must go to the primary
+        """
+        if not self._replicas or self.is_sticky(principal, last_write):
+            return None
+
+        for _ in range(len(self._replicas)):
+            replica = self._replicas[next(self._next)]
+            if await self._is_usable(replica):
+                return replica.sessionmaker()
+
+        logger.warning("No healthy read replica available, reading from primary")
+        return None
+
+    async def _is_usable(self, replica: _Replica) -> bool:
+        """Check replica health, probing its lag when the last probe is stale."""
+        now = time.monotonic()
+        if now < replica.unhealthy_until:
+            return False
+
+        if now - replica.checked_at >= self.check_interval:
+            # Claim the probe first so concurrent requests reuse the last verdict
+            replica.checked_at = now
+            try:
+                async with replica.engine.connect() as conn:
+                    replica.lag = float(await conn.scalar(REPLICA_LAG_QUERY) or 0)
+            except Exception as e:
+                logger.warning(
+                    f"Read replica {replica.engine.url.host} probe failed: {e}"
+                )
+                replica.lag = None
+                replica.unhealthy_until = now + self.failure_cooldown
+                return False
+
+        if replica.lag is None or replica.lag > self.max_lag_seconds:
+            return False
+        return True
+
+
+def create_sessionmaker(
+    engine: AsyncEngine, unit_of_work: bool = False
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Create the application session factory for an engine.
+
+    Args:
+        engine: Engine the sessions are bound to
+        unit_of_work: Whether sessions defer commits to commit_unit_of_work()
+
+    Returns:
+        async_sessionmaker producing UnitOfWorkSession instances
+    """
+    return async_sessionmaker(
+        engine,
+        class_=UnitOfWorkSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+        info={UNIT_OF_WORK: unit_of_work},
+    )
+
+
 # -----------------------------------------------------------------------------
 # Lifecycle Management
 # -----------------------------------------------------------------------------
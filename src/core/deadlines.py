@@ -0,0 +1,199 @@
+"""
+Per-route statement timeouts and client request deadlines.
+
+This module provides:
+- RequestBudget: DB time budget of one request (route timeout + client deadline)
+- get_request_budget: Budget of a request, created on first use
+- StatementTimeout: Route dependency overriding the statement timeout
+- is_statement_timeout: Detect PostgreSQL query cancellation errors
+- DEADLINE_HEADER: Header carrying the client's remaining wait time
+
+get_db attaches the request's budget to its session. Each time the session
+begins a transaction, SET LOCAL statement_timeout is issued with the
+smaller of the route's timeout and the time left before the client
+deadline. A request is one transaction (unit of work), so once the client
+deadline is the tighter limit, the timeout is lowered again before each
+later statement to what is left; a statement due after the deadline fails
+without reaching the database. PostgreSQL cancels statements that overrun
+the timeout; the transaction is rolled back, the connection returns to the
+pool and the client gets a 504 (see core.handlers.database_error_handler).
+
+Example:
+    @router.get("", dependencies=[Depends(StatementTimeout(5000))])
+    async def search(...): ...
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, SessionTransaction
+
+from core.config import settings
+from core.exceptions import RequestTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Remaining milliseconds the client is willing to wait for the response
+DEADLINE_HEADER = "X-Request-Deadline-Ms"
+
+# Session.info key holding the request's RequestBudget
+REQUEST_BUDGET = "request_budget"
+
+# PostgreSQL SQLSTATE for query_canceled (statement_timeout, cancel request)
+QUERY_CANCELED_SQLSTATE = "57014"
+
+# Connections of request transactions with a client deadline, and their
+# budget (Connection objects are per transaction; entries go with them)
+_connection_budgets: WeakKeyDictionary[Connection, "RequestBudget"] = (
+    WeakKeyDictionary()
+)
+
+
+@dataclass
+class RequestBudget:
+    """
+    DB time budget of one request.
+
+    Attributes:
+        statement_timeout_ms: Maximum duration of any statement
+        deadline: Monotonic time after which the client has given up
+    """
+
+    statement_timeout_ms: int
+    deadline: float | None = None
+
+    @classmethod
+    def from_request(cls, request: Request) -> "RequestBudget":
+        """
+        Create the budget for a request from settings and its deadline header.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            RequestBudget with the default statement timeout
+        """
+        deadline = None
+        header = request.headers.get(DEADLINE_HEADER)
+        if header is not None:
+            try:
+                deadline = time.monotonic() + max(int(header), 0) / 1000
+            except ValueError:
+                logger.debug(f"Ignoring invalid {DEADLINE_HEADER} header: {header!r}")
+        return cls(
+            statement_timeout_ms=settings.db_statement_timeout_ms, deadline=deadline
+        )
+
+    def effective_timeout_ms(self) -> int:
+        """
+        Get the statement timeout to apply now.
+
+        Returns:
+            Milliseconds (<= 0 when the client deadline has already passed)
+        """
+        if self.deadline is None:
+            return self.statement_timeout_ms
+        remaining_ms = int((self.deadline - time.monotonic()) * 1000)
+        return min(self.statement_timeout_ms, remaining_ms)
+
+
+def get_request_budget(request: Request) -> RequestBudget:
+    """
+    Get the DB time budget of a request, creating it on first use.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        RequestBudget stored in request.state
+    """
+    budget = getattr(request.state, "db_budget", None)
+    if budget is None:
+        budget = RequestBudget.from_request(request)
+        request.state.db_budget = budget
+    return budget
+
+
+class StatementTimeout:
+    """
+    Route dependency setting the route's statement timeout.
+
+    Route dependencies are resolved before the session runs its first
+    statement, so the timeout applies to the whole request.
+    """
+
+    def __init__(self, timeout_ms: int):
+        """
+        Initialize statement timeout.
+
+        Args:
+            timeout_ms: Maximum duration of any statement of the route
+        """
+        self.timeout_ms = timeout_ms
+
+    async def __call__(self, request: Request) -> None:
+        """Apply the timeout to the current request's budget."""
+        get_request_budget(request).statement_timeout_ms = self.timeout_ms
+
+
+def is_statement_timeout(exc: BaseException) -> bool:
+    """
+    Check whether a database error is a cancelled statement.
+
+    Args:
+        exc: Exception raised by SQLAlchemy
+
+    Returns:
+        True if PostgreSQL cancelled the statement (SQLSTATE 57014)
+    """
+    return (
+        isinstance(exc, DBAPIError)
+        and getattr(exc.orig, "sqlstate", None) == QUERY_CANCELED_SQLSTATE
+    )
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Apply the request's statement timeout to each new transaction."""
+    budget: RequestBudget | None = session.info.get(REQUEST_BUDGET)
+    if budget is None:
+        return
+
+    timeout_ms = budget.effective_timeout_ms()
+    if timeout_ms <= 0:
+        raise RequestTimeoutError("Client deadline expired before the query started")
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+    if budget.deadline is not None:
+        _connection_budgets[connection] = budget
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _apply_remaining_deadline(
+    connection: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Lower the statement timeout to the time left before the client deadline."""
+    budget = _connection_budgets.get(connection)
+    if budget is None:
+        return
+
+    timeout_ms = budget.effective_timeout_ms()
+    if timeout_ms >= budget.statement_timeout_ms:
+        return  # The route timeout set at begin is still the tighter limit
+    if timeout_ms <= 0:
+        raise RequestTimeoutError("Client deadline expired before the query started")
+    # Raw cursor: no events, so this does not recurse
+    cursor.execute(f"SET LOCAL statement_timeout = {timeout_ms}")
@@ -20,7 +20,8 @@ Exception hierarchy:
     ├── ValidationError (422)
     │   ├── WeakPasswordError
     │   └── InvalidInputError
-    └── RateLimitExceededError (429)
+    ├── RateLimitExceededError (429)
+    └── RequestTimeoutError (504)
 """
 
 from typing import Any
@@ -361,6 +362,27 @@ class RateLimitExceededError(AppException):
         )
 
 
+# =============================================================================
+# Timeout Error (504 Gateway Timeout)
+# =============================================================================
+
+
+class RequestTimeoutError(AppException):
+    """Raised when a request's DB time budget or client deadline expires."""
+
+    def __init__(
+        self,
+        message: str = "The request took too long and was cancelled.",
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            message=message,
+            status_code=504,
+            error_code="REQUEST_TIMEOUT",
+            details=details,
+        )
+
+
 # =============================================================================
 # Encryption Error (500 Internal Server Error)
 # =============================================================================
@@ -5,6 +5,7 @@ This module provides:
 - Custom application exception handler (AppException)
 - Pydantic validation error handler (RequestValidationError)
 - General unhandled exception handler (Exception)
+- Database error handler (DBAPIError, cancelled statements -> 504)
 - Rate limit exceeded handler (RateLimitExceeded)
 """
 
@@ -14,9 +15,11 @@ from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy.exc import DBAPIError
 
 from core.config import settings
-from core.exceptions import AppException
+from core.deadlines import is_statement_timeout
+from core.exceptions import AppException, RequestTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +121,18 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     )
 
 
+async def database_error_handler(request: Request, exc: DBAPIError) -> JSONResponse:
+    """
+    Handle database errors.
+
+    Statements cancelled by statement_timeout (route budget or client
+    deadline) return 504; any other database error is unexpected.
+    """
+    if is_statement_timeout(exc):
+        return await app_exception_handler(request, RequestTimeoutError())
+    return await general_exception_handler(request, exc)
+
+
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
     """
     Handle rate limit exceeded errors.
@@ -0,0 +1,286 @@
+"""
+Idempotency keys for write endpoints.
+
+This module provides:
+- IdempotentRoute: APIRoute honouring an Idempotency-Key header on POST
+- IdempotencyStore: Redis-backed record of in-flight and completed requests
+- idempotency_store: Process-wide IdempotencyStore
+- IDEMPOTENCY_HEADER / IDEMPOTENCY_REPLAYED_HEADER: Header names
+
+A client retrying a POST sends the same Idempotency-Key. The first
+request claims the key in Redis (SET NX) and, once its transaction has
+committed, stores its response for IDEMPOTENCY_TTL seconds. Retries then
+get the stored response (marked with Idempotent-Replayed: true) without
+re-running the endpoint. A duplicate arriving while the first request is
+still running waits for it (up to IDEMPOTENCY_LOCK_TIMEOUT seconds, 409
+after that). Keys are scoped to the caller and the request path, and a
+key reused with a different body is rejected with 422.
+
+Only successful (2xx) responses are stored: a failed request rolled back,
+so its key is released and a retry runs again. While Redis is
+unavailable, requests run without idempotency protection.
+
+Example:
+    router = APIRouter(prefix="/items", route_class=IdempotentRoute)
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from types import TracebackType
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from pydantic_core import from_json, to_json
+
+from core.config import settings
+from core.exceptions import ConflictError, InvalidInputError
+from core.rate_limit import rate_limit_key
+from core.redis import RedisManager, RedisUnavailableError, redis_manager
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Longest accepted Idempotency-Key (UUIDs and ULIDs fit comfortably)
+MAX_KEY_LENGTH = 255
+
+# Deletes the in-flight claim only if it is still ours
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+class IdempotencyStore:
+    """
+    Claims, stores and replays requests by idempotency key.
+
+    Records are JSON documents under one Redis key per (caller, path,
+    idempotency key): {"fingerprint", "owner"} while in flight, then
+    {"fingerprint", "status", "headers", "body"} once completed.
+    """
+
+    def __init__(
+        self,
+        redis: RedisManager,
+        ttl: int,
+        lock_timeout: float,
+        prefix: str = "idempotency:",
+    ):
+        """
+        Initialize IdempotencyStore.
+
+        Args:
+            redis: Shared Redis pool
+            ttl: Seconds completed responses are replayed
+            lock_timeout: Seconds a claim is held (and duplicates wait)
+            prefix: Redis key prefix
+        """
+        self.redis = redis
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.prefix = prefix
+        self._release: Any = None
+
+    async def execute(self, request: Request, key: str, handler: Handler) -> Response:
+        """
+        Run handler once per idempotency key, replaying its response after.
+
+        Args:
+            request: Incoming request
+            key: Idempotency-Key header value
+            handler: Route handler to run if the key is new
+
+        Returns:
+            The handler's response, or the stored response of the first request
+
+        Raises:
+            InvalidInputError: If the key is malformed or was used for a
+                different request body
+            ConflictError: If the first request is still running after
+                lock_timeout seconds
+        """
+        if not key or len(key) > MAX_KEY_LENGTH or not key.isascii():
+            raise InvalidInputError(
+                field=IDEMPOTENCY_HEADER,
+                message=f"{IDEMPOTENCY_HEADER} must be 1-{MAX_KEY_LENGTH} "
+                "ASCII characters",
+            )
+
+        body = await request.body()  # Cached: the endpoint reads it again
+        fingerprint = hashlib.sha256(
+            b"%s\n%s\n%s" % (request.method.encode(), request.url.query.encode(), body)
+        ).hexdigest()
+        storage_key = (
+            f"{self.prefix}{rate_limit_key(request.scope)}:{request.url.path}:{key}"
+        )
+        claim = to_json({"fingerprint": fingerprint, "owner": uuid.uuid4().hex})
+
+        try:
+            record = await self._claim_or_wait(storage_key, claim, fingerprint)
+        except RedisUnavailableError as e:
+            logger.warning(f"Idempotency unavailable, running request once: {e}")
+            return await handler(request)
+
+        if record is not None:
+            logger.info(f"Replaying response for idempotency key {key}")
+            return self._replay(record)
+
+        response: Response | None = None
+
+        async def finish(
+            exc_type: type[BaseException] | None,
+            exc: BaseException | None,
+            tb: TracebackType | None,
+        ) -> bool:
+            if exc is None and response is not None:
+                await self._complete(storage_key, claim, fingerprint, response)
+            else:
+                await self._release_claim(storage_key, claim)
+            return False
+
+        # Pushed before the route's function-scoped dependencies, so it exits
+        # after them (i.e. after get_db's COMMIT) and before the response is
+        # sent: a failed COMMIT releases the key instead of storing a success
+        request.scope["fastapi_function_astack"].push_async_exit(finish)
+        response = await handler(request)
+        return response
+
+    async def _claim_or_wait(
+        self, storage_key: str, claim: bytes, fingerprint: str
+    ) -> dict[str, Any] | None:
+        """
+        Claim the key, or wait for the request that holds it.
+
+        Returns:
+            None if the key was claimed, else the completed record
+        """
+        deadline = time.monotonic() + self.lock_timeout
+        delay = 0.01
+        while True:
+            claimed = await self.redis.execute(
+                lambda client: client.set(
+                    storage_key, claim, nx=True, px=int(self.lock_timeout * 1000)
+                )
+            )
+            if claimed:
+                return None
+
+            raw = await self.redis.execute(lambda client: client.get(storage_key))
+            if raw is None:
+                continue  # Released (or expired) meanwhile: claim again
+
+            record = from_json(raw)
+            if record["fingerprint"] != fingerprint:
+                raise InvalidInputError(
+                    field=IDEMPOTENCY_HEADER,
+                    message=f"{IDEMPOTENCY_HEADER} was already used for a "
+                    "different request",
+                )
+            if "status" in record:
+                return record
+            if time.monotonic() >= deadline:
+                raise ConflictError(
+                    message="A request with this Idempotency-Key is still in progress"
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    async def _complete(
+        self, storage_key: str, claim: bytes, fingerprint: str, response: Response
+    ) -> None:
+        """Store a successful response, or release the claim otherwise."""
+        body = getattr(response, "body", None)
+        if not 200 <= response.status_code < 300 or not isinstance(body, bytes):
+            # Errors are retryable; streamed bodies cannot be replayed
+            await self._release_claim(storage_key, claim)
+            return
+
+        record = to_json(
+            {
+                "fingerprint": fingerprint,
+                "status": response.status_code,
+                "headers": [
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in response.raw_headers
+                ],
+                "body": base64.b64encode(body).decode(),
+            }
+        )
+        try:
+            await self.redis.execute(
+                lambda client: client.set(storage_key, record, ex=self.ttl)
+            )
+        except RedisUnavailableError as e:
+            logger.warning(f"Failed to store idempotent response: {e}")
+
+    async def _release_claim(self, storage_key: str, claim: bytes) -> None:
+        """Drop our in-flight claim so a retry runs the request again."""
+        try:
+            await self.redis.execute(
+                lambda client: self._get_release_script(client)(
+                    keys=[storage_key], args=[claim], client=client
+                )
+            )
+        except RedisUnavailableError as e:
+            logger.warning(f"Failed to release idempotency key: {e}")
+
+    def _get_release_script(self, client: Any) -> Any:
+        """Get the release script (EVALSHA, loaded on first use)."""
+        if self._release is None:
+            self._release = client.register_script(_RELEASE_SCRIPT)
+        return self._release
+
+    @staticmethod
+    def _replay(record: dict[str, Any]) -> Response:
+        """Rebuild a stored response."""
+        response = Response(
+            content=base64.b64decode(record["body"]), status_code=record["status"]
+        )
+        response.raw_headers = [
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in record["headers"]
+        ]
+        response.headers[IDEMPOTENCY_REPLAYED_HEADER] = "true"
+        return response
+
+
+# Process-wide store
+idempotency_store = IdempotencyStore(
+    redis_manager,
+    ttl=settings.idempotency_ttl,
+    lock_timeout=settings.idempotency_lock_timeout,
+)
+
+
+class IdempotentRoute(APIRoute):
+    """
+    Route class making POST endpoints honour the Idempotency-Key header.
+
+    Requests without the header, and other methods, are unaffected.
+    """
+
+    def get_route_handler(self) -> Handler:
+        """Wrap the endpoint handler of POST routes with idempotency_store."""
+        handler = super().get_route_handler()
+        if "POST" not in self.methods:
+            return handler
+
+        async def idempotent_handler(request: Request) -> Response:
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if key is None:
+                return await handler(request)
+            return await idempotency_store.execute(request, key, handler)
+
+        return idempotent_handler
@@ -1,11 +1,20 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from core import settings
-from core.database import close_database_connection, create_database_engine
+from core.database import (
+    RoutingSessionmaker,
+    close_database_connection,
+    create_database_engine,
+    create_sessionmaker,
+)
+from core.catalog import reference_catalog
+from core.rate_limit import rate_limiter
+from core.redis import redis_manager
+from core.warmup import warm_up
 
 logger = logging.getLogger(__name__)
 
@@ -20,29 +29,76 @@ async def lifespan(app: FastAPI):  # type: ignore
 
     Handles:
     - Database engine creation and storage in app.state
+    - Read replica engine creation (when configured)
     - Session factory creation
+    - Reference catalog (loaded by the warm-up, reloaded on version change)
+    - Background warm-up (app.state.ready is set once it finishes)
+    - Shared Redis connection pool (probed in the background)
+    - Rate limit reconciliation with Redis (when rate limiting is enabled)
     - Resource cleanup on shutdown
     """
     logger.info(f"Starting {settings.app_name} v{settings.version}")
     logger.info(f"Environment: {settings.environment}")
 
-    # Create database engine
+    # Create database engines
     engine = create_database_engine()
+    replica_engines = [
+        create_database_engine(url, name=f"replica-{i}")
+        for i, url in enumerate(settings.database_replica_url_strs, start=1)
+    ]
 
-    # Create sessionmaker and store in app state
-    app.state.sessionmaker = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autocommit=False,
-        autoflush=False,
+    # Create routing sessionmaker and store in app state
+    app.state.sessionmaker = RoutingSessionmaker(
+        create_sessionmaker(engine, unit_of_work=settings.db_unit_of_work),
+        replica_engines,
+        sticky_seconds=settings.db_replica_sticky_seconds,
+        max_lag_seconds=settings.db_replica_max_lag_seconds,
+        check_interval=settings.db_replica_check_interval,
+        failure_cooldown=settings.db_replica_failure_cooldown,
     )
+    if replica_engines:
+        logger.info(f"Read routing enabled across {len(replica_engines)} replica(s)")
 
     logger.info("Sessionmaker created successfully")
 
+    reference_catalog.start(app.state.sessionmaker)
+
+    # Warm up in the background; readiness reports ready once it finishes
+    app.state.ready = False
+    warmup_task = None
+    if settings.startup_warmup_enabled:
+        warmup_task = asyncio.create_task(
+            _warm_up_then_ready(app, [engine, *replica_engines])
+        )
+    else:
+        app.state.ready = True
+
+    # Shared Redis pool (connections open on demand)
+    redis_manager.start()
+    if settings.rate_limit_enabled:
+        rate_limiter.start()
+
     yield
 
+    await rate_limiter.stop()
+    await redis_manager.stop()
+
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
     # Cleanup on shutdown
     logger.info("Shutting down application")
     await close_database_connection(engine)
+    for replica_engine in replica_engines:
+        await close_database_connection(replica_engine)
     app.state.sessionmaker = None
+
+
+async def _warm_up_then_ready(app: FastAPI, engines: list) -> None:  # type: ignore
+    """Run the warm-up, then mark the application ready."""
+    try:
+        await warm_up(engines)
+    except Exception as e:
+        logger.error(f"Warm-up failed: {e}")
+    finally:
+        app.state.ready = True
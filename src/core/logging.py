@@ -7,16 +7,24 @@ This module provides structured logging configuration with support for:
 - JSON logging (production, for log aggregation)
 - Multiple log levels and formatters
 - Separate error log file
+
+Log files (and their directory) are created when the first record is
+written, not when logging is configured.
 """
 
 import logging
 import logging.config
 import sys
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
 from core.config import settings
 
+# Request ID of the request being handled (set by RequestIDMiddleware)
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
 
 def setup_logging() -> None:
     """
@@ -31,11 +39,6 @@ def setup_logging() -> None:
 
     Call this function at application startup, before any logging occurs.
     """
-    # Create logs directory if it doesn't exist
-    if settings.log_file_enabled:
-        log_dir = Path(settings.log_file_path).parent
-        log_dir.mkdir(parents=True, exist_ok=True)
-
     # Build logging configuration dictionary
     logging_config = get_logging_config()
 
@@ -141,24 +144,26 @@ def get_logging_config() -> dict[str, Any]:
     # Add file handlers if enabled
     if settings.log_file_enabled:
         config["handlers"]["file"] = {
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "core.logging.LazyRotatingFileHandler",
             "level": settings.log_level,
             "formatter": file_formatter,
             "filename": settings.log_file_path,
             "maxBytes": settings.log_file_max_bytes,
             "backupCount": settings.log_file_backup_count,
             "encoding": "utf-8",
+            "delay": True,
             "filters": ["correlation_id"],
         }
 
         config["handlers"]["error_file"] = {
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "core.logging.LazyRotatingFileHandler",
             "level": "ERROR",
             "formatter": file_formatter,
             "filename": str(Path(settings.log_file_path).parent / "error.log"),
             "maxBytes": settings.log_file_max_bytes,
             "backupCount": settings.log_file_backup_count,
             "encoding": "utf-8",
+            "delay": True,
             "filters": ["correlation_id"],
         }
 
@@ -169,6 +174,21 @@ def get_logging_config() -> dict[str, Any]:
     return config
 
 
+class LazyRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that creates its file and directory on first write.
+
+    Used with delay=True so configuring logging (at import of main) does not
+    touch the filesystem; the log directory is created only once something
+    is actually logged to the file.
+    """
+
+    def _open(self):  # type: ignore[no-untyped-def]
+        """Create the parent directory, then open the log file."""
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 class CorrelationIdFilter(logging.Filter):
     """
     Logging filter to add correlation_id to log records.
@@ -191,10 +211,9 @@ class CorrelationIdFilter(logging.Filter):
         Returns:
             True (always allow the log record)
         """
-        # Try to get correlation_id from context
-        # This will be set by middleware in actual requests
+        # Get correlation_id from context (set by middleware in requests)
         if not hasattr(record, "correlation_id"):
-            record.correlation_id = "no-request-id"
+            record.correlation_id = request_id_var.get() or "no-request-id"
 
         return True
 
@@ -5,27 +5,40 @@ This module provides:
 - Request ID generation and tracking
 - Security headers middleware
 - Request/response logging
+- Per-request SQL query recording
+- Read-your-writes marker for replica routing across workers
+
+All middleware are pure ASGI: they wrap the send callable instead of
+subclassing BaseHTTPMiddleware, so a request does not pay for an extra
+task, memory stream and response re-wrapping per middleware, and
+streaming responses pass through untouched. Non-HTTP scopes (lifespan,
+websocket) are forwarded unchanged.
 """
 
 import logging
+import math
 import time
 import uuid
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+from core.database import LAST_WRITE_COOKIE, LAST_WRITE_HEADER, track_writes
+from core.logging import request_id_var
+from core.query_recorder import record_queries
 
 logger = logging.getLogger(__name__)
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware to generate and track request IDs.
 
     This middleware:
     - Generates a unique UUID for each request
-    - Stores it in request.state.request_id
+    - Stores it in the ASGI scope state (request.state.request_id) and the
+      request_id_var context
     - Adds X-Request-ID header to responses
     - Enables request tracing across services
 
@@ -35,33 +48,49 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Error responses (for debugging)
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:  # type: ignore
+    def __init__(self, app: ASGIApp):
         """
-        Process request and add request ID.
+        Initialize RequestIDMiddleware.
 
         Args:
-            request: FastAPI Request object
-            call_next: Next middleware or endpoint handler
+            app: ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and add request ID.
 
-        Returns:
-            Response with X-Request-ID header
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate unique request ID
         request_id = str(uuid.uuid4())
 
         # Store in request state for use in endpoints and logging
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+        token = request_id_var.set(request_id)
 
-        # Process request
-        response = await call_next(request)
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-
-        return response  # type: ignore
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all responses.
 
@@ -73,7 +102,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - Strict-Transport-Security: Force HTTPS (production only)
     - Referrer-Policy: strict-origin-when-cross-origin
 
-    These headers protect against common web vulnerabilities.
+    These headers protect against common web vulnerabilities. The header
+    list is encoded once, when the middleware is created.
     """
 
     def __init__(self, app: ASGIApp, enable_hsts: bool = False):
@@ -84,29 +114,9 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             app: ASGI application
             enable_hsts: Enable Strict-Transport-Security header (production only)
         """
-        super().__init__(app)
+        self.app = app
         self.enable_hsts = enable_hsts
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:  # type: ignore
-        """
-        Process request and add security headers.
-
-        Args:
-            request: FastAPI Request object
-            call_next: Next middleware or endpoint handler
-
-        Returns:
-            Response with security headers
-        """
-        # Process request
-        response = await call_next(request)
-
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
         # Content Security Policy
         # This is a strict policy - adjust based on your needs
         # Note: We allow cdn.jsdelivr.net and fastapi.tiangolo.com for Swagger UI
@@ -124,21 +134,60 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "form-action 'self'",
             "worker-src 'self' blob:",
         ]
-        response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
+
+        headers = {
+            "X-Content-Type-Options": "nosniff",
+            "X-Frame-Options": "DENY",
+            "X-XSS-Protection": "1; mode=block",
+            "Referrer-Policy": "strict-origin-when-cross-origin",
+            "Content-Security-Policy": "; ".join(csp_directives),
+        }
 
         # HSTS (only in production with HTTPS)
-        if self.enable_hsts:
+        if enable_hsts:
             # max-age=31536000 = 1 year
             # includeSubDomains = apply to all subdomains
             # preload = submit to HSTS preload list
-            response.headers["Strict-Transport-Security"] = (
+            headers["Strict-Transport-Security"] = (
                 "max-age=31536000; includeSubDomains; preload"
             )
 
-        return response  # type: ignore
+        self.headers: list[tuple[bytes, bytes]] = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers.items()
+        ]
+        self._header_names = frozenset(name for name, _ in self.headers)
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and add security headers.
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Security headers replace any value set by the endpoint
+                message["headers"] = [
+                    *(
+                        (name, value)
+                        for name, value in message.get("headers", ())
+                        if name.lower() not in self._header_names
+                    ),
+                    *self.headers,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
+
+
+class RequestLoggingMiddleware:
     """
     Middleware to log all incoming requests and outgoing responses.
 
@@ -154,51 +203,68 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     - INFO: Successful requests (2xx, 3xx)
     - WARNING: Client errors (4xx)
     - ERROR: Server errors (5xx)
+
+    X-Response-Time measures the time until the response starts; the log
+    line is written once the last body chunk has been sent.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:  # type: ignore
+    def __init__(self, app: ASGIApp):
         """
-        Process request and log details.
+        Initialize RequestLoggingMiddleware.
 
         Args:
-            request: FastAPI Request object
-            call_next: Next middleware or endpoint handler
+            app: ASGI application
+        """
+        self.app = app
 
-        Returns:
-            Response object
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        # Record start time
-        start_time = time.time()
+        Process request and log details.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Get request details
-        method = request.method
-        path = request.url.path
-        client_host = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("User-Agent", "unknown")
-        request_id = getattr(request.state, "request_id", "unknown")
+        # Record start time
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add response time header
+                duration = time.perf_counter() - start_time
+                MutableHeaders(scope=message)["X-Response-Time"] = f"{duration:.3f}s"
+            await send(message)
 
         # Process request
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_timing)
         except Exception as e:
             # Log exception
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logger.error(
-                f"Request failed: {method} {path} - "
-                f"request_id={request_id} client={client_host} "
+                f"Request failed: {scope['method']} {scope['path']} - "
+                f"request_id={_request_id(scope)} client={_client_host(scope)} "
                 f"duration={duration:.3f}s error={str(e)}",
                 exc_info=True,
             )
             raise
 
         # Calculate response time
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         # Log based on status code
-        status_code = response.status_code
+        user_agent = Headers(scope=scope).get("User-Agent", "unknown")
         log_message = (
-            f"{method} {path} {status_code} - "
-            f"request_id={request_id} client={client_host} "
+            f"{scope['method']} {scope['path']} {status_code} - "
+            f"request_id={_request_id(scope)} client={_client_host(scope)} "
             f"duration={duration:.3f}s user_agent={user_agent}"
         )
 
@@ -209,7 +275,119 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         else:
             logger.error(log_message)
 
-        # Add response time header
-        response.headers["X-Response-Time"] = f"{duration:.3f}s"
 
-        return response  # type: ignore
+class QueryRecorderMiddleware:
+    """
+    Middleware recording the SQL statements each request executes.
+
+    This middleware:
+    - Activates a QueryRecorder for the request (see core.query_recorder)
+    - Logs a warning when a statement shape repeats (possible N+1)
+    - Logs a warning when a route's QueryBudget is exceeded
+    - Adds X-DB-Query-Count and X-DB-Time headers in debug mode
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize QueryRecorderMiddleware.
+
+        Args:
+            app: ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request while recording its queries.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http" or not settings.query_recorder_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        with record_queries() as recorder:
+
+            async def send_with_query_stats(message: Message) -> None:
+                if message["type"] == "http.response.start" and settings.debug:
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(recorder.count)
+                    headers["X-DB-Time"] = f"{recorder.total_time:.3f}s"
+                await send(message)
+
+            await self.app(scope, receive, send_with_query_stats)
+
+        # Label with the route template so repeated shapes group per endpoint
+        route = scope.get("route")
+        recorder.report(f"{scope['method']} {getattr(route, 'path', scope['path'])}")
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware returning a last-write marker to clients that wrote.
+
+    Replica stickiness is otherwise remembered only by the worker that
+    served the write. This middleware:
+    - Tracks whether the request flushed changes to the primary
+    - Sets the LAST_WRITE_COOKIE cookie and LAST_WRITE_HEADER header (Unix
+      timestamp of the write) on such responses, valid for the sticky window
+
+    get_read_db honours the marker on whichever worker the next read lands.
+    """
+
+    def __init__(self, app: ASGIApp, sticky_seconds: float):
+        """
+        Initialize ReadYourWritesMiddleware.
+
+        Args:
+            app: ASGI application
+            sticky_seconds: Read-your-writes window after a write
+        """
+        self.app = app
+        self.max_age = math.ceil(sticky_seconds)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request while tracking its writes.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_writes() as tracker:
+
+            async def send_with_marker(message: Message) -> None:
+                if (
+                    message["type"] == "http.response.start"
+                    and tracker.written_at is not None
+                ):
+                    marker = f"{tracker.written_at:.3f}"
+                    headers = MutableHeaders(scope=message)
+                    headers[LAST_WRITE_HEADER] = marker
+                    headers.append(
+                        "Set-Cookie",
+                        f"{LAST_WRITE_COOKIE}={marker}; Max-Age={self.max_age}; "
+                        "Path=/; HttpOnly; SameSite=Lax",
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_marker)
+
+
+def _request_id(scope: Scope) -> str:
+    """Get the request ID set by RequestIDMiddleware."""
+    return scope.get("state", {}).get("request_id", "unknown")
+
+
+def _client_host(scope: Scope) -> str:
+    """Get the client address of a request."""
+    client = scope.get("client")
+    return client[0] if client else "unknown"
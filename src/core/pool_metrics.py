@@ -0,0 +1,315 @@
+"""
+Connection pool telemetry.
+
+This module provides:
+- Histogram: Fixed-bucket histogram for durations
+- PoolMetrics: Per-engine pool counters, histograms and saturation alarms
+- InstrumentedQueuePool: AsyncAdaptedQueuePool timing connection checkout waits
+- instrument_engine: Attach PoolMetrics to an engine through pool events
+- get_pool_stats: Snapshot of every instrumented pool
+
+Pool events (connect, checkout, checkin, close, invalidate) feed counters,
+connection hold time and connection lifetime. SQLAlchemy has no event for
+"waiting for a connection", so InstrumentedQueuePool times _do_get() to
+measure checkout waits and count pool timeouts.
+"""
+
+import logging
+import math
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bucket upper bounds in seconds
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+HOLD_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+LIFETIME_BUCKETS = (1, 10, 60, 300, 900, 1800, 3600, 7200)
+
+# Minimum seconds between two alarms of the same kind for one pool
+ALARM_INTERVAL_SECONDS = 60
+
+_CONNECTED_AT = "metrics_connected_at"
+_CHECKED_OUT_AT = "metrics_checked_out_at"
+
+# Instrumented pools by name ("primary", "replica-1", ...)
+_registry: dict[str, "PoolMetrics"] = {}
+
+
+# ============================================================================
+# Metric Types
+# ============================================================================
+
+
+class Histogram:
+    """
+    Cumulative fixed-bucket histogram (Prometheus style).
+
+    Example:
+        histogram = Histogram((0.01, 0.1, 1))
+        histogram.observe(0.05)
+        histogram.snapshot()["buckets"]  # {"0.01": 0, "0.1": 1, "1": 1, "+Inf": 1}
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        """
+        Initialize histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds
+        """
+        self.bounds = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cumulative bucket counts with count, sum and max."""
+        buckets: dict[str, int] = {}
+        running = 0
+        for bound, count in zip((*self.bounds, math.inf), self.counts):
+            running += count
+            buckets["+Inf" if bound == math.inf else f"{bound:g}"] = running
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "max": round(self.max, 6),
+            "buckets": buckets,
+        }
+
+
+# ============================================================================
+# Pool Metrics
+# ============================================================================
+
+
+class PoolMetrics:
+    """
+    Telemetry for one engine's connection pool.
+
+    Attributes:
+        name: Pool name used in reports
+        engine: Instrumented engine (gauges read its current pool)
+        wait: Checkout wait time histogram (seconds)
+        hold: Time connections stay checked out (seconds)
+        lifetime: Lifetime of closed connections (seconds)
+        connects / checkouts / timeouts / invalidations: Counters
+    """
+
+    def __init__(self, name: str, engine: AsyncEngine):
+        """
+        Initialize pool metrics.
+
+        Args:
+            name: Pool name used in reports
+            engine: Engine whose pool is measured
+        """
+        self.name = name
+        self.engine = engine
+        self.wait = Histogram(WAIT_BUCKETS)
+        self.hold = Histogram(HOLD_BUCKETS)
+        self.lifetime = Histogram(LIFETIME_BUCKETS)
+        self.connects = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.invalidations = 0
+        self._last_alarm: dict[str, float] = {}
+
+    # ------------------------------------------------------------------------
+    # Gauges
+    # ------------------------------------------------------------------------
+
+    def gauges(self) -> dict[str, int]:
+        """Return current pool occupancy."""
+        pool = self.engine.sync_engine.pool
+        size = pool.size()
+        max_overflow = getattr(pool, "_max_overflow", 0)
+        return {
+            "size": size,
+            "max_overflow": max_overflow,
+            "capacity": size + max(max_overflow, 0),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+
+    @property
+    def is_saturated(self) -> bool:
+        """Whether every connection the pool may open is checked out."""
+        gauges = self.gauges()
+        return gauges["max_overflow"] >= 0 and gauges["in_use"] >= gauges["capacity"]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return gauges, counters and histograms."""
+        return {
+            **self.gauges(),
+            "saturated": self.is_saturated,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "invalidations": self.invalidations,
+            "wait_seconds": self.wait.snapshot(),
+            "hold_seconds": self.hold.snapshot(),
+            "lifetime_seconds": self.lifetime.snapshot(),
+        }
+
+    # ------------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------------
+
+    def record_wait(self, seconds: float) -> None:
+        """Record a successful checkout wait."""
+        self.wait.observe(seconds)
+        if seconds * 1000 >= settings.db_pool_wait_warning_ms:
+            self._alarm(
+                "wait",
+                f"Database pool '{self.name}' checkout waited {seconds * 1000:.0f}ms "
+                f"({self.gauges()})",
+            )
+
+    def record_timeout(self, seconds: float) -> None:
+        """Record a checkout that gave up after pool_timeout."""
+        self.timeouts += 1
+        self.wait.observe(seconds)
+        logger.error(
+            f"Database pool '{self.name}' checkout timed out after {seconds:.1f}s "
+            f"({self.gauges()})"
+        )
+
+    def _alarm(self, kind: str, message: str) -> None:
+        """Log a rate-limited saturation warning."""
+        now = time.monotonic()
+        if now - self._last_alarm.get(kind, -math.inf) < ALARM_INTERVAL_SECONDS:
+            return
+        self._last_alarm[kind] = now
+        logger.warning(message)
+
+    # ------------------------------------------------------------------------
+    # Pool Event Handlers
+    # ------------------------------------------------------------------------
+
+    def on_connect(self, dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        """Count new connections and remember when they were opened."""
+        self.connects += 1
+        record.info[_CONNECTED_AT] = time.monotonic()
+
+    def on_checkout(
+        self, dbapi_connection: Any, record: ConnectionPoolEntry, proxy: Any
+    ) -> None:
+        """Count checkouts and raise the saturation alarm."""
+        self.checkouts += 1
+        record.info[_CHECKED_OUT_AT] = time.monotonic()
+        if self.is_saturated:
+            self._alarm(
+                "saturated",
+                f"Database pool '{self.name}' saturated: all connections in use "
+                f"({self.gauges()})",
+            )
+
+    def on_checkin(self, dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        """Record how long the connection was held."""
+        checked_out_at = record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            self.hold.observe(time.monotonic() - checked_out_at)
+
+    def on_close(self, dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        """Record the lifetime of a closed connection."""
+        connected_at = record.info.pop(_CONNECTED_AT, None)
+        if connected_at is not None:
+            self.lifetime.observe(time.monotonic() - connected_at)
+
+    def on_invalidate(
+        self, dbapi_connection: Any, record: ConnectionPoolEntry, exception: Any
+    ) -> None:
+        """Count invalidated connections."""
+        self.invalidations += 1
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that times checkout waits.
+
+    Waits and timeouts are reported to the PoolMetrics attached by
+    instrument_engine(); until then the pool behaves like its parent.
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Check out a connection, timing how long it took."""
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout(time.perf_counter() - start)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return record
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        """Recreate the pool (e.g. on dispose), keeping its metrics."""
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> PoolMetrics:
+    """
+    Attach pool telemetry to an engine.
+
+    Args:
+        engine: Engine to instrument
+        name: Pool name used in reports (e.g. "primary")
+
+    Returns:
+        PoolMetrics collecting the engine's pool telemetry (replaces any
+        previously registered under the same name)
+    """
+    metrics = PoolMetrics(name, engine)
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "connect", metrics.on_connect)
+    event.listen(sync_engine, "checkout", metrics.on_checkout)
+    event.listen(sync_engine, "checkin", metrics.on_checkin)
+    event.listen(sync_engine, "close", metrics.on_close)
+    event.listen(sync_engine, "invalidate", metrics.on_invalidate)
+    if isinstance(sync_engine.pool, InstrumentedQueuePool):
+        sync_engine.pool.metrics = metrics
+    _registry[name] = metrics
+    return metrics
+
+
+def get_pool_stats() -> dict[str, dict[str, Any]]:
+    """
+    Snapshot every instrumented pool.
+
+    Returns:
+        Pool name -> gauges, counters and histograms
+    """
+    return {name: metrics.snapshot() for name, metrics in _registry.items()}
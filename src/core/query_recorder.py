@@ -0,0 +1,282 @@
+"""
+Request-scoped SQL instrumentation and N+1 detection.
+
+This module provides:
+- QueryRecorder: Statement count, DB time and repeated statement shapes
+- record_queries: Context manager activating a recorder (requests, tests)
+- current_recorder: Recorder active in the current context, if any
+- QueryBudget: Route dependency declaring a per-route query budget
+- QueryBudgetExceededError: Raised when an enforced budget is exceeded
+- normalize_statement: Reduce SQL to its shape (literals and params removed)
+
+Statements are captured through engine-level cursor execute events on the
+Engine class, so every engine (primary, replicas, test engines) reports to
+the recorder bound to the current request via a ContextVar. The same hooks
+feed slow statements to core.slow_queries, with or without a recorder.
+
+Example:
+    with record_queries() as recorder:
+        await service.list_user_transactions(...)
+    assert recorder.count <= 5
+"""
+
+import logging
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.config import settings
+from core.slow_queries import slow_query_log
+
+logger = logging.getLogger(__name__)
+
+_QUERY_START = "query_recorder_start"
+
+_current: ContextVar["QueryRecorder | None"] = ContextVar(
+    "query_recorder", default=None
+)
+
+# Literal and parameter patterns collapsed by normalize_statement()
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|:\w+")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,)*\s*\?\s*\)", re.IGNORECASE)
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape.
+
+    Bound parameters, literals and IN lists are replaced by "?", so the
+    same query issued with different values maps to one shape.
+
+    Args:
+        statement: SQL statement as sent to the driver
+
+    Returns:
+        Normalized statement shape
+
+    Example:
+        normalize_statement("SELECT * FROM t WHERE id = $1 AND n > 10")
+        # "SELECT * FROM t WHERE id = ? AND n > ?"
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _BIND_PARAM.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip()
+    return _IN_LIST.sub("IN (?)", shape)
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """Raised when a request runs more statements than its declared budget."""
+
+
+@dataclass
+class ShapeStats:
+    """Executions of one statement shape."""
+
+    count: int = 0
+    total_time: float = 0.0
+
+
+@dataclass
+class QueryRecorder:
+    """
+    Statements executed within one request (or test block).
+
+    Attributes:
+        count: Number of statements executed
+        total_time: Total time spent executing statements (seconds)
+        shapes: Normalized statement -> executions
+        budget: Maximum statements allowed (None for no budget)
+        enforce_budget: Raise when the budget is exceeded instead of warning
+    """
+
+    count: int = 0
+    total_time: float = 0.0
+    shapes: dict[str, ShapeStats] = field(default_factory=dict)
+    budget: int | None = None
+    enforce_budget: bool = False
+
+    def record(self, statement: str, duration: float, shape: str | None = None) -> None:
+        """
+        Record one executed statement.
+
+        Args:
+            statement: SQL statement
+            duration: Execution time in seconds
+            shape: Normalized statement, if already computed
+
+        Raises:
+            QueryBudgetExceededError: If an enforced budget is exceeded
+        """
+        self.count += 1
+        self.total_time += duration
+        shape = shape or normalize_statement(statement)
+        stats = self.shapes.setdefault(shape, ShapeStats())
+        stats.count += 1
+        stats.total_time += duration
+
+        if self.enforce_budget and self.budget is not None and self.count > self.budget:
+            raise QueryBudgetExceededError(
+                f"Query budget of {self.budget} exceeded: {self.count} statements"
+            )
+
+    def repeated(self, threshold: int) -> dict[str, ShapeStats]:
+        """
+        Get statement shapes executed at least threshold times.
+
+        Args:
+            threshold: Minimum executions of one shape
+
+        Returns:
+            Shape -> executions, most repeated first
+        """
+        repeated = {
+            shape: stats
+            for shape, stats in self.shapes.items()
+            if stats.count >= threshold
+        }
+        return dict(sorted(repeated.items(), key=lambda item: -item[1].count))
+
+    def report(self, label: str) -> None:
+        """
+        Log the request's query summary, N+1 patterns and budget overruns.
+
+        Args:
+            label: Request label for log messages (e.g. "GET /api/v1/accounts")
+        """
+        logger.debug(
+            f"{label}: {self.count} statements, {self.total_time * 1000:.1f}ms in DB"
+        )
+
+        for shape, stats in self.repeated(settings.query_n_plus_one_threshold).items():
+            logger.warning(
+                f"Possible N+1 in {label}: statement executed {stats.count} times "
+                f"({stats.total_time * 1000:.1f}ms): {shape[:500]}"
+            )
+
+        if self.budget is not None and self.count > self.budget:
+            logger.warning(
+                f"Query budget exceeded in {label}: "
+                f"{self.count} statements (budget {self.budget})"
+            )
+
+
+def current_recorder() -> QueryRecorder | None:
+    """Get the recorder active in the current context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def record_queries(enforce_budget: bool | None = None) -> Iterator[QueryRecorder]:
+    """
+    Record every statement executed in the current context.
+
+    Args:
+        enforce_budget: Raise on budget overruns (default: setting
+            query_budget_enforced)
+
+    Yields:
+        Active QueryRecorder
+    """
+    recorder = QueryRecorder(
+        enforce_budget=(
+            settings.query_budget_enforced if enforce_budget is None else enforce_budget
+        )
+    )
+    token = _current.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current.reset(token)
+
+
+class QueryBudget:
+    """
+    Route dependency declaring the maximum statements a request may run.
+
+    Overruns are logged; with QUERY_BUDGET_ENFORCED (e.g. in tests) the
+    statement exceeding the budget raises QueryBudgetExceededError.
+
+    Example:
+        @router.get("", dependencies=[Depends(QueryBudget(10))])
+        async def list_items(...): ...
+    """
+
+    def __init__(self, max_queries: int):
+        """
+        Initialize query budget.
+
+        Args:
+            max_queries: Maximum statements for the request
+        """
+        self.max_queries = max_queries
+
+    async def __call__(self) -> None:
+        """Apply the budget to the current request's recorder."""
+        recorder = current_recorder()
+        if recorder is not None:
+            recorder.budget = self.max_queries
+
+
+# ============================================================================
+# Engine Events
+# ============================================================================
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Remember when the statement started."""
+    conn.info.setdefault(_QUERY_START, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Report the statement to the active recorder and the slow query log."""
+    starts = conn.info.get(_QUERY_START)
+    if not starts:
+        return
+    duration = time.perf_counter() - starts.pop()
+
+    recorder = _current.get()
+    is_slow = duration * 1000 >= settings.slow_query_threshold_ms
+    if recorder is None and not is_slow:
+        return
+
+    shape = normalize_statement(statement)
+    if is_slow:
+        slow_query_log.observe(shape, statement, parameters, duration, conn.engine)
+    if recorder is not None:
+        recorder.record(statement, duration, shape=shape)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context: Any) -> None:
+    """Discard the start time of a failed statement."""
+    conn = exception_context.connection
+    starts = conn.info.get(_QUERY_START) if conn is not None else None
+    if starts:
+        starts.pop()
@@ -1,16 +1,358 @@
+"""
+Rate limiting.
+
+This module provides:
+- limiter: slowapi Limiter for strict per-route limits (login, register, ...)
+- HybridRateLimiter: Per-worker token buckets reconciled with Redis in batches
+- rate_limiter: Process-wide HybridRateLimiter enforcing RATE_LIMIT_DEFAULT
+- RateLimitMiddleware: Pure ASGI middleware applying rate_limiter to the API
+- rate_limit_key: Rate limit key of a request (user ID, else client address)
+- rate_limit_error: Body of a 429 response (middleware and batch sub-requests)
+
+The global limit is checked on every API request, so it must not cost a
+network round trip. Each worker keeps a token bucket per key in memory
+and decides locally in microseconds. Every RATE_LIMIT_SYNC_INTERVAL
+seconds it sends the tokens consumed since the last sync for all active
+keys to Redis in one atomic Lua script call, which applies them to the
+shared buckets and returns what is left; local buckets then continue
+from the shared state. Between syncs, workers may together admit up to
+one sync interval's worth of extra requests per key.
+
+Redis is reached through the shared pool (core.redis). While it is
+unreachable or its circuit breaker is open, workers keep limiting locally
+(each worker then enforces the full limit on its own).
+"""
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from jose import JWTError
+from limits import parse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from core import settings
+from core.redis import RedisManager, RedisUnavailableError, redis_manager
+from core.security import TOKEN_TYPE_ACCESS, decode_token, verify_token_type
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
 # Rate Limiter Setup
 # ============================================================================
-# Initialize rate limiter with Redis backend
+# Per-route limits of sensitive endpoints, keyed on the client address and
+# checked against Redis on every call (exact across workers). When rate
+# limiting is disabled the in-memory backend is used instead, so the Redis
+# client is not imported or connected at all. The global default limit is
+# enforced by RateLimitMiddleware below.
 limiter = Limiter(
     key_func=get_remote_address,
-    storage_uri=settings.redis_url_str,
-    default_limits=[settings.rate_limit_default],  # Global rate limit
+    storage_uri=settings.redis_url_str if settings.rate_limit_enabled else "memory://",
     enabled=settings.rate_limit_enabled,
 )
+
+
+# ============================================================================
+# Hybrid Local/Redis Limiter
+# ============================================================================
+
+# Applies consumed tokens to shared buckets (Redis server time) and returns
+# the tokens left in each. KEYS: bucket keys. ARGV: capacity, refill rate
+# (tokens/s), TTL (s), then tokens consumed per key.
+SYNC_SCRIPT = """
+local now = redis.call('TIME')
+local now_s = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local remaining = {}
+for i, key in ipairs(KEYS) do
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now_s
+    tokens = math.min(capacity, tokens + math.max(0, now_s - ts) * rate)
+    tokens = math.max(0, tokens - tonumber(ARGV[i + 3]))
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now_s))
+    redis.call('EXPIRE', key, ttl)
+    remaining[i] = tostring(tokens)
+end
+return remaining
+"""
+
+
+@dataclass
+class _Bucket:
+    """Local token bucket of one key."""
+
+    tokens: float
+    updated: float
+    pending: float = 0.0  # Tokens consumed locally since the last sync
+
+
+class HybridRateLimiter:
+    """
+    Token bucket limiter deciding locally and reconciling with Redis.
+
+    hit() never performs I/O; run() (started by start()) pushes consumed
+    tokens to Redis every sync_interval seconds.
+    """
+
+    def __init__(
+        self,
+        limit: str,
+        redis: RedisManager | None,
+        sync_interval: float,
+        prefix: str = "ratelimit:",
+    ):
+        """
+        Initialize HybridRateLimiter.
+
+        Args:
+            limit: Limit in slowapi notation (e.g. "100/minute")
+            redis: Shared Redis pool (None for local-only limiting)
+            sync_interval: Seconds between Redis reconciliations
+            prefix: Redis key prefix of the shared buckets
+        """
+        item = parse(limit)
+        self.capacity = float(item.amount)
+        self.rate = item.amount / item.get_expiry()
+        self.period = item.get_expiry()
+        self.redis = redis
+        self.sync_interval = sync_interval
+        self.prefix = prefix
+        self._buckets: dict[str, _Bucket] = {}
+        self._script: Any = None
+        self._local_only = False
+        self._task: asyncio.Task[None] | None = None
+
+    def hit(self, key: str) -> float:
+        """
+        Consume one token of key.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            0 if the request is allowed, else seconds until a token is available
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(tokens=self.capacity, updated=now)
+        else:
+            bucket.tokens = min(
+                self.capacity, bucket.tokens + (now - bucket.updated) * self.rate
+            )
+            bucket.updated = now
+
+        if bucket.tokens < 1:
+            return (1 - bucket.tokens) / self.rate
+        bucket.tokens -= 1
+        bucket.pending += 1
+        return 0.0
+
+    async def sync(self) -> None:
+        """Push consumed tokens to Redis and adopt the shared bucket levels."""
+        self._evict_idle()
+        consumed = {key: b.pending for key, b in self._buckets.items() if b.pending}
+        if not consumed:
+            return
+        for key, tokens in consumed.items():
+            self._buckets[key].pending -= tokens
+
+        if self.redis is None:
+            return  # Local-only: consumed tokens are already applied locally
+
+        keys = [f"{self.prefix}{key}" for key in consumed]
+        args = [self.capacity, self.rate, int(self.period) + 1, *consumed.values()]
+        try:
+            remaining = await self.redis.execute(
+                lambda client: self._get_script(client)(
+                    keys=keys, args=args, client=client
+                )
+            )
+        except RedisUnavailableError as e:
+            if not self._local_only:
+                logger.warning(f"Rate limit sync failed, limiting locally: {e}")
+                self._local_only = True
+            return
+
+        if self._local_only:
+            logger.info("Rate limit sync with Redis restored")
+            self._local_only = False
+
+        now = time.monotonic()
+        for key, tokens in zip(consumed, remaining):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                # Tokens consumed while the script ran are still pending
+                bucket.tokens = max(0.0, float(tokens) - bucket.pending)
+                bucket.updated = now
+
+    async def run(self) -> None:
+        """Reconcile with Redis every sync_interval seconds, forever."""
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error(f"Rate limit sync error: {e}")
+
+    def start(self) -> None:
+        """Start the background reconciliation task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop reconciling and push the last consumed tokens."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            await self.sync()
+
+    def _get_script(self, client: Any) -> Any:
+        """Get the sync script (EVALSHA, loaded on first use)."""
+        if self._script is None:
+            self._script = client.register_script(SYNC_SCRIPT)
+        return self._script
+
+    def _evict_idle(self) -> None:
+        """Drop buckets that refilled completely (no state worth keeping)."""
+        now = time.monotonic()
+        idle = [
+            key
+            for key, bucket in self._buckets.items()
+            if not bucket.pending
+            and bucket.tokens + (now - bucket.updated) * self.rate >= self.capacity
+        ]
+        for key in idle:
+            del self._buckets[key]
+
+
+# Process-wide limiter for the global default limit
+rate_limiter = HybridRateLimiter(
+    settings.rate_limit_default,
+    redis=redis_manager,
+    sync_interval=settings.rate_limit_sync_interval,
+)
+
+
+# ============================================================================
+# Request Keys
+# ============================================================================
+
+
+@lru_cache(maxsize=4096)
+def _token_subject(token: str) -> tuple[str, float] | None:
+    """Verify an access token once; return its subject and expiry."""
+    try:
+        claims = decode_token(token)
+    except JWTError:
+        return None
+    if not verify_token_type(claims, TOKEN_TYPE_ACCESS) or not claims.get("sub"):
+        return None
+    return claims["sub"], float(claims.get("exp", 0))
+
+
+def rate_limit_key(scope: Scope) -> str:
+    """
+    Get the rate limit key of a request.
+
+    Requests with a valid access token are keyed on the user ID (signature
+    checked once per token, then cached); others on the client address.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        "user:<id>" or "ip:<address>"
+    """
+    scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        subject = _token_subject(token)
+        if subject is not None and subject[1] > time.time():
+            return f"user:{subject[0]}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def rate_limit_error(request_id: str | None) -> dict[str, Any]:
+    """
+    Build the body of a 429 response.
+
+    Args:
+        request_id: Request ID of the rejected request
+
+    Returns:
+        Error body in the same format as rate_limit_handler
+    """
+    return {
+        "error": {
+            "code": "RATE_LIMIT_EXCEEDED",
+            "message": "Rate limit exceeded. Please try again later.",
+        },
+        "meta": {"request_id": request_id},
+    }
+
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+
+class RateLimitMiddleware:
+    """
+    Middleware enforcing the global rate limit on API requests.
+
+    Rejected requests get 429 with Retry-After, in the same format as
+    rate_limit_handler. Paths outside /api (health checks, docs) are not
+    limited.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: HybridRateLimiter | None = None):
+        """
+        Initialize RateLimitMiddleware.
+
+        Args:
+            app: ASGI application
+            limiter: Limiter to apply (default: rate_limiter)
+        """
+        self.app = app
+        self.limiter = limiter or rate_limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request if it is within the rate limit.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http" or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        key = rate_limit_key(scope)
+        retry_after = self.limiter.hit(key)
+        if not retry_after:
+            await self.app(scope, receive, send)
+            return
+
+        request_id = scope.get("state", {}).get("request_id")
+        logger.warning(f"Rate limit exceeded: {key} (request_id={request_id})")
+        response = JSONResponse(
+            status_code=429,
+            content=rate_limit_error(request_id),
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+        await response(scope, receive, send)
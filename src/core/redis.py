@@ -0,0 +1,244 @@
+"""
+Shared Redis connection pool.
+
+This module provides:
+- CircuitBreaker: Stop calling a failing dependency, retry after a timeout
+- RedisManager: Pooled async Redis client with latency probes and a breaker
+- redis_manager: Process-wide RedisManager (started in lifespan)
+- RedisUnavailableError: Raised when Redis is down or the breaker is open
+
+Every Redis user (rate limiter, caches) goes through redis_manager, so
+the worker holds one pool of at most REDIS_MAX_CONNECTIONS connections.
+Commands time out after REDIS_SOCKET_TIMEOUT seconds; after
+REDIS_BREAKER_FAILURE_THRESHOLD consecutive failures the breaker opens
+and calls fail immediately (callers fall back to local behaviour) until a
+trial call succeeds. A background PING probe measures latency and closes
+the breaker once Redis is back, even without traffic.
+
+Example:
+    try:
+        value = await redis_manager.execute(lambda client: client.get(key))
+    except RedisUnavailableError:
+        value = None
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from core.config import settings
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RedisUnavailableError(Exception):
+    """Raised when Redis cannot be used (not started, failing or breaker open)."""
+
+
+# ============================================================================
+# Circuit Breaker
+# ============================================================================
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    States:
+    - closed: calls allowed
+    - open: calls rejected until reset_timeout has elapsed
+    - half_open: calls allowed again; the next success closes the breaker,
+      the next failure re-opens it
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before allowing a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Check whether a call may be attempted now."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            return True
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful call (closes the breaker)."""
+        if self.state != self.CLOSED:
+            logger.info("Redis circuit breaker closed")
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call (may open the breaker)."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    f"Redis circuit breaker opened after {self.failures} failure(s)"
+                )
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+# ============================================================================
+# Redis Manager
+# ============================================================================
+
+
+class RedisManager:
+    """
+    Owner of the worker's Redis connection pool.
+
+    start() creates the pool (connections are opened on demand) and the
+    probe task; stop() closes both.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a stopped manager."""
+        self._client: "Redis | None" = None
+        self._probe_task: asyncio.Task[None] | None = None
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.redis_breaker_failure_threshold,
+            reset_timeout=settings.redis_breaker_reset_timeout,
+        )
+        self.latency_ms: float | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether the pool has been created."""
+        return self._client is not None
+
+    @property
+    def healthy(self) -> bool:
+        """Whether Redis answered the last call and the breaker is closed."""
+        return self.started and self.breaker.state == CircuitBreaker.CLOSED
+
+    def start(self, client: "Redis | None" = None) -> None:
+        """
+        Create the connection pool and start latency probes.
+
+        Args:
+            client: Client to use instead of one built from settings (tests)
+        """
+        if self._client is not None:
+            return
+        if client is None:
+            # Imported lazily: not needed by processes that never start Redis
+            from redis.asyncio import ConnectionPool, Redis
+
+            pool = ConnectionPool.from_url(
+                settings.redis_url_str,
+                max_connections=settings.redis_max_connections,
+                socket_timeout=settings.redis_socket_timeout,
+                socket_connect_timeout=settings.redis_socket_timeout,
+                health_check_interval=30,
+            )
+            client = Redis(connection_pool=pool)
+        self._client = client
+        self._probe_task = asyncio.create_task(self._probe())
+        logger.info(
+            f"Redis pool created (max_connections={settings.redis_max_connections})"
+        )
+
+    async def stop(self) -> None:
+        """Stop probing and close the pool."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def execute(self, operation: Callable[["Redis"], Awaitable[T]]) -> T:
+        """
+        Run an operation on the shared client through the circuit breaker.
+
+        Args:
+            operation: Coroutine function receiving the client
+
+        Returns:
+            The operation's result
+
+        Raises:
+            RedisUnavailableError: If not started, the breaker is open or the
+                operation failed with a connection, timeout or server error
+        """
+        if self._client is None:
+            raise RedisUnavailableError("Redis pool not started")
+        if not self.breaker.allow():
+            raise RedisUnavailableError("Redis circuit breaker open")
+
+        from redis.exceptions import RedisError
+
+        try:
+            result = await operation(self._client)
+        except (RedisError, OSError, asyncio.TimeoutError) as e:
+            self.breaker.record_failure()
+            raise RedisUnavailableError(str(e)) from e
+        self.breaker.record_success()
+        return result
+
+    async def ping(self) -> float | None:
+        """
+        Measure the PING round trip.
+
+        Returns:
+            Latency in milliseconds, or None if Redis is unavailable
+        """
+        start = time.perf_counter()
+        try:
+            await self.execute(lambda client: client.ping())
+        except RedisUnavailableError:
+            self.latency_ms = None
+            return None
+        self.latency_ms = (time.perf_counter() - start) * 1000
+        return self.latency_ms
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of the Redis connection state.
+
+        Returns:
+            Breaker state, consecutive failures and last PING latency
+        """
+        return {
+            "breaker": self.breaker.state,
+            "failures": self.breaker.failures,
+            "latency_ms": (
+                round(self.latency_ms, 3) if self.latency_ms is not None else None
+            ),
+        }
+
+    async def _probe(self) -> None:
+        """Ping Redis every REDIS_PROBE_INTERVAL seconds."""
+        while True:
+            await self.ping()
+            await asyncio.sleep(settings.redis_probe_interval)
+
+
+# Process-wide manager
+redis_manager = RedisManager()
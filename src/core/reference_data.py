@@ -0,0 +1,278 @@
+"""
+Conditional GET for reference data endpoints.
+
+This module provides:
+- ReferenceDataVersions: Per-table version counters, cached per worker
+- reference_data_versions: Process-wide ReferenceDataVersions
+- ReferenceDataETag: Route dependency adding ETag and Cache-Control headers
+  and answering a matching If-None-Match with 304 Not Modified
+- REFERENCE_TABLES: Tables tracked in reference_data_versions
+- single_version_bump: Bump a table's counter once for a multi-statement
+  bulk write
+
+Reference data (currencies, account types, financial institutions)
+changes rarely. Database triggers increment a counter in
+reference_data_versions on every write to a reference table; workers keep
+those counters in memory for REFERENCE_DATA_VERSION_TTL seconds (and drop
+them as soon as they commit a change themselves). A strong ETag is derived
+from the counters, the request path and query string, so a revalidation
+with a matching If-None-Match is answered with 304 without opening a
+database session - only the access token's signature is checked.
+
+Example:
+    @router.get("/items", dependencies=[Depends(ReferenceDataETag("items"))])
+    async def list_items(...): ...
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from itertools import chain
+from typing import Any
+
+from fastapi import HTTPException, Request, Response, status
+from jose import JWTError
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.security import TOKEN_TYPE_ACCESS, decode_token, verify_token_type
+from models import ReferenceDataVersion
+
+logger = logging.getLogger(__name__)
+
+# Tables whose writes bump their reference_data_versions counter
+REFERENCE_TABLES = frozenset({"account_types", "financial_institutions"})
+
+# Session.info flag set when a flush wrote to a reference table
+_REFERENCE_DATA_WRITTEN = "reference_data_written"
+
+# Transaction-local setting that makes the version triggers skip their bump
+_DEFER_BUMPS = "emerald.defer_reference_version"
+
+
+class ReferenceDataVersions:
+    """
+    Version counters of the reference tables, cached in memory.
+
+    Counters are re-read from the primary at most once per
+    REFERENCE_DATA_VERSION_TTL seconds; concurrent requests share one read.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty (stale) registry."""
+        self._versions: dict[str, int] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Force the next lookup to re-read the counters."""
+        self._loaded_at = None
+
+    async def get(
+        self, sessionmaker: Callable[[], AsyncSession], tables: tuple[str, ...]
+    ) -> dict[str, int] | None:
+        """
+        Get the current versions of tables.
+
+        Args:
+            sessionmaker: Factory of primary sessions (used when stale)
+            tables: Reference tables to look up
+
+        Returns:
+            Table -> version (0 for untracked tables), or None if the
+            counters could not be read
+        """
+        if not self._is_fresh():
+            async with self._lock:
+                if not self._is_fresh():
+                    try:
+                        await self._load(sessionmaker)
+                    except Exception as e:
+                        logger.warning(f"Could not read reference data versions: {e}")
+                        return None
+        return {table: self._versions.get(table, 0) for table in tables}
+
+    def _is_fresh(self) -> bool:
+        """Check whether the cached counters are within their TTL."""
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < settings.reference_data_version_ttl
+        )
+
+    async def _load(self, sessionmaker: Callable[[], AsyncSession]) -> None:
+        """Read all counters from the database."""
+        async with sessionmaker() as session:
+            result = await session.execute(
+                select(ReferenceDataVersion.table_name, ReferenceDataVersion.version)
+            )
+            self._versions = {table: version for table, version in result.all()}
+        self._loaded_at = time.monotonic()
+
+
+# Process-wide registry
+reference_data_versions = ReferenceDataVersions()
+
+
+class ReferenceDataETag:
+    """
+    Route dependency for conditional GET of reference data.
+
+    Sets ETag and Cache-Control on the response (also returned, for routes
+    that build their own Response) and raises 304 Not Modified when the
+    request's If-None-Match matches. Declare it before any dependency that
+    opens a database session so a 304 never touches the database.
+    """
+
+    def __init__(self, *tables: str, data_version: str = "", public: bool = False):
+        """
+        Initialize reference data ETag.
+
+        Args:
+            tables: Reference tables the response is built from
+            data_version: Version of data that lives in code (e.g. currencies)
+            public: Response is not user-specific (no token required for 304)
+        """
+        self.tables = tables
+        self.data_version = data_version
+        self.public = public
+
+    async def __call__(self, request: Request, response: Response) -> dict[str, str]:
+        """
+        Answer revalidations and add caching headers.
+
+        Args:
+            request: Incoming request
+            response: Response whose headers are set
+
+        Returns:
+            ETag and Cache-Control headers (empty if versions are unavailable)
+
+        Raises:
+            HTTPException (304): If If-None-Match matches the current ETag
+        """
+        versions: dict[str, int] | None = {}
+        if self.tables:
+            versions = await reference_data_versions.get(
+                request.app.state.sessionmaker, self.tables
+            )
+        if versions is None:
+            return {}
+
+        visibility = "public" if self.public else "private"
+        headers = {
+            "ETag": self._etag(request, versions),
+            "Cache-Control": f"{visibility}, max-age={settings.reference_data_max_age}",
+        }
+
+        if etag_matches(request.headers.get("If-None-Match"), headers["ETag"]) and (
+            self.public or _has_valid_access_token(request)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+
+        response.headers.update(headers)
+        return headers
+
+    def _etag(self, request: Request, versions: dict[str, int]) -> str:
+        """Derive a strong ETag from versions and the requested representation."""
+        parts = [
+            settings.version,
+            self.data_version,
+            *(f"{table}:{version}" for table, version in sorted(versions.items())),
+            request.url.path,
+            request.url.query,
+        ]
+        digest = hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+        return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Header value (list of entity tags or "*")
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def _has_valid_access_token(request: Request) -> bool:
+    """Check the Bearer token's signature and type, without a database lookup."""
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        return verify_token_type(decode_token(token), TOKEN_TYPE_ACCESS)
+    except JWTError:
+        return False
+
+
+@asynccontextmanager
+async def single_version_bump(session: AsyncSession, table: str) -> AsyncIterator[None]:
+    """
+    Bump a reference table's version once for all writes made inside.
+
+    The triggers bump the counter after every statement; a bulk load made
+    of several statements would invalidate every cached copy several times
+    over. Inside this block they skip the bump (for the whole transaction)
+    and the counter is incremented once on a clean exit. Nothing is bumped
+    if the block raises - the caller rolls back.
+
+    Args:
+        session: Session whose transaction makes the writes
+        table: Reference table written to
+    """
+    await session.execute(
+        text("SELECT set_config(:name, 'on', true)"), {"name": _DEFER_BUMPS}
+    )
+    yield
+    await session.execute(
+        text("SELECT set_config(:name, 'off', true)"), {"name": _DEFER_BUMPS}
+    )
+    await session.execute(
+        text(
+            "INSERT INTO reference_data_versions (table_name, version, updated_at) "
+            "VALUES (:table, 1, now()) "
+            "ON CONFLICT (table_name) DO UPDATE "
+            "SET version = reference_data_versions.version + 1, updated_at = now()"
+        ),
+        {"table": table},
+    )
+    # Raw SQL is not seen by _track_reference_writes
+    session.info[_REFERENCE_DATA_WRITTEN] = True
+
+
+# ============================================================================
+# Session Events
+# ============================================================================
+
+
+@event.listens_for(Session, "after_flush")
+def _track_reference_writes(session: Session, flush_context: Any) -> None:
+    """Remember that this transaction wrote to a reference table."""
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if getattr(obj, "__tablename__", None) in REFERENCE_TABLES:
+            session.info[_REFERENCE_DATA_WRITTEN] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_reference_versions(session: Session) -> None:
+    """Re-read versions after this worker committed reference data changes."""
+    if session.info.pop(_REFERENCE_DATA_WRITTEN, False):
+        reference_data_versions.invalidate()
@@ -0,0 +1,95 @@
+"""
+Fast JSON responses for list endpoints.
+
+This module provides:
+- PydanticJSONResponse: JSON response serialised by pydantic-core to bytes
+- paginated_response: Validate ORM rows once and return a paginated response
+
+Returning a model from a route makes FastAPI validate it again against
+response_model and, on FastAPI releases without the dump_json fast path
+(or with a custom response_class), dump it to a dict, run jsonable_encoder
+and finally json.dumps. Returning a Response instance skips all of that:
+rows are validated once, in a single pydantic-core call, and the page is
+serialised straight to bytes. Routes keep their response_model so the
+OpenAPI schema is unchanged.
+
+Example:
+    @router.get("", response_model=PaginatedResponse[ItemListResponse])
+    async def list_items(...) -> PydanticJSONResponse:
+        items, count = await service.list_items(...)
+        return paginated_response(items, ItemListResponse, count, pagination)
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from schemas.common import PaginatedResponse, PaginationMeta, PaginationParams
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core.
+
+    Accepts models, lists of models and plain JSON-compatible values.
+    Models are serialised in JSON mode exactly as FastAPI would (UUIDs,
+    dates and Decimals as strings, computed fields included).
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialise content to JSON bytes.
+
+        Args:
+            content: Response payload
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return to_json(content, by_alias=True)
+
+
+@lru_cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Get the cached list validator of an item schema."""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def paginated_response(
+    items: Sequence[Any],
+    model: type[BaseModel],
+    total: int,
+    pagination: PaginationParams,
+    headers: dict[str, str] | None = None,
+    context: dict[str, Any] | None = None,
+) -> PydanticJSONResponse:
+    """
+    Build a paginated JSON response from ORM rows.
+
+    Args:
+        items: ORM objects of the current page
+        model: Item schema (must allow from_attributes)
+        total: Total number of items across all pages
+        pagination: Pagination parameters of the request
+        headers: Extra response headers (e.g. ETag, Cache-Control)
+        context: Validation context of the item schema
+
+    Returns:
+        PydanticJSONResponse with the PaginatedResponse body
+    """
+    data = _list_adapter(model).validate_python(
+        items, from_attributes=True, context=context
+    )
+    meta = PaginationMeta(
+        total=total,
+        page=pagination.page,
+        page_size=pagination.page_size,
+    )
+    # Items are already validated: construct the page without revalidating
+    page_model = PaginatedResponse[model]  # type: ignore[valid-type]
+    page = page_model.model_construct(data=data, meta=meta)
+    return PydanticJSONResponse(page, headers=headers)
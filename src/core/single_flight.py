@@ -0,0 +1,160 @@
+"""
+Request coalescing for identical concurrent reads.
+
+This module provides:
+- SingleFlight: Share one in-flight execution between identical calls
+- single_flight: Process-wide SingleFlight used by read-only services
+- read_key: Coalescing key of a read (session binding plus normalised parts)
+- detached_copy: Session-independent copy of an ORM instance, for sharing
+
+When many clients ask for the same expensive read at once (institution
+lists at the start of the month, a shared account everyone opens), only
+the first caller runs the query; callers arriving while it is in flight
+await the same result instead of running it again. Nothing is cached:
+once the call completes, the next caller runs the query afresh.
+
+Results are shared as-is, so only read-only services coalesce (see the
+read service dependencies) and callers must treat the results as
+immutable. ORM instances are shared as detached copies (detached_copy):
+the leader's instances belong to its session, which may be closed or
+rolled back (expiring them) before a follower serializes the result.
+Keys start with the session's engine, so a caller that reads from the
+primary (read-your-writes) never receives a replica's result.
+
+Example:
+    async def load() -> Account | None:
+        account = await repo.get_by_id(account_id)
+        return detached_copy(account) if account else None
+
+    account = await single_flight.do(read_key(session, "account", account_id), load)
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls sharing a key.
+
+    The first caller (leader) runs the call; others (followers) await its
+    future. Exceptions are shared like results. If the leader is cancelled
+    (e.g. its client disconnected), a follower takes over and runs the call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize SingleFlight with no calls in flight."""
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        self.executed = 0  # Calls run
+        self.shared = 0  # Calls answered by another caller's execution
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn, or wait for the identical call already in flight.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function performing the call
+
+        Returns:
+            fn's result (possibly from another caller's execution)
+        """
+        while (future := self._calls.get(key)) is not None:
+            try:
+                result: T = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                continue  # The leader was cancelled: take over
+            self.shared += 1
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.executed += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved: no warning when nobody waited
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> dict[str, int]:
+        """
+        Snapshot of coalescing counters.
+
+        Returns:
+            Calls executed, calls shared and calls currently in flight
+        """
+        return {
+            "executed": self.executed,
+            "shared": self.shared,
+            "in_flight": len(self._calls),
+        }
+
+
+def read_key(session: AsyncSession, *parts: Hashable | BaseModel) -> tuple[Any, ...]:
+    """
+    Build the coalescing key of a read.
+
+    Args:
+        session: Session the read runs on (its engine scopes the key)
+        *parts: Query name, principal scope and parameters; Pydantic
+            parameter models are normalised to their JSON form
+
+    Returns:
+        Hashable key
+    """
+    return (
+        id(session.bind),
+        *(
+            part.model_dump_json() if isinstance(part, BaseModel) else part
+            for part in parts
+        ),
+    )
+
+
+def detached_copy(instance: T) -> T:
+    """
+    Copy an ORM instance's column values into a new, session-less instance.
+
+    The copy keeps no reference to the original's session, so it stays
+    readable after that session is closed, rolled back or expired.
+    Relationships are not copied (responses embed reference data from
+    core.catalog). The source's columns must be loaded (they are read
+    here, while its session is still open).
+
+    Args:
+        instance: Persistent ORM instance
+
+    Returns:
+        Transient instance of the same class with the same column values
+    """
+    mapper = inspect(instance).mapper
+    copy = mapper.class_manager.new_instance()
+    for attr in mapper.column_attrs:
+        set_committed_value(copy, attr.key, getattr(instance, attr.key))
+    return copy
+
+
+# Process-wide coalescer
+single_flight = SingleFlight()
@@ -0,0 +1,251 @@
+"""
+Slow-query capture with sampled EXPLAIN plans.
+
+This module provides:
+- SlowQuery: Captured slow statement (shape, parameter types, duration, request)
+- SlowQueryLog: Bounded in-memory buffer plus rotating JSON-lines file
+- slow_query_log: Process-wide SlowQueryLog fed by core.query_recorder
+- enable_explain: Allow sampled EXPLAIN (ANALYZE, BUFFERS) on an engine
+
+Statements slower than SLOW_QUERY_THRESHOLD_MS are captured without
+parameter values (only their types), so no user data is stored. A sample
+of slow SELECT statements (SLOW_QUERY_EXPLAIN_SAMPLE_RATE) is re-run
+out-of-band under EXPLAIN (ANALYZE, BUFFERS) on a separate connection,
+inside a rolled-back transaction with a statement timeout. At most one
+EXPLAIN runs at a time.
+"""
+
+import asyncio
+import json
+import logging
+import random
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.config import settings
+from core.logging import LazyRotatingFileHandler, request_id_var
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SlowQuery:
+    """
+    Slow statement captured for analysis.
+
+    Attributes:
+        captured_at: When the statement finished (ISO 8601, UTC)
+        request_id: Request that issued the statement (None outside requests)
+        statement: Normalized statement shape
+        parameter_types: Types of bound parameters (values are not stored)
+        duration_ms: Execution time in milliseconds
+        plan: EXPLAIN (ANALYZE, BUFFERS) output, when sampled
+    """
+
+    captured_at: str
+    request_id: str | None
+    statement: str
+    parameter_types: list[str] | dict[str, str]
+    duration_ms: float
+    plan: str | None = None
+
+
+def parameter_types(parameters: Any) -> list[str] | dict[str, str]:
+    """
+    Describe bound parameters by type only.
+
+    Args:
+        parameters: DBAPI parameters (sequence, mapping or executemany list)
+
+    Returns:
+        Parameter type names, positional or by name
+    """
+    if (
+        isinstance(parameters, list)
+        and parameters
+        and isinstance(parameters[0], (tuple, list, dict))
+    ):
+        parameters = parameters[0]  # executemany: first row is representative
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (tuple, list)):
+        return [type(value).__name__ for value in parameters]
+    return []
+
+
+class SlowQueryLog:
+    """
+    Bounded log of slow statements.
+
+    Keeps the most recent entries in memory for the admin endpoint and
+    appends every entry as a JSON line to a rotating file (when file
+    logging is enabled).
+    """
+
+    def __init__(self, max_entries: int = 200):
+        """
+        Initialize slow query log.
+
+        Args:
+            max_entries: In-memory entries kept (oldest dropped first)
+        """
+        self.entries: deque[SlowQuery] = deque(maxlen=max_entries)
+        self._explain_engines: dict[int, AsyncEngine] = {}
+        self._explain_tasks: set[asyncio.Task[None]] = set()
+        self._file_handler: LazyRotatingFileHandler | None = None
+
+    def observe(
+        self,
+        shape: str,
+        statement: str,
+        parameters: Any,
+        duration: float,
+        engine: Engine,
+    ) -> None:
+        """
+        Capture a statement if it exceeded the slow query threshold.
+
+        Args:
+            shape: Normalized statement shape
+            statement: SQL statement as executed (for EXPLAIN)
+            parameters: DBAPI parameters as executed (for EXPLAIN)
+            duration: Execution time in seconds
+            engine: Sync engine that executed the statement
+        """
+        duration_ms = duration * 1000
+        if duration_ms < settings.slow_query_threshold_ms:
+            return
+
+        entry = SlowQuery(
+            captured_at=datetime.now(UTC).isoformat(),
+            request_id=request_id_var.get(),
+            statement=shape,
+            parameter_types=parameter_types(parameters),
+            duration_ms=round(duration_ms, 3),
+        )
+        self.entries.append(entry)
+        logger.warning(
+            f"Slow query ({duration_ms:.0f}ms, request_id={entry.request_id}): "
+            f"{shape[:500]}"
+        )
+
+        if self._should_explain(statement, engine):
+            self._schedule_explain(entry, statement, parameters, engine)
+        else:
+            self._write(entry)
+
+    def recent(self, limit: int = 50) -> list[SlowQuery]:
+        """
+        Get the most recent slow queries, newest first.
+
+        Args:
+            limit: Maximum entries to return
+
+        Returns:
+            List of SlowQuery entries
+        """
+        return list(reversed(self.entries))[:limit]
+
+    def enable_explain(self, engine: AsyncEngine) -> None:
+        """
+        Allow sampled EXPLAIN runs for statements executed on engine.
+
+        Args:
+            engine: Engine whose slow statements may be explained
+        """
+        self._explain_engines[id(engine.sync_engine)] = engine
+
+    # ------------------------------------------------------------------------
+    # EXPLAIN
+    # ------------------------------------------------------------------------
+
+    def _should_explain(self, statement: str, engine: Engine) -> bool:
+        """Decide whether to sample this statement for EXPLAIN ANALYZE."""
+        if self._explain_tasks or id(engine) not in self._explain_engines:
+            return False
+        # ANALYZE executes the statement: only plain reads are safe to re-run
+        head = statement.lstrip().upper()
+        if not head.startswith("SELECT") or "FOR UPDATE" in head:
+            return False
+        return random.random() < settings.slow_query_explain_sample_rate
+
+    def _schedule_explain(
+        self, entry: SlowQuery, statement: str, parameters: Any, engine: Engine
+    ) -> None:
+        """Run EXPLAIN in a background task (needs a running event loop)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(entry)
+            return
+        task = loop.create_task(
+            self._explain(
+                entry, statement, parameters, self._explain_engines[id(engine)]
+            )
+        )
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+    async def _explain(
+        self, entry: SlowQuery, statement: str, parameters: Any, engine: AsyncEngine
+    ) -> None:
+        """Attach the EXPLAIN (ANALYZE, BUFFERS) plan to entry, then persist it."""
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(
+                    text(
+                        "SET LOCAL statement_timeout = "
+                        f"{int(settings.slow_query_explain_timeout_ms)}"
+                    )
+                )
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+                )
+                entry.plan = "\n".join(row[0] for row in result)
+                await conn.rollback()
+        except Exception as e:
+            logger.warning(f"EXPLAIN of slow query failed: {e}")
+        self._write(entry)
+
+    # ------------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------------
+
+    def _write(self, entry: SlowQuery) -> None:
+        """Append entry to the rotating slow query file."""
+        if not settings.log_file_enabled:
+            return
+        try:
+            if self._file_handler is None:
+                self._file_handler = LazyRotatingFileHandler(
+                    settings.slow_query_log_path,
+                    maxBytes=settings.log_file_max_bytes,
+                    backupCount=settings.log_file_backup_count,
+                    encoding="utf-8",
+                    delay=True,
+                )
+            self._file_handler.emit(
+                logging.makeLogRecord({"msg": json.dumps(asdict(entry))})
+            )
+        except OSError as e:
+            logger.error(f"Failed to write slow query log: {e}")
+
+
+# Process-wide slow query log
+slow_query_log = SlowQueryLog(max_entries=settings.slow_query_buffer_size)
+
+
+def enable_explain(engine: AsyncEngine) -> None:
+    """
+    Allow sampled EXPLAIN runs on an application engine.
+
+    Args:
+        engine: Engine whose slow statements may be explained
+    """
+    slow_query_log.enable_explain(engine)
@@ -0,0 +1,167 @@
+"""
+In-memory typeahead index.
+
+This module provides:
+- TypeaheadIndex: Substring search over a small, static set of values,
+  ranked by match quality
+- normalize: Case-, accent- and punctuation-insensitive form of a text
+
+Texts are normalized ("Crédit Agricole S.A." -> "credit agricole s a")
+and indexed by trigram, plus by the one- and two-character prefixes of
+their words. A query of three characters or more intersects the posting
+lists of its trigrams and keeps the values whose text contains the query
+(the semantics of ILIKE '%term%'); shorter queries match word prefixes.
+Either way only a handful of candidates are examined, so lookups take
+microseconds rather than a sequential scan.
+
+Matches are ranked by quality - whole text, start of text, start of a
+word, anywhere - then by an optional preference (e.g. the user's
+country), then shortest text first.
+
+Indexes are immutable: rebuild one when the values change.
+
+Example:
+    index = TypeaheadIndex((bank, (bank.name, bank.short_name)) for bank in banks)
+    index.search("deut", limit=5, prefer=lambda bank: bank.country_code == "DE")
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Match quality tiers (lower ranks first)
+EXACT, PREFIX, WORD_PREFIX, SUBSTRING = range(4)
+
+# Posting lists intersected per query (the rarest trigrams of the query)
+_MAX_INTERSECTED = 3
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize a text for matching.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Casefolded text without accents, words separated by single spaces
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(_NON_WORD.sub(" ", stripped).split())
+
+
+def _trigrams(text: str) -> set[str]:
+    """Every three-character substring of text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class TypeaheadIndex(Generic[T]):
+    """
+    Trigram and word-prefix index of values searchable by their texts.
+    """
+
+    def __init__(self, entries: Iterable[tuple[T, Sequence[str]]]):
+        """
+        Build the index.
+
+        Args:
+            entries: Values with the texts they are found by (e.g. name and
+                short name)
+        """
+        normalized = [
+            (value, tuple(filter(None, map(normalize, texts))))
+            for value, texts in entries
+        ]
+        # Positions follow the final tie-break (shortest text first), so
+        # ranking only compares tiers, preference and positions
+        normalized.sort(
+            key=lambda entry: (min(map(len, entry[1]), default=0), entry[1])
+        )
+
+        self._values: list[T] = [value for value, _ in normalized]
+        # Texts with a leading space: " " + query matches the start of a word
+        self._texts: list[tuple[str, ...]] = [
+            tuple(f" {text}" for text in texts) for _, texts in normalized
+        ]
+        self._postings: dict[str, set[int]] = defaultdict(set)
+        for position, (_, texts) in enumerate(normalized):
+            for text in texts:
+                for gram in _trigrams(text):
+                    self._postings[gram].add(position)
+                for word in text.split():
+                    self._postings[word[:1]].add(position)
+                    self._postings[word[:2]].add(position)
+
+    def __len__(self) -> int:
+        """Number of indexed values."""
+        return len(self._values)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        prefer: Callable[[T], bool] | None = None,
+    ) -> list[T]:
+        """
+        Find the best matches of a query.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of results
+            prefer: Rank values it accepts first within a match tier
+
+        Returns:
+            Matching values, best first
+        """
+        query = normalize(query)
+        if not query:
+            return []
+
+        substring = len(query) >= 3
+        if substring:
+            postings = sorted(
+                (self._postings.get(gram, set()) for gram in _trigrams(query)), key=len
+            )
+            # The rarest trigrams prune enough; matches are verified below
+            candidates = set.intersection(*postings[:_MAX_INTERSECTED])
+        else:
+            # Too short for trigrams: match the start of words only
+            candidates = self._postings.get(query, set())
+
+        # Best `limit` positions per (tier, not preferred) bucket
+        buckets: dict[tuple[int, bool], list[int]] = defaultdict(list)
+        full = [0] * (SUBSTRING + 1)  # Full buckets per tier
+        word = f" {query}"
+        for position in sorted(candidates):
+            tier = SUBSTRING + 1
+            for text in self._texts[position]:
+                if text == word:
+                    tier = EXACT
+                    break
+                if text.startswith(word):
+                    tier = min(tier, PREFIX)
+                elif word in text:
+                    tier = min(tier, WORD_PREFIX)
+                elif substring and query in text:
+                    tier = min(tier, SUBSTRING)
+            if tier > SUBSTRING:
+                continue  # Trigrams matched but not contiguously
+            if full[tier] == 2:
+                continue  # Only later (worse ranked) positions left for this tier
+            preferred = prefer is not None and prefer(self._values[position])
+            bucket = buckets[(tier, not preferred)]
+            bucket.append(position)
+            if len(bucket) == limit:
+                full[tier] += 1 if prefer is not None else 2
+
+        ranked = [
+            position for _, bucket in sorted(buckets.items()) for position in bucket
+        ]
+        return [self._values[position] for position in ranked[:limit]]
@@ -0,0 +1,126 @@
+"""
+Startup warm-up.
+
+This module provides:
+- warm_up: Prepare a fresh worker before it reports ready
+
+A new worker otherwise pays, on its first requests, for:
+- Lazy mapper configuration (configure_mappers)
+- TCP/TLS handshakes and authentication of every pooled connection
+- SQLAlchemy compilation of each statement (cached per engine afterwards)
+
+warm_up() does that work up front: it configures mappers, opens
+db_pool_size connections on every engine, and runs the hottest repository
+statements once on every engine (auth lookups, account/transaction
+listings, reference data) so their compiled forms are cached where the
+statements will run - listings are served by replicas - and loads the
+reference catalog (core.catalog). Each step is best effort - a failure is
+logged and the worker still becomes ready.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from contextlib import AsyncExitStack
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import configure_mappers
+
+from core.catalog import reference_catalog
+from core.config import settings
+from core.database import create_sessionmaker
+from repositories import (
+    AccountRepository,
+    AccountTypeRepository,
+    FinancialInstitutionRepository,
+    RefreshTokenRepository,
+    TransactionRepository,
+    UserRepository,
+)
+from schemas import (
+    AccountFilterParams,
+    AccountSortParams,
+    FinancialInstitutionFilterParams,
+    FinancialInstitutionSortParams,
+    PaginationParams,
+    TransactionFilterParams,
+    TransactionSortParams,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up(engines: list[AsyncEngine]) -> None:
+    """
+    Warm up mappers, connection pools and the statement cache.
+
+    Args:
+        engines: Primary and replica engines to warm up
+    """
+    start = time.perf_counter()
+
+    configure_mappers()
+
+    for engine in engines:
+        try:
+            await _open_pool(engine, settings.db_pool_size)
+        except Exception as e:
+            logger.warning(f"Warm-up could not open pool for {engine.url.host}: {e}")
+
+    # The compiled statement cache is per engine: prime replicas too
+    for engine in engines:
+        try:
+            async with create_sessionmaker(engine)() as session:
+                await _prime_statements(session)
+                await session.rollback()
+        except Exception as e:
+            logger.warning(
+                f"Warm-up could not prime statements on {engine.url.host}: {e}"
+            )
+
+    # Logs and keeps the worker going on failure (misses reload on demand)
+    await reference_catalog.refresh()
+
+    logger.info(f"Warm-up finished in {time.perf_counter() - start:.3f}s")
+
+
+async def _open_pool(engine: AsyncEngine, size: int) -> None:
+    """Check out size connections at once so the pool opens all of them."""
+    # Each connection is registered on the stack as soon as it opens, and the
+    # task group waits for every checkout (even after a failure) before the
+    # stack returns them all to the pool
+    try:
+        async with AsyncExitStack() as stack:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(size):
+                    group.create_task(stack.enter_async_context(engine.connect()))
+    except ExceptionGroup as group_error:
+        raise group_error.exceptions[0] from group_error
+
+
+async def _prime_statements(session: AsyncSession) -> None:
+    """Run the hottest statements once with placeholder values."""
+    placeholder_id = uuid.uuid4()
+    pagination = PaginationParams()
+
+    # Authentication (every request, login, token refresh)
+    await UserRepository(session).get_by_id(placeholder_id)
+    await UserRepository(session).get_by_email("warmup@example.invalid")
+    await RefreshTokenRepository(session).get_by_token_hash("0" * 64)
+
+    # Most requested listings
+    await AccountRepository(session).list_for_user(
+        placeholder_id, AccountFilterParams(), AccountSortParams(), pagination
+    )
+    await TransactionRepository(session).list_for_user(
+        placeholder_id, TransactionFilterParams(), TransactionSortParams(), pagination
+    )
+
+    # Reference data
+    await AccountTypeRepository(session).get_all_ordered()
+    await FinancialInstitutionRepository(session).list_all(
+        FinancialInstitutionFilterParams(),
+        FinancialInstitutionSortParams(),
+        pagination,
+    )
@@ -15,12 +15,15 @@ from fastapi import APIRouter, FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy.exc import DBAPIError
 
 from api import routes
 from core import settings
+from core.compression import CompressionMiddleware
 from core.exceptions import AppException
 from core.handlers import (
     app_exception_handler,
+    database_error_handler,
     general_exception_handler,
     rate_limit_handler,
     validation_exception_handler,
@@ -28,11 +31,13 @@ from core.handlers import (
 from core.lifespan import lifespan
 from core.logging import setup_logging
 from core.middleware import (
+    QueryRecorderMiddleware,
+    ReadYourWritesMiddleware,
     RequestIDMiddleware,
     RequestLoggingMiddleware,
     SecurityHeadersMiddleware,
 )
-from core.rate_limit import limiter
+from core.rate_limit import RateLimitMiddleware, limiter
 
 # Setup logging
 setup_logging()
@@ -60,6 +65,7 @@ app.state.limiter = limiter
 # ============================================================================
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(DBAPIError, database_error_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
 
@@ -67,19 +73,38 @@ app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
 # ============================================================================
 # Middleware Setup (Order matters!)
 # ============================================================================
-# 1. Request ID middleware (must be first to add request_id to state)
+# 1. Global rate limit (in-memory buckets reconciled with Redis; innermost,
+#    so rejections still carry a request ID and are logged)
+if settings.rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware)
+
+# 2. Request ID middleware (must be first to add request_id to state)
 app.add_middleware(RequestIDMiddleware)
 
-# 2. Request logging middleware (logs all requests with request_id)
+# 3. Request logging middleware (logs all requests with request_id)
 app.add_middleware(RequestLoggingMiddleware)
 
-# 3. Security headers middleware
+# 4. Query recorder middleware (statement counts, N+1 detection)
+app.add_middleware(QueryRecorderMiddleware)
+
+# 5. Read-your-writes marker (replica stickiness across workers)
+if settings.database_replica_urls:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        sticky_seconds=settings.db_replica_sticky_seconds,
+    )
+
+# 6. Security headers middleware
 app.add_middleware(
     SecurityHeadersMiddleware,
     enable_hsts=settings.is_production,
 )
 
-# 4. CORS middleware (should be last to ensure headers are added to all responses)
+# 7. Compression middleware (negotiated gzip/br/zstd, sees final headers)
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware)
+
+# 8. CORS middleware (should be last to ensure headers are added to all responses)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -101,6 +126,8 @@ v1_router.include_router(routes.accounts.router)
 v1_router.include_router(routes.account_shares.router)
 v1_router.include_router(routes.transactions.router)
 v1_router.include_router(routes.audit_logs.router)
+v1_router.include_router(routes.admin.router)
+v1_router.include_router(routes.batch.router)
 
 # Create API Router
 api_router = APIRouter(prefix="/api")
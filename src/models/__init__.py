@@ -7,8 +7,10 @@ Import models from this module to ensure proper initialization.
 
 from .account import Account
 from .account_share import AccountShare
+from .account_summary import AccountSummary
 from .account_type import AccountType
 from .audit_log import AuditLog
+from .audit_user_agent import AuditUserAgent
 from .base import Base
 from .card import Card
 from .enums import (
@@ -21,6 +23,7 @@ from .enums import (
 )
 from .financial_institution import FinancialInstitution
 from .mixins import AuditFieldsMixin, SoftDeleteMixin, TimestampMixin
+from .reference_data_version import ReferenceDataVersion
 from .refresh_token import RefreshToken
 from .transaction import Transaction
 from .user import User
@@ -38,11 +41,13 @@ __all__ = [
     "RefreshToken",
     # Audit models
     "AuditLog",
+    "AuditUserAgent",
     "AuditAction",
     "AuditStatus",
     # Account models
     "Account",
     "AccountShare",
+    "AccountSummary",
     "AccountType",  # Master data table (replaces enum)
     "PermissionLevel",
     # Card models
@@ -54,4 +59,5 @@ __all__ = [
     # Master data models
     "FinancialInstitution",
     "InstitutionType",
+    "ReferenceDataVersion",
 ]
@@ -68,6 +68,7 @@ class Account(Base, TimestampMixin, SoftDeleteMixin, AuditFieldsMixin):
         owner: User object who owns this account (via user_id)
         financial_institution: FinancialInstitution object (via financial_institution_id, eager-loaded)
         account_type: AccountType object (via account_type_id, eager-loaded)
+        summary: AccountSummary with transaction statistics (loaded by listings)
         shares: List of AccountShare objects (who has access and permission level)
 
     Validation:
@@ -213,14 +214,22 @@ class Account(Base, TimestampMixin, SoftDeleteMixin, AuditFieldsMixin):
     financial_institution: Mapped["FinancialInstitution"] = relationship(  # ty:ignore[unresolved-reference]  # noqa: F821
         "FinancialInstitution",
         foreign_keys=[financial_institution_id],
-        lazy="selectin",  # Async-safe eager loading to prevent N+1 queries
+        lazy="raise_on_sql",  # Responses embed it from core.catalog
         back_populates="accounts",
     )
 
     account_type: Mapped[AccountType] = relationship(  # type: ignore
         "AccountType",
         foreign_keys=[account_type_id],
-        lazy="selectin",  # Async-safe eager loading to prevent N+1 queries
+        lazy="raise_on_sql",  # Responses embed it from core.catalog
+    )
+
+    summary: Mapped["AccountSummary | None"] = relationship(  # ty:ignore[unresolved-reference]  # noqa: F821
+        "AccountSummary",
+        foreign_keys="AccountSummary.account_id",
+        lazy="raise_on_sql",  # Loaded explicitly by the account listing
+        uselist=False,
+        viewonly=True,  # Maintained with SQL upserts (AccountSummaryRepository)
     )
 
     shares: Mapped[list["AccountShare"]] = relationship(  # ty:ignore[unresolved-reference]  # noqa: F821
@@ -252,6 +261,6 @@ class Account(Base, TimestampMixin, SoftDeleteMixin, AuditFieldsMixin):
         """String representation of Account."""
         return (
             f"Account(id={self.id}, name={self.account_name}, "
-            f"type={self.account_type.key}, balance={self.current_balance} {self.currency}, "
-            f"institution={self.financial_institution.short_name})"
+            f"type={self.account_type_id}, balance={self.current_balance} {self.currency}, "
+            f"institution={self.financial_institution_id})"
         )
@@ -0,0 +1,113 @@
+"""
+AccountSummary model for per-account activity statistics.
+
+This module defines:
+- AccountSummary: Transaction statistics of one account
+
+Architecture:
+- One row per account, maintained incrementally by the transaction write
+  paths (create, update, delete, split, join) with relative upserts, so
+  listing accounts never aggregates transactions
+- Counts and dates cover top-level transactions (split children do not
+  change balances either); to_review_count also counts split children,
+  which are reviewed individually
+- Month statistics cover the calendar month (UTC) in month_start; rows
+  whose month_start is not the current month are read as zero
+- Rebuilt from the transactions table by
+  AccountSummaryRepository.rebuild_all() (repair job)
+"""
+
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class AccountSummary(Base):
+    """
+    Activity statistics of an account.
+
+    Attributes:
+        id: UUID primary key
+        account_id: Summarized account (unique, deleted with the account)
+        transaction_count: Non-deleted top-level transactions
+        to_review_count: Non-deleted transactions (including split children)
+            with review_status to_review
+        last_transaction_date: Latest transaction_date of the top-level
+            transactions (NULL if none)
+        month_start: First day of the month the month statistics cover
+        month_inflow: Sum of positive amounts dated in that month
+        month_outflow: Sum of negative amounts dated in that month, as a
+            positive number
+        updated_at: When the summary last changed
+
+    Unique Constraints:
+        - account_id must be unique - enables INSERT ... ON CONFLICT updates
+    """
+
+    __tablename__ = "account_summaries"
+
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+
+    transaction_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    to_review_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    last_transaction_date: Mapped[date | None] = mapped_column(
+        Date,
+        nullable=True,
+    )
+
+    month_start: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+
+    month_inflow: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+    )
+
+    month_outflow: Mapped[Decimal] = mapped_column(
+        Numeric(15, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+    @staticmethod
+    def current_month() -> date:
+        """First day of the current month (UTC)."""
+        return datetime.now(UTC).date().replace(day=1)
+
+    def __repr__(self) -> str:
+        """String representation of AccountSummary."""
+        return (
+            f"AccountSummary(account_id={self.account_id}, "
+            f"transactions={self.transaction_count}, "
+            f"to_review={self.to_review_count})"
+        )
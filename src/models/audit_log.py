@@ -14,10 +14,11 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from .audit_user_agent import AuditUserAgent
 from .base import Base
 from .enums import AuditAction, AuditStatus
 from .user import User
@@ -49,15 +50,24 @@ class AuditLog(Base):
         entity_id: UUID of the affected entity
         old_values: JSONB snapshot of values before the action
         new_values: JSONB snapshot of values after the action
+        is_compact: True if old_values/new_values hold only the changed keys
         description: Human-readable description of the action
         ip_address: IP address of the client
-        user_agent: User agent string of the client
+        user_agent_id: Interned user agent (FK to audit_user_agents)
+        user_agent_text: Inline user agent string (rows written before interning)
         request_id: Correlation ID for tracing requests
         status: Status of the action (SUCCESS, FAILURE, PARTIAL)
         error_message: Error message if status is FAILURE
         extra_metadata: Additional context as JSONB
         created_at: When the action occurred (indexed for queries)
         user: Relationship to User model
+        user_agent_entry: Relationship to the interned AuditUserAgent
+
+    Compact Encoding:
+    - UPDATE rows may store only the changed keys (is_compact=True);
+      AuditService reconstructs the full before/after view on read
+    - User agents are dictionary-encoded in audit_user_agents
+    - JSONB and text columns use lz4 TOAST compression (set in migration)
 
     Data Retention:
     - 7 years for financial compliance (configurable via settings)
@@ -77,7 +87,7 @@ class AuditLog(Base):
             entity_id=user.id,
             description="User logged in successfully",
             ip_address=request.client.host,
-            user_agent=request.headers.get("User-Agent"),
+            user_agent_id=interned_user_agent.id,
             request_id=request.state.request_id,
             status=AuditStatus.SUCCESS,
         )
@@ -136,6 +146,14 @@ class AuditLog(Base):
         nullable=True,
     )
 
+    # Whether old_values/new_values hold only the changed keys
+    is_compact: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+    )
+
     # Human-readable description
     description: Mapped[str | None] = mapped_column(
         Text,
@@ -149,11 +167,20 @@ class AuditLog(Base):
         index=True,
     )
 
-    user_agent: Mapped[str | None] = mapped_column(
+    # Inline user agent, only populated by rows written before interning
+    user_agent_text: Mapped[str | None] = mapped_column(
+        "user_agent",
         String(500),
         nullable=True,
     )
 
+    # Dictionary-encoded user agent
+    user_agent_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("audit_user_agents.id", ondelete="RESTRICT"),
+        nullable=True,
+    )
+
     request_id: Mapped[str | None] = mapped_column(
         String(36),  # UUID length
         nullable=True,
@@ -193,6 +220,12 @@ class AuditLog(Base):
         lazy="selectin",
     )
 
+    # Relationship to the interned user agent string
+    user_agent_entry: Mapped[AuditUserAgent | None] = relationship(
+        "AuditUserAgent",
+        lazy="selectin",
+    )
+
     # Composite indexes for common query patterns
     __table_args__ = (
         # Index for user's audit logs
@@ -212,6 +245,18 @@ class AuditLog(Base):
         ),
     )
 
+    @property
+    def user_agent(self) -> str | None:
+        """
+        Client user agent, resolved from the lookup table when interned.
+
+        Returns:
+            User agent string or None if not recorded
+        """
+        if self.user_agent_entry is not None:
+            return self.user_agent_entry.user_agent
+        return self.user_agent_text
+
     def __repr__(self) -> str:
         """String representation of AuditLog."""
         return (
@@ -0,0 +1,54 @@
+"""
+AuditUserAgent model for dictionary-encoded user agent strings.
+
+This module defines:
+- AuditUserAgent: Lookup table of distinct client user agent strings
+
+Architecture:
+- Each distinct user agent string is stored exactly once
+- Audit logs reference it through audit_logs.user_agent_id
+- Rows are append-only, like the audit logs that reference them
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class AuditUserAgent(Base):
+    """
+    Interned user agent string referenced by audit logs.
+
+    Mobile and browser clients send a small set of long, highly repetitive
+    User-Agent headers. Storing them once and referencing them by ID keeps
+    the audit_logs table compact.
+
+    Attributes:
+        id: UUID primary key
+        user_agent: Distinct user agent string (max 500 chars, unique)
+        created_at: When the user agent was first seen
+
+    Unique Constraints:
+        - user_agent must be unique - enables INSERT ... ON CONFLICT interning
+    """
+
+    __tablename__ = "audit_user_agents"
+
+    user_agent: Mapped[str] = mapped_column(
+        String(500),
+        nullable=False,
+        unique=True,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of AuditUserAgent."""
+        return f"AuditUserAgent(id={self.id}, user_agent={self.user_agent!r})"
@@ -299,6 +299,7 @@ class AuditAction(str, enum.Enum):
     CREATE_FINANCIAL_INSTITUTION = "CREATE_FINANCIAL_INSTITUTION"
     UPDATE_FINANCIAL_INSTITUTION = "UPDATE_FINANCIAL_INSTITUTION"
     DEACTIVATE_FINANCIAL_INSTITUTION = "DEACTIVATE_FINANCIAL_INSTITUTION"
+    IMPORT_FINANCIAL_INSTITUTIONS = "IMPORT_FINANCIAL_INSTITUTIONS"
 
     # Account type actions
     CREATE_ACCOUNT_TYPE = "CREATE_ACCOUNT_TYPE"
@@ -314,6 +315,7 @@ class AuditAction(str, enum.Enum):
     ACCOUNT_DEACTIVATE = "ACCOUNT_DEACTIVATE"
     ACCOUNT_LOCK = "ACCOUNT_LOCK"
     ACCOUNT_UNLOCK = "ACCOUNT_UNLOCK"
+    VERIFY_ACCOUNT_BALANCES = "VERIFY_ACCOUNT_BALANCES"
 
     # Security events
     RATE_LIMIT_EXCEEDED = "RATE_LIMIT_EXCEEDED"
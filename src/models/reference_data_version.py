@@ -0,0 +1,63 @@
+"""
+ReferenceDataVersion model for reference data change tracking.
+
+This module defines:
+- ReferenceDataVersion: Version counter of one reference data table
+
+Architecture:
+- One row per reference table (account_types, financial_institutions)
+- Statement-level triggers on those tables increment the counter on every
+  INSERT, UPDATE, DELETE or TRUNCATE, whatever the writer (API, migrations,
+  manual SQL)
+- The counter feeds the ETags of reference data endpoints
+  (see core.reference_data)
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ReferenceDataVersion(Base):
+    """
+    Version counter of a reference data table.
+
+    Attributes:
+        id: UUID primary key
+        table_name: Name of the tracked table (unique)
+        version: Incremented on every write statement against the table
+        updated_at: When the table last changed
+
+    Unique Constraints:
+        - table_name must be unique - enables INSERT ... ON CONFLICT bumps
+    """
+
+    __tablename__ = "reference_data_versions"
+
+    table_name: Mapped[str] = mapped_column(
+        String(63),
+        nullable=False,
+        unique=True,
+    )
+
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=1,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of ReferenceDataVersion."""
+        return (
+            f"ReferenceDataVersion(table_name={self.table_name!r}, "
+            f"version={self.version})"
+        )
@@ -6,6 +6,7 @@ This module exports all repository classes for database operations.
 
 from .account_repository import AccountRepository
 from .account_share_repository import AccountShareRepository
+from .account_summary_repository import AccountSummaryRepository
 from .account_type_repository import AccountTypeRepository
 from .audit_repository import AuditLogRepository
 from .base import BaseRepository
@@ -18,6 +19,7 @@ from .user_repository import UserRepository
 __all__ = [
     "AccountRepository",
     "AccountShareRepository",
+    "AccountSummaryRepository",
     "AccountTypeRepository",
     "AuditLogRepository",
     "BaseRepository",
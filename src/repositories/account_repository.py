@@ -5,15 +5,29 @@ This module provides database operations for Account model, including:
 - Standard CRUD operations (inherited from BaseRepository)
 - Custom queries: get by user, get by name, check name existence
 - Pagination and filtering support
+- Fleet-wide balance verification (one grouped pass, one UPDATE ... FROM)
 """
 
 import uuid
-
-from sqlalchemy import UnaryExpression, and_, asc, desc, func, select
+from decimal import Decimal
+
+from sqlalchemy import (
+    Numeric,
+    UnaryExpression,
+    and_,
+    asc,
+    column,
+    desc,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
-from models import Account, AccountShare
+from models import Account, AccountShare, Transaction
 from schemas import AccountFilterParams, AccountSortParams, PaginationParams, SortOrder
 from .base import BaseRepository
 
@@ -47,14 +61,14 @@ class AccountRepository(BaseRepository[Account]):
         """
         Get all accounts for a specific user.
 
-        Includes eager loading of financial_institution and account_type relationships
-        to prevent N+1 queries. Automatically excludes soft-deleted accounts via BaseRepository.
+        Account types and institutions are not loaded (responses embed them from
+        core.catalog). Automatically excludes soft-deleted accounts via BaseRepository.
 
         Args:
             user_id: ID of the user who owns the accounts
 
         Returns:
-            List of Account instances with eager-loaded institution and account type
+            List of Account instances
 
         Example:
             # Get all checking accounts for user at specific institution
@@ -64,28 +78,18 @@ class AccountRepository(BaseRepository[Account]):
             Account.user_id == user_id,
         ]
 
-        load_relationships = [
-            selectinload(Account.financial_institution),
-            selectinload(Account.account_type),
-        ]
-
         order_by = [
             desc(Account.created_at),
             desc(Account.id),
         ]
 
-        return await self._list(
-            filters=filters,
-            load_relationships=load_relationships,
-            order_by=order_by,
-        )
+        return await self._list(filters=filters, order_by=order_by)
 
     async def get_shared_with_user(self, user_id: uuid.UUID) -> list[Account]:
         """
         Get all accounts shared with a specific user.
 
         Returns accounts where the user has been granted access via AccountShare.
-        Includes eager loading of financial_institution and account_type relationships.
         Automatically excludes soft-deleted accounts via BaseRepository.
 
         Args:
@@ -106,11 +110,6 @@ class AccountRepository(BaseRepository[Account]):
             AccountShare.user_id == user_id,
         ]
 
-        load_relationships = [
-            selectinload(Account.financial_institution),
-            selectinload(Account.account_type),
-        ]
-
         order_by = [
             desc(Account.created_at),
             desc(Account.id),
@@ -122,7 +121,6 @@ class AccountRepository(BaseRepository[Account]):
         )
         query = self._apply_soft_delete_filter(query)
 
-        query = query.options(*load_relationships)
         query = query.where(and_(*filters))
         query = query.order_by(*order_by)
 
@@ -272,15 +270,112 @@ class AccountRepository(BaseRepository[Account]):
         # Add secondary sort by id for deterministic pagination
         order_by.append(desc(Account.id))
 
-        load_relationships = [
-            selectinload(Account.financial_institution),
-            selectinload(Account.account_type),
-        ]
-
         return await self._list_and_count(
             filters=filters,
             order_by=order_by,
-            load_relationships=load_relationships,
+            # Summary statistics ride along in the same query
+            load_relationships=[joinedload(Account.summary)],
             offset=pagination_params.offset,
             limit=pagination_params.page_size,
         )
+
+    # ========================================================================
+    # BALANCE VERIFICATION
+    # ========================================================================
+
+    async def find_balance_mismatches(
+        self,
+    ) -> tuple[int, list[tuple[uuid.UUID, Decimal, Decimal]]]:
+        """
+        Compare every active account's balance with its transactions.
+
+        One grouped pass over accounts and transactions: the expected
+        balance is opening_balance + SUM(amount) of the non-deleted
+        top-level transactions (split children do not change balances).
+
+        Returns:
+            Tuple of (accounts checked, list of (account_id, current_balance,
+            calculated_balance) for mismatching accounts)
+        """
+        ledger = (
+            select(
+                Account.id,
+                Account.current_balance,
+                (
+                    Account.opening_balance
+                    + func.coalesce(func.sum(Transaction.amount), 0)
+                ).label("calculated_balance"),
+            )
+            .select_from(Account)
+            .outerjoin(
+                Transaction,
+                and_(
+                    Transaction.account_id == Account.id,
+                    Transaction.parent_transaction_id.is_(None),
+                    Transaction.deleted_at.is_(None),
+                ),
+            )
+            .where(Account.deleted_at.is_(None))
+            .group_by(Account.id)
+            .subquery("ledger")
+        )
+        mismatch = ledger.c.current_balance != ledger.c.calculated_balance
+        # One row, whatever the number of accounts
+        query = select(
+            func.count(),
+            func.array_agg(ledger.c.id).filter(mismatch),
+            func.array_agg(ledger.c.current_balance).filter(mismatch),
+            func.array_agg(ledger.c.calculated_balance).filter(mismatch),
+        )
+
+        result = await self.session.execute(query)
+        checked, ids, cached, calculated = result.one()
+        return checked, list(zip(ids or [], cached or [], calculated or []))
+
+    async def fix_balances(
+        self, corrections: list[tuple[uuid.UUID, Decimal, Decimal]]
+    ) -> list[uuid.UUID]:
+        """
+        Set the balances found by find_balance_mismatches() in one UPDATE.
+
+        An account is only updated while its balance is still the one that
+        was compared; accounts written in the meantime are left alone (their
+        transactions changed since the comparison). The corrections are sent
+        as three arrays joined with unnest(), so the statement has three
+        bind parameters however many accounts it fixes (asyncpg allows at
+        most 32767 per query).
+
+        Args:
+            corrections: (account_id, current_balance, calculated_balance)
+
+        Returns:
+            IDs of the updated accounts
+        """
+        if not corrections:
+            return []
+
+        account_ids, cached, calculated = zip(*corrections)
+        fixes = (
+            func.unnest(
+                literal(list(account_ids), ARRAY(UUID(as_uuid=True))),
+                literal(list(cached), ARRAY(Numeric(15, 2))),
+                literal(list(calculated), ARRAY(Numeric(15, 2))),
+            )
+            .table_valued(
+                column("account_id", UUID(as_uuid=True)),
+                column("cached_balance", Numeric(15, 2)),
+                column("calculated_balance", Numeric(15, 2)),
+            )
+            .render_derived(name="fixes")
+        )
+        result = await self.session.execute(
+            update(Account)
+            .where(
+                Account.id == fixes.c.account_id,
+                Account.current_balance == fixes.c.cached_balance,
+            )
+            .values(current_balance=fixes.c.calculated_balance, updated_at=func.now())
+            .returning(Account.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,245 @@
+"""
+Account summary repository for database operations.
+
+This module provides database operations for the AccountSummary model:
+- Relative upserts applying the effect of transaction writes
+- Recomputing the last transaction date after removals
+- Rebuilding every summary from the transactions table in one statement
+"""
+
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import Date, and_, case, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Account, AccountSummary, Transaction, TransactionReviewStatus
+from .base import BaseRepository
+
+
+class AccountSummaryRepository(BaseRepository[AccountSummary]):
+    """
+    Repository for AccountSummary model operations.
+
+    Summaries are only written with SQL statements (never through ORM
+    instances), so concurrent transaction writes add up instead of
+    overwriting each other.
+
+    Note:
+        AccountSummary has no soft delete; rows are deleted with their
+        account (ON DELETE CASCADE).
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize AccountSummaryRepository.
+
+        Args:
+            session: Async database session
+        """
+        super().__init__(AccountSummary, session)
+
+    async def apply_delta(
+        self,
+        account_id: uuid.UUID,
+        transaction_count: int,
+        to_review_count: int,
+        last_transaction_date: date | None,
+        month_start: date,
+        month_inflow: Decimal,
+        month_outflow: Decimal,
+    ) -> None:
+        """
+        Add a change to an account's summary, creating it if missing.
+
+        Counts and month totals are added to the stored values, and
+        last_transaction_date only moves forward. When month_start differs
+        from the stored month (the first write of a month), the month
+        totals are recomputed from the transactions table instead: the
+        delta alone would miss transactions dated in the new month but
+        recorded earlier, and removing one of them would make the totals
+        negative. Pending transaction changes must be flushed first.
+
+        Args:
+            account_id: Summarized account
+            transaction_count: Change of the transaction count
+            to_review_count: Change of the to-review count
+            last_transaction_date: Latest added transaction date, if any
+            month_start: Current month (first day)
+            month_inflow: Change of the month inflow
+            month_outflow: Change of the month outflow (positive magnitude)
+        """
+        table = AccountSummary.__table__
+        upsert = insert(table).values(
+            account_id=account_id,
+            transaction_count=transaction_count,
+            to_review_count=to_review_count,
+            last_transaction_date=last_transaction_date,
+            month_start=month_start,
+            month_inflow=month_inflow,
+            month_outflow=month_outflow,
+        )
+        excluded = upsert.excluded
+        same_month = table.c.month_start == excluded.month_start
+        month_end = (month_start + timedelta(days=32)).replace(day=1)
+        in_month = and_(
+            Transaction.account_id == account_id,
+            Transaction.parent_transaction_id.is_(None),
+            Transaction.deleted_at.is_(None),
+            Transaction.transaction_date >= month_start,
+            Transaction.transaction_date < month_end,
+        )
+        zero = Decimal("0.00")
+        # Only evaluated on month rollover (CASE evaluates subqueries lazily)
+        recomputed_inflow = (
+            select(func.coalesce(func.sum(Transaction.amount), zero))
+            .where(in_month, Transaction.amount > 0)
+            .scalar_subquery()
+        )
+        recomputed_outflow = (
+            select(func.coalesce(-func.sum(Transaction.amount), zero))
+            .where(in_month, Transaction.amount < 0)
+            .scalar_subquery()
+        )
+        await self.session.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[table.c.account_id],
+                set_={
+                    "transaction_count": table.c.transaction_count
+                    + excluded.transaction_count,
+                    "to_review_count": table.c.to_review_count
+                    + excluded.to_review_count,
+                    # GREATEST ignores NULLs
+                    "last_transaction_date": func.greatest(
+                        table.c.last_transaction_date, excluded.last_transaction_date
+                    ),
+                    "month_start": excluded.month_start,
+                    "month_inflow": case(
+                        (same_month, table.c.month_inflow + excluded.month_inflow),
+                        else_=recomputed_inflow,
+                    ),
+                    "month_outflow": case(
+                        (same_month, table.c.month_outflow + excluded.month_outflow),
+                        else_=recomputed_outflow,
+                    ),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    async def refresh_last_transaction_date(
+        self, account_id: uuid.UUID, removed_date: date
+    ) -> None:
+        """
+        Recompute last_transaction_date after removing a transaction.
+
+        Only runs the aggregate when the removed date may have been the
+        latest one; pending transaction changes must be flushed first.
+
+        Args:
+            account_id: Summarized account
+            removed_date: transaction_date of the removed transaction
+        """
+        latest = (
+            select(func.max(Transaction.transaction_date))
+            .where(
+                Transaction.account_id == account_id,
+                Transaction.parent_transaction_id.is_(None),
+                Transaction.deleted_at.is_(None),
+            )
+            .scalar_subquery()
+        )
+        await self.session.execute(
+            update(AccountSummary)
+            .where(
+                AccountSummary.account_id == account_id,
+                AccountSummary.last_transaction_date <= removed_date,
+            )
+            .values(last_transaction_date=latest, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+
+    async def rebuild_all(self, month_start: date, month_end: date) -> int:
+        """
+        Recompute the summaries of all active accounts from their transactions.
+
+        One INSERT ... SELECT ... GROUP BY over the transactions table; only
+        summaries that differ from the recomputed values are written.
+
+        Args:
+            month_start: First day of the current month
+            month_end: First day of the next month
+
+        Returns:
+            Number of summaries created or corrected
+        """
+        table = AccountSummary.__table__
+        ledger = Transaction.parent_transaction_id.is_(None)
+        this_month = and_(
+            ledger,
+            Transaction.transaction_date >= month_start,
+            Transaction.transaction_date < month_end,
+        )
+        zero = Decimal("0.00")
+        source = (
+            select(
+                Account.id,
+                func.count(Transaction.id).filter(ledger),
+                func.count(Transaction.id).filter(
+                    Transaction.review_status == TransactionReviewStatus.to_review
+                ),
+                func.max(Transaction.transaction_date).filter(ledger),
+                literal(month_start, Date),
+                func.coalesce(
+                    func.sum(Transaction.amount).filter(
+                        this_month, Transaction.amount > 0
+                    ),
+                    zero,
+                ),
+                func.coalesce(
+                    -func.sum(Transaction.amount).filter(
+                        this_month, Transaction.amount < 0
+                    ),
+                    zero,
+                ),
+            )
+            .select_from(Account)
+            .outerjoin(
+                Transaction,
+                and_(
+                    Transaction.account_id == Account.id,
+                    Transaction.deleted_at.is_(None),
+                ),
+            )
+            .where(Account.deleted_at.is_(None))
+            .group_by(Account.id)
+        )
+        columns = [
+            "account_id",
+            "transaction_count",
+            "to_review_count",
+            "last_transaction_date",
+            "month_start",
+            "month_inflow",
+            "month_outflow",
+        ]
+        # Server defaults: the ORM-side ones would give every row the same id
+        upsert = insert(table).from_select(columns, source, include_defaults=False)
+        excluded = upsert.excluded
+        values = {name: excluded[name] for name in columns[1:]}
+        changed = tuple_(*(table.c[name] for name in values)).is_distinct_from(
+            tuple_(*values.values())
+        )
+        written = (
+            upsert.on_conflict_do_update(
+                index_elements=[table.c.account_id],
+                set_={**values, "updated_at": func.now()},
+                where=changed,
+            )
+            .returning(table.c.account_id)
+            .cte("written")
+        )
+        result = await self.session.execute(select(func.count()).select_from(written))
+        return result.scalar_one()
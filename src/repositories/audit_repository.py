@@ -7,13 +7,25 @@ creation and reading, not updates or deletes.
 """
 
 import logging
+import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import ColumnElement, UnaryExpression, and_, asc, desc, func, select
+from sqlalchemy import (
+    ColumnElement,
+    UnaryExpression,
+    and_,
+    asc,
+    desc,
+    func,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.strategy_options import _AbstractLoad
 
-from models import AuditLog
+from models import AuditLog, AuditUserAgent
 from schemas import (
     AuditLogFilterParams,
     AuditLogSortParams,
@@ -138,6 +150,86 @@ class AuditLogRepository:
         await self.session.refresh(instance)
         return instance
 
+    async def intern_user_agent(self, user_agent: str) -> tuple[uuid.UUID, bool]:
+        """
+        Get or create the lookup row for a user agent string.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING so concurrent requests with the
+        same user agent converge on a single row.
+
+        Args:
+            user_agent: User agent string (max 500 chars)
+
+        Returns:
+            Tuple of (user agent ID, True if the row already existed)
+
+        Example:
+            user_agent_id, existed = await audit_repo.intern_user_agent(
+                "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X)"
+            )
+        """
+        insert_stmt = (
+            insert(AuditUserAgent)
+            .values(id=uuid.uuid4(), user_agent=user_agent)
+            .on_conflict_do_nothing(index_elements=[AuditUserAgent.user_agent])
+            .returning(AuditUserAgent.id)
+        )
+        result = await self.session.execute(insert_stmt)
+        inserted_id = result.scalar_one_or_none()
+        if inserted_id is not None:
+            return inserted_id, False
+
+        query = select(AuditUserAgent.id).where(AuditUserAgent.user_agent == user_agent)
+        result = await self.session.execute(query)
+        return result.scalar_one(), True
+
+    async def list_entity_histories(
+        self,
+        entities: set[tuple[str, uuid.UUID]],
+        until: datetime,
+    ) -> list[AuditLog]:
+        """
+        Get the audit history of several entities in one query.
+
+        Used to reconstruct full before/after snapshots for compact rows,
+        which only store the changed keys.
+
+        Args:
+            entities: Set of (entity_type, entity_id) pairs
+            until: Only include logs created at or before this timestamp
+
+        Returns:
+            AuditLog instances ordered by creation time (oldest first)
+
+        Example:
+            history = await audit_repo.list_entity_histories(
+                entities={("transaction", transaction.id)},
+                until=datetime.now(UTC),
+            )
+        """
+        if not entities:
+            return []
+
+        query = (
+            select(AuditLog)
+            .where(
+                or_(
+                    *(
+                        and_(
+                            AuditLog.entity_type == entity_type,
+                            AuditLog.entity_id == entity_id,
+                        )
+                        for entity_type, entity_id in entities
+                    )
+                ),
+                AuditLog.created_at <= until,
+            )
+            .order_by(asc(AuditLog.created_at))
+        )
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def list_user_logs(
         self,
         filter_params: AuditLogFilterParams,
@@ -2,10 +2,34 @@
 Financial institution repository for database operations.
 
 This module provides database operations for the FinancialInstitution model,
-including searches by SWIFT code, routing number, and filtering by country/type.
+including searches by SWIFT code, routing number, and filtering by country/type,
+and bulk upserts of institution directories (COPY into a staging table, then
+INSERT ... ON CONFLICT).
 """
 
-from sqlalchemy import asc, desc, or_, select
+from collections.abc import AsyncIterable, Iterable
+from typing import Any
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ColumnElement,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    asc,
+    cast,
+    desc,
+    func,
+    literal_column,
+    not_,
+    null,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import FinancialInstitution
@@ -17,6 +41,26 @@ from schemas import (
 )
 from .base import BaseRepository
 
+# Staging table bulk imports are copied into (dropped at commit)
+_import_staging = Table(
+    "financial_institutions_import",
+    MetaData(),
+    Column("line", Integer, nullable=False),
+    Column("name", String(200), nullable=False),
+    Column("short_name", String(100), nullable=False),
+    Column("swift_code", String(11)),
+    Column("routing_number", String(9)),
+    Column("country_code", String(2), nullable=False),
+    Column("institution_type", String(20), nullable=False),
+    Column("logo_url", String(500)),
+    Column("website_url", String(500)),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# Order of the values in each row passed to bulk_upsert
+IMPORT_COLUMNS = tuple(column.name for column in _import_staging.columns)
+
 
 class FinancialInstitutionRepository(BaseRepository[FinancialInstitution]):
     """
@@ -194,3 +238,121 @@ class FinancialInstitutionRepository(BaseRepository[FinancialInstitution]):
             offset=pagination_params.offset,
             limit=pagination_params.page_size,
         )
+
+    # ========================================================================
+    # BULK LOADING
+    # ========================================================================
+
+    async def copy_to_staging(
+        self, rows: Iterable[tuple[Any, ...]] | AsyncIterable[tuple[Any, ...]]
+    ) -> None:
+        """
+        Stream institutions into a temporary staging table with COPY.
+
+        The staging table lives until the transaction ends; merge it with
+        merge_staging().
+
+        Args:
+            rows: Tuples of IMPORT_COLUMNS values, each with a SWIFT code or
+                a routing number
+        """
+        connection = await self.session.connection()
+        await connection.run_sync(_import_staging.create)
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            _import_staging.name, records=rows, columns=IMPORT_COLUMNS
+        )
+
+    async def merge_staging(self) -> tuple[int, int]:
+        """
+        Insert or update the staged institutions, matched by their codes.
+
+        One INSERT ... ON CONFLICT per natural key: rows with a SWIFT code
+        match on swift_code, the others on routing_number. When a code is
+        staged more than once, the row with the highest line wins. Optional
+        values missing from a row keep their stored value, matched
+        soft-deleted institutions are restored, and institutions that would
+        not change are left untouched (no updated_at bump, no dead tuples).
+
+        Returns:
+            Tuple of (inserted count, updated count)
+
+        Raises:
+            IntegrityError: If a row's other code belongs to another
+                institution
+        """
+        staged = _import_staging.c
+        inserted, updated = 0, 0
+        for key, rows_filter in (
+            (staged.swift_code, staged.swift_code.isnot(None)),
+            (
+                staged.routing_number,
+                staged.swift_code.is_(None) & staged.routing_number.isnot(None),
+            ),
+        ):
+            result = await self.session.execute(_merge_statement(key.name, rows_filter))
+            merged_inserted, merged_updated = result.one()
+            inserted += merged_inserted
+            updated += merged_updated
+        return inserted, updated
+
+
+def _merge_statement(key: str, rows_filter: ColumnElement[bool]) -> Any:
+    """
+    Build the upsert of the staged rows matching rows_filter on key.
+
+    Args:
+        key: Natural key column (swift_code or routing_number)
+        rows_filter: Staged rows to merge
+
+    Returns:
+        Statement returning (inserted count, updated count)
+    """
+    table = FinancialInstitution.__table__
+    staged = _import_staging.c
+    columns = [column.name for column in staged if column.name != "line"]
+    source = (
+        select(
+            *(
+                cast(staged[name], table.c[name].type)
+                if name == "institution_type"
+                else staged[name]
+                for name in columns
+            )
+        )
+        .where(rows_filter)
+        .distinct(staged[key])
+        .order_by(staged[key], staged.line.desc())
+    )
+    # Server defaults: the ORM-side ones would give every row the same id
+    upsert = insert(table).from_select(columns, source, include_defaults=False)
+    excluded = upsert.excluded
+
+    values: dict[str, Any] = {
+        name: (
+            func.coalesce(excluded[name], table.c[name])
+            if staged[name].nullable
+            else excluded[name]
+        )
+        for name in columns
+    }
+    values["deleted_at"] = null()
+    changed = tuple_(*(table.c[name] for name in values)).is_distinct_from(
+        tuple_(*values.values())
+    )
+
+    merged = (
+        upsert.on_conflict_do_update(
+            index_elements=[key],
+            index_where=table.c[key].isnot(None),
+            set_={**values, "updated_at": func.now()},
+            where=changed,
+        )
+        # xmax is 0 for freshly inserted rows
+        .returning(literal_column("xmax = 0", Boolean).label("inserted"))
+        .cte("merged")
+    )
+    return select(
+        func.count().filter(merged.c.inserted),
+        func.count().filter(not_(merged.c.inserted)),
+    )
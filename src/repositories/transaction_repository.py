@@ -296,6 +296,8 @@ class TransactionRepository(BaseRepository[Transaction]):
         Calculate account balance from all non-deleted transactions.
 
         Formula: SUM(amount) WHERE account_id = ? AND deleted_at IS NULL
+        AND parent_transaction_id IS NULL (split children are parts of their
+        parent's amount and do not change the balance)
 
         This is used to verify cached balance in accounts.current_balance.
 
@@ -315,7 +317,10 @@ class TransactionRepository(BaseRepository[Transaction]):
         query = (
             select(func.coalesce(func.sum(Transaction.amount), 0))
             .select_from(Transaction)
-            .where(Transaction.account_id == account_id)
+            .where(
+                Transaction.account_id == account_id,
+                Transaction.parent_transaction_id.is_(None),
+            )
         )
         query = self._apply_soft_delete_filter(query)
 
@@ -330,6 +335,7 @@ class TransactionRepository(BaseRepository[Transaction]):
         Calculate historical balance at a specific date.
 
         Formula: SUM(amount) WHERE account_id = ? AND date <= ? AND deleted_at IS NULL
+        (top-level transactions only, like calculate_account_balance)
 
         Useful for historical reports and balance verification.
 
@@ -353,6 +359,7 @@ class TransactionRepository(BaseRepository[Transaction]):
             .where(
                 Transaction.account_id == account_id,
                 Transaction.transaction_date <= as_of_date,
+                Transaction.parent_transaction_id.is_(None),
             )
         )
         query = self._apply_soft_delete_filter(query)
@@ -15,7 +15,10 @@ from .account import (
     AccountListResponse,
     AccountResponse,
     AccountSortParams,
+    AccountSummaryResponse,
     AccountUpdate,
+    BalanceCorrection,
+    BalanceVerificationResult,
 )
 from .account_share import (
     AccountShareCreate,
@@ -42,6 +45,12 @@ from .auth import (
     LogoutRequest,
     RefreshTokenRequest,
 )
+from .batch import (
+    BatchRequest,
+    BatchRequestItem,
+    BatchResponse,
+    BatchResponseItem,
+)
 from .card import (
     CardBase,
     CardCreate,
@@ -69,13 +78,16 @@ from .enums import (
     AccountSortField,
     AuditLogSortField,
     CardSortField,
+    ImportFormat,
     SortOrder,
     TransactionSortField,
 )
 from .financial_institution import (
+    FinancialInstitutionAutocompleteParams,
     FinancialInstitutionCreate,
     FinancialInstitutionEmbeddedResponse,
     FinancialInstitutionFilterParams,
+    FinancialInstitutionImportResult,
     FinancialInstitutionListResponse,
     FinancialInstitutionResponse,
     FinancialInstitutionSortParams,
@@ -113,6 +125,11 @@ __all__ = [
     "ErrorResponse",
     "SortOrder",
     "SortParams",
+    # Batch schemas
+    "BatchRequest",
+    "BatchRequestItem",
+    "BatchResponse",
+    "BatchResponseItem",
     # Currency schemas
     "Currency",
     "CurrenciesResponse",
@@ -150,16 +167,22 @@ __all__ = [
     "FinancialInstitutionFilterParams",
     "FinancialInstitutionEmbeddedResponse",
     "FinancialInstitutionSortParams",
+    "FinancialInstitutionAutocompleteParams",
+    "FinancialInstitutionImportResult",
+    "ImportFormat",
     # Account schemas
     "AccountEmbeddedResponse",
     "AccountListResponse",
     "AccountSortParams",
+    "AccountSummaryResponse",
     "AccountResponse",
     "AccountCreate",
     "AccountUpdate",
     "AccountBase",
     "AccountFilterParams",
     "AccountSortField",
+    "BalanceCorrection",
+    "BalanceVerificationResult",
     # Account Share schemas
     "AccountShareCreate",
     "AccountShareListResponse",
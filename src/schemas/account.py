@@ -3,19 +3,31 @@ Account Pydantic schemas for API request/response handling.
 
 This module provides:
 - Account creation and update schemas
-- Account response schemas
+- Account response schemas (with transaction statistics for lists)
 - Account filtering schemas
+- Balance verification results
 - Account sort field enum
 """
 
 import re
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
-
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 from schwifty import IBAN
 
+from models import AccountSummary
+
 from .account_type import (
     AccountTypeEmbeddedResponse,
 )
@@ -309,7 +321,36 @@ class AccountUpdate(BaseModel):
         return value
 
 
-class AccountResponse(AccountBase):
+class EmbedsReferenceData(BaseModel):
+    """
+    Mixin embedding an account's type and institution from a catalog.
+
+    When validated from an Account with a "catalog" in the validation
+    context (see core.catalog), account_type and financial_institution are
+    looked up in the catalog by id instead of read from the ORM
+    relationships, which are then never loaded.
+    """
+
+    @model_validator(mode="before")
+    @classmethod
+    def embed_from_catalog(cls, data: Any, info: ValidationInfo) -> Any:
+        """Replace relationship reads with catalog lookups."""
+        catalog = (info.context or {}).get("catalog")
+        if catalog is None or isinstance(data, dict):
+            return data
+        values = {
+            name: getattr(data, name)
+            for name in cls.model_fields
+            if name not in ("account_type", "financial_institution")
+        }
+        values["account_type"] = catalog.account_type(data.account_type_id)
+        values["financial_institution"] = catalog.institution(
+            data.financial_institution_id
+        )
+        return values
+
+
+class AccountResponse(EmbedsReferenceData, AccountBase):
     """
     Schema for account response.
 
@@ -363,7 +404,50 @@ class AccountResponse(AccountBase):
     model_config = ConfigDict(from_attributes=True)
 
 
-class AccountListResponse(BaseModel):
+class AccountSummaryResponse(BaseModel):
+    """
+    Schema for an account's transaction statistics.
+
+    Split children only count towards to_review_count. Month totals cover
+    the current calendar month (UTC).
+
+    Attributes:
+        transaction_count: Number of transactions
+        to_review_count: Number of transactions to review
+        last_transaction_date: Date of the latest transaction
+        month_inflow: Sum of this month's incoming amounts
+        month_outflow: Sum of this month's outgoing amounts (positive)
+    """
+
+    transaction_count: int = Field(default=0, description="Number of transactions")
+    to_review_count: int = Field(
+        default=0, description="Number of transactions to review"
+    )
+    last_transaction_date: date | None = Field(
+        default=None, description="Date of the latest transaction"
+    )
+    month_inflow: Decimal = Field(
+        default=Decimal("0.00"), description="Incoming amounts this month"
+    )
+    month_outflow: Decimal = Field(
+        default=Decimal("0.00"), description="Outgoing amounts this month (positive)"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def zero_previous_month(cls, data: Any) -> Any:
+        """Read month totals of a previous month as zero."""
+        if not isinstance(data, AccountSummary):
+            return data
+        values = {name: getattr(data, name) for name in cls.model_fields}
+        if data.month_start != AccountSummary.current_month():
+            values["month_inflow"] = values["month_outflow"] = Decimal("0.00")
+        return values
+
+
+class AccountListResponse(EmbedsReferenceData):
     """
     Schema for account list item (optimized response).
 
@@ -380,6 +464,7 @@ class AccountListResponse(BaseModel):
         icon_url: Icon URL
         financial_institution: Full institution details
         created_at: Creation timestamp
+        summary: Transaction statistics
     """
 
     id: uuid.UUID
@@ -391,9 +476,16 @@ class AccountListResponse(BaseModel):
     icon_url: str | None
     financial_institution: FinancialInstitutionEmbeddedResponse
     created_at: datetime
+    summary: AccountSummaryResponse = Field(default_factory=AccountSummaryResponse)
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("summary", mode="before")
+    @classmethod
+    def default_summary(cls, value: Any) -> Any:
+        """Accounts without transactions have no summary row yet."""
+        return AccountSummaryResponse() if value is None else value
+
 
 class AccountEmbeddedResponse(BaseModel):
     """
@@ -410,6 +502,51 @@ class AccountEmbeddedResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BalanceCorrection(BaseModel):
+    """
+    An account whose cached balance did not match its transactions.
+
+    Attributes:
+        account_id: Account UUID
+        cached_balance: current_balance before verification
+        calculated_balance: opening_balance + sum of transactions
+    """
+
+    account_id: uuid.UUID = Field(description="Account UUID")
+    cached_balance: Decimal = Field(description="Balance before verification")
+    calculated_balance: Decimal = Field(description="Balance from transactions")
+
+
+class BalanceVerificationResult(BaseModel):
+    """
+    Outcome of a fleet-wide balance verification.
+
+    Returned by POST /api/v1/admin/balances/verify.
+
+    Attributes:
+        checked: Active accounts compared
+        mismatched: Accounts whose balance did not match
+        fixed: Mismatched balances corrected
+        skipped: Mismatched accounts written during verification (left
+            alone; verify again)
+        dry_run: Whether corrections were only reported
+        duration_ms: Wall time of the verification
+        accounts_per_second: Verification throughput
+        corrections: First mismatches found (at most 20)
+    """
+
+    checked: int = Field(ge=0, description="Active accounts compared")
+    mismatched: int = Field(ge=0, description="Balances not matching")
+    fixed: int = Field(ge=0, description="Balances corrected")
+    skipped: int = Field(ge=0, description="Accounts written meanwhile")
+    dry_run: bool = Field(description="Corrections only reported")
+    duration_ms: float = Field(ge=0, description="Verification wall time")
+    accounts_per_second: float = Field(ge=0, description="Throughput")
+    corrections: list[BalanceCorrection] = Field(
+        default_factory=list, description="First mismatches found"
+    )
+
+
 class AccountFilterParams(BaseModel):
     """
     Schema for account filtering parameters.
@@ -0,0 +1,91 @@
+"""
+Batch request schemas.
+
+This module provides Pydantic schemas for:
+- Sub-requests of a batch (id, method, path with query string)
+- Batch request and response envelopes
+"""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Most sub-requests a single batch may carry
+MAX_BATCH_REQUESTS = 20
+
+
+class BatchRequestItem(BaseModel):
+    """
+    One sub-request of a batch.
+
+    Attributes:
+        id: Client-chosen identifier, echoed in the matching response
+        method: HTTP method (only GET: sub-requests run concurrently)
+        path: Absolute API path, optionally with a query string
+    """
+
+    id: str = Field(min_length=1, max_length=64, description="Sub-request identifier")
+    method: Literal["GET"] = Field(default="GET", description="HTTP method")
+    path: str = Field(
+        min_length=1,
+        max_length=2048,
+        description="API path with optional query string",
+    )
+
+    @field_validator("path")
+    @classmethod
+    def validate_path(cls, value: str) -> str:
+        """Ensure the path targets the API."""
+        if not value.startswith("/api/"):
+            raise ValueError("path must start with /api/")
+        return value
+
+
+class BatchRequest(BaseModel):
+    """Request schema for a batch of independent sub-requests."""
+
+    requests: list[BatchRequestItem] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_REQUESTS,
+        description="Sub-requests, executed concurrently",
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "requests": [
+                    {"id": "accounts", "path": "/api/v1/accounts"},
+                    {"id": "cards", "path": "/api/v1/cards?page_size=50"},
+                ]
+            }
+        }
+    )
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self) -> "BatchRequest":
+        """Ensure every sub-request id is unique."""
+        ids = [item.id for item in self.requests]
+        if len(set(ids)) != len(ids):
+            raise ValueError("sub-request ids must be unique")
+        return self
+
+
+class BatchResponseItem(BaseModel):
+    """
+    Response of one sub-request.
+
+    Attributes:
+        id: Identifier of the sub-request
+        status: HTTP status code of the sub-request
+        body: Decoded JSON body (None when empty)
+    """
+
+    id: str = Field(description="Sub-request identifier")
+    status: int = Field(description="HTTP status code")
+    body: Any = Field(default=None, description="Response body")
+
+
+class BatchResponse(BaseModel):
+    """Response schema for a batch, in request order."""
+
+    responses: list[BatchResponseItem] = Field(description="Sub-request responses")
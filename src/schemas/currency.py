@@ -2,7 +2,7 @@
 Currency schemas for ISO 4217 currency data.
 
 This module provides Pydantic schemas for:
-- Currency model (code, symbol, name)
+- Currency model (code, symbol, name, minor units)
 - Response schemas for currency endpoints
 """
 
@@ -19,11 +19,16 @@ class Currency(BaseModel):
     code: str = Field(min_length=3, max_length=3, description="ISO 4217 currency code")
     symbol: str = Field(min_length=1, description="Currency symbol")
     name: str = Field(min_length=1, description="Full currency name")
+    minor_units: int = Field(
+        default=2, ge=0, le=4, description="Decimal places of the minor unit"
+    )
 
     model_config = {"frozen": True}  # Immutable for thread safety
 
     @classmethod
-    def create(cls, code: str, symbol: str, name: str) -> "Currency":
+    def create(
+        cls, code: str, symbol: str, name: str, minor_units: int = 2
+    ) -> "Currency":
         """
         Factory method for creating currency instances.
 
@@ -31,11 +36,12 @@ class Currency(BaseModel):
             code: ISO 4217 code (converted to uppercase)
             symbol: Currency symbol
             name: Full currency name
+            minor_units: Decimal places of the minor unit
 
         Returns:
             Currency instance
         """
-        return cls(code=code.upper(), symbol=symbol, name=name)
+        return cls(code=code.upper(), symbol=symbol, name=name, minor_units=minor_units)
 
 
 class CurrenciesResponse(BaseModel):
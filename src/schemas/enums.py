@@ -42,6 +42,19 @@ class CardSortField(str, Enum):
     CREATED_AT = "created_at"
 
 
+class ImportFormat(str, Enum):
+    """
+    File formats accepted by bulk imports.
+
+    Values:
+        CSV: Comma-separated values with a header row
+        JSON: Array of objects, or one object per line (JSON Lines)
+    """
+
+    CSV = "csv"
+    JSON = "json"
+
+
 class SortOrder(str, Enum):
     """
     Sort direction for list queries.
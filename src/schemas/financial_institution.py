@@ -413,6 +413,57 @@ class FinancialInstitutionFilterParams(BaseModel):
         return value if value else None
 
 
+class FinancialInstitutionAutocompleteParams(BaseModel):
+    """
+    Schema for institution typeahead queries.
+
+    Used as query parameters in GET /api/v1/financial-institutions/autocomplete.
+
+    Attributes:
+        q: Text typed so far (matched against name and short_name)
+        country_code: Country whose institutions rank first
+        limit: Maximum number of suggestions
+    """
+
+    q: str = Field(
+        min_length=1,
+        max_length=100,
+        description="Text typed so far (case- and accent-insensitive)",
+    )
+
+    country_code: CountryAlpha2 | None = Field(
+        default=None,
+        description="Rank institutions of this country first (ISO 3166-1 alpha-2)",
+    )
+
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=50,
+        description="Maximum number of suggestions",
+    )
+
+
+class FinancialInstitutionImportResult(BaseModel):
+    """
+    Outcome of a bulk institution import.
+
+    Returned by POST /api/v1/financial-institutions/import.
+
+    Attributes:
+        received: Valid rows read from the file
+        inserted: New institutions
+        updated: Existing institutions whose data changed (or were restored)
+        unchanged: Rows matching an institution as it already was (including
+            rows superseded by a later row with the same code)
+    """
+
+    received: int = Field(ge=0, description="Valid rows read from the file")
+    inserted: int = Field(ge=0, description="New institutions")
+    updated: int = Field(ge=0, description="Existing institutions changed")
+    unchanged: int = Field(ge=0, description="Rows that changed nothing")
+
+
 class FinancialInstitutionSortParams(SortParams[FinancialInstitutionSortField]):
     """
     Sorting parameters for financial institution list queries.
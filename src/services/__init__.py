@@ -3,21 +3,31 @@ Service layer for business logic.
 
 This package provides service classes that implement business logic,
 coordinate between repositories, and handle transaction management.
+
+Services are imported on first access: a CLI command or a test that needs
+one service does not load every other service, repository and schema
+module. The worker imports them all through its routes at startup.
 """
 
-from .account_service import AccountService
-from .account_type_service import AccountTypeService
-from .audit_service import AuditService
-from .auth_service import AuthService
-from .card_service import CardService
-from .currency_service import CurrencyService
-from .financial_institution_service import FinancialInstitutionService
-from .permission_service import PermissionService
-from .transaction_service import TransactionService
-from .user_service import UserService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .account_service import AccountService
+    from .account_summary_service import AccountSummaryService, SummaryEntry
+    from .account_type_service import AccountTypeService
+    from .audit_service import AuditService
+    from .auth_service import AuthService
+    from .card_service import CardService
+    from .currency_service import CurrencyService
+    from .financial_institution_service import FinancialInstitutionService
+    from .permission_service import PermissionService
+    from .transaction_service import TransactionService
+    from .user_service import UserService
 
 __all__ = [
     "AccountService",
+    "AccountSummaryService",
     "AccountTypeService",
     "AuditService",
     "AuthService",
@@ -25,6 +35,32 @@ __all__ = [
     "CurrencyService",
     "FinancialInstitutionService",
     "PermissionService",
+    "SummaryEntry",
     "TransactionService",
     "UserService",
 ]
+
+# Exported name -> module of this package defining it
+_EXPORTS = {
+    "AccountService": "account_service",
+    "AccountSummaryService": "account_summary_service",
+    "AccountTypeService": "account_type_service",
+    "AuditService": "audit_service",
+    "AuthService": "auth_service",
+    "CardService": "card_service",
+    "CurrencyService": "currency_service",
+    "FinancialInstitutionService": "financial_institution_service",
+    "PermissionService": "permission_service",
+    "SummaryEntry": "account_summary_service",
+    "TransactionService": "transaction_service",
+    "UserService": "user_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a service module on first access and cache the export."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
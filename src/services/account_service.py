@@ -7,14 +7,18 @@ This module provides:
 - List user's accounts with pagination and filtering
 - Update account (name, type, institution, metadata)
 - Soft delete account
+- Balance verification and repair (single account or all accounts)
 """
 
 import logging
+import time
 import uuid
 from decimal import Decimal
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.catalog import reference_catalog
 from core.encryption import EncryptionService
 from core.exceptions import (
     AlreadyExistsError,
@@ -23,12 +27,18 @@ from core.exceptions import (
     NotFoundError,
     ValidationError,
 )
-from models import Account, AccountShare, AuditAction, PermissionLevel, User
+from core.single_flight import detached_copy, read_key, single_flight
+from models import (
+    Account,
+    AccountShare,
+    AuditAction,
+    AuditStatus,
+    PermissionLevel,
+    User,
+)
 from repositories import (
     AccountRepository,
     AccountShareRepository,
-    AccountTypeRepository,
-    FinancialInstitutionRepository,
     TransactionRepository,
     UserRepository,
 )
@@ -39,6 +49,8 @@ from schemas import (
     AccountShareUpdate,
     AccountSortParams,
     AccountUpdate,
+    BalanceCorrection,
+    BalanceVerificationResult,
     PaginationParams,
 )
 from .audit_service import AuditService
@@ -47,6 +59,30 @@ from .permission_service import PermissionService
 
 logger = logging.getLogger(__name__)
 
+# Corrections listed in verification results and their audit entry
+MAX_REPORTED_CORRECTIONS = 20
+
+
+def _audit_snapshot(account: Account) -> dict[str, Any]:
+    """
+    Full audit snapshot of an account's user-editable state.
+
+    CREATE rows store it as new_values and UPDATE rows diff two of them, so
+    compact UPDATE rows can be expanded back to full snapshots.
+    """
+    return {
+        "account_name": account.account_name,
+        "account_type_id": str(account.account_type_id)
+        if account.account_type_id
+        else None,
+        "financial_institution_id": str(account.financial_institution_id)
+        if account.financial_institution_id
+        else None,
+        "color_hex": account.color_hex,
+        "icon_url": str(account.icon_url) if account.icon_url else None,
+        "notes": account.notes,
+    }
+
 
 class AccountService:
     """
@@ -63,17 +99,17 @@ class AccountService:
     Audit logging is performed for all mutating operations.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, coalesce_reads: bool = False):
         """
         Initialize AccountService with database session and encryption service.
 
         Args:
             session: Async database session
+            coalesce_reads: Share identical concurrent reads (read-only use)
         """
         self.session = session
+        self.coalesce_reads = coalesce_reads
         self.account_repo = AccountRepository(session)
-        self.account_type_repo = AccountTypeRepository(session)
-        self.financial_institution_repo = FinancialInstitutionRepository(session)
         self.account_share_repo = AccountShareRepository(session)
         self.user_repo = UserRepository(session)
         self.permission_service = PermissionService(session)
@@ -127,8 +163,11 @@ class AccountService:
                 f"Account name '{data.account_name}' already exists. Please choose a different name."
             )
 
-        # Validate account type exists and is active
-        account_type = await self.account_type_repo.get_by_id(data.account_type_id)
+        # Validate account type and institution against the reference catalog
+        await reference_catalog.ensure(
+            self.session, [data.account_type_id], [data.financial_institution_id]
+        )
+        account_type = reference_catalog.account_type(data.account_type_id)
         if not account_type:
             logger.warning(
                 f"User {user.id} attempted to create account with non-existent "
@@ -141,20 +180,16 @@ class AccountService:
 
         # Validate currency is supported (ISO 4217 currency codes)
         if not self.currency_service.is_supported(data.currency):
-            supported_codes = ", ".join(self.currency_service.get_supported_codes())
             logger.warning(
                 f"User {user.id} attempted to create account with unsupported currency: {data.currency}"
             )
             raise ValidationError(
                 f"Unsupported currency code '{data.currency}'. "
-                f"Supported currencies: {supported_codes}"
+                "See /api/v1/metadata/currencies for supported currencies"
             )
 
         # Validate financial institution exists
-        financial_institution = await self.financial_institution_repo.exists(
-            data.financial_institution_id
-        )
-        if not financial_institution:
+        if not reference_catalog.institution_exists(data.financial_institution_id):
             logger.warning(
                 f"User {user.id} attempted to create account with non existent "
                 f"institution: {data.financial_institution_id}"
@@ -214,21 +249,23 @@ class AccountService:
         )
 
         # Log audit event
+        institution = reference_catalog.institution(data.financial_institution_id)
         await self.audit_service.log_event(
             user_id=user.id,
             action=AuditAction.CREATE,
             entity_type="account",
             entity_id=account.id,
-            description=f"Created account '{account.account_name}' at {account.financial_institution.short_name} ({account.account_type.name}, {account.currency})",
+            description=f"Created account '{account.account_name}' at {institution.short_name} ({account_type.name}, {account.currency})",
+            new_values=_audit_snapshot(account),
             extra_metadata={
                 "account_name": account.account_name,
                 "account_type_id": str(data.account_type_id),
-                "account_type_key": account.account_type.key,
-                "account_type_name": account.account_type.name,
+                "account_type_key": account_type.key,
+                "account_type_name": account_type.name,
                 "currency": account.currency,
                 "opening_balance": str(data.opening_balance),
                 "financial_institution_id": str(data.financial_institution_id),
-                "financial_institution_name": account.financial_institution.short_name,
+                "financial_institution_name": institution.short_name,
             },
             ip_address=ip_address,
             user_agent=user_agent,
@@ -266,7 +303,19 @@ class AccountService:
         Example:
             account = await account_service.get_account(account_id, current_user)
         """
-        account = await self.account_repo.get_by_id(account_id)
+        if self.coalesce_reads:
+            # The row is the same for everyone it is shared with; access is
+            # still checked per user below. Followers get a detached copy:
+            # the leader's session may be gone by the time they serialize it
+            async def load() -> Account | None:
+                account = await self.account_repo.get_by_id(account_id)
+                return detached_copy(account) if account else None
+
+            account = await single_flight.do(
+                read_key(self.session, "account", account_id), load
+            )
+        else:
+            account = await self.account_repo.get_by_id(account_id)
 
         if not account:
             logger.warning(f"Account {account_id} not found")
@@ -283,6 +332,9 @@ class AccountService:
             )
             raise NotFoundError("Account")  # Don't reveal account exists
 
+        await reference_catalog.ensure(
+            self.session, [account.account_type_id], [account.financial_institution_id]
+        )
         return account
 
     async def update_account(
@@ -357,11 +409,18 @@ class AccountService:
                     f"Account name '{update_dict['account_name']}' already exists. Please choose a different name."
                 )
 
+        await reference_catalog.ensure(
+            self.session,
+            [update_dict.get("account_type_id", account.account_type_id)],
+            [
+                update_dict.get(
+                    "financial_institution_id", account.financial_institution_id
+                )
+            ],
+        )
+
         if "account_type_id" in update_dict:
-            account_type = await self.account_type_repo.get_by_id(
-                update_dict["account_type_id"]
-            )
-            if not account_type:
+            if not reference_catalog.account_type(update_dict["account_type_id"]):
                 logger.warning(
                     f"User {current_user.id} attempted to update account {account_id} "
                     f"with non-existent account type: {update_dict['account_type_id']}"
@@ -369,7 +428,7 @@ class AccountService:
                 raise NotFoundError("Account type not found")
 
         if "financial_institution_id" in update_dict:
-            if not await self.financial_institution_repo.exists(
+            if not reference_catalog.institution_exists(
                 update_dict["financial_institution_id"]
             ):
                 logger.warning(
@@ -382,18 +441,7 @@ class AccountService:
                 )
 
         # 4. Capture old values for audit
-        old_values = {
-            "account_name": account.account_name,
-            "account_type_id": str(account.account_type_id)
-            if account.account_type_id
-            else None,
-            "financial_institution_id": str(account.financial_institution_id)
-            if account.financial_institution_id
-            else None,
-            "color_hex": account.color_hex,
-            "icon_url": str(account.icon_url) if account.icon_url else None,
-            "notes": account.notes,
-        }
+        old_values = _audit_snapshot(account)
 
         # 5. Apply changes to model instance
         for key, value in update_dict.items():
@@ -404,24 +452,13 @@ class AccountService:
         account = await self.account_repo.update(account)
 
         # 7. Capture new values for audit
-        new_values = {
-            "account_name": account.account_name,
-            "account_type_id": str(account.account_type_id)
-            if account.account_type_id
-            else None,
-            "financial_institution_id": str(account.financial_institution_id)
-            if account.financial_institution_id
-            else None,
-            "color_hex": account.color_hex,
-            "icon_url": str(account.icon_url) if account.icon_url else None,
-            "notes": account.notes,
-        }
+        new_values = _audit_snapshot(account)
 
         logger.info(
             f"Updated account {account.id}: changed_fields={list(update_dict.keys())}"
         )
 
-        # 8. Audit log with old/new values
+        # 8. Audit log with changed old/new values only
         await self.audit_service.log_event(
             user_id=current_user.id,
             action=AuditAction.UPDATE,
@@ -433,6 +470,7 @@ class AccountService:
             ip_address=ip_address,
             user_agent=user_agent,
             request_id=request_id,
+            compact=True,
         )
 
         # 9. Commit transaction
@@ -478,6 +516,7 @@ class AccountService:
             raise NotFoundError("Account")
 
         # Soft delete account
+        account_type = reference_catalog.account_type(account.account_type_id)
         await self.account_repo.soft_delete(account)
 
         logger.info(f"Soft deleted account {account.id} ({account.account_name})")
@@ -492,8 +531,8 @@ class AccountService:
             extra_metadata={
                 "account_name": account.account_name,
                 "account_type_id": str(account.account_type_id),
-                "account_type_key": account.account_type.key,
-                "account_type_name": account.account_type.name,
+                "account_type_key": account_type.key,
+                "account_type_name": account_type.name,
                 "currency": account.currency,
                 "final_balance": str(account.current_balance),
             },
@@ -535,14 +574,21 @@ class AccountService:
             )
         """
         # Get user accounts
-        user_accounts = await self.account_repo.list_for_user(
+        accounts, count = await self.account_repo.list_for_user(
             user_id=current_user.id,
             filter_params=filters,
             pagination_params=pagination,
             sort_params=sorting,
         )
 
-        return user_accounts
+        # Responses embed account types and institutions from the catalog
+        await reference_catalog.ensure(
+            self.session,
+            {account.account_type_id for account in accounts},
+            {account.financial_institution_id for account in accounts},
+        )
+
+        return accounts, count
 
     # =============================================================================
     # Account Sharing Methods
@@ -1084,3 +1130,88 @@ class AccountService:
             "mismatch": mismatch,
             "fixed": mismatch,
         }
+
+    async def verify_all_balances(
+        self,
+        fix: bool = True,
+        current_user: User | None = None,
+        request_id: str | None = None,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+    ) -> BalanceVerificationResult:
+        """
+        Verify the balances of all active accounts and fix mismatches (admin only).
+
+        Set-based counterpart of verify_and_fix_balance(): one grouped query
+        compares every current_balance with opening_balance + SUM(amount),
+        and one UPDATE ... FROM corrects the mismatches. The run is recorded
+        as a single audit entry with the counts and the first corrections.
+
+        Args:
+            fix: Correct mismatches (False only reports them)
+            current_user: Admin running the verification (None for the CLI)
+            request_id: Request ID for audit logging
+            ip_address: Client IP address
+            user_agent: Client user agent
+
+        Returns:
+            Counts, throughput and the first mismatches found
+
+        Example:
+            result = await account_service.verify_all_balances(fix=False)
+            if result.mismatched:
+                print(f"{result.mismatched} of {result.checked} balances are wrong")
+        """
+        start = time.perf_counter()
+
+        checked, mismatches = await self.account_repo.find_balance_mismatches()
+        fixed = await self.account_repo.fix_balances(mismatches) if fix else []
+        await self.session.commit()
+
+        duration = time.perf_counter() - start
+        result = BalanceVerificationResult(
+            checked=checked,
+            mismatched=len(mismatches),
+            fixed=len(fixed),
+            skipped=len(mismatches) - len(fixed) if fix else 0,
+            dry_run=not fix,
+            duration_ms=round(duration * 1000, 1),
+            accounts_per_second=round(checked / duration, 1) if duration else 0.0,
+            corrections=[
+                BalanceCorrection(
+                    account_id=account_id,
+                    cached_balance=cached,
+                    calculated_balance=calculated,
+                )
+                for account_id, cached, calculated in mismatches[
+                    :MAX_REPORTED_CORRECTIONS
+                ]
+            ],
+        )
+
+        admin = current_user.id if current_user else "cli"
+        log = logger.warning if mismatches else logger.info
+        log(
+            f"Balances verified by {admin}: {checked} accounts, "
+            f"{result.mismatched} mismatched, {result.fixed} fixed, "
+            f"{result.skipped} skipped in {result.duration_ms} ms "
+            f"({result.accounts_per_second} accounts/s)"
+        )
+
+        # One audit entry for the whole run
+        await self.audit_service.log_event(
+            user_id=current_user.id if current_user else None,
+            action=AuditAction.VERIFY_ACCOUNT_BALANCES,
+            entity_type="account",
+            description=(
+                f"Verified {checked} account balances, "
+                f"{result.mismatched} mismatched, {result.fixed} fixed"
+            ),
+            status=AuditStatus.PARTIAL if result.skipped else AuditStatus.SUCCESS,
+            extra_metadata=result.model_dump(mode="json"),
+            request_id=request_id,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+
+        return result
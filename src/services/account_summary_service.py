@@ -0,0 +1,155 @@
+"""
+Account summary service for incrementally maintained account statistics.
+
+This module provides:
+- SummaryEntry: The summary-relevant fields of a transaction
+- AccountSummaryService: Applies transaction writes to account summaries
+  and rebuilds them (repair job)
+
+Transaction writes record what they added and removed; the service turns
+that into one relative upsert of the account's summary row, so reading
+the statistics never aggregates the transactions table.
+"""
+
+import logging
+import time
+import uuid
+from collections.abc import Iterable
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import NamedTuple, Self
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import AccountSummary, Transaction, TransactionReviewStatus
+from repositories import AccountSummaryRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryEntry(NamedTuple):
+    """
+    The fields of a transaction that account summaries depend on.
+
+    Snapshot a transaction with SummaryEntry.of() before changing it, so
+    its old values can be removed from the summary.
+    """
+
+    amount: Decimal
+    transaction_date: date
+    review_status: TransactionReviewStatus
+    is_split_child: bool
+
+    @classmethod
+    def of(cls, transaction: Transaction) -> Self:
+        """Snapshot transaction."""
+        return cls(
+            amount=transaction.amount,
+            transaction_date=transaction.transaction_date,
+            review_status=transaction.review_status,
+            is_split_child=transaction.parent_transaction_id is not None,
+        )
+
+
+class AccountSummaryService:
+    """
+    Service keeping AccountSummary rows in step with transaction writes.
+
+    Split children only count towards to_review_count: the other
+    statistics cover top-level transactions, like account balances.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize AccountSummaryService with database session.
+
+        Args:
+            session: Async database session
+        """
+        self.session = session
+        self.summary_repo = AccountSummaryRepository(session)
+
+    async def record(
+        self,
+        account_id: uuid.UUID,
+        added: Iterable[Transaction | SummaryEntry] = (),
+        removed: Iterable[Transaction | SummaryEntry] = (),
+    ) -> None:
+        """
+        Apply added and removed transactions to an account's summary.
+
+        Must run after the transaction changes are flushed. An update is
+        recorded as removing the old snapshot and adding the new values.
+
+        Args:
+            account_id: Account the transactions belong to
+            added: Transactions (or snapshots) now counted
+            removed: Transactions (or snapshots) no longer counted
+        """
+        month = AccountSummary.current_month()
+        transaction_count = to_review_count = 0
+        inflow = outflow = Decimal("0.00")
+        latest_added: date | None = None
+        latest_removed: date | None = None
+
+        for entries, sign in ((added, 1), (removed, -1)):
+            for entry in entries:
+                if isinstance(entry, Transaction):
+                    entry = SummaryEntry.of(entry)
+                if entry.review_status == TransactionReviewStatus.to_review:
+                    to_review_count += sign
+                if entry.is_split_child:
+                    continue
+                transaction_count += sign
+                day = entry.transaction_date
+                if sign > 0 and (latest_added is None or day > latest_added):
+                    latest_added = day
+                elif sign < 0 and (latest_removed is None or day > latest_removed):
+                    latest_removed = day
+                if day.replace(day=1) == month:
+                    if entry.amount > 0:
+                        inflow += sign * entry.amount
+                    else:
+                        outflow -= sign * entry.amount
+
+        if transaction_count or to_review_count or inflow or outflow or latest_added:
+            await self.summary_repo.apply_delta(
+                account_id=account_id,
+                transaction_count=transaction_count,
+                to_review_count=to_review_count,
+                last_transaction_date=latest_added,
+                month_start=month,
+                month_inflow=inflow,
+                month_outflow=outflow,
+            )
+
+        # A transaction dated on or after the removed one still exists
+        if latest_removed is not None and (
+            latest_added is None or latest_added < latest_removed
+        ):
+            await self.summary_repo.refresh_last_transaction_date(
+                account_id, latest_removed
+            )
+
+    async def rebuild(self) -> int:
+        """
+        Recompute every account summary from the transactions table.
+
+        Repairs drift (e.g. transactions changed outside the service) and
+        picks up transactions dated in a month that has since started.
+
+        Returns:
+            Number of summaries created or corrected
+        """
+        month_start = AccountSummary.current_month()
+        month_end = (month_start + timedelta(days=32)).replace(day=1)
+
+        start = time.perf_counter()
+        written = await self.summary_repo.rebuild_all(month_start, month_end)
+        await self.session.commit()
+
+        logger.info(
+            f"Rebuilt account summaries: {written} written "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        return written
@@ -17,6 +17,7 @@ import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.exceptions import AlreadyExistsError, NotFoundError
+from core.single_flight import detached_copy, read_key, single_flight
 from models import AccountType, AuditAction, User
 from repositories import AccountTypeRepository
 from schemas import (
@@ -44,14 +45,16 @@ class AccountTypeService:
     Authenticated user operations: get, list (all authenticated users can access)
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, coalesce_reads: bool = False):
         """
         Initialize AccountTypeService with database session.
 
         Args:
             session: Async database session
+            coalesce_reads: Share identical concurrent reads (read-only use)
         """
         self.session = session
+        self.coalesce_reads = coalesce_reads
         self.account_type_repo = AccountTypeRepository(session)
         self.audit_service = AuditService(session)
 
@@ -212,6 +215,15 @@ class AccountTypeService:
             # Get all types
             types = await service.list_account_types()
         """
+        if self.coalesce_reads:
+            # Same list for every user: coalesce across principals, sharing
+            # detached copies (the leader's session may close first)
+            async def load() -> list[AccountType]:
+                account_types = await self.account_type_repo.get_all_ordered()
+                return [detached_copy(account_type) for account_type in account_types]
+
+            return await single_flight.do(read_key(self.session, "account_types"), load)
+
         account_types = await self.account_type_repo.get_all_ordered()
 
         return account_types
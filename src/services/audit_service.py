@@ -6,13 +6,16 @@ This module provides:
 - Audit log creation for data modifications
 - Audit log retrieval for users and admins
 - GDPR-compliant data access tracking
+- Compact encoding (changed-fields-only diffs, interned user agents)
 """
 
 import logging
 import uuid
 from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from models import AuditAction, AuditLog, AuditStatus
 from repositories import AuditLogRepository
@@ -20,6 +23,19 @@ from schemas import AuditLogFilterParams, AuditLogSortParams, PaginationParams
 
 logger = logging.getLogger(__name__)
 
+# Maximum stored length of a user agent string (audit_user_agents.user_agent)
+USER_AGENT_MAX_LENGTH = 500
+
+# Process-wide cache of interned user agent IDs (user agent -> ID).
+# Only IDs of rows that were already committed are cached, so a rolled back
+# request can never leave a dangling ID behind.
+_USER_AGENT_CACHE_SIZE = 1024
+_interned_user_agents: dict[str, uuid.UUID] = {}
+
+# Session.info key: user agents inserted by the current transaction
+# (user agent -> ID), promoted to the process-wide cache after COMMIT
+_PENDING_USER_AGENTS = "pending_user_agents"
+
 
 class AuditService:
     """
@@ -59,6 +75,7 @@ class AuditService:
         status: AuditStatus = AuditStatus.SUCCESS,
         error_message: str | None = None,
         extra_metadata: dict[str, Any] | None = None,
+        compact: bool = False,
     ) -> AuditLog:
         """
         Log a generic audit event.
@@ -66,6 +83,10 @@ class AuditService:
         This is the core method for creating audit logs. Use the specialized
         methods (log_login, log_data_change, etc.) for common scenarios.
 
+        With compact=True, only the keys whose values differ between
+        old_values and new_values are stored. Readers get the full snapshot
+        back through expand_logs().
+
         Args:
             user_id: User who performed the action (None for system actions)
             action: Type of action performed
@@ -80,6 +101,7 @@ class AuditService:
             status: Status of the action
             error_message: Error message if status is FAILURE
             extra_metadata: Additional context as JSONB
+            compact: Store only the changed keys of old_values/new_values
 
         Returns:
             Created AuditLog instance
@@ -97,6 +119,13 @@ class AuditService:
                 status=AuditStatus.SUCCESS,
             )
         """
+        if compact:
+            old_values, new_values = self.diff_values(old_values, new_values)
+
+        user_agent_id = (
+            await self._intern_user_agent(user_agent) if user_agent else None
+        )
+
         audit_log = AuditLog(
             user_id=user_id,
             action=action,
@@ -104,9 +133,10 @@ class AuditService:
             entity_id=entity_id,
             old_values=old_values,
             new_values=new_values,
+            is_compact=compact,
             description=description,
             ip_address=ip_address,
-            user_agent=user_agent,
+            user_agent_id=user_agent_id,
             request_id=request_id,
             status=status,
             error_message=error_message,
@@ -122,6 +152,155 @@ class AuditService:
 
         return audit_log
 
+    async def _intern_user_agent(self, user_agent: str) -> uuid.UUID:
+        """
+        Resolve a user agent string to its lookup table ID.
+
+        Args:
+            user_agent: Client user agent string
+
+        Returns:
+            UUID of the interned user agent
+        """
+        user_agent = user_agent[:USER_AGENT_MAX_LENGTH]
+
+        cached_id = _interned_user_agents.get(user_agent)
+        if cached_id is not None:
+            return cached_id
+
+        # Rows inserted earlier in this transaction are not committed yet:
+        # reuse them, but only cache them once the transaction commits
+        pending = self.session.info.setdefault(_PENDING_USER_AGENTS, {})
+        if user_agent in pending:
+            return pending[user_agent]
+
+        user_agent_id, existed = await self.audit_repo.intern_user_agent(user_agent)
+
+        if not existed:
+            pending[user_agent] = user_agent_id
+        elif len(_interned_user_agents) < _USER_AGENT_CACHE_SIZE:
+            # ON CONFLICT waits for concurrent inserts, so a row found by
+            # another transaction's insert is already committed
+            _interned_user_agents[user_agent] = user_agent_id
+
+        return user_agent_id
+
+    @staticmethod
+    def diff_values(
+        old_values: dict[str, Any] | None,
+        new_values: dict[str, Any] | None,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """
+        Reduce before/after snapshots to the keys whose values changed.
+
+        Args:
+            old_values: Full snapshot before the change
+            new_values: Full snapshot after the change
+
+        Returns:
+            Tuple of (changed old values, changed new values)
+
+        Example:
+            old, new = AuditService.diff_values(
+                {"amount": "-50.00", "merchant": "Shop"},
+                {"amount": "-60.00", "merchant": "Shop"},
+            )
+            # old == {"amount": "-50.00"}, new == {"amount": "-60.00"}
+        """
+        if old_values is None or new_values is None:
+            return old_values, new_values
+
+        changed_keys = [
+            key
+            for key in old_values.keys() | new_values.keys()
+            if old_values.get(key) != new_values.get(key)
+        ]
+
+        return (
+            {key: old_values.get(key) for key in changed_keys if key in old_values},
+            {key: new_values.get(key) for key in changed_keys if key in new_values},
+        )
+
+    @staticmethod
+    def replay_history(
+        history: list[AuditLog],
+    ) -> dict[uuid.UUID, tuple[dict[str, Any], dict[str, Any]]]:
+        """
+        Rebuild full before/after snapshots for the compact rows of a history.
+
+        The history of a single entity is replayed oldest first: the CREATE
+        row's new_values is the full snapshot, compact UPDATE rows apply
+        their diff, and full UPDATE rows only refresh keys of the snapshot
+        (partial rows such as balance repairs are not entity state). Other
+        actions (splits, joins, ...) carry event metadata and are skipped.
+
+        Args:
+            history: AuditLog instances of ONE entity, oldest first
+
+        Returns:
+            Mapping of compact audit log ID to (full old values, full new values)
+        """
+        state: dict[str, Any] = {}
+        expanded: dict[uuid.UUID, tuple[dict[str, Any], dict[str, Any]]] = {}
+
+        for log in history:
+            if log.action == AuditAction.CREATE:
+                state = dict(log.new_values or {})
+            elif log.action != AuditAction.UPDATE:
+                continue
+            elif log.is_compact:
+                full_old = {**state, **(log.old_values or {})}
+                full_new = {**full_old, **(log.new_values or {})}
+                expanded[log.id] = (full_old, full_new)
+                state = full_new
+            else:
+                state.update(
+                    (key, value)
+                    for key, value in (log.new_values or {}).items()
+                    if key in state
+                )
+
+        return expanded
+
+    async def expand_logs(self, logs: list[AuditLog]) -> list[AuditLog]:
+        """
+        Reconstruct the full view of compact audit logs.
+
+        Loads the history of every entity referenced by a compact row with a
+        single query, replays it, and replaces the stored diffs with full
+        snapshots. Expanded rows are detached from the session first, so the
+        immutable audit table is never written to.
+
+        Args:
+            logs: Audit logs as loaded from the database
+
+        Returns:
+            The same logs, with compact rows carrying full old/new values
+        """
+        compact_logs = [log for log in logs if log.is_compact and log.entity_id]
+        if not compact_logs:
+            return logs
+
+        entities = {(log.entity_type, log.entity_id) for log in compact_logs}
+        until = max(log.created_at for log in compact_logs)
+        history = await self.audit_repo.list_entity_histories(entities, until)
+
+        histories: dict[tuple[str, uuid.UUID], list[AuditLog]] = {}
+        for entry in history:
+            histories.setdefault((entry.entity_type, entry.entity_id), []).append(entry)
+
+        expanded: dict[uuid.UUID, tuple[dict[str, Any], dict[str, Any]]] = {}
+        for entity_history in histories.values():
+            expanded.update(self.replay_history(entity_history))
+
+        for log in compact_logs:
+            if log.id not in expanded:
+                continue
+            self.session.expunge(log)
+            log.old_values, log.new_values = expanded[log.id]
+
+        return logs
+
     async def log_login(
         self,
         user_id: uuid.UUID,
@@ -348,10 +527,33 @@ class AuditService:
                 limit=20
             )
         """
-        user_logs = await self.audit_repo.list_user_logs(
+        logs, total = await self.audit_repo.list_user_logs(
             filter_params=filters,
             pagination_params=pagination,
             sort_params=sorting,
         )
 
-        return user_logs
+        return await self.expand_logs(logs), total
+
+
+# ============================================================================
+# Session Events
+# ============================================================================
+
+
+@event.listens_for(Session, "after_commit")
+def _promote_pending_user_agents(session: Session) -> None:
+    """Cache user agent IDs inserted by a transaction once it committed."""
+    pending = session.info.pop(_PENDING_USER_AGENTS, None)
+    if not pending:
+        return
+    for user_agent, user_agent_id in pending.items():
+        if len(_interned_user_agents) >= _USER_AGENT_CACHE_SIZE:
+            break
+        _interned_user_agents[user_agent] = user_agent_id
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_user_agents(session: Session) -> None:
+    """Forget user agent IDs whose insert was rolled back."""
+    session.info.pop(_PENDING_USER_AGENTS, None)
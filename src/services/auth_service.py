@@ -18,6 +18,7 @@ from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core import settings
+from core.database import release_connection
 from core.exceptions import (
     AlreadyExistsError,
     AuthenticationError,
@@ -119,7 +120,8 @@ class AuthService:
             )
             raise AlreadyExistsError("User with this username")
 
-        # Hash the password
+        # Hash the password (CPU-bound; don't hold a pooled connection)
+        await release_connection(self.session)
         password_hash = hash_password(data.password)
 
         # Create user in database
@@ -197,7 +199,8 @@ class AuthService:
             logger.warning(f"Login failed: user not found with email {email}")
             raise InvalidCredentialsError()
 
-        # Verify password
+        # Verify password (CPU-bound; don't hold a pooled connection)
+        await release_connection(self.session)
         if not verify_password(password, user.password_hash):
             logger.warning(f"Login failed: invalid password for user {user.id}")
             raise InvalidCredentialsError()
@@ -293,9 +296,10 @@ class AuthService:
             logger.warning(
                 f"Token reuse detected! Revoking entire token family: {db_token.token_family_id}"
             )
-            # Revoke entire token family
+            # Revoke entire token family. Commit for real: the error below
+            # rolls the request's unit of work back
             await self.token_repo.revoke_token_family(db_token.token_family_id)
-            await self.session.commit()
+            await release_connection(self.session)
             raise InvalidTokenError("Token has been compromised. Please log in again.")
 
         # Check if token is expired
@@ -459,7 +463,8 @@ class AuthService:
             logger.error(f"Password change failed: user not found {user_id}")
             raise AuthenticationError("User not found")
 
-        # Verify current password
+        # Verify current password (CPU-bound; don't hold a pooled connection)
+        await release_connection(self.session)
         if not verify_password(current_password, user.password_hash):
             logger.warning(
                 f"Password change failed: invalid current password for user {user_id}"
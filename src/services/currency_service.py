@@ -2,12 +2,16 @@
 Currency service for ISO 4217 currency data.
 
 This module provides:
-- CurrencyService for managing currency list
+- CurrencyService for currency lookup and validation
 - Injectable service that follows FastAPI dependency patterns
+
+The data lives in the process-wide registry (core.currencies); the
+service is a thin, allocation-free view over it.
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.currencies import CURRENCIES, get_currency, is_supported
 from schemas import Currency
 
 
@@ -16,7 +20,7 @@ class CurrencyService:
     Currency service providing ISO 4217 currency data.
 
     Injectable service that provides currency lookup and validation.
-    Thread-safe due to immutable Currency models.
+    Thread-safe: the registry and its Currency models are immutable.
     """
 
     def __init__(self, session: AsyncSession | None = None):
@@ -28,35 +32,15 @@ class CurrencyService:
                      pattern consistency when used inside other services)
         """
         self.session = session
-        self._currencies = self._initialize_currencies()
-
-    def _initialize_currencies(self) -> list[Currency]:
-        """
-        Initialize currency list.
-
-        Returns:
-            List of supported currencies
-        """
-        return [
-            # North America
-            Currency.create("USD", "$", "US Dollar"),
-            # Europe
-            Currency.create("EUR", "€", "Euro"),
-            Currency.create("GBP", "£", "Pound Sterling"),
-            Currency.create("CHF", "CHF", "Swiss Franc"),
-            # Asia-Pacific
-            Currency.create("JPY", "¥", "Japanese Yen"),
-            Currency.create("CNY", "¥", "Chinese Yuan"),
-        ]
 
     def get_all(self) -> list[Currency]:
         """
         Get all supported currencies.
 
         Returns:
-            Copy of currency list to prevent external modification
+            New list of currencies (sorted by code)
         """
-        return self._currencies.copy()
+        return list(CURRENCIES.values())
 
     def get_by_code(self, code: str) -> Currency | None:
         """
@@ -68,8 +52,7 @@ class CurrencyService:
         Returns:
             Currency if found, None otherwise
         """
-        code_upper = code.upper()
-        return next((c for c in self._currencies if c.code == code_upper), None)
+        return get_currency(code)
 
     def is_supported(self, code: str) -> bool:
         """
@@ -81,7 +64,7 @@ class CurrencyService:
         Returns:
             True if currency is supported, False otherwise
         """
-        return self.get_by_code(code) is not None
+        return is_supported(code)
 
     def get_supported_codes(self) -> list[str]:
         """
@@ -90,4 +73,4 @@ class CurrencyService:
         Returns:
             List of ISO 4217 currency codes
         """
-        return [c.code for c in self._currencies]
+        return list(CURRENCIES)
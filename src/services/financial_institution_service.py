@@ -5,31 +5,60 @@ This module provides:
 - Create financial institution (admin only)
 - Get financial institution details
 - List/search financial institutions with filters
+- Typeahead search of financial institutions (in memory)
 - Update financial institution (admin only)
 - Deactivate financial institution (admin only)
+- Bulk import of institution directories from CSV or JSON (admin only)
 
 All state-changing operations are logged to audit trail.
 """
 
+import asyncio
+import csv
+import io
+import json
 import logging
 import uuid
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+from typing import IO, Any
 
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.exceptions import AlreadyExistsError, NotFoundError
+from core.catalog import reference_catalog
+from core.exceptions import (
+    AlreadyExistsError,
+    ConflictError,
+    NotFoundError,
+    ValidationError,
+)
+from core.reference_data import single_version_bump
+from core.single_flight import detached_copy, read_key, single_flight
 from models import AuditAction, FinancialInstitution, User
 from repositories import FinancialInstitutionRepository
 from schemas import (
+    FinancialInstitutionAutocompleteParams,
     FinancialInstitutionCreate,
     FinancialInstitutionFilterParams,
+    FinancialInstitutionImportResult,
+    FinancialInstitutionListResponse,
     FinancialInstitutionSortParams,
     FinancialInstitutionUpdate,
+    ImportFormat,
     PaginationParams,
 )
 from .audit_service import AuditService
 
 logger = logging.getLogger(__name__)
 
+# Rows parsed and validated per worker thread hop during imports
+IMPORT_BATCH_SIZE = 1000
+
+# Invalid rows listed in an import's error details
+MAX_REPORTED_IMPORT_ERRORS = 20
+
 
 class FinancialInstitutionService:
     """
@@ -47,14 +76,16 @@ class FinancialInstitutionService:
     Authenticated user operations: get, list (all authenticated users can access)
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, coalesce_reads: bool = False):
         """
         Initialize FinancialInstitutionService with database session.
 
         Args:
             session: Async database session
+            coalesce_reads: Share identical concurrent reads (read-only use)
         """
         self.session = session
+        self.coalesce_reads = coalesce_reads
         self.institution_repo = FinancialInstitutionRepository(session)
         self.audit_service = AuditService(session)
 
@@ -280,13 +311,54 @@ class FinancialInstitutionService:
                 sorting=FinancialInstitutionSortParams()
             )
         """
-        financial_institutions = await self.institution_repo.list_all(
+        list_all = partial(
+            self.institution_repo.list_all,
             filter_params=filters,
             pagination_params=pagination,
             sort_params=sorting,
         )
+        if self.coalesce_reads:
+            # Same list for every user: coalesce across principals, sharing
+            # detached copies (the leader's session may close first)
+            async def load() -> tuple[list[FinancialInstitution], int]:
+                institutions, total = await list_all()
+                return [detached_copy(i) for i in institutions], total
+
+            return await single_flight.do(
+                read_key(
+                    self.session, "financial_institutions", filters, pagination, sorting
+                ),
+                load,
+            )
+
+        return await list_all()
+
+    async def autocomplete(
+        self, params: FinancialInstitutionAutocompleteParams
+    ) -> list[FinancialInstitutionListResponse]:
+        """
+        Suggest institutions for a partially typed name.
+
+        Served from the reference catalog's typeahead index (no query once
+        the catalog is loaded). Matches on the whole name rank before
+        prefixes, word prefixes and other substrings; within a tier,
+        institutions of params.country_code come first.
 
-        return financial_institutions
+        Args:
+            params: Query text, preferred country and result limit
+
+        Returns:
+            Matching institutions (soft-deleted excluded), best first
+
+        Example:
+            suggestions = await service.autocomplete(
+                FinancialInstitutionAutocompleteParams(q="sant", country_code="ES")
+            )
+        """
+        await reference_catalog.ensure(self.session)
+        return reference_catalog.search_institutions(
+            params.q, country_code=params.country_code, limit=params.limit
+        )
 
     async def update_institution(
         self,
@@ -492,3 +564,211 @@ class FinancialInstitutionService:
             ip_address=ip_address,
             user_agent=user_agent,
         )
+
+    async def import_institutions(
+        self,
+        stream: IO[bytes],
+        file_format: ImportFormat,
+        current_user: User | None = None,
+        request_id: str | None = None,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+    ) -> FinancialInstitutionImportResult:
+        """
+        Insert or update institutions from a directory file (admin only).
+
+        Rows are validated like POST /financial-institutions bodies and need
+        a SWIFT code or a routing number, which identifies the institution
+        to update. Parsing runs in worker threads, batch by batch, while the
+        rows stream into the database with COPY; they are then merged in a
+        single transaction that bumps the financial_institutions version
+        once. Nothing is written if any row is invalid.
+
+        Args:
+            stream: Binary file (UTF-8)
+            file_format: CSV with a header row, or JSON (array or JSON Lines)
+            current_user: Admin running the import (None for the CLI)
+            request_id: Request ID for audit logging
+            ip_address: Client IP address
+            user_agent: Client user agent
+
+        Returns:
+            Counts of received, inserted, updated and unchanged rows
+
+        Raises:
+            ValidationError: If the file is malformed or rows are invalid
+            ConflictError: If a row's codes belong to two institutions
+
+        Example:
+            with open("bic_directory.csv", "rb") as file:
+                result = await service.import_institutions(file, ImportFormat.CSV)
+        """
+        errors: list[dict[str, Any]] = []
+        received = 0
+
+        async def records() -> AsyncIterator[tuple[Any, ...]]:
+            nonlocal received
+            rows = _read_rows(stream, file_format)
+            while batch := await asyncio.to_thread(_validate_batch, rows, errors):
+                received += len(batch)
+                for record in batch:
+                    yield record
+
+        try:
+            async with single_version_bump(self.session, "financial_institutions"):
+                await self.institution_repo.copy_to_staging(records())
+                if errors:
+                    raise ValidationError(
+                        f"{len(errors)} invalid rows, nothing was imported",
+                        details={"errors": errors[:MAX_REPORTED_IMPORT_ERRORS]},
+                    )
+                inserted, updated = await self.institution_repo.merge_staging()
+        except IntegrityError as e:
+            await self.session.rollback()
+            logger.warning(f"Institution import conflict: {e.orig}")
+            raise ConflictError(
+                "A SWIFT code and routing number in the file belong to "
+                "different institutions"
+            )
+        except ValidationError:
+            await self.session.rollback()
+            raise
+
+        # Commit transaction
+        await self.session.commit()
+
+        result = FinancialInstitutionImportResult(
+            received=received,
+            inserted=inserted,
+            updated=updated,
+            unchanged=received - inserted - updated,
+        )
+        admin = current_user.id if current_user else "cli"
+        logger.info(
+            f"Institutions imported by {admin}: {received} rows, "
+            f"{inserted} inserted, {updated} updated"
+        )
+
+        # Log to audit trail
+        await self.audit_service.log_event(
+            user_id=current_user.id if current_user else None,
+            action=AuditAction.IMPORT_FINANCIAL_INSTITUTIONS,
+            entity_type="financial_institution",
+            extra_metadata={"format": file_format.value, **result.model_dump()},
+            request_id=request_id,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+
+        return result
+
+
+# ============================================================================
+# Import File Parsing
+# ============================================================================
+
+
+def _read_rows(
+    stream: IO[bytes], file_format: ImportFormat
+) -> Iterator[tuple[int, Any]]:
+    """
+    Read the raw rows of an import file.
+
+    Args:
+        stream: Binary file (UTF-8, optionally with a BOM)
+        file_format: File format
+
+    Yields:
+        (line number, row) pairs - the record number for JSON arrays
+
+    Raises:
+        ValidationError: If the file is not valid JSON
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if file_format == ImportFormat.CSV:
+            reader = csv.DictReader(text)
+            for row in reader:
+                # Blank cells are missing values; cells beyond the header
+                # (key None) are dropped
+                yield (
+                    reader.line_num,
+                    {
+                        key: value.strip() or None
+                        for key, value in row.items()
+                        if key is not None and value is not None
+                    },
+                )
+            return
+
+        lines = enumerate(text, start=1)
+        for number, line in lines:
+            if line.strip():
+                break
+        else:
+            return
+
+        try:
+            if line.lstrip().startswith("["):
+                yield from enumerate(json.loads(line + text.read()), start=1)
+                return
+
+            yield number, json.loads(line)
+            for number, line in lines:
+                if line.strip():
+                    yield number, json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValidationError(f"Invalid JSON on line {number}: {e.msg}")
+    finally:
+        text.detach()  # Leave the caller's file open
+
+
+def _validate_batch(
+    rows: Iterator[tuple[int, Any]], errors: list[dict[str, Any]]
+) -> list[tuple[Any, ...]]:
+    """
+    Validate the next IMPORT_BATCH_SIZE rows of an import file.
+
+    Args:
+        rows: Raw rows from _read_rows
+        errors: Receives {"line", "error"} for each invalid row
+
+    Returns:
+        Staging records (repositories IMPORT_COLUMNS order), empty once
+        the file is exhausted
+    """
+    batch: list[tuple[Any, ...]] = []
+    for line, row in rows:
+        try:
+            if not isinstance(row, dict):
+                raise ValueError("Expected an object")
+            data = FinancialInstitutionCreate.model_validate(row)
+            if not data.swift_code and not data.routing_number:
+                raise ValueError("Either swift_code or routing_number is required")
+        except PydanticValidationError as e:
+            message = "; ".join(
+                f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                for error in e.errors()
+            )
+            errors.append({"line": line, "error": message})
+            continue
+        except ValueError as e:
+            errors.append({"line": line, "error": str(e)})
+            continue
+
+        batch.append(
+            (
+                line,
+                data.name,
+                data.short_name,
+                data.swift_code,
+                data.routing_number,
+                str(data.country_code),
+                data.institution_type.value,
+                str(data.logo_url) if data.logo_url else None,
+                str(data.website_url) if data.website_url else None,
+            )
+        )
+        if len(batch) == IMPORT_BATCH_SIZE:
+            break
+    return batch
@@ -9,14 +9,17 @@ This module provides:
 - Delete transaction (soft delete) with balance updates
 - Split transaction into multiple parts
 - Join split transactions back together
+- Account summary statistics kept in step with every write
 """
 
 import logging
 import uuid
 from decimal import Decimal
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.currencies import fits_precision, minor_units, quantize_amounts
 from core.exceptions import (
     AuthorizationError,
     NotFoundError,
@@ -37,6 +40,7 @@ from schemas import (
     TransactionSortParams,
     TransactionUpdate,
 )
+from .account_summary_service import AccountSummaryService, SummaryEntry
 from .audit_service import AuditService
 from .currency_service import CurrencyService
 from .permission_service import PermissionService
@@ -44,6 +48,27 @@ from .permission_service import PermissionService
 logger = logging.getLogger(__name__)
 
 
+def _audit_snapshot(transaction: Transaction) -> dict[str, Any]:
+    """
+    Full audit snapshot of a transaction's user-editable state.
+
+    CREATE rows store it as new_values and UPDATE rows diff two of them, so
+    compact UPDATE rows can be expanded back to full snapshots.
+    """
+    return {
+        "transaction_date": str(transaction.transaction_date),
+        "amount": str(transaction.amount),
+        "currency": transaction.currency,
+        "original_description": transaction.original_description,
+        "user_description": transaction.user_description,
+        "merchant": transaction.merchant,
+        "card_id": str(transaction.card_id) if transaction.card_id else None,
+        "comments": transaction.comments,
+        "review_status": transaction.review_status.value,
+        "value_date": str(transaction.value_date) if transaction.value_date else None,
+    }
+
+
 class TransactionService:
     """
     Service class for transaction management operations.
@@ -72,6 +97,7 @@ class TransactionService:
         self.permission_service = PermissionService(session)
         self.currency_service = CurrencyService(session)
         self.audit_service = AuditService(session)
+        self.summary_service = AccountSummaryService(session)
 
     async def create_transaction(
         self,
@@ -133,13 +159,12 @@ class TransactionService:
 
         # Validate currency is supported
         if not self.currency_service.is_supported(data.currency):
-            supported_codes = ", ".join(self.currency_service.get_supported_codes())
             logger.warning(
                 f"User {current_user.id} attempted to create transaction with unsupported currency: {data.currency}"
             )
             raise ValidationError(
                 f"Unsupported currency code '{data.currency}'. "
-                f"Supported currencies: {supported_codes}"
+                "See /api/v1/metadata/currencies for supported currencies"
             )
 
         # Validate currency matches account
@@ -155,6 +180,13 @@ class TransactionService:
         if data.amount == 0:
             raise ValidationError("Transaction amount cannot be zero")
 
+        # Validate amount precision for the currency (e.g. no cents for JPY)
+        if not fits_precision(data.amount, data.currency):
+            raise ValidationError(
+                f"{data.currency} amounts cannot have more than "
+                f"{minor_units(data.currency)} decimal places"
+            )
+
         # Validate card if provided
         if data.card_id is not None:
             card = await self.card_repo.get_by_id_for_user(
@@ -191,6 +223,8 @@ class TransactionService:
         account.current_balance += data.amount
         new_balance = account.current_balance
 
+        await self.summary_service.record(account_id, added=[transaction])
+
         logger.info(
             f"Created transaction {transaction.id} for account {account_id}, "
             f"updated balance: {old_balance} -> {new_balance}"
@@ -205,15 +239,7 @@ class TransactionService:
             entity_type="transaction",
             entity_id=transaction.id,
             description=f"Created transaction: {data.original_description} ({data.amount} {data.currency})",
-            new_values={
-                "transaction_date": str(data.transaction_date),
-                "amount": str(data.amount),
-                "currency": data.currency,
-                "original_description": data.original_description,
-                "merchant": data.merchant,
-                "card_id": str(data.card_id) if data.card_id else None,
-                "review_status": data.review_status.value,
-            },
+            new_values=_audit_snapshot(transaction),
             extra_metadata={
                 "account_id": str(account_id),
                 "old_balance": str(old_balance),
@@ -413,6 +439,13 @@ class TransactionService:
         # 4. Business validations
         if "amount" in update_dict and update_dict["amount"] == 0:
             raise ValidationError("Transaction amount cannot be zero")
+        if "amount" in update_dict and not fits_precision(
+            update_dict["amount"], existing.currency
+        ):
+            raise ValidationError(
+                f"{existing.currency} amounts cannot have more than "
+                f"{minor_units(existing.currency)} decimal places"
+            )
 
         # Validate card if being updated
         # card_id can be:
@@ -439,19 +472,10 @@ class TransactionService:
         balance_delta = new_amount - old_amount
 
         # 6. Capture old values for audit
-        old_values = {
-            "transaction_date": str(existing.transaction_date),
-            "amount": str(existing.amount),
-            "original_description": existing.original_description,
-            "user_description": existing.user_description,
-            "merchant": existing.merchant,
-            "card_id": str(existing.card_id) if existing.card_id else None,
-            "comments": existing.comments,
-            "review_status": existing.review_status.value,
-            "value_date": str(existing.value_date) if existing.value_date else None,
-        }
-
-        # 7. Apply changes to model instance
+        old_values = _audit_snapshot(existing)
+
+        # 7. Apply changes to model instance (keeping the summary-relevant values)
+        previous = SummaryEntry.of(existing)
         for key, value in update_dict.items():
             setattr(existing, key, value)
         existing.updated_by = current_user.id
@@ -460,17 +484,7 @@ class TransactionService:
         updated = await self.transaction_repo.update(existing)
 
         # 9. Capture new values for audit
-        new_values = {
-            "transaction_date": str(updated.transaction_date),
-            "amount": str(updated.amount),
-            "original_description": updated.original_description,
-            "user_description": updated.user_description,
-            "merchant": updated.merchant,
-            "card_id": str(updated.card_id) if updated.card_id else None,
-            "comments": updated.comments,
-            "review_status": updated.review_status.value,
-            "value_date": str(updated.value_date) if updated.value_date else None,
-        }
+        new_values = _audit_snapshot(updated)
 
         # 10. Update balance if amount changed
         if balance_delta != Decimal(0):
@@ -485,7 +499,11 @@ class TransactionService:
                 f"new balance: {old_balance} -> {new_balance}"
             )
 
-        # 11. Audit log with old/new values
+        await self.summary_service.record(
+            existing.account_id, added=[updated], removed=[previous]
+        )
+
+        # 11. Audit log with changed old/new values only
         await self.audit_service.log_event(
             user_id=current_user.id,
             action=AuditAction.UPDATE,
@@ -501,6 +519,7 @@ class TransactionService:
             ip_address=ip_address,
             user_agent=user_agent,
             request_id=request_id,
+            compact=True,
         )
 
         # 12. Commit transaction
@@ -566,6 +585,7 @@ class TransactionService:
         # Use database transaction for atomicity
         # Transaction managed by caller
         # If parent, delete all children first
+        children: list[Transaction] = []
         if await self.transaction_repo.has_children(transaction_id):
             children = await self.transaction_repo.get_children(transaction_id)
             for child in children:
@@ -586,6 +606,10 @@ class TransactionService:
         account.current_balance -= existing.amount
         new_balance = account.current_balance
 
+        await self.summary_service.record(
+            existing.account_id, removed=[existing, *children]
+        )
+
         logger.info(
             f"Deleted transaction {transaction_id}, "
             f"updated balance: {old_balance} -> {new_balance}"
@@ -632,6 +656,7 @@ class TransactionService:
         2. User must be creator, owner, or admin
         3. Parent cannot already be a child
         4. At least 2 splits required
+        5. Split amounts fit the parent currency's precision (e.g. no cents for JPY)
 
         Process:
         1. Create child transactions with parent_transaction_id set
@@ -679,8 +704,17 @@ class TransactionService:
         if len(splits) < 2:
             raise ValidationError("At least 2 splits are required")
 
+        # Validation: Split amounts fit the currency precision (one quantum
+        # lookup for the whole batch)
+        amounts = [Decimal(str(s["amount"])) for s in splits]
+        if quantize_amounts(amounts, parent.currency) != amounts:
+            raise ValidationError(
+                f"{parent.currency} amounts cannot have more than "
+                f"{minor_units(parent.currency)} decimal places"
+            )
+
         # Validation: Split amounts must sum to parent amount
-        total_amount_splits = sum(Decimal(str(s["amount"])) for s in splits)
+        total_amount_splits = sum(amounts)
         if total_amount_splits != parent.amount:
             logger.warning(
                 f"Split amounts ({total_amount_splits}) don't equal parent amount ({parent.amount})"
@@ -707,13 +741,13 @@ class TransactionService:
         # Use database transaction for atomicity
         # Transaction managed by caller
         children = []
-        for split_data in splits:
+        for split_data, amount in zip(splits, amounts, strict=True):
             child = Transaction(
                 account_id=parent.account_id,
                 parent_transaction_id=parent.id,
                 transaction_date=parent.transaction_date,
                 value_date=parent.value_date,
-                amount=Decimal(str(split_data["amount"])),
+                amount=amount,
                 currency=parent.currency,
                 original_description=parent.original_description,
                 user_description=split_data.get("user_description"),
@@ -729,6 +763,7 @@ class TransactionService:
         logger.info(f"Split transaction {transaction_id} into {len(children)} children")
 
         # No balance update needed (parent still exists, children don't add new amounts)
+        await self.summary_service.record(parent.account_id, added=children)
         await self.session.commit()
 
         # Audit log
@@ -833,6 +868,7 @@ class TransactionService:
         )
 
         # No balance update (children never affected balance independently)
+        await self.summary_service.record(parent.account_id, removed=children)
 
         # Audit log
         await self.audit_service.log_event(
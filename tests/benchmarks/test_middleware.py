@@ -0,0 +1,122 @@
+"""
+Per-request overhead benchmark of the middleware stack.
+
+Requests are driven straight through ASGI (no HTTP client), so only
+middleware and routing cost is measured. The reference stack has the same
+depth built from pass-through BaseHTTPMiddleware layers - a lower bound of
+what the previous BaseHTTPMiddleware implementations cost, since those also
+did their own work on top.
+
+Tests cover:
+- The pure ASGI stack is cheaper per request than the BaseHTTPMiddleware
+  reference (overhead saved is printed with -s; marked as a benchmark, run
+  with `pytest -m benchmark`)
+
+MIDDLEWARE_BENCHMARK_REQUESTS sets the requests per measured run.
+"""
+
+import asyncio
+import logging
+import os
+import time
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.types import Message
+
+from core.middleware import (
+    QueryRecorderMiddleware,
+    RequestIDMiddleware,
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+REQUESTS = int(os.environ.get("MIDDLEWARE_BENCHMARK_REQUESTS", "2000"))
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/ping",
+    "raw_path": b"/ping",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"test"), (b"user-agent", b"benchmark")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("test", 80),
+}
+
+
+async def ping(request: Request) -> PlainTextResponse:
+    """Minimal endpoint."""
+    return PlainTextResponse("pong")
+
+
+class PassThroughMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware layer doing no work of its own."""
+
+    async def dispatch(self, request, call_next):  # type: ignore[no-untyped-def]
+        return await call_next(request)
+
+
+def make_app(*middleware: tuple[type, dict]) -> Starlette:
+    """Create a one-route app wrapped in the given middleware."""
+    app = Starlette()
+    app.add_route("/ping", ping)
+    for middleware_class, options in middleware:
+        app.add_middleware(middleware_class, **options)
+    return app
+
+
+async def time_requests(app: Starlette, count: int) -> float:
+    """Send count requests through app and return seconds per request."""
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    # Warm up (middleware stack is built on the first call)
+    await app({**SCOPE}, receive, send)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await app({**SCOPE, "headers": list(SCOPE["headers"])}, receive, send)
+    return (time.perf_counter() - start) / count
+
+
+@pytest.mark.benchmark
+def test_asgi_stack_overhead_below_base_http_middleware() -> None:
+    """Pure ASGI middleware add less per-request overhead than the reference."""
+    baseline = make_app()
+    reference = make_app(*[(PassThroughMiddleware, {})] * 4)
+    current = make_app(
+        (RequestIDMiddleware, {}),
+        (RequestLoggingMiddleware, {}),
+        (QueryRecorderMiddleware, {}),
+        (SecurityHeadersMiddleware, {"enable_hsts": True}),
+    )
+
+    middleware_logger = logging.getLogger("core.middleware")
+    middleware_logger.disabled = True
+    try:
+        bare = asyncio.run(time_requests(baseline, REQUESTS))
+        base_http = asyncio.run(time_requests(reference, REQUESTS))
+        asgi = asyncio.run(time_requests(current, REQUESTS))
+    finally:
+        middleware_logger.disabled = False
+
+    base_http_overhead_us = (base_http - bare) * 1e6
+    asgi_overhead_us = (asgi - bare) * 1e6
+    print(
+        f"\nMiddleware overhead per request: BaseHTTPMiddleware x4 "
+        f"{base_http_overhead_us:.1f}us, pure ASGI {asgi_overhead_us:.1f}us, "
+        f"saved {base_http_overhead_us - asgi_overhead_us:.1f}us"
+    )
+    assert asgi < base_http
@@ -0,0 +1,58 @@
+"""
+Hot-path benchmark of the global rate limit.
+
+Measures what every API request pays for RateLimitMiddleware's decision:
+deriving the key from a (cached) access token and consuming a token from
+the in-memory bucket. No Redis is involved on this path.
+
+Tests cover:
+- Key derivation plus bucket hit stays under RATE_LIMIT_MAX_MICROSECONDS
+  per request (timing printed with -s)
+
+RATE_LIMIT_BENCHMARK_REQUESTS sets the requests per measured run (the
+best of three runs is kept). Timing-based, so excluded from the default
+run: use -m benchmark.
+"""
+
+import os
+import time
+from datetime import timedelta
+
+import pytest
+
+from core.rate_limit import HybridRateLimiter, rate_limit_key
+from core.security import TOKEN_TYPE_ACCESS, create_token
+
+REQUESTS = int(os.environ.get("RATE_LIMIT_BENCHMARK_REQUESTS", "20000"))
+MAX_MICROSECONDS = float(os.environ.get("RATE_LIMIT_MAX_MICROSECONDS", "50"))
+
+
+@pytest.mark.benchmark
+def test_rate_limit_hot_path_in_microseconds() -> None:
+    """The per-request rate limit decision costs microseconds."""
+    limiter = HybridRateLimiter(
+        f"{REQUESTS * 10}/minute", redis=None, sync_interval=1.0
+    )
+    tokens = [
+        create_token({"sub": f"user-{i}"}, timedelta(minutes=5), TOKEN_TYPE_ACCESS)
+        for i in range(100)
+    ]
+    scopes = [
+        {
+            "type": "http",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+            "client": ("10.0.0.1", 1234),
+        }
+        for token in tokens
+    ]
+
+    runs = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for index in range(REQUESTS):
+            assert limiter.hit(rate_limit_key(scopes[index % 100])) == 0
+        runs.append((time.perf_counter() - start) / REQUESTS)
+
+    microseconds = min(runs) * 1_000_000
+    print(f"\nrate limit decision: {microseconds:.2f}us per request")
+    assert microseconds < MAX_MICROSECONDS
@@ -0,0 +1,145 @@
+"""
+Startup benchmarks for the application module graph.
+
+Each check runs in a fresh interpreter (subprocess), so modules already
+imported by the test session do not hide the cost of a cold start.
+
+Tests cover:
+- Cumulative import time of main (python -X importtime) within budget
+- Wall-clock time to import main within budget (best of several runs)
+- Disabled subsystems (Redis-backed rate limiting) are not imported
+- Service and route packages load their modules on first access
+
+Timing checks are marked as benchmarks and excluded from the default run
+(see pyproject.toml); run them with `pytest -m benchmark tests/benchmarks/`.
+Budgets can be tuned per machine through environment variables:
+- STARTUP_IMPORT_BUDGET_MS: Maximum cumulative import time of main
+- STARTUP_WALL_BUDGET_MS: Maximum wall-clock time to import main
+- STARTUP_BENCHMARK_RUNS: Runs of the wall-clock harness (best is kept)
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = PROJECT_DIR / "src"
+
+IMPORT_BUDGET_MS = float(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "3000"))
+WALL_BUDGET_MS = float(os.environ.get("STARTUP_WALL_BUDGET_MS", "4000"))
+BENCHMARK_RUNS = int(os.environ.get("STARTUP_BENCHMARK_RUNS", "3"))
+
+# Wall-clock harness run in the child interpreter
+WALL_CLOCK_SCRIPT = """
+import time
+start = time.perf_counter()
+import main
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def run_python(*args: str, **env: str) -> subprocess.CompletedProcess[str]:
+    """Run a fresh interpreter on src/ with the test environment and .env."""
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_DIR,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR), **env},
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """
+    Parse python -X importtime output.
+
+    Args:
+        stderr: Standard error of the interpreter
+
+    Returns:
+        Module name -> cumulative import time in microseconds
+    """
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, module = line[len("import time:") :].split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[module.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def test_parse_importtime() -> None:
+    """Header lines are skipped and cumulative times are keyed by module."""
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   core.config\n"
+        "import time:       300 |       1500 | main\n"
+    )
+
+    assert parse_importtime(stderr) == {"core.config": 120, "main": 1500}
+
+
+@pytest.mark.benchmark
+def test_import_time_budget() -> None:
+    """Cumulative import time of main stays within STARTUP_IMPORT_BUDGET_MS."""
+    result = run_python("-X", "importtime", "-c", "import main")
+
+    main_ms = parse_importtime(result.stderr)["main"] / 1000
+    assert main_ms <= IMPORT_BUDGET_MS, (
+        f"import main took {main_ms:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms); "
+        "run `PYTHONPATH=src python -X importtime -c 'import main'` to find it"
+    )
+
+
+@pytest.mark.benchmark
+def test_cold_start_wall_clock_budget() -> None:
+    """Best wall-clock import of main stays within STARTUP_WALL_BUDGET_MS."""
+    timings = [
+        float(run_python("-c", WALL_CLOCK_SCRIPT).stdout.strip().splitlines()[-1])
+        for _ in range(BENCHMARK_RUNS)
+    ]
+
+    best_ms = min(timings)
+    assert best_ms <= WALL_BUDGET_MS, (
+        f"Cold start took {best_ms:.0f}ms (budget {WALL_BUDGET_MS:.0f}ms, "
+        f"runs: {', '.join(f'{t:.0f}' for t in timings)})"
+    )
+
+
+def test_disabled_rate_limiting_skips_redis() -> None:
+    """With rate limiting disabled the Redis client is never imported."""
+    result = run_python(
+        "-c",
+        "import sys, main; print('redis' in sys.modules)",
+        RATE_LIMIT_ENABLED="false",
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_service_import_loads_only_its_module() -> None:
+    """Importing one service does not load the other service modules."""
+    result = run_python(
+        "-c",
+        "import sys; from services import AuditService; "
+        "print(sorted(m for m in sys.modules if m.startswith('services.')))",
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "['services.audit_service']"
+
+
+def test_route_modules_load_on_access() -> None:
+    """The routes package imports a route module when it is first used."""
+    result = run_python(
+        "-c",
+        "import sys, api; loaded = 'api.routes.admin' in sys.modules; "
+        "api.routes.admin; print(loaded, 'api.routes.admin' in sys.modules)",
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "False True"
@@ -16,6 +16,7 @@ os.environ["RATE_LIMIT_LOGIN"] = "10000 per hour"
 os.environ["RATE_LIMIT_REGISTER"] = "10000 per hour"
 os.environ["RATE_LIMIT_PASSWORD_CHANGE"] = "10000 per hour"
 os.environ["RATE_LIMIT_TOKEN_REFRESH"] = "10000 per hour"
+os.environ["QUERY_BUDGET_ENFORCED"] = "true"
 
 import asyncio
 from typing import AsyncGenerator
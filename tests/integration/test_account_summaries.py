@@ -0,0 +1,245 @@
+"""
+Integration tests for incrementally maintained account summaries (PostgreSQL).
+
+Tests cover:
+- Summary rows after transaction create, update, delete, split and join,
+  each matching a recomputation from the transactions table
+- Month totals recomputed on the first write of a month (no negative
+  totals, earlier-recorded transactions of the new month counted)
+- The rebuild-summaries command correcting drifted rows
+"""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from cli.accounts import rebuild_summaries
+from models import Account, AccountSummary
+from services import AccountSummaryService
+
+TODAY = datetime.now(UTC).date()
+THIS_MONTH = TODAY.replace(day=1)
+LAST_MONTH = (THIS_MONTH - timedelta(days=1)).replace(day=1)
+
+
+async def create_transaction(
+    async_client: AsyncClient,
+    user_token: dict,
+    account: Account,
+    amount: str,
+    review_status: str = "to_review",
+    transaction_date: str = str(TODAY),
+) -> str:
+    """Create a transaction through the API and return its ID."""
+    response = await async_client.post(
+        f"/api/v1/accounts/{account.id}/transactions",
+        headers={"Authorization": f"Bearer {user_token['access_token']}"},
+        json={
+            "transaction_date": transaction_date,
+            "amount": amount,
+            "currency": "USD",
+            "original_description": "Summary test",
+            "review_status": review_status,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+async def read_summary(test_engine: AsyncEngine, account: Account) -> AccountSummary:
+    """Read an account's summary row."""
+    async with async_sessionmaker(test_engine, expire_on_commit=False)() as session:
+        summary = await session.scalar(
+            select(AccountSummary).where(AccountSummary.account_id == account.id)
+        )
+    assert summary is not None
+    return summary
+
+
+async def rebuild(test_engine: AsyncEngine) -> int:
+    """Recompute every summary from the transactions table."""
+    async with async_sessionmaker(test_engine, class_=AsyncSession)() as session:
+        return await AccountSummaryService(session).rebuild()
+
+
+@pytest.mark.asyncio
+class TestSummaryWrites:
+    """Summaries follow transaction writes and agree with a recomputation."""
+
+    async def test_create(
+        self, async_client: AsyncClient, test_engine, user_token: dict, test_account
+    ):
+        """Created transactions count, date and add to the month totals."""
+        await create_transaction(async_client, user_token, test_account, "-50.00")
+        await create_transaction(
+            async_client, user_token, test_account, "200.00", "reviewed"
+        )
+
+        summary = await read_summary(test_engine, test_account)
+
+        assert summary.transaction_count == 2
+        assert summary.to_review_count == 1
+        assert summary.last_transaction_date == TODAY
+        assert summary.month_start == THIS_MONTH
+        assert summary.month_inflow == Decimal("200.00")
+        assert summary.month_outflow == Decimal("50.00")
+        assert await rebuild(test_engine) == 0
+
+    async def test_update(
+        self, async_client: AsyncClient, test_engine, user_token: dict, test_account
+    ):
+        """An update replaces the old amount and review status."""
+        transaction_id = await create_transaction(
+            async_client, user_token, test_account, "-25.00"
+        )
+
+        response = await async_client.put(
+            f"/api/v1/transactions/{transaction_id}",
+            headers={"Authorization": f"Bearer {user_token['access_token']}"},
+            json={"amount": "40.00", "review_status": "reviewed"},
+        )
+        assert response.status_code == 200
+
+        summary = await read_summary(test_engine, test_account)
+        assert summary.transaction_count == 1
+        assert summary.to_review_count == 0
+        assert summary.month_inflow == Decimal("40.00")
+        assert summary.month_outflow == Decimal("0.00")
+        assert await rebuild(test_engine) == 0
+
+    async def test_delete(
+        self, async_client: AsyncClient, test_engine, user_token: dict, test_account
+    ):
+        """A deletion removes the transaction and refreshes the last date."""
+        await create_transaction(
+            async_client,
+            user_token,
+            test_account,
+            "-10.00",
+            transaction_date=str(THIS_MONTH),
+        )
+        latest_id = await create_transaction(
+            async_client, user_token, test_account, "-15.00"
+        )
+
+        response = await async_client.delete(
+            f"/api/v1/transactions/{latest_id}",
+            headers={"Authorization": f"Bearer {user_token['access_token']}"},
+        )
+        assert response.status_code == 204
+
+        summary = await read_summary(test_engine, test_account)
+        assert summary.transaction_count == 1
+        assert summary.last_transaction_date == THIS_MONTH
+        assert summary.month_outflow == Decimal("10.00")
+        assert await rebuild(test_engine) == 0
+
+    async def test_split_and_join(
+        self, async_client: AsyncClient, test_engine, user_token: dict, test_account
+    ):
+        """Split children only count for review; joining restores the parent."""
+        transaction_id = await create_transaction(
+            async_client, user_token, test_account, "-50.00"
+        )
+        headers = {"Authorization": f"Bearer {user_token['access_token']}"}
+
+        response = await async_client.post(
+            f"/api/v1/transactions/{transaction_id}/split",
+            headers=headers,
+            json={
+                "splits": [
+                    {"amount": "-30.00", "user_description": "Groceries"},
+                    {"amount": "-20.00", "user_description": "Household items"},
+                ]
+            },
+        )
+        assert response.status_code == 200
+
+        split = await read_summary(test_engine, test_account)
+        assert split.transaction_count == 1
+        assert split.month_outflow == Decimal("50.00")
+        assert await rebuild(test_engine) == 0
+
+        response = await async_client.post(
+            f"/api/v1/transactions/{transaction_id}/join", headers=headers
+        )
+        assert response.status_code == 200
+
+        joined = await read_summary(test_engine, test_account)
+        assert joined.transaction_count == 1
+        assert joined.to_review_count == 1
+        assert joined.month_outflow == Decimal("50.00")
+        assert await rebuild(test_engine) == 0
+
+
+@pytest.mark.asyncio
+class TestMonthRollover:
+    """The first write of a month recomputes the month totals."""
+
+    async def test_removal_after_rollover_recomputes_totals(
+        self, async_client: AsyncClient, test_engine, user_token: dict, test_account
+    ):
+        """Removing a transaction recorded before the rollover never goes negative."""
+        await create_transaction(async_client, user_token, test_account, "-40.00")
+        removed_id = await create_transaction(
+            async_client, user_token, test_account, "-10.00"
+        )
+        # As if both were recorded (future-dated) while the row tracked last month
+        async with async_sessionmaker(test_engine)() as session:
+            await session.execute(
+                update(AccountSummary)
+                .where(AccountSummary.account_id == test_account.id)
+                .values(
+                    month_start=LAST_MONTH,
+                    month_inflow=Decimal("0.00"),
+                    month_outflow=Decimal("999.00"),
+                )
+            )
+            await session.commit()
+
+        response = await async_client.delete(
+            f"/api/v1/transactions/{removed_id}",
+            headers={"Authorization": f"Bearer {user_token['access_token']}"},
+        )
+        assert response.status_code == 204
+
+        summary = await read_summary(test_engine, test_account)
+        assert summary.month_start == THIS_MONTH
+        assert summary.month_inflow == Decimal("0.00")
+        assert summary.month_outflow == Decimal("40.00")
+
+
+@pytest.mark.asyncio
+class TestRebuildSummaries:
+    """Tests for the rebuild-summaries command."""
+
+    async def test_rebuild_corrects_drifted_rows(
+        self, async_client: AsyncClient, test_engine, user_token: dict, test_account
+    ):
+        """Drifted summaries are recomputed; a second run writes nothing."""
+        await create_transaction(async_client, user_token, test_account, "-5.00")
+        async with async_sessionmaker(test_engine)() as session:
+            await session.execute(
+                update(AccountSummary)
+                .where(AccountSummary.account_id == test_account.id)
+                .values(transaction_count=7, to_review_count=0)
+            )
+            await session.commit()
+
+        with (
+            patch("cli.accounts.create_database_engine", return_value=test_engine),
+            # The shared test engine outlives the command
+            patch("cli.accounts.close_database_connection", AsyncMock()),
+        ):
+            assert await rebuild_summaries() >= 1
+            assert await rebuild_summaries() == 0
+
+        summary = await read_summary(test_engine, test_account)
+        assert summary.transaction_count == 1
+        assert summary.to_review_count == 1
+        assert summary.month_outflow == Decimal("5.00")
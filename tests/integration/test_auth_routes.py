@@ -13,6 +13,9 @@ Tests cover:
 import pytest
 from httpx import AsyncClient
 
+from api.dependencies import get_db
+from core.database import create_sessionmaker
+from main import app
 from models import User
 
 
@@ -267,6 +270,39 @@ class TestTokenRefresh:
         data = response2.json()
         assert data["error"]["code"] == "INVALID_TOKEN"
 
+    @pytest.mark.asyncio
+    async def test_refresh_token_reuse_revokes_family_in_unit_of_work(
+        self, async_client: AsyncClient, user_token: dict, test_engine
+    ):
+        """Test that family revocation survives the failed request's rollback."""
+        # Use the production get_db: one real COMMIT per request
+        app.dependency_overrides.pop(get_db, None)
+        previous_sessionmaker = getattr(app.state, "sessionmaker", None)
+        app.state.sessionmaker = create_sessionmaker(test_engine, unit_of_work=True)
+        try:
+            rotated = await async_client.post(
+                "/api/auth/refresh",
+                json={"refresh_token": user_token["refresh_token"]},
+            )
+            assert rotated.status_code == 200
+            sibling_token = rotated.json()["refresh_token"]
+
+            # Reuse the rotated-out token: the request fails and rolls back
+            reuse = await async_client.post(
+                "/api/auth/refresh",
+                json={"refresh_token": user_token["refresh_token"]},
+            )
+            assert reuse.status_code == 401
+
+            # The sibling issued by the rotation must be revoked as well
+            sibling = await async_client.post(
+                "/api/auth/refresh",
+                json={"refresh_token": sibling_token},
+            )
+            assert sibling.status_code == 401
+        finally:
+            app.state.sessionmaker = previous_sessionmaker
+
 
 # ============================================================================
 # Logout Tests
@@ -0,0 +1,170 @@
+"""
+Integration tests for fleet-wide balance verification (PostgreSQL).
+
+Tests cover:
+- Mismatches found from the ledger (split children and deleted
+  transactions excluded)
+- Balances fixed in one UPDATE, skipping accounts changed since comparing
+- Correction batches larger than asyncpg's bind parameter limit
+"""
+
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Account, AccountType, FinancialInstitution, Transaction, User
+from repositories import AccountRepository
+
+
+async def make_account(
+    db_session: AsyncSession,
+    user: User,
+    institution: FinancialInstitution,
+    account_type: AccountType,
+    current_balance: str,
+    amounts: tuple[str, ...] = (),
+) -> Account:
+    """Create an account (opening balance 100.00) with top-level transactions."""
+    account = Account(
+        user_id=user.id,
+        financial_institution_id=institution.id,
+        account_type_id=account_type.id,
+        account_name=f"Account {uuid.uuid4().hex[:8]}",
+        currency="EUR",
+        opening_balance=Decimal("100.00"),
+        current_balance=Decimal(current_balance),
+    )
+    db_session.add(account)
+    await db_session.flush()
+    for amount in amounts:
+        db_session.add(make_transaction(account, amount))
+    await db_session.flush()
+    return account
+
+
+def make_transaction(account: Account, amount: str, **kwargs: object) -> Transaction:
+    """Create a transaction of account."""
+    return Transaction(
+        account_id=account.id,
+        transaction_date=date(2025, 1, 15),
+        amount=Decimal(amount),
+        currency="EUR",
+        original_description="Test transaction",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+class TestBalanceVerification:
+    """Tests for AccountRepository.find_balance_mismatches and fix_balances."""
+
+    async def test_mismatches_follow_the_ledger(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_financial_institution: FinancialInstitution,
+        savings_account_type: AccountType,
+    ):
+        """Split children and deleted transactions do not change balances."""
+        drifted = await make_account(
+            db_session,
+            test_user,
+            test_financial_institution,
+            savings_account_type,
+            current_balance="100.00",
+            amounts=("50.00",),
+        )
+        parent = make_transaction(drifted, "-30.00")
+        db_session.add(parent)
+        await db_session.flush()
+        db_session.add_all(
+            [
+                make_transaction(drifted, "-10.00", parent_transaction_id=parent.id),
+                make_transaction(drifted, "-20.00", parent_transaction_id=parent.id),
+                make_transaction(drifted, "999.00", deleted_at=datetime.now(UTC)),
+            ]
+        )
+        in_step = await make_account(
+            db_session,
+            test_user,
+            test_financial_institution,
+            savings_account_type,
+            current_balance="75.00",
+            amounts=("-25.00",),
+        )
+        await db_session.flush()
+
+        checked, mismatches = await AccountRepository(
+            db_session
+        ).find_balance_mismatches()
+
+        by_id = {account_id: rest for account_id, *rest in mismatches}
+        assert checked >= 2
+        assert by_id[drifted.id] == [Decimal("100.00"), Decimal("120.00")]
+        assert in_step.id not in by_id
+
+    async def test_fix_skips_accounts_changed_since_comparing(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_financial_institution: FinancialInstitution,
+        savings_account_type: AccountType,
+    ):
+        """Only accounts still holding the compared balance are corrected."""
+        stale = await make_account(
+            db_session,
+            test_user,
+            test_financial_institution,
+            savings_account_type,
+            current_balance="90.00",
+        )
+        changed = await make_account(
+            db_session,
+            test_user,
+            test_financial_institution,
+            savings_account_type,
+            current_balance="80.00",
+        )
+
+        fixed = await AccountRepository(db_session).fix_balances(
+            [
+                (stale.id, Decimal("90.00"), Decimal("100.00")),
+                # Compared at 70.00, written to 80.00 since
+                (changed.id, Decimal("70.00"), Decimal("100.00")),
+            ]
+        )
+
+        assert fixed == [stale.id]
+        await db_session.refresh(stale)
+        await db_session.refresh(changed)
+        assert stale.current_balance == Decimal("100.00")
+        assert changed.current_balance == Decimal("80.00")
+
+    async def test_fix_more_corrections_than_bind_parameters(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_financial_institution: FinancialInstitution,
+        savings_account_type: AccountType,
+    ):
+        """Corrections beyond asyncpg's 32767 parameters still run as one UPDATE."""
+        account = await make_account(
+            db_session,
+            test_user,
+            test_financial_institution,
+            savings_account_type,
+            current_balance="0.00",
+        )
+        corrections = [
+            (uuid.uuid4(), Decimal("0.00"), Decimal("1.00")) for _ in range(12_000)
+        ]
+        corrections.append((account.id, Decimal("0.00"), Decimal("100.00")))
+
+        fixed = await AccountRepository(db_session).fix_balances(corrections)
+
+        assert fixed == [account.id]
+        await db_session.refresh(account)
+        assert account.current_balance == Decimal("100.00")
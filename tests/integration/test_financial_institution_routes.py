@@ -3,6 +3,7 @@ Integration tests for Financial Institution API routes.
 
 Tests:
 - POST /api/v1/financial-institutions - Create institution (admin only)
+- POST /api/v1/financial-institutions/import - Bulk import (admin only)
 - GET /api/v1/financial-institutions - List institutions
 - GET /api/v1/financial-institutions/{id} - Get institution by ID
 - GET /api/v1/financial-institutions/swift/{code} - Get by SWIFT code
@@ -223,6 +224,95 @@ class TestFinancialInstitutionRoutes:
 
         assert response.status_code == 401
 
+    # ========================================================================
+    # POST /api/v1/financial-institutions/import - Bulk Import (Admin Only)
+    # ========================================================================
+
+    async def test_import_institutions_inserts_then_updates(
+        self, async_client: AsyncClient, admin_token: dict
+    ):
+        """Test importing a CSV, then re-importing it with changes."""
+        headers = {"Authorization": f"Bearer {admin_token['access_token']}"}
+        csv_file = (
+            "name,short_name,swift_code,routing_number,country_code,institution_type\n"
+            "Deutsche Bank AG,Deutsche Bank,DEUTDEFF,,DE,bank\n"
+            "JPMorgan Chase Bank,Chase,,021000021,US,bank\n"
+        )
+
+        response = await async_client.post(
+            "/api/v1/financial-institutions/import",
+            files={"file": ("directory.csv", csv_file, "text/csv")},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "received": 2,
+            "inserted": 2,
+            "updated": 0,
+            "unchanged": 0,
+        }
+
+        response = await async_client.post(
+            "/api/v1/financial-institutions/import",
+            files={
+                "file": (
+                    "directory.csv",
+                    csv_file.replace("Chase,", "JPMorgan Chase,"),
+                    "text/csv",
+                )
+            },
+            headers=headers,
+        )
+
+        assert response.json() == {
+            "received": 2,
+            "inserted": 0,
+            "updated": 1,
+            "unchanged": 1,
+        }
+        response = await async_client.get(
+            "/api/v1/financial-institutions/routing/021000021", headers=headers
+        )
+        assert response.json()["short_name"] == "JPMorgan Chase"
+
+    async def test_import_institutions_invalid_row_imports_nothing(
+        self, async_client: AsyncClient, admin_token: dict
+    ):
+        """Test that a file with an invalid row is rejected as a whole."""
+        headers = {"Authorization": f"Bearer {admin_token['access_token']}"}
+        json_lines = (
+            '{"name": "Banco de Sabadell", "short_name": "Sabadell",'
+            ' "swift_code": "BSABESBB", "country_code": "ES",'
+            ' "institution_type": "bank"}\n'
+            '{"name": "No Codes Bank", "short_name": "No Codes",'
+            ' "country_code": "ES", "institution_type": "bank"}\n'
+        )
+
+        response = await async_client.post(
+            "/api/v1/financial-institutions/import?file_format=json",
+            files={"file": ("directory.jsonl", json_lines, "application/json")},
+            headers=headers,
+        )
+
+        assert response.status_code == 422
+        response = await async_client.get(
+            "/api/v1/financial-institutions/swift/BSABESBB", headers=headers
+        )
+        assert response.status_code == 404
+
+    async def test_import_institutions_non_admin_forbidden(
+        self, async_client: AsyncClient, user_token: dict
+    ):
+        """Test that regular users cannot import institutions."""
+        response = await async_client.post(
+            "/api/v1/financial-institutions/import",
+            files={"file": ("directory.csv", "name\n", "text/csv")},
+            headers={"Authorization": f"Bearer {user_token['access_token']}"},
+        )
+
+        assert response.status_code == 403
+
     # ========================================================================
     # GET /api/v1/financial-institutions - List Institutions
     # ========================================================================
@@ -724,6 +724,56 @@ async def test_split_transaction_maintains_balance(
     assert response.status_code == 400
 
 
+@pytest.mark.asyncio
+async def test_split_amounts_must_fit_currency_precision(
+    async_client: AsyncClient,
+    user_token: dict,
+    test_financial_institution,
+    savings_account_type,
+):
+    """Test: Split amounts cannot have more decimals than the currency allows."""
+    headers = {"Authorization": f"Bearer {user_token['access_token']}"}
+    account_response = await async_client.post(
+        "/api/v1/accounts",
+        headers=headers,
+        json={
+            "account_name": "Yen Account",
+            "account_type_id": str(savings_account_type.id),
+            "currency": "JPY",
+            "opening_balance": "10000",
+            "financial_institution_id": str(test_financial_institution.id),
+        },
+    )
+    account_id = account_response.json()["id"]
+    create_response = await async_client.post(
+        f"/api/v1/accounts/{account_id}/transactions",
+        headers=headers,
+        json={
+            "transaction_date": str(date.today()),
+            "amount": "-1000",
+            "currency": "JPY",
+            "original_description": "Shopping",
+            "review_status": "to_review",
+        },
+    )
+    transaction_id = create_response.json()["id"]
+
+    # Sums to the parent amount, but JPY has no minor unit
+    response = await async_client.post(
+        f"/api/v1/transactions/{transaction_id}/split",
+        headers=headers,
+        json={
+            "splits": [
+                {"amount": "-500.50", "user_description": "Split 1"},
+                {"amount": "-499.50", "user_description": "Split 2"},
+            ]
+        },
+    )
+
+    assert response.status_code == 400
+    assert "decimal places" in response.json()["error"]["message"]
+
+
 @pytest.mark.asyncio
 async def test_cannot_split_already_split_transaction(
     async_client: AsyncClient,
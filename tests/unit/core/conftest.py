@@ -0,0 +1,60 @@
+"""
+Shared fixtures for core unit tests.
+
+This module provides:
+- FakeRedis: In-memory stand-in for the Redis commands core modules use
+- redis: RedisManager started with a FakeRedis client
+"""
+
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, patch
+
+import pytest_asyncio
+
+from core.redis import RedisManager
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands of caches and stores."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.aclose = AsyncMock()
+        self.ping = AsyncMock(return_value=True)
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, nx: bool = False, **expiry: int):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    async def incr(self, key: str) -> int:
+        value = int(self.data.get(key, 0)) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+    def register_script(self, script: str):
+        # Stands in for the idempotency store's compare-and-delete script
+        async def release(keys: list[str], args: list[bytes], client: object) -> int:
+            if self.data.get(keys[0]) == args[0]:
+                del self.data[keys[0]]
+                return 1
+            return 0
+
+        return release
+
+
+@pytest_asyncio.fixture
+async def redis() -> AsyncGenerator[RedisManager, None]:
+    """Redis manager started with an in-memory client."""
+    manager = RedisManager()
+    with patch("core.redis.settings.redis_probe_interval", 3600):
+        manager.start(client=FakeRedis())
+        yield manager
+    await manager.stop()
@@ -0,0 +1,167 @@
+"""
+Unit tests for batched sub-requests.
+
+Tests cover:
+- Responses returned in request order with their own status and body
+- Shared request state and forwarded (but filtered) headers
+- HTTP errors and unhandled exceptions isolated per sub-request
+- Concurrency capped by BATCH_MAX_CONCURRENCY
+- Each sub-request charged to the global rate limit
+- Batch schema validation (path prefix, unique ids, size limit)
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import ValidationError
+
+from core.batch import execute_batch
+from core.handlers import general_exception_handler
+from core.rate_limit import HybridRateLimiter
+from schemas import BatchRequest, BatchResponse
+
+
+def make_app() -> FastAPI:
+    """Create an app with a batch endpoint and a few sub-request targets."""
+    app = FastAPI()
+    app.add_exception_handler(Exception, general_exception_handler)
+    app.state.running = 0
+    app.state.peak = 0
+
+    @app.post("/api/batch")
+    async def batch(request: Request, body: BatchRequest) -> BatchResponse:
+        responses = await execute_batch(request, body.requests, {"principal": "u1"})
+        return BatchResponse(responses=responses)
+
+    @app.get("/api/echo")
+    async def echo(request: Request, value: str = "") -> dict[str, object]:
+        return {
+            "value": value,
+            "principal": request.state.principal,
+            "authorization": request.headers.get("authorization"),
+            "if_none_match": request.headers.get("if-none-match"),
+        }
+
+    @app.get("/api/slow")
+    async def slow(request: Request) -> dict[str, int]:
+        app.state.running += 1
+        app.state.peak = max(app.state.peak, app.state.running)
+        await asyncio.sleep(0.01)
+        app.state.running -= 1
+        return {"peak": app.state.peak}
+
+    @app.get("/api/missing")
+    async def missing() -> None:
+        raise HTTPException(status_code=404, detail="Not found")
+
+    @app.get("/api/broken")
+    async def broken() -> None:
+        raise RuntimeError("boom")
+
+    @app.get("/api/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for chunk in (b"a", b"b"):
+                yield chunk
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+async def post_batch(app: FastAPI, *paths: str) -> list[dict[str, object]]:
+    """POST a batch of GET sub-requests and return its responses."""
+    requests = [{"id": str(index), "path": path} for index, path in enumerate(paths)]
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as http:
+        response = await http.post(
+            "/api/batch",
+            json={"requests": requests},
+            headers={"Authorization": "Bearer token", "If-None-Match": '"abc"'},
+        )
+    assert response.status_code == 200
+    return response.json()["responses"]
+
+
+@pytest.mark.asyncio
+async def test_responses_in_request_order() -> None:
+    """Each sub-request gets its own response, in request order."""
+    responses = await post_batch(
+        make_app(), "/api/echo?value=first", "/api/stream", "/api/echo?value=last"
+    )
+
+    assert [r["id"] for r in responses] == ["0", "1", "2"]
+    assert responses[0]["body"]["value"] == "first"
+    assert responses[1] == {"id": "1", "status": 200, "body": "ab"}
+    assert responses[2]["body"]["value"] == "last"
+
+
+@pytest.mark.asyncio
+async def test_state_and_headers_forwarded() -> None:
+    """Sub-requests share batch state and credentials, not conditional headers."""
+    (response,) = await post_batch(make_app(), "/api/echo")
+
+    assert response["body"]["principal"] == "u1"
+    assert response["body"]["authorization"] == "Bearer token"
+    assert response["body"]["if_none_match"] is None
+
+
+@pytest.mark.asyncio
+async def test_errors_isolated_per_sub_request() -> None:
+    """HTTP errors and crashes only affect their own sub-request."""
+    with patch("core.handlers.logger"):
+        responses = await post_batch(
+            make_app(), "/api/missing", "/api/broken", "/api/unknown", "/api/echo"
+        )
+
+    assert [r["status"] for r in responses] == [404, 500, 404, 200]
+    assert responses[1]["body"]["error"]["code"] == "INTERNAL_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_concurrency_capped() -> None:
+    """No more than BATCH_MAX_CONCURRENCY sub-requests run at once."""
+    with patch("core.batch.settings.batch_max_concurrency", 2):
+        responses = await post_batch(make_app(), *["/api/slow"] * 6)
+
+    peaks = [r["body"]["peak"] for r in responses]
+    assert max(peaks) == 2
+
+
+@pytest.mark.asyncio
+async def test_sub_requests_charged_to_rate_limit() -> None:
+    """Every sub-request costs a token; those over the limit get 429."""
+    limiter = HybridRateLimiter("2/minute", redis=None, sync_interval=1.0)
+
+    with (
+        patch("core.batch.settings.rate_limit_enabled", True),
+        patch("core.batch.rate_limiter", limiter),
+        patch("core.batch.logger"),
+    ):
+        responses = await post_batch(make_app(), *["/api/echo"] * 3)
+
+    assert [r["status"] for r in responses] == [200, 200, 429]
+    assert responses[2]["body"]["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+    assert limiter.hit("ip:127.0.0.1") > 0
+
+
+@pytest.mark.parametrize(
+    "requests",
+    [
+        [],
+        [{"id": "a", "path": "/health"}],
+        [{"id": "a", "path": "/api/echo", "method": "POST"}],
+        [{"id": "a", "path": "/api/echo"}, {"id": "a", "path": "/api/slow"}],
+        [{"id": str(index), "path": "/api/echo"} for index in range(21)],
+    ],
+)
+def test_invalid_batch_rejected(requests: list[dict[str, str]]) -> None:
+    """Empty, oversized, non-API, non-GET and duplicate-id batches are invalid."""
+    with pytest.raises(ValidationError):
+        BatchRequest.model_validate({"requests": requests})
@@ -0,0 +1,280 @@
+"""
+Unit tests for the two-tier cache.
+
+Tests cover:
+- Read-through loading (local hits, Redis hits across workers, coalescing)
+- LRU eviction and local expiry
+- Invalidation of one key and of a whole cache (version bump)
+- Probabilistic early refresh of Redis entries
+- Degradation to the local tier when Redis is unavailable
+- Decorator API, disabled caching and stats
+"""
+
+import asyncio
+import time
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from core.cache import MISSING, Cache, _caches, cache_stats
+from core.redis import RedisManager
+
+
+class Item(BaseModel):
+    """Cached value type."""
+
+    id: int
+    name: str
+
+
+class Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Loader:
+    """Loader recording how often it ran."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> Item:
+        self.calls += 1
+        return Item(id=self.calls, name="checking")
+
+
+@pytest.fixture(autouse=True)
+def cache_registry() -> Iterator[None]:
+    """Drop test caches from the process-wide registry read by cache_stats()."""
+    registered = dict(_caches)
+    yield
+    _caches.clear()
+    _caches.update(registered)
+
+
+def make_cache(redis: RedisManager | None, **kwargs: object) -> Cache[Item]:
+    """Create an Item cache (a new instance stands for another worker)."""
+    return Cache("items", Item, ttl=60, local_ttl=5, redis=redis, **kwargs)
+
+
+# ============================================================================
+# Read-Through
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_second_lookup_is_local_hit(redis: RedisManager) -> None:
+    """A loaded value is served from memory afterwards."""
+    cache = make_cache(redis)
+    loader = Loader()
+
+    first = await cache.get_or_load("a", loader)
+    second = await cache.get_or_load("a", loader)
+
+    assert loader.calls == 1
+    assert second is first
+    assert cache.stats()["local_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_other_worker_hits_redis(redis: RedisManager) -> None:
+    """Another worker reads the value from Redis instead of loading it."""
+    loader = Loader()
+    await make_cache(redis).get_or_load("a", loader)
+    other = make_cache(redis)
+
+    value = await other.get_or_load("a", loader)
+
+    assert loader.calls == 1
+    assert value == Item(id=1, name="checking")
+    assert other.stats()["redis_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_coalesced(redis: RedisManager) -> None:
+    """Concurrent misses of one key run the loader once."""
+    cache = make_cache(redis)
+    calls = 0
+
+    async def slow_loader() -> Item:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return Item(id=1, name="slow")
+
+    await asyncio.gather(*(cache.get_or_load("a", slow_loader) for _ in range(5)))
+
+    assert calls == 1
+
+
+# ============================================================================
+# Local Tier
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(redis: RedisManager) -> None:
+    """The least recently used entry is evicted beyond maxsize."""
+    cache = make_cache(redis, maxsize=2)
+    loader = Loader()
+    await cache.get_or_load("a", loader)
+    await cache.get_or_load("b", loader)
+    await cache.get_or_load("a", loader)  # b is now least recently used
+
+    await cache.get_or_load("c", loader)
+
+    assert list(cache._local) == ["a", "c"]
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_local_entry_expires(redis: RedisManager) -> None:
+    """After local_ttl the value is read from Redis again."""
+    cache = make_cache(redis)
+    loader = Loader()
+    clock = Clock()
+
+    with patch("core.cache.time.monotonic", clock):
+        await cache.get_or_load("a", loader)
+        clock.now += 6
+        await cache.get_or_load("a", loader)
+
+    assert loader.calls == 1
+    assert cache.stats()["redis_hits"] == 1
+
+
+# ============================================================================
+# Invalidation
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_invalidate_key(redis: RedisManager) -> None:
+    """An invalidated key is loaded again."""
+    cache = make_cache(redis)
+    loader = Loader()
+    await cache.get_or_load("a", loader)
+
+    await cache.invalidate("a")
+
+    assert await cache.get("a") is MISSING
+    assert (await cache.get_or_load("a", loader)).id == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_bumps_version_for_all_workers(redis: RedisManager) -> None:
+    """clear() makes every worker reload once it re-reads the version."""
+    cache, other = make_cache(redis), make_cache(redis)
+    loader = Loader()
+    clock = Clock()
+
+    with patch("core.cache.time.monotonic", clock):
+        await cache.get_or_load("a", loader)
+        await other.get_or_load("a", loader)
+
+        await cache.clear()
+        clock.now += 6
+        value = await other.get_or_load("a", loader)
+
+    assert value.id == 2
+    assert other.stats()["version"] == 1
+
+
+# ============================================================================
+# Early Refresh and Degradation
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_early_refresh_near_expiry(redis: RedisManager) -> None:
+    """XFetch may elect a lookup to reload an entry that is about to expire."""
+    cache = make_cache(redis)
+    loader = Loader()
+    await cache.set("a", Item(id=0, name="old"), load_time=1.0)
+    later = time.time() + 50  # 10 seconds before expiry
+
+    # random() == 0 never refreshes early; near 1 it does (1s load time)
+    with patch("core.cache.time.time", return_value=later):
+        with patch("core.cache.random.random", return_value=0.0):
+            cache._local.clear()
+            kept = await cache.get_or_load("a", loader)
+        with patch("core.cache.random.random", return_value=0.999999):
+            cache._local.clear()
+            refreshed = await cache.get_or_load("a", loader)
+
+    assert kept.id == 0
+    assert refreshed.id == 1
+    assert loader.calls == 1
+    assert cache.stats()["early_refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_unavailable_uses_local_tier() -> None:
+    """Without Redis values are loaded and kept locally."""
+    cache = make_cache(RedisManager())
+    loader = Loader()
+
+    with patch("core.cache.logger"):
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("a", loader)
+
+    assert loader.calls == 1
+    assert cache.stats()["redis_errors"] >= 1
+
+
+# ============================================================================
+# Decorator, Settings and Stats
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator(redis: RedisManager) -> None:
+    """Decorated functions read through the cache by their key."""
+    cache = make_cache(redis)
+    calls = []
+
+    @cache.cached(key=lambda item_id: item_id)
+    async def get_item(item_id: int) -> Item:
+        calls.append(item_id)
+        return Item(id=item_id, name="decorated")
+
+    await get_item(1)
+    await get_item(1)
+    await get_item(2)
+
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_loads(redis: RedisManager) -> None:
+    """With CACHE_ENABLED=false every lookup runs the loader."""
+    cache = make_cache(redis)
+    loader = Loader()
+
+    with patch("core.cache.settings.cache_enabled", False):
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("a", loader)
+
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stats_report_hit_ratio(redis: RedisManager) -> None:
+    """Stats are reported per cache with a hit ratio."""
+    cache = make_cache(redis)
+    loader = Loader()
+    await cache.get_or_load("a", loader)
+    await cache.get_or_load("a", loader)
+
+    stats = cache_stats()["items"]
+
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["local_entries"] == 1
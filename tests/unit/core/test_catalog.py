@@ -0,0 +1,287 @@
+"""
+Unit tests for the reference catalog.
+
+Tests cover:
+- Loading on a miss, and no reload while the ids are known
+- Unknown ids queried by id once loaded, missing ones cached until the
+  next version change
+- Soft-deleted institutions embedded but rejected for new references
+- Reloads on reference data version changes (and failed reloads)
+- Account responses embedding from the catalog instead of relationships
+- Institution typeahead search
+"""
+
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.catalog import ReferenceCatalog
+from models import InstitutionType
+from schemas import AccountListResponse
+
+CHECKING = SimpleNamespace(id=uuid.uuid4(), key="checking", name="Checking")
+
+
+def make_institution(
+    name: str, short_name: str, country_code: str = "ES", deleted: bool = False
+) -> SimpleNamespace:
+    """Create a financial_institutions row."""
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name=name,
+        short_name=short_name,
+        swift_code=None,
+        country_code=country_code,
+        institution_type=InstitutionType.bank,
+        logo_url=None,
+        deleted_at=datetime.now(UTC) if deleted else None,
+    )
+
+
+BANK = make_institution("Bank", "BNK")
+CLOSED_BANK = make_institution("Closed Bank", "CLB", deleted=True)
+
+
+def make_session(
+    account_types: list[SimpleNamespace], institutions: list[SimpleNamespace]
+) -> MagicMock:
+    """Create a session returning the rows of both reference tables."""
+    results = [MagicMock(), MagicMock()]
+    results[0].all.return_value = account_types
+    results[1].all.return_value = institutions
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=lambda query: results.pop(0))
+    return session
+
+
+def make_sessionmaker(session: MagicMock) -> MagicMock:
+    """Create a sessionmaker handing out session."""
+    sessionmaker = MagicMock()
+    sessionmaker.return_value.__aenter__ = AsyncMock(return_value=session)
+    sessionmaker.return_value.__aexit__ = AsyncMock(return_value=False)
+    return sessionmaker
+
+
+# ============================================================================
+# Lookups
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_miss_loads_on_request_session() -> None:
+    """Unknown ids load the tables on the caller's session."""
+    catalog = ReferenceCatalog()
+    session = make_session([CHECKING], [BANK])
+
+    await catalog.ensure(session, [CHECKING.id], [BANK.id])
+
+    assert session.execute.await_count == 2
+    assert catalog.account_type(CHECKING.id).key == "checking"
+    assert catalog.institution(BANK.id).short_name == "BNK"
+    assert catalog.institution_exists(BANK.id)
+
+
+@pytest.mark.asyncio
+async def test_known_ids_run_no_query() -> None:
+    """Once loaded, lookups of known ids do not touch the database."""
+    catalog = ReferenceCatalog()
+    await catalog.ensure(make_session([CHECKING], [BANK]), [CHECKING.id])
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    await catalog.ensure(session, [CHECKING.id], [BANK.id])
+
+    session.execute.assert_not_awaited()
+    assert catalog.stats()["loads"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_id_not_found() -> None:
+    """An id missing from the tables is reported as not existing."""
+    catalog = ReferenceCatalog()
+    unknown = uuid.uuid4()
+
+    await catalog.ensure(make_session([CHECKING], [BANK]), [unknown], [unknown])
+
+    assert catalog.account_type(unknown) is None
+    assert not catalog.institution_exists(unknown)
+
+
+@pytest.mark.asyncio
+async def test_unknown_id_queried_without_reload() -> None:
+    """Once loaded, an unknown id is looked up on its own, not via a reload."""
+    catalog = ReferenceCatalog()
+    await catalog.ensure(make_session([CHECKING], []))
+    new_bank = make_institution("New Bank", "NEW")
+    session = make_session([], [])
+    session.execute = AsyncMock(return_value=MagicMock(all=lambda: [new_bank]))
+
+    await catalog.ensure(session, [CHECKING.id], [new_bank.id])
+
+    session.execute.assert_awaited_once()
+    query = str(session.execute.await_args.args[0])
+    assert "financial_institutions.id IN" in query
+    assert "account_types" not in query
+    assert catalog.stats()["loads"] == 1
+    assert catalog.institution_exists(new_bank.id)
+    assert [r.id for r in catalog.search_institutions("new bank")] == [new_bank.id]
+
+
+@pytest.mark.asyncio
+async def test_missing_id_cached_until_version_change() -> None:
+    """Ids that do not exist are not queried again until versions change."""
+    catalog = ReferenceCatalog()
+    await catalog.ensure(make_session([CHECKING], [BANK]))
+    unknown = uuid.uuid4()
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(all=lambda: []))
+
+    await catalog.ensure(session, [unknown])
+    await catalog.ensure(session, [unknown])
+
+    session.execute.assert_awaited_once()
+    assert catalog.account_type(unknown) is None
+    assert catalog.stats()["known_missing"] == 1
+
+    # A version change reloads the catalog and forgets missing ids
+    catalog.start(make_sessionmaker(make_session([CHECKING], [BANK])))
+    versions = AsyncMock(return_value={"account_types": 2})
+    with patch("core.catalog.reference_data_versions.get", versions):
+        await catalog.ensure(session, [unknown])
+
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_institution_embedded_not_selectable() -> None:
+    """Soft-deleted institutions stay embeddable but cannot be referenced."""
+    catalog = ReferenceCatalog()
+
+    await catalog.ensure(make_session([], [BANK, CLOSED_BANK]), [], [CLOSED_BANK.id])
+
+    assert catalog.institution(CLOSED_BANK.id).name == "Closed Bank"
+    assert not catalog.institution_exists(CLOSED_BANK.id)
+
+
+# ============================================================================
+# Version-Driven Reloads
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_refresh_reloads_on_version_change() -> None:
+    """The catalog reloads only when the reference versions change."""
+    catalog = ReferenceCatalog()
+    renamed = SimpleNamespace(id=CHECKING.id, key="checking", name="Current")
+    sessions = [make_session([CHECKING], []), make_session([renamed], [])]
+    sessionmaker = MagicMock()
+    sessionmaker.return_value.__aenter__ = AsyncMock(
+        side_effect=lambda: sessions.pop(0)
+    )
+    sessionmaker.return_value.__aexit__ = AsyncMock(return_value=False)
+    catalog.start(sessionmaker)
+    versions = AsyncMock(
+        side_effect=[
+            {"account_types": 1, "financial_institutions": 1},
+            {"account_types": 1, "financial_institutions": 1},
+            {"account_types": 2, "financial_institutions": 1},
+        ]
+    )
+
+    with patch("core.catalog.reference_data_versions.get", versions):
+        await catalog.refresh()
+        await catalog.refresh()
+        assert catalog.stats()["loads"] == 1
+        await catalog.refresh()
+
+    assert catalog.stats()["loads"] == 2
+    assert catalog.account_type(CHECKING.id).name == "Current"
+
+
+@pytest.mark.asyncio
+async def test_failed_reload_keeps_previous_copy() -> None:
+    """A reload failure is logged and the loaded entries keep being served."""
+    catalog = ReferenceCatalog()
+    await catalog.ensure(make_session([CHECKING], []), [CHECKING.id])
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=ConnectionError("down"))
+    catalog.start(make_sessionmaker(session))
+    versions = AsyncMock(return_value={"account_types": 3})
+
+    with (
+        patch("core.catalog.reference_data_versions.get", versions),
+        patch("core.catalog.logger") as mock_logger,
+    ):
+        await catalog.refresh()
+
+    mock_logger.warning.assert_called_once()
+    assert catalog.account_type(CHECKING.id).key == "checking"
+
+
+# ============================================================================
+# Response Embedding
+# ============================================================================
+
+
+class Unloaded:
+    """Stand-in for a relationship that must not be loaded."""
+
+    def __get__(self, instance: object, owner: type) -> None:
+        raise AssertionError("relationship loaded")
+
+
+class FakeAccount:
+    """Account row whose relationships raise when read."""
+
+    account_type = Unloaded()
+    financial_institution = Unloaded()
+
+    def __init__(self) -> None:
+        self.id = uuid.uuid4()
+        self.account_name = "Main"
+        self.account_type_id = CHECKING.id
+        self.financial_institution_id = CLOSED_BANK.id
+        self.currency = "EUR"
+        self.current_balance = Decimal("10.00")
+        self.color_hex = "#000000"
+        self.icon_url = None
+        self.created_at = datetime.now(UTC)
+        self.summary = None
+
+
+@pytest.mark.asyncio
+async def test_response_embeds_from_catalog() -> None:
+    """Account responses take type and institution from the catalog."""
+    catalog = ReferenceCatalog()
+    await catalog.ensure(make_session([CHECKING], [CLOSED_BANK]), [CHECKING.id])
+
+    response = AccountListResponse.model_validate(
+        FakeAccount(), context={"catalog": catalog}
+    )
+
+    assert response.account_type.name == "Checking"
+    assert response.financial_institution.short_name == "CLB"
+
+
+# ============================================================================
+# Search
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_search_institutions() -> None:
+    """Search ranks the preferred country first and skips deleted institutions."""
+    catalog = ReferenceCatalog()
+    spanish = make_institution("Banco Santander S.A.", "Santander", "ES")
+    british = make_institution("Santander UK plc", "Santander UK", "GB")
+    closed = make_institution("Santander Closed", "Santander C", deleted=True)
+    await catalog.ensure(make_session([], [spanish, british, closed]))
+
+    results = catalog.search_institutions("santan", country_code="GB")
+
+    assert [result.id for result in results] == [british.id, spanish.id]
+    assert results[0].country_code == "GB"
@@ -0,0 +1,214 @@
+"""
+Unit tests for negotiated response compression.
+
+Tests cover:
+- Accept-Encoding negotiation (weights, wildcard, identity, preference)
+- Large JSON bodies compressed with rewritten Content-Length, Vary and ETag
+- Small, binary, already-encoded and empty responses left untouched
+- Streaming responses compressed chunk by chunk
+"""
+
+import asyncio
+import json
+import zlib
+from collections.abc import AsyncIterator
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.types import Message
+
+from core.compression import CompressionMiddleware, negotiate_encoding
+
+PAYLOAD = {"data": [{"id": index, "description": "Groceries"} for index in range(200)]}
+
+
+async def large_json(request: Request) -> JSONResponse:
+    """Return a compressible JSON body with a strong ETag."""
+    return JSONResponse(PAYLOAD, headers={"ETag": '"abc"'})
+
+
+async def small_json(request: Request) -> JSONResponse:
+    """Return a body below the threshold."""
+    return JSONResponse({"ok": True})
+
+
+async def image(request: Request) -> Response:
+    """Return a large binary body."""
+    return Response(b"\x89PNG" + bytes(4096), media_type="image/png")
+
+
+async def encoded(request: Request) -> Response:
+    """Return a body that is already gzip-encoded."""
+    body = zlib.compress(b"x" * 4096)
+    return Response(
+        body, media_type="application/json", headers={"Content-Encoding": "gzip"}
+    )
+
+
+async def not_modified(request: Request) -> Response:
+    """Return 304 without a body."""
+    return Response(status_code=304, headers={"ETag": '"abc"'})
+
+
+async def stream(request: Request) -> StreamingResponse:
+    """Stream JSON lines in several chunks."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for index in range(3):
+            yield json.dumps({"line": index}).encode() + b"\n"
+
+    return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+
+def make_app() -> CompressionMiddleware:
+    """Create an app wrapped in CompressionMiddleware."""
+    app = Starlette(
+        routes=[
+            Route("/large", large_json),
+            Route("/small", small_json),
+            Route("/image", image),
+            Route("/encoded", encoded),
+            Route("/not-modified", not_modified),
+            Route("/stream", stream),
+        ]
+    )
+    return CompressionMiddleware(app, minimum_size=500)
+
+
+async def request(path: str, accept_encoding: str | None = "gzip") -> list[Message]:
+    """Send a GET request through the app and collect the sent messages."""
+    headers = [(b"host", b"test")]
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("test", 80),
+    }
+    messages: list[Message] = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> Message:
+        if requests:
+            return requests.pop()
+        # No disconnect: wait until the app is done with the response
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await make_app()(scope, receive, send)
+    return messages
+
+
+def response_headers(messages: list[Message]) -> dict[str, str]:
+    """Get the response headers of collected messages."""
+    return {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+
+
+def response_body(messages: list[Message]) -> bytes:
+    """Concatenate the body chunks of collected messages."""
+    return b"".join(m.get("body", b"") for m in messages[1:])
+
+
+# ============================================================================
+# Negotiation
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("GZIP", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "zstd"),
+        ("*;q=0.5, zstd;q=0", "br"),
+        ("gzip, br, zstd", "zstd"),
+        ("gzip;q=1.0, br;q=0.8", "gzip"),
+        ("deflate, gzip;q=invalid, br", "br"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str, expected: str | None) -> None:
+    """The highest-weighted supported coding wins, ties by server preference."""
+    encodings = ("zstd", "br", "gzip")
+    assert negotiate_encoding(accept_encoding, encodings) == expected
+
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_large_json_is_gzipped() -> None:
+    """Compressible bodies are gzipped with matching headers."""
+    messages = await request("/large")
+    headers = response_headers(messages)
+    body = response_body(messages)
+
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-length"] == str(len(body))
+    assert "Accept-Encoding" in headers["vary"]
+    assert headers["etag"] == 'W/"abc"'
+    assert json.loads(zlib.decompress(body, 16 + zlib.MAX_WBITS)) == PAYLOAD
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path,accept_encoding",
+    [
+        ("/large", None),
+        ("/large", "identity"),
+        ("/small", "gzip"),
+        ("/image", "gzip"),
+        ("/not-modified", "gzip"),
+    ],
+)
+async def test_response_left_uncompressed(
+    path: str, accept_encoding: str | None
+) -> None:
+    """Unaccepted, small, binary and empty responses pass through."""
+    messages = await request(path, accept_encoding)
+
+    assert "content-encoding" not in response_headers(messages)
+
+
+@pytest.mark.asyncio
+async def test_already_encoded_response_untouched() -> None:
+    """A response with a Content-Encoding is not compressed twice."""
+    messages = await request("/encoded")
+
+    assert response_headers(messages)["content-encoding"] == "gzip"
+    assert zlib.decompress(response_body(messages)) == b"x" * 4096
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_compressed_per_chunk() -> None:
+    """Streamed chunks are compressed and flushed as they arrive."""
+    messages = await request("/stream")
+    headers = response_headers(messages)
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    # Every chunk decodes on its own: nothing is buffered until the end
+    first_chunk = decompressor.decompress(messages[1]["body"])
+    assert first_chunk == b'{"line": 0}\n'
+    rest = decompressor.decompress(response_body(messages[1:]))
+    assert rest == b'{"line": 1}\n{"line": 2}\n'
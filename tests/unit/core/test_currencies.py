@@ -0,0 +1,83 @@
+"""
+Unit tests for the ISO 4217 currency registry.
+
+Tests cover:
+- Case-insensitive lookups and unsupported codes
+- Minor units per currency
+- Rounding of single amounts and batches to the stored precision
+- Precision checks
+- Immutability and a stable data version
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from core.currencies import (
+    CURRENCIES,
+    currency_data_version,
+    fits_precision,
+    get_currency,
+    is_supported,
+    minor_units,
+    quantize_amount,
+    quantize_amounts,
+)
+
+
+def test_lookup_case_insensitive() -> None:
+    """Codes are found regardless of case; unknown codes are not."""
+    assert get_currency("eur") is CURRENCIES["EUR"]
+    assert is_supported("Jpy")
+    assert get_currency("ZZZ") is None
+    assert not is_supported("XXX")  # "No currency" is not a currency
+
+
+def test_minor_units() -> None:
+    """Each currency carries its ISO 4217 minor units."""
+    assert minor_units("JPY") == 0
+    assert minor_units("EUR") == 2
+    assert minor_units("KWD") == 3
+
+    with pytest.raises(KeyError):
+        minor_units("ZZZ")
+
+
+def test_quantize_amount() -> None:
+    """Amounts round half up to min(minor units, stored scale) places."""
+    assert quantize_amount(Decimal("10.005"), "EUR") == Decimal("10.01")
+    assert quantize_amount(Decimal("-10.005"), "EUR") == Decimal("-10.01")
+    assert quantize_amount(Decimal("1234.5"), "JPY") == Decimal("1235")
+    assert str(quantize_amount(Decimal("1.2345"), "KWD")) == "1.23"
+
+
+def test_quantize_amounts() -> None:
+    """Batches round like single amounts, in order."""
+    amounts = [Decimal("0.125"), Decimal("2"), Decimal("-0.004")]
+
+    assert quantize_amounts(amounts, "usd") == [
+        quantize_amount(amount, "USD") for amount in amounts
+    ]
+    assert quantize_amounts([], "USD") == []
+
+
+def test_fits_precision() -> None:
+    """Amounts with digits beyond the stored precision do not fit."""
+    assert fits_precision(Decimal("10.50"), "EUR")
+    assert not fits_precision(Decimal("10.505"), "EUR")
+    assert fits_precision(Decimal("1500"), "JPY")
+    assert fits_precision(Decimal("1500.00"), "JPY")
+    assert not fits_precision(Decimal("1500.5"), "JPY")
+    assert not fits_precision(Decimal("NaN"), "EUR")
+
+
+def test_registry_is_immutable() -> None:
+    """The registry cannot be modified at runtime."""
+    with pytest.raises(TypeError):
+        CURRENCIES["ZZZ"] = CURRENCIES["EUR"]  # type: ignore[index]
+
+
+def test_data_version_stable() -> None:
+    """The fingerprint only depends on the registry contents."""
+    assert currency_data_version() == currency_data_version()
+    assert len(currency_data_version()) == 16
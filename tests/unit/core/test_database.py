@@ -0,0 +1,246 @@
+"""
+Unit tests for unit-of-work sessions and read-replica routing.
+
+Tests cover:
+- Unit-of-work commits (flush until the request's single commit)
+- Releasing connections before CPU-bound work
+- The request's COMMIT running before the response (a failure gives a 500)
+- Primary sessions from the routing sessionmaker
+- Read-your-writes stickiness window (per worker and via last-write markers)
+- Replica lag probing and fallback to the primary
+- Failed replicas taken out of rotation
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies import DbSession
+
+from core.database import (
+    UNIT_OF_WORK,
+    RoutingSessionmaker,
+    UnitOfWorkSession,
+    _mark_session_writes,
+    release_connection,
+    track_writes,
+)
+from core.handlers import general_exception_handler
+
+
+def make_replica_engine(lag: float | None = 0.0, fails: bool = False) -> MagicMock:
+    """Create a mock replica engine whose lag probe returns lag."""
+    engine = MagicMock()
+    engine.url.host = "replica"
+    conn = AsyncMock()
+    if fails:
+        conn.scalar.side_effect = ConnectionError("replica down")
+    else:
+        conn.scalar.return_value = lag
+    engine.connect.return_value.__aenter__.return_value = conn
+    return engine
+
+
+@pytest.fixture
+def primary() -> MagicMock:
+    """Create a mock primary sessionmaker."""
+    return MagicMock()
+
+
+class TestUnitOfWorkSession:
+    """Tests for UnitOfWorkSession and release_connection."""
+
+    @pytest.mark.asyncio
+    async def test_commit_flushes_in_unit_of_work_mode(self) -> None:
+        """Service commits only flush while unit-of-work mode is on."""
+        session = UnitOfWorkSession(info={UNIT_OF_WORK: True})
+        with (
+            patch.object(AsyncSession, "flush", new_callable=AsyncMock) as flush,
+            patch.object(AsyncSession, "commit", new_callable=AsyncMock) as commit,
+        ):
+            await session.commit()
+            await session.commit()
+            flush.assert_awaited()
+            commit.assert_not_awaited()
+
+            await session.commit_unit_of_work()
+            commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_commit_without_unit_of_work(self) -> None:
+        """Commit behaves normally when unit-of-work mode is off."""
+        session = UnitOfWorkSession(info={UNIT_OF_WORK: False})
+        with patch.object(AsyncSession, "commit", new_callable=AsyncMock) as commit:
+            await session.commit()
+            commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_release_connection_commits_open_transaction(self) -> None:
+        """release_connection ends the open transaction for real."""
+        session = UnitOfWorkSession(info={UNIT_OF_WORK: True})
+        with (
+            patch.object(session, "in_transaction", return_value=True),
+            patch.object(AsyncSession, "commit", new_callable=AsyncMock) as commit,
+        ):
+            await release_connection(session)
+            commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_release_connection_without_transaction(self) -> None:
+        """release_connection is a no-op when no connection is held."""
+        session = UnitOfWorkSession(info={UNIT_OF_WORK: True})
+        with patch.object(AsyncSession, "commit", new_callable=AsyncMock) as commit:
+            await release_connection(session)
+            commit.assert_not_awaited()
+
+
+class TestRequestCommit:
+    """Tests for get_db's COMMIT at the end of the request."""
+
+    @pytest.mark.asyncio
+    async def test_commit_failure_returns_server_error(self) -> None:
+        """A failed COMMIT turns into a 500 instead of the route's response."""
+        session = UnitOfWorkSession(info={UNIT_OF_WORK: True})
+        app = FastAPI()
+        app.state.sessionmaker = lambda: session
+        app.add_exception_handler(Exception, general_exception_handler)
+
+        @app.post("/items", status_code=201)
+        async def create_item(db: DbSession) -> dict[str, bool]:
+            return {"created": True}
+
+        failure = OperationalError("COMMIT", {}, Exception("serialization failure"))
+        with (
+            patch.object(
+                UnitOfWorkSession,
+                "commit_unit_of_work",
+                new_callable=AsyncMock,
+                side_effect=failure,
+            ) as commit,
+            patch.object(AsyncSession, "rollback", new_callable=AsyncMock) as rollback,
+            patch("core.handlers.logger"),
+        ):
+            async with AsyncClient(
+                transport=ASGITransport(app=app, raise_app_exceptions=False),
+                base_url="http://test",
+            ) as client:
+                response = await client.post("/items")
+
+        commit.assert_awaited_once()
+        rollback.assert_awaited_once()
+        assert response.status_code == 500
+
+
+class TestRoutingSessionmaker:
+    """Tests for RoutingSessionmaker."""
+
+    def test_call_returns_primary_session(self, primary: MagicMock) -> None:
+        """Calling the factory returns a primary session."""
+        factory = RoutingSessionmaker(primary)
+        assert factory() is primary.return_value
+        assert factory.has_replicas is False
+
+    @pytest.mark.asyncio
+    async def test_read_session_without_replicas(self, primary: MagicMock) -> None:
+        """Reads stay on the primary when no replica is configured."""
+        factory = RoutingSessionmaker(primary)
+        assert await factory.read_session("user:1") is None
+
+    @pytest.mark.asyncio
+    async def test_read_session_uses_healthy_replica(self, primary: MagicMock) -> None:
+        """A replica within the lag budget serves reads."""
+        engine = make_replica_engine(lag=0.5)
+        factory = RoutingSessionmaker(primary, [engine], max_lag_seconds=5)
+
+        session = await factory.read_session("user:1")
+
+        assert session is not None
+        assert session.bind is engine
+
+    @pytest.mark.asyncio
+    async def test_sticky_principal_reads_from_primary(
+        self, primary: MagicMock
+    ) -> None:
+        """A principal that just wrote reads its own writes from the primary."""
+        factory = RoutingSessionmaker(
+            primary, [make_replica_engine()], sticky_seconds=5
+        )
+        factory.mark_write("user:1")
+
+        assert await factory.read_session("user:1") is None
+        assert await factory.read_session("user:2") is not None
+
+    @pytest.mark.asyncio
+    async def test_stickiness_expires(self, primary: MagicMock) -> None:
+        """Stickiness ends after the configured window."""
+        factory = RoutingSessionmaker(
+            primary, [make_replica_engine()], sticky_seconds=5
+        )
+        with patch("core.database.time.monotonic", return_value=100.0):
+            factory.mark_write("user:1")
+        with patch("core.database.time.monotonic", return_value=106.0):
+            assert factory.is_sticky("user:1") is False
+
+    @pytest.mark.asyncio
+    async def test_last_write_marker_sticks_across_workers(
+        self, primary: MagicMock
+    ) -> None:
+        """A marker from another worker's write keeps reads on the primary."""
+        factory = RoutingSessionmaker(
+            primary, [make_replica_engine()], sticky_seconds=5
+        )
+        with patch("core.database.time.time", return_value=1000.0):
+            assert await factory.read_session("user:1", last_write=998.0) is None
+            assert factory.is_sticky("user:1", last_write=990.0) is False
+            # Far-future markers are ignored rather than pinning the primary
+            assert factory.is_sticky("user:1", last_write=5000.0) is False
+
+    def test_track_writes_records_flush_time(self) -> None:
+        """Flushes inside track_writes() record the write time."""
+        session = MagicMock()
+        session.info = {}
+        with track_writes() as tracker:
+            assert tracker.written_at is None
+            with patch("core.database.time.time", return_value=1234.5):
+                _mark_session_writes(session, None)
+
+        assert tracker.written_at == 1234.5
+
+    @pytest.mark.asyncio
+    async def test_lagging_replica_falls_back(self, primary: MagicMock) -> None:
+        """A replica lagging beyond the budget is skipped."""
+        factory = RoutingSessionmaker(
+            primary, [make_replica_engine(lag=30)], max_lag_seconds=5
+        )
+        assert await factory.read_session("user:1") is None
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_takes_replica_out(self, primary: MagicMock) -> None:
+        """A failing probe sends reads to the next healthy replica."""
+        broken = make_replica_engine(fails=True)
+        healthy = make_replica_engine(lag=0)
+        factory = RoutingSessionmaker(primary, [broken, healthy])
+
+        first = await factory.read_session()
+        second = await factory.read_session()
+
+        assert first is not None and first.bind is healthy
+        assert second is not None and second.bind is healthy
+        broken.connect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mark_failed_applies_cooldown(self, primary: MagicMock) -> None:
+        """mark_failed removes the replica until the cooldown elapses."""
+        factory = RoutingSessionmaker(
+            primary, [make_replica_engine()], failure_cooldown=30
+        )
+        session = await factory.read_session()
+        assert session is not None
+
+        factory.mark_failed(session)
+
+        assert await factory.read_session() is None
@@ -0,0 +1,198 @@
+"""
+Unit tests for statement timeouts and request deadlines.
+
+Tests cover:
+- Budget creation from settings and the deadline header
+- Effective timeout (route timeout vs. remaining client deadline)
+- SET LOCAL statement_timeout on transaction begin
+- Timeout lowered before later statements once the client deadline binds
+- Cancelled statements mapped to 504 responses
+"""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import Request
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from core.deadlines import (
+    DEADLINE_HEADER,
+    REQUEST_BUDGET,
+    RequestBudget,
+    StatementTimeout,
+    _apply_remaining_deadline,
+    _apply_statement_timeout,
+    get_request_budget,
+    is_statement_timeout,
+)
+from core.exceptions import RequestTimeoutError
+from core.handlers import database_error_handler
+
+
+def make_request(headers: dict[str, str] | None = None) -> MagicMock:
+    """Create a mock request with the given headers and empty state."""
+    request = MagicMock(spec=Request)
+    request.headers = headers or {}
+    request.state = MagicMock(spec=[])
+    return request
+
+
+def make_db_error(sqlstate: str | None) -> DBAPIError:
+    """Create a DBAPIError whose driver error carries sqlstate."""
+    orig = Exception("driver error")
+    orig.sqlstate = sqlstate  # type: ignore[attr-defined]
+    return OperationalError("SELECT 1", {}, orig)
+
+
+class TestRequestBudget:
+    """Tests for RequestBudget and get_request_budget."""
+
+    def test_default_timeout_without_deadline(self) -> None:
+        """Without a header the configured statement timeout applies."""
+        with patch("core.deadlines.settings.db_statement_timeout_ms", 15000):
+            budget = get_request_budget(make_request())
+        assert budget.deadline is None
+        assert budget.effective_timeout_ms() == 15000
+
+    def test_budget_is_created_once_per_request(self) -> None:
+        """The budget is stored on the request and reused."""
+        request = make_request()
+        assert get_request_budget(request) is get_request_budget(request)
+
+    def test_client_deadline_shortens_timeout(self) -> None:
+        """The remaining client deadline caps the statement timeout."""
+        budget = RequestBudget.from_request(make_request({DEADLINE_HEADER: "2000"}))
+        assert 0 < budget.effective_timeout_ms() <= 2000
+
+    def test_invalid_deadline_header_ignored(self) -> None:
+        """Malformed deadline headers are ignored."""
+        budget = RequestBudget.from_request(make_request({DEADLINE_HEADER: "soon"}))
+        assert budget.deadline is None
+
+    @pytest.mark.asyncio
+    async def test_statement_timeout_dependency(self) -> None:
+        """StatementTimeout overrides the route's timeout."""
+        request = make_request()
+        await StatementTimeout(5000)(request)
+        assert get_request_budget(request).statement_timeout_ms == 5000
+
+
+class TestApplyStatementTimeout:
+    """Tests for the after_begin statement timeout hook."""
+
+    def test_sets_local_statement_timeout(self) -> None:
+        """Each transaction gets SET LOCAL statement_timeout."""
+        session = MagicMock()
+        session.info = {REQUEST_BUDGET: RequestBudget(statement_timeout_ms=5000)}
+        connection = MagicMock()
+
+        _apply_statement_timeout(session, MagicMock(), connection)
+
+        connection.exec_driver_sql.assert_called_once_with(
+            "SET LOCAL statement_timeout = 5000"
+        )
+
+    def test_no_budget_no_statement(self) -> None:
+        """Sessions outside requests keep the server default."""
+        session = MagicMock()
+        session.info = {}
+        connection = MagicMock()
+
+        _apply_statement_timeout(session, MagicMock(), connection)
+
+        connection.exec_driver_sql.assert_not_called()
+
+    def test_expired_deadline_raises(self) -> None:
+        """No query starts once the client deadline has passed."""
+        session = MagicMock()
+        session.info = {
+            REQUEST_BUDGET: RequestBudget(statement_timeout_ms=5000, deadline=0.0)
+        }
+        with pytest.raises(RequestTimeoutError):
+            _apply_statement_timeout(session, MagicMock(), MagicMock())
+
+
+class TestApplyRemainingDeadline:
+    """Tests for the per-statement client deadline hook."""
+
+    def begin(self, budget: RequestBudget) -> MagicMock:
+        """Begin a request transaction with budget on a mock connection."""
+        session = MagicMock()
+        session.info = {REQUEST_BUDGET: budget}
+        connection = MagicMock()
+        _apply_statement_timeout(session, MagicMock(), connection)
+        return connection
+
+    def execute(self, connection: MagicMock) -> MagicMock:
+        """Run the hook for a statement on connection; return its cursor."""
+        cursor = MagicMock()
+        _apply_remaining_deadline(connection, cursor, "SELECT 1", {}, None, False)
+        return cursor
+
+    def test_later_statements_get_remaining_time(self) -> None:
+        """Each statement's timeout is what is left of the client deadline."""
+        budget = RequestBudget(
+            statement_timeout_ms=30000, deadline=time.monotonic() + 2
+        )
+        connection = self.begin(budget)
+
+        budget.deadline -= 1.5  # 1.5 s spent on earlier statements
+        cursor = self.execute(connection)
+
+        (sql,) = cursor.execute.call_args.args
+        timeout_ms = int(sql.removeprefix("SET LOCAL statement_timeout = "))
+        assert 0 < timeout_ms <= 500
+
+    def test_route_timeout_tighter_runs_nothing(self) -> None:
+        """No extra statement while the route timeout is the tighter limit."""
+        budget = RequestBudget(statement_timeout_ms=100, deadline=time.monotonic() + 60)
+        connection = self.begin(budget)
+
+        self.execute(connection).execute.assert_not_called()
+
+    def test_expired_deadline_fails_fast(self) -> None:
+        """Statements due after the client deadline never reach the database."""
+        budget = RequestBudget(statement_timeout_ms=5000, deadline=time.monotonic() + 1)
+        connection = self.begin(budget)
+
+        budget.deadline = 0.0
+        with pytest.raises(RequestTimeoutError):
+            self.execute(connection)
+
+    def test_no_deadline_not_tracked(self) -> None:
+        """Requests without a client deadline pay nothing per statement."""
+        connection = self.begin(RequestBudget(statement_timeout_ms=5000))
+
+        self.execute(connection).execute.assert_not_called()
+
+
+class TestDatabaseErrorHandler:
+    """Tests for database_error_handler."""
+
+    def test_is_statement_timeout(self) -> None:
+        """Only SQLSTATE 57014 counts as a cancelled statement."""
+        assert is_statement_timeout(make_db_error("57014")) is True
+        assert is_statement_timeout(make_db_error("23505")) is False
+
+    @pytest.mark.asyncio
+    async def test_cancelled_statement_returns_504(self) -> None:
+        """Cancelled statements return 504 REQUEST_TIMEOUT."""
+        request = MagicMock(spec=Request)
+        request.state.request_id = "req-1"
+
+        response = await database_error_handler(request, make_db_error("57014"))
+
+        assert response.status_code == 504
+        assert json.loads(response.body)["error"]["code"] == "REQUEST_TIMEOUT"
+
+    @pytest.mark.asyncio
+    async def test_other_database_errors_return_500(self) -> None:
+        """Other database errors fall through to the generic handler."""
+        request = MagicMock(spec=Request)
+        request.state.request_id = "req-1"
+
+        response = await database_error_handler(request, make_db_error("23505"))
+
+        assert response.status_code == 500
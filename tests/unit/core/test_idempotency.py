@@ -0,0 +1,209 @@
+"""
+Unit tests for idempotency keys.
+
+Tests cover:
+- Retries with the same key replay the stored response without re-running
+- Concurrent duplicates wait for the first request (409 after the timeout)
+- Keys reused with a different body, and malformed keys, are rejected
+- Failed requests release their key so a retry runs again
+- Requests without a key, and while Redis is unavailable, always run
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient, Response
+
+from core.exceptions import AppException
+from core.handlers import app_exception_handler
+from core.idempotency import IdempotencyStore, IdempotentRoute
+from core.redis import RedisManager
+
+
+class Endpoint:
+    """Endpoint behaviour controlled by the test."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = False
+        self.gate: asyncio.Event | None = None
+
+
+def make_app(endpoint: Endpoint) -> FastAPI:
+    """Create an app with an idempotent POST endpoint."""
+    app = FastAPI()
+    app.add_exception_handler(AppException, app_exception_handler)
+    router = APIRouter(route_class=IdempotentRoute)
+
+    @router.post("/api/items", status_code=201)
+    async def create_item(item: dict[str, int]) -> dict[str, int]:
+        endpoint.calls += 1
+        if endpoint.gate is not None:
+            await endpoint.gate.wait()
+        if endpoint.fail:
+            raise HTTPException(status_code=400, detail="Rejected")
+        return {"id": endpoint.calls, **item}
+
+    app.include_router(router)
+    return app
+
+
+async def post(app: FastAPI, key: str | None, value: int = 1) -> Response:
+    """POST to the idempotent endpoint with an optional Idempotency-Key."""
+    headers = {"Idempotency-Key": key} if key is not None else {}
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as http:
+        return await http.post("/api/items", json={"value": value}, headers=headers)
+
+
+@pytest.fixture
+def endpoint() -> Endpoint:
+    """Fresh endpoint state."""
+    return Endpoint()
+
+
+@pytest.fixture
+def store(redis: RedisManager) -> IdempotencyStore:
+    """Store with a short lock timeout, patched in for IdempotentRoute."""
+    store = IdempotencyStore(redis, ttl=60, lock_timeout=0.2)
+    with patch("core.idempotency.idempotency_store", store):
+        yield store
+
+
+# ============================================================================
+# Replay
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_stored_response(
+    store: IdempotencyStore, endpoint: Endpoint
+) -> None:
+    """The endpoint runs once; the retry gets the same status and body."""
+    app = make_app(endpoint)
+
+    first = await post(app, "key-1")
+    retry = await post(app, "key-1")
+
+    assert endpoint.calls == 1
+    assert retry.status_code == first.status_code == 201
+    assert retry.json() == first.json() == {"id": 1, "value": 1}
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_waits_for_first(
+    store: IdempotencyStore, endpoint: Endpoint
+) -> None:
+    """A duplicate in flight gets the first request's response."""
+    app = make_app(endpoint)
+    endpoint.gate = asyncio.Event()
+
+    first = asyncio.create_task(post(app, "key-1"))
+    duplicate = asyncio.create_task(post(app, "key-1"))
+    await asyncio.sleep(0.05)
+    endpoint.gate.set()
+    responses = await asyncio.gather(first, duplicate)
+
+    assert endpoint.calls == 1
+    assert responses[0].json() == responses[1].json()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_gives_up_after_lock_timeout(
+    store: IdempotencyStore, endpoint: Endpoint
+) -> None:
+    """A duplicate still waiting after the lock timeout gets 409."""
+    app = make_app(endpoint)
+    endpoint.gate = asyncio.Event()
+
+    first = asyncio.create_task(post(app, "key-1"))
+    await asyncio.sleep(0.01)
+    duplicate = await post(app, "key-1")
+    endpoint.gate.set()
+    await first
+
+    assert duplicate.status_code == 409
+    assert endpoint.calls == 1
+
+
+# ============================================================================
+# Rejections and Fallbacks
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_key_reused_with_different_body(
+    store: IdempotencyStore, endpoint: Endpoint
+) -> None:
+    """Reusing a key for another request body is a client error."""
+    app = make_app(endpoint)
+    await post(app, "key-1", value=1)
+
+    response = await post(app, "key-1", value=2)
+
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "INVALID_INPUT"
+    assert endpoint.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_malformed_key_rejected(
+    store: IdempotencyStore, endpoint: Endpoint
+) -> None:
+    """Empty and oversized keys are rejected before the endpoint runs."""
+    app = make_app(endpoint)
+
+    assert (await post(app, "")).status_code == 422
+    assert (await post(app, "k" * 256)).status_code == 422
+    assert endpoint.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_request_releases_key(
+    store: IdempotencyStore, endpoint: Endpoint
+) -> None:
+    """Error responses are not stored: the retry runs the endpoint again."""
+    app = make_app(endpoint)
+    endpoint.fail = True
+    failed = await post(app, "key-1")
+    endpoint.fail = False
+
+    retry = await post(app, "key-1")
+
+    assert failed.status_code == 400
+    assert retry.status_code == 201
+    assert endpoint.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_requests_without_key_always_run(
+    store: IdempotencyStore, endpoint: Endpoint
+) -> None:
+    """Without an Idempotency-Key every request runs."""
+    app = make_app(endpoint)
+
+    await post(app, None)
+    await post(app, None)
+
+    assert endpoint.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_unavailable_runs_request(endpoint: Endpoint) -> None:
+    """Without Redis the request runs unprotected rather than failing."""
+    store = IdempotencyStore(RedisManager(), ttl=60, lock_timeout=0.2)
+    app = make_app(endpoint)
+
+    with (
+        patch("core.idempotency.idempotency_store", store),
+        patch("core.idempotency.logger") as mock_logger,
+    ):
+        response = await post(app, "key-1")
+
+    assert response.status_code == 201
+    mock_logger.warning.assert_called_once()
@@ -0,0 +1,43 @@
+"""
+Unit tests for logging configuration.
+
+Tests cover:
+- File handlers configured to open lazily
+- Log directory created on first write
+"""
+
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+from core.logging import LazyRotatingFileHandler, get_logging_config
+
+
+class TestLazyRotatingFileHandler:
+    """Tests for LazyRotatingFileHandler."""
+
+    def test_directory_created_on_first_write(self, tmp_path: Path) -> None:
+        """Neither the directory nor the file exist until a record is emitted."""
+        path = tmp_path / "logs" / "app.log"
+        handler = LazyRotatingFileHandler(path, maxBytes=1024, delay=True)
+
+        assert not path.parent.exists()
+
+        handler.emit(logging.makeLogRecord({"msg": "hello"}))
+        handler.close()
+
+        assert path.read_text().strip() == "hello"
+
+
+def test_file_handlers_deferred() -> None:
+    """File handlers are configured to open their files lazily."""
+    with patch("core.logging.settings") as mock_settings:
+        mock_settings.log_file_enabled = True
+        mock_settings.log_file_path = "logs/app.log"
+        mock_settings.log_level = "INFO"
+        mock_settings.log_format = "console"
+        handlers = get_logging_config()["handlers"]
+
+    for name in ("file", "error_file"):
+        assert handlers[name]["class"] == "core.logging.LazyRotatingFileHandler"
+        assert handlers[name]["delay"] is True
@@ -0,0 +1,215 @@
+"""
+Unit tests for the ASGI middleware stack.
+
+Tests cover:
+- Request ID in scope state, context and response header
+- Precomputed security headers (HSTS only when enabled)
+- Response time header and request logging
+- Query recorder debug headers
+- Last-write marker on responses to writing requests
+- Streaming responses and non-HTTP scopes pass through
+"""
+
+from collections.abc import AsyncIterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from core.database import LAST_WRITE_COOKIE, LAST_WRITE_HEADER, _mark_session_writes
+from core.logging import request_id_var
+from core.middleware import (
+    QueryRecorderMiddleware,
+    ReadYourWritesMiddleware,
+    RequestIDMiddleware,
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+
+async def echo_request_id(request: Request) -> JSONResponse:
+    """Return the request ID as seen by the endpoint."""
+    return JSONResponse(
+        {"state": request.state.request_id, "context": request_id_var.get()},
+        headers={"X-Frame-Options": "SAMEORIGIN"},
+    )
+
+
+async def stream(request: Request) -> StreamingResponse:
+    """Stream a body in several chunks."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in (b"a", b"b", b"c"):
+            yield chunk
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+async def not_found(request: Request) -> PlainTextResponse:
+    """Return a client error."""
+    return PlainTextResponse("missing", status_code=404)
+
+
+def make_app(enable_hsts: bool = False) -> Starlette:
+    """Create an app wrapped in the middleware stack, in main.py order."""
+    app = Starlette(
+        routes=[
+            Route("/echo", echo_request_id),
+            Route("/stream", stream),
+            Route("/missing", not_found),
+        ]
+    )
+    app.add_middleware(RequestIDMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(QueryRecorderMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware, enable_hsts=enable_hsts)
+    return app
+
+
+def client(app: Starlette) -> AsyncClient:
+    """Create an HTTP client calling the app in-process."""
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestRequestIDMiddleware:
+    """Tests for RequestIDMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_request_id_in_state_context_and_header(self) -> None:
+        """The endpoint sees the same ID that is returned in X-Request-ID."""
+        async with client(make_app()) as http:
+            response = await http.get("/echo")
+
+        body = response.json()
+        assert body["state"] == body["context"] == response.headers["X-Request-ID"]
+        assert request_id_var.get() is None
+
+
+class TestSecurityHeadersMiddleware:
+    """Tests for SecurityHeadersMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_headers_added_and_override_endpoint(self) -> None:
+        """Security headers are added once and replace endpoint values."""
+        async with client(make_app()) as http:
+            response = await http.get("/echo")
+
+        assert response.headers.get_list("X-Frame-Options") == ["DENY"]
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert "frame-ancestors 'none'" in response.headers["Content-Security-Policy"]
+        assert "Strict-Transport-Security" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_hsts_when_enabled(self) -> None:
+        """HSTS is only sent when enabled."""
+        async with client(make_app(enable_hsts=True)) as http:
+            response = await http.get("/echo")
+
+        assert response.headers["Strict-Transport-Security"].startswith("max-age=")
+
+
+class TestRequestLoggingMiddleware:
+    """Tests for RequestLoggingMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_logs_by_status_with_request_id(self) -> None:
+        """Client errors are logged as warnings with the request ID."""
+        with patch("core.middleware.logger") as mock_logger:
+            async with client(make_app()) as http:
+                response = await http.get("/missing")
+
+        assert response.headers["X-Response-Time"].endswith("s")
+        message = mock_logger.warning.call_args.args[0]
+        assert message.startswith("GET /missing 404")
+        assert f"request_id={response.headers['X-Request-ID']}" in message
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_passes_through(self) -> None:
+        """Streamed bodies arrive intact with every header added."""
+        async with client(make_app()) as http:
+            response = await http.get("/stream")
+
+        assert response.text == "abc"
+        assert "X-Request-ID" in response.headers
+        assert "X-Response-Time" in response.headers
+        assert response.headers["X-Frame-Options"] == "DENY"
+
+
+class TestQueryRecorderMiddleware:
+    """Tests for QueryRecorderMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_debug_headers(self) -> None:
+        """Query count and DB time headers are added in debug mode."""
+        with patch("core.middleware.settings") as mock_settings:
+            mock_settings.query_recorder_enabled = True
+            mock_settings.debug = True
+            async with client(make_app()) as http:
+                response = await http.get("/echo")
+
+        assert response.headers["X-DB-Query-Count"] == "0"
+        assert response.headers["X-DB-Time"] == "0.000s"
+
+
+class TestReadYourWritesMiddleware:
+    """Tests for ReadYourWritesMiddleware."""
+
+    @staticmethod
+    def make_marker_app() -> Starlette:
+        """Create an app whose /write endpoint flushes a session."""
+
+        async def write(request: Request) -> PlainTextResponse:
+            session = MagicMock()
+            session.info = {}
+            _mark_session_writes(session, None)
+            return PlainTextResponse("written")
+
+        app = Starlette(routes=[Route("/stream", stream), Route("/write", write)])
+        app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=4.5)
+        return app
+
+    @pytest.mark.asyncio
+    async def test_marker_set_after_write(self) -> None:
+        """Writing requests get the marker as a header and a cookie."""
+        with patch("core.database.time.time", return_value=1700000000.0):
+            async with client(self.make_marker_app()) as http:
+                response = await http.get("/write")
+
+        assert response.headers[LAST_WRITE_HEADER] == "1700000000.000"
+        cookie = response.headers["Set-Cookie"]
+        assert cookie.startswith(f"{LAST_WRITE_COOKIE}=1700000000.000;")
+        assert "Max-Age=5" in cookie
+
+    @pytest.mark.asyncio
+    async def test_no_marker_without_write(self) -> None:
+        """Pure reads do not refresh the marker."""
+        async with client(self.make_marker_app()) as http:
+            response = await http.get("/stream")
+
+        assert LAST_WRITE_HEADER not in response.headers
+        assert "Set-Cookie" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_non_http_scope_forwarded() -> None:
+    """Lifespan and websocket scopes reach the app unchanged."""
+    calls = []
+
+    async def app(scope, receive, send) -> None:  # type: ignore[no-untyped-def]
+        calls.append(scope)
+
+    scope = {"type": "lifespan"}
+    for middleware in (
+        RequestIDMiddleware(app),
+        RequestLoggingMiddleware(app),
+        QueryRecorderMiddleware(app),
+        SecurityHeadersMiddleware(app),
+    ):
+        await middleware(scope, None, None)  # type: ignore[arg-type]
+
+    assert calls == [scope] * 4
+    assert "state" not in scope
@@ -0,0 +1,141 @@
+"""
+Unit tests for connection pool telemetry.
+
+Tests cover:
+- Histogram cumulative buckets
+- Pool event handlers (hold time, lifetime, counters)
+- Saturation gauges
+- Checkout wait timing and timeout counting
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.pool_metrics import (
+    Histogram,
+    InstrumentedQueuePool,
+    PoolMetrics,
+    get_pool_stats,
+    instrument_engine,
+)
+
+
+def make_engine(in_use: int = 0, size: int = 5, max_overflow: int = 10) -> MagicMock:
+    """Create a mock engine whose pool reports the given occupancy."""
+    engine = MagicMock()
+    pool = engine.sync_engine.pool
+    pool.size.return_value = size
+    pool._max_overflow = max_overflow
+    pool.checkedout.return_value = in_use
+    pool.checkedin.return_value = max(size - in_use, 0)
+    pool.overflow.return_value = in_use - size
+    return engine
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_cumulative_buckets(self) -> None:
+        """Buckets are cumulative and overflow lands in +Inf."""
+        histogram = Histogram((0.01, 0.1, 1))
+        for value in (0.005, 0.05, 0.05, 5):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["buckets"] == {"0.01": 1, "0.1": 3, "1": 3, "+Inf": 4}
+        assert snapshot["count"] == 4
+        assert snapshot["max"] == 5
+
+
+class TestPoolMetrics:
+    """Tests for PoolMetrics."""
+
+    def test_hold_and_lifetime_recorded(self) -> None:
+        """Checkin records hold time, close records connection lifetime."""
+        metrics = PoolMetrics("primary", make_engine())
+        record = MagicMock()
+        record.info = {}
+
+        with patch("core.pool_metrics.time.monotonic", return_value=10.0):
+            metrics.on_connect(None, record)
+            metrics.on_checkout(None, record, None)
+        with patch("core.pool_metrics.time.monotonic", return_value=10.5):
+            metrics.on_checkin(None, record)
+        with patch("core.pool_metrics.time.monotonic", return_value=70.0):
+            metrics.on_close(None, record)
+
+        assert metrics.connects == 1
+        assert metrics.checkouts == 1
+        assert metrics.hold.count == 1 and metrics.hold.sum == 0.5
+        assert metrics.lifetime.count == 1 and metrics.lifetime.sum == 60.0
+
+    def test_saturation(self) -> None:
+        """Pool is saturated when all size + overflow connections are in use."""
+        assert PoolMetrics("p", make_engine(in_use=14)).is_saturated is False
+        saturated = PoolMetrics("p", make_engine(in_use=15))
+        assert saturated.is_saturated is True
+        assert saturated.gauges()["overflow"] == 10
+
+    def test_saturation_alarm_rate_limited(self) -> None:
+        """Saturation warnings are logged at most once per interval."""
+        metrics = PoolMetrics("primary", make_engine(in_use=15))
+        record = MagicMock()
+        record.info = {}
+
+        with patch("core.pool_metrics.logger") as mock_logger:
+            metrics.on_checkout(None, record, None)
+            metrics.on_checkout(None, record, None)
+
+        mock_logger.warning.assert_called_once()
+
+
+class TestInstrumentedQueuePool:
+    """Tests for InstrumentedQueuePool."""
+
+    def test_records_wait(self) -> None:
+        """Successful checkouts are timed."""
+        pool = InstrumentedQueuePool(creator=MagicMock())
+        pool.metrics = PoolMetrics("primary", make_engine())
+
+        with patch.object(AsyncAdaptedQueuePool, "_do_get", return_value="record"):
+            assert pool._do_get() == "record"
+
+        assert pool.metrics.wait.count == 1
+        assert pool.metrics.timeouts == 0
+
+    def test_counts_timeouts(self) -> None:
+        """Checkouts hitting pool_timeout are counted and re-raised."""
+        pool = InstrumentedQueuePool(creator=MagicMock())
+        pool.metrics = PoolMetrics("primary", make_engine())
+
+        with patch.object(
+            AsyncAdaptedQueuePool, "_do_get", side_effect=PoolTimeoutError("timeout")
+        ):
+            with pytest.raises(PoolTimeoutError):
+                pool._do_get()
+
+        assert pool.metrics.timeouts == 1
+
+    def test_recreate_keeps_metrics(self) -> None:
+        """Pools recreated on dispose keep reporting to the same metrics."""
+        pool = InstrumentedQueuePool(creator=MagicMock())
+        pool.metrics = PoolMetrics("primary", make_engine())
+
+        assert pool.recreate().metrics is pool.metrics
+
+
+def test_instrument_engine_registers_pool() -> None:
+    """instrument_engine attaches metrics and reports them by name."""
+    engine = make_engine()
+    engine.sync_engine.pool = InstrumentedQueuePool(creator=MagicMock())
+
+    with patch("core.pool_metrics.event.listen") as listen:
+        metrics = instrument_engine(engine, "test-pool")
+
+    assert engine.sync_engine.pool.metrics is metrics
+    assert listen.call_count == 5
+    assert "test-pool" in get_pool_stats()
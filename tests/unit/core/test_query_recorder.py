@@ -0,0 +1,111 @@
+"""
+Unit tests for the per-request query recorder.
+
+Tests cover:
+- Statement shape normalization
+- Recording through engine events
+- N+1 warnings for repeated statement shapes
+- Query budget enforcement
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from core.query_recorder import (
+    QueryBudget,
+    QueryBudgetExceededError,
+    QueryRecorder,
+    current_recorder,
+    normalize_statement,
+    record_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    """Create an in-memory SQLite engine."""
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+class TestNormalizeStatement:
+    """Tests for normalize_statement."""
+
+    def test_replaces_params_and_literals(self) -> None:
+        """Bound parameters and literals collapse to placeholders."""
+        assert (
+            normalize_statement(
+                "SELECT *\n  FROM t WHERE id = $1 AND name = 'x' LIMIT 10"
+            )
+            == "SELECT * FROM t WHERE id = ? AND name = ? LIMIT ?"
+        )
+
+    def test_collapses_in_lists(self) -> None:
+        """IN lists of any length share one shape."""
+        assert normalize_statement("SELECT * FROM t WHERE id IN ($1, $2, $3)") == (
+            normalize_statement("SELECT * FROM t WHERE id IN ($1)")
+        )
+
+
+class TestQueryRecorder:
+    """Tests for QueryRecorder and record_queries."""
+
+    def test_records_statements_from_engine_events(self, engine) -> None:
+        """Statements executed in the context are counted and grouped."""
+        with record_queries() as recorder:
+            with engine.connect() as conn:
+                for i in range(3):
+                    conn.execute(text(f"SELECT {i}"))
+
+        assert recorder.count == 3
+        assert recorder.total_time > 0
+        assert recorder.shapes["SELECT ?"].count == 3
+
+    def test_no_recording_outside_context(self, engine) -> None:
+        """Nothing is recorded when no recorder is active."""
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert current_recorder() is None
+
+    def test_report_warns_on_repeated_shapes(self) -> None:
+        """Shapes repeated beyond the threshold are reported as N+1."""
+        recorder = QueryRecorder()
+        for _ in range(6):
+            recorder.record("SELECT * FROM cards WHERE id = $1", 0.001)
+        recorder.record("SELECT * FROM accounts", 0.001)
+
+        with patch("core.query_recorder.logger") as mock_logger:
+            recorder.report("GET /api/v1/cards")
+
+        mock_logger.warning.assert_called_once()
+        assert "N+1" in mock_logger.warning.call_args[0][0]
+
+    def test_enforced_budget_raises(self) -> None:
+        """Exceeding an enforced budget raises at the offending statement."""
+        recorder = QueryRecorder(budget=2, enforce_budget=True)
+        recorder.record("SELECT 1", 0.001)
+        recorder.record("SELECT 2", 0.001)
+        with pytest.raises(QueryBudgetExceededError):
+            recorder.record("SELECT 3", 0.001)
+
+    def test_unenforced_budget_only_warns(self) -> None:
+        """Budget overruns are logged when not enforced."""
+        recorder = QueryRecorder(budget=1)
+        recorder.record("SELECT 1", 0.001)
+        recorder.record("SELECT 2", 0.001)
+
+        with patch("core.query_recorder.logger") as mock_logger:
+            recorder.report("GET /x")
+
+        assert "budget" in mock_logger.warning.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_query_budget_dependency(self) -> None:
+        """QueryBudget applies its limit to the active recorder."""
+        with record_queries(enforce_budget=True) as recorder:
+            await QueryBudget(7)()
+        assert recorder.budget == 7
+        assert recorder.enforce_budget is True
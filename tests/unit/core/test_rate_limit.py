@@ -0,0 +1,223 @@
+"""
+Unit tests for the hybrid local/Redis rate limiter.
+
+Tests cover:
+- Local token buckets (admit up to capacity, refill, Retry-After)
+- Batched reconciliation with Redis (one script call, shared levels adopted)
+- Local-only fallback when Redis is unavailable or not configured
+- Eviction of idle buckets
+- Rate limit keys (verified user ID, else client address)
+- RateLimitMiddleware responses and exempt paths
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from core.rate_limit import HybridRateLimiter, RateLimitMiddleware, rate_limit_key
+from core.redis import RedisUnavailableError
+from core.security import TOKEN_TYPE_ACCESS, TOKEN_TYPE_REFRESH, create_token
+
+
+class Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Patch the limiter's monotonic clock."""
+    clock = Clock()
+    with patch("core.rate_limit.time.monotonic", clock):
+        yield clock
+
+
+def make_limiter(with_redis: bool = True) -> HybridRateLimiter:
+    """Create a 10/second limiter with a mocked pool and sync script."""
+    client = MagicMock()
+    client.register_script.return_value = AsyncMock()
+
+    async def execute(operation):  # type: ignore[no-untyped-def]
+        return await operation(client)
+
+    redis = MagicMock()
+    redis.execute = AsyncMock(side_effect=execute)
+    limiter = HybridRateLimiter(
+        "10/second", redis=redis if with_redis else None, sync_interval=0.1
+    )
+    limiter._script = client.register_script.return_value
+    return limiter
+
+
+def scope_with(authorization: str | None = None) -> dict:
+    """Create an HTTP scope with an optional Authorization header."""
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return {"type": "http", "headers": headers, "client": ("10.0.0.1", 1234)}
+
+
+# ============================================================================
+# Local Buckets
+# ============================================================================
+
+
+def test_bucket_admits_capacity_then_rejects(clock: Clock) -> None:
+    """Requests beyond capacity are rejected with the wait for one token."""
+    limiter = make_limiter()
+
+    assert all(limiter.hit("user:1") == 0 for _ in range(10))
+    assert limiter.hit("user:1") == pytest.approx(0.1)
+    assert limiter.hit("user:2") == 0
+
+
+def test_bucket_refills_over_time(clock: Clock) -> None:
+    """Tokens refill at capacity per period."""
+    limiter = make_limiter()
+    for _ in range(10):
+        limiter.hit("user:1")
+
+    clock.now += 0.25
+
+    assert limiter.hit("user:1") == 0
+    assert limiter.hit("user:1") == 0
+    assert limiter.hit("user:1") > 0
+
+
+# ============================================================================
+# Reconciliation
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_sync_pushes_consumed_tokens_in_one_call(clock: Clock) -> None:
+    """All keys are reconciled in one script call; shared levels are adopted."""
+    limiter = make_limiter()
+    limiter._script.return_value = ["2", "7.5"]
+    for _ in range(3):
+        limiter.hit("user:1")
+    limiter.hit("ip:10.0.0.1")
+
+    await limiter.sync()
+
+    limiter._script.assert_awaited_once()
+    kwargs = limiter._script.await_args.kwargs
+    assert kwargs["keys"] == ["ratelimit:user:1", "ratelimit:ip:10.0.0.1"]
+    assert kwargs["args"][3:] == [3.0, 1.0]
+    # Other workers consumed most of user:1's tokens
+    assert limiter.hit("user:1") == 0
+    assert limiter.hit("user:1") == 0
+    assert limiter.hit("user:1") > 0
+
+
+@pytest.mark.asyncio
+async def test_sync_failure_falls_back_to_local(clock: Clock) -> None:
+    """While Redis is unavailable, limiting is local; the outage logs once."""
+    limiter = make_limiter()
+    execute = limiter.redis.execute.side_effect
+    limiter.redis.execute.side_effect = RedisUnavailableError("breaker open")
+
+    with patch("core.rate_limit.logger") as mock_logger:
+        for _ in range(2):
+            limiter.hit("user:1")
+            await limiter.sync()
+        assert limiter.hit("user:1") == 0
+
+        limiter.redis.execute.side_effect = execute
+        limiter._script.return_value = ["10"]
+        limiter.hit("user:1")
+        await limiter.sync()
+
+    mock_logger.warning.assert_called_once()
+    mock_logger.info.assert_called_once()
+    limiter._script.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_local_only_without_redis(clock: Clock) -> None:
+    """Without a Redis pool, sync never calls Redis."""
+    limiter = make_limiter(with_redis=False)
+    limiter.hit("user:1")
+
+    await limiter.sync()
+
+    limiter._script.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_idle_buckets_evicted(clock: Clock) -> None:
+    """Buckets that refilled completely are dropped."""
+    limiter = make_limiter(with_redis=False)
+    limiter.hit("user:1")
+    await limiter.sync()
+
+    clock.now += 1
+    await limiter.sync()
+
+    assert limiter._buckets == {}
+
+
+# ============================================================================
+# Keys
+# ============================================================================
+
+
+def test_key_uses_verified_user_id() -> None:
+    """A valid access token keys on its subject."""
+    token = create_token({"sub": "user-1"}, timedelta(minutes=5), TOKEN_TYPE_ACCESS)
+
+    assert rate_limit_key(scope_with(f"Bearer {token}")) == "user:user-1"
+
+
+@pytest.mark.parametrize(
+    "authorization",
+    [
+        None,
+        "Bearer not-a-token",
+        "Basic dXNlcjpwYXNz",
+        "Bearer "
+        + create_token({"sub": "user-1"}, timedelta(minutes=5), TOKEN_TYPE_REFRESH),
+        "Bearer "
+        + create_token({"sub": "user-1"}, timedelta(minutes=-5), TOKEN_TYPE_ACCESS),
+    ],
+)
+def test_key_falls_back_to_client_address(authorization: str | None) -> None:
+    """Missing, invalid, refresh and expired tokens key on the client."""
+    assert rate_limit_key(scope_with(authorization)) == "ip:10.0.0.1"
+
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_middleware_rejects_with_retry_after() -> None:
+    """Requests over the limit get 429 with Retry-After; /health is exempt."""
+
+    async def ok(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/api/items", ok), Route("/health", ok)])
+    limiter = MagicMock()
+    limiter.hit.return_value = 1.5
+    transport = ASGITransport(app=RateLimitMiddleware(app, limiter=limiter))
+
+    async with AsyncClient(transport=transport, base_url="http://test") as http:
+        limited = await http.get("/api/items")
+        exempt = await http.get("/health")
+
+    assert limited.status_code == 429
+    assert limited.headers["Retry-After"] == "2"
+    assert limited.json()["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+    assert exempt.status_code == 200
+    limiter.hit.assert_called_once()
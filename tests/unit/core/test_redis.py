@@ -0,0 +1,145 @@
+"""
+Unit tests for the shared Redis pool.
+
+Tests cover:
+- CircuitBreaker transitions (closed, open, half-open, closed again)
+- RedisManager.execute (breaker accounting, error conversion, not started)
+- Latency probes (ping) and stats snapshots
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from core.redis import CircuitBreaker, RedisManager, RedisUnavailableError
+
+
+class Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Patch the breaker's monotonic clock."""
+    clock = Clock()
+    with patch("core.redis.time.monotonic", clock):
+        yield clock
+
+
+@pytest_asyncio.fixture
+async def manager() -> RedisManager:
+    """Create a manager started with a mocked client."""
+    client = MagicMock()
+    client.ping = AsyncMock(return_value=True)
+    client.aclose = AsyncMock()
+    manager = RedisManager()
+    manager.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+    with patch("core.redis.settings.redis_probe_interval", 3600):
+        manager.start(client=client)
+        yield manager
+    await manager.stop()
+
+
+# ============================================================================
+# Circuit Breaker
+# ============================================================================
+
+
+def test_breaker_opens_after_threshold(clock: Clock) -> None:
+    """Consecutive failures open the breaker; a success resets the count."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    with patch("core.redis.logger"):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_after_reset_timeout(clock: Clock) -> None:
+    """After reset_timeout one trial decides whether the breaker closes."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    with patch("core.redis.logger"):
+        breaker.record_failure()
+
+        clock.now += 10
+        assert breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+        clock.now += 10
+        assert breaker.allow()
+        breaker.record_success()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+# ============================================================================
+# Redis Manager
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_execute_not_started() -> None:
+    """Calls fail fast before the pool is created."""
+    with pytest.raises(RedisUnavailableError):
+        await RedisManager().execute(lambda client: client.get("key"))
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_result(manager: RedisManager) -> None:
+    """Successful operations return their result and keep the breaker closed."""
+    operation = AsyncMock(return_value="value")
+
+    assert await manager.execute(operation) == "value"
+    assert manager.healthy
+
+
+@pytest.mark.asyncio
+async def test_execute_failures_open_breaker(
+    clock: Clock, manager: RedisManager
+) -> None:
+    """Redis errors are converted; once open, the client is not called."""
+    operation = AsyncMock(side_effect=RedisConnectionError("refused"))
+
+    with patch("core.redis.logger"):
+        for _ in range(2):
+            with pytest.raises(RedisUnavailableError):
+                await manager.execute(operation)
+        with pytest.raises(RedisUnavailableError, match="breaker open"):
+            await manager.execute(operation)
+
+    assert operation.await_count == 2
+    assert not manager.healthy
+
+
+@pytest.mark.asyncio
+async def test_ping_measures_latency(manager: RedisManager) -> None:
+    """ping returns and records the round trip, or None when unavailable."""
+    assert await manager.ping() is not None
+    assert manager.stats()["breaker"] == CircuitBreaker.CLOSED
+    assert manager.stats()["latency_ms"] is not None
+
+    manager._client.ping.side_effect = OSError("unreachable")
+    assert await manager.ping() is None
+    assert manager.stats() == {
+        "breaker": CircuitBreaker.CLOSED,
+        "failures": 1,
+        "latency_ms": None,
+    }
@@ -0,0 +1,224 @@
+"""
+Unit tests for conditional GET of reference data.
+
+Tests cover:
+- If-None-Match matching (lists, weak tags, wildcard)
+- Version registry TTL caching, invalidation and read failures
+- ReferenceDataETag headers, 304 answers and token requirement
+- ETag changes with table versions and the query string
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException, Response
+from starlette.requests import Request
+
+from core.reference_data import (
+    ReferenceDataETag,
+    ReferenceDataVersions,
+    etag_matches,
+)
+from core.security import TOKEN_TYPE_ACCESS, TOKEN_TYPE_REFRESH, create_token
+
+
+def make_sessionmaker(rows: list[tuple[str, int]]) -> MagicMock:
+    """Create a sessionmaker whose sessions return rows."""
+    result = MagicMock()
+    result.all.return_value = rows
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    sessionmaker = MagicMock()
+    sessionmaker.return_value.__aenter__ = AsyncMock(return_value=session)
+    sessionmaker.return_value.__aexit__ = AsyncMock(return_value=False)
+    return sessionmaker
+
+
+def make_request(headers: dict[str, str] | None = None, query: str = "") -> Request:
+    """Create a GET request on /financial-institutions."""
+    app = MagicMock()
+    app.state.sessionmaker = make_sessionmaker([])
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/financial-institutions",
+        "query_string": query.encode(),
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in (headers or {}).items()
+        ],
+        "app": app,
+    }
+    return Request(scope)
+
+
+def access_token(token_type: str = TOKEN_TYPE_ACCESS) -> str:
+    """Create a signed token of token_type."""
+    return create_token({"sub": "user"}, timedelta(minutes=5), token_type)
+
+
+# ============================================================================
+# If-None-Match
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, False),
+        ("", False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", "abc"', True),
+        ('"other"', False),
+        ("*", True),
+    ],
+)
+def test_etag_matches(header: str | None, expected: bool) -> None:
+    """If-None-Match uses weak comparison and accepts lists and *."""
+    assert etag_matches(header, '"abc"') is expected
+
+
+# ============================================================================
+# Version Registry
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_versions_are_cached_within_ttl() -> None:
+    """Counters are read once per TTL; untracked tables default to 0."""
+    registry = ReferenceDataVersions()
+    sessionmaker = make_sessionmaker([("account_types", 3)])
+
+    first = await registry.get(sessionmaker, ("account_types", "unknown"))
+    second = await registry.get(sessionmaker, ("account_types",))
+
+    assert first == {"account_types": 3, "unknown": 0}
+    assert second == {"account_types": 3}
+    assert sessionmaker.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_reload() -> None:
+    """invalidate() makes the next lookup re-read the counters."""
+    registry = ReferenceDataVersions()
+    sessionmaker = make_sessionmaker([("account_types", 3)])
+
+    await registry.get(sessionmaker, ("account_types",))
+    registry.invalidate()
+    await registry.get(sessionmaker, ("account_types",))
+
+    assert sessionmaker.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_versions_unavailable_on_read_failure() -> None:
+    """A failed read returns None instead of raising."""
+    registry = ReferenceDataVersions()
+    sessionmaker = MagicMock(side_effect=RuntimeError("database down"))
+
+    assert await registry.get(sessionmaker, ("account_types",)) is None
+
+
+# ============================================================================
+# ReferenceDataETag
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_etag_headers_set_on_response() -> None:
+    """ETag and Cache-Control are set on the response and returned."""
+    dependency = ReferenceDataETag("financial_institutions")
+    response = Response()
+
+    with patch(
+        "core.reference_data.reference_data_versions.get",
+        AsyncMock(return_value={"financial_institutions": 1}),
+    ):
+        headers = await dependency(make_request(), response)
+
+    assert headers["ETag"].startswith('"')
+    assert headers["Cache-Control"].startswith("private, max-age=")
+    assert response.headers["ETag"] == headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_with_access_token_returns_304() -> None:
+    """A matching If-None-Match with a valid access token gets 304."""
+    dependency = ReferenceDataETag("financial_institutions")
+    versions = AsyncMock(return_value={"financial_institutions": 1})
+
+    with patch("core.reference_data.reference_data_versions.get", versions):
+        etag = (await dependency(make_request(), Response()))["ETag"]
+        request = make_request(
+            {"If-None-Match": etag, "Authorization": f"Bearer {access_token()}"}
+        )
+        with pytest.raises(HTTPException) as exc_info:
+            await dependency(request, Response())
+
+    assert exc_info.value.status_code == 304
+    assert exc_info.value.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "authorization",
+    [None, "Bearer invalid", f"Bearer {access_token(TOKEN_TYPE_REFRESH)}"],
+)
+async def test_private_etag_requires_access_token(authorization: str | None) -> None:
+    """Without a valid access token the request falls through to the route."""
+    dependency = ReferenceDataETag("financial_institutions")
+    versions = AsyncMock(return_value={"financial_institutions": 1})
+
+    with patch("core.reference_data.reference_data_versions.get", versions):
+        etag = (await dependency(make_request(), Response()))["ETag"]
+        headers = {"If-None-Match": etag}
+        if authorization:
+            headers["Authorization"] = authorization
+        assert await dependency(make_request(headers), Response())
+
+
+@pytest.mark.asyncio
+async def test_public_etag_without_tables_returns_304() -> None:
+    """Public code-only data answers 304 without a token or a database read."""
+    dependency = ReferenceDataETag(data_version="v1", public=True)
+
+    etag = (await dependency(make_request(), Response()))["ETag"]
+    with pytest.raises(HTTPException) as exc_info:
+        await dependency(make_request({"If-None-Match": etag}), Response())
+
+    assert exc_info.value.status_code == 304
+    assert exc_info.value.headers["Cache-Control"].startswith("public")
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_with_version_and_query() -> None:
+    """A table write or a different query yields a different ETag."""
+    dependency = ReferenceDataETag("financial_institutions")
+
+    async def etag(version: int, query: str = "") -> str:
+        with patch(
+            "core.reference_data.reference_data_versions.get",
+            AsyncMock(return_value={"financial_institutions": version}),
+        ):
+            return (await dependency(make_request(query=query), Response()))["ETag"]
+
+    assert await etag(1) == await etag(1)
+    assert await etag(1) != await etag(2)
+    assert await etag(1) != await etag(1, "page=2")
+
+
+@pytest.mark.asyncio
+async def test_no_headers_when_versions_unavailable() -> None:
+    """Without versions the route runs uncached."""
+    dependency = ReferenceDataETag("financial_institutions")
+    response = Response()
+
+    with patch(
+        "core.reference_data.reference_data_versions.get",
+        AsyncMock(return_value=None),
+    ):
+        assert await dependency(make_request(), response) == {}
+
+    assert "ETag" not in response.headers
@@ -0,0 +1,99 @@
+"""
+Unit tests for fast JSON responses.
+
+Tests cover:
+- Paginated bodies identical to FastAPI's response_model serialisation
+- Single validation of ORM rows (from attributes)
+- FastAPI returns the response as is (no response_model round trip)
+"""
+
+import json
+import uuid
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from httpx import ASGITransport, AsyncClient
+
+from core.responses import PydanticJSONResponse, paginated_response
+from models.enums import CardType, TransactionReviewStatus
+from schemas import (
+    PaginatedResponse,
+    PaginationMeta,
+    PaginationParams,
+    TransactionListResponse,
+)
+
+
+def make_transaction(with_card: bool = False) -> SimpleNamespace:
+    """Create an ORM-like transaction row."""
+    card = SimpleNamespace(
+        id=uuid.uuid4(),
+        name="Visa",
+        card_type=CardType.credit_card,
+        last_four_digits="4242",
+        card_network="Visa",
+    )
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        transaction_date=date(2025, 1, 15),
+        amount=Decimal("-12.50"),
+        currency="EUR",
+        original_description="Coffee",
+        user_description=None,
+        merchant="Cafe",
+        card=card if with_card else None,
+        review_status=TransactionReviewStatus.to_review,
+        is_split_parent=False,
+        is_split_child=False,
+    )
+
+
+class TestPaginatedResponse:
+    """Tests for paginated_response."""
+
+    def test_body_matches_response_model_serialisation(self) -> None:
+        """The fast path produces the same JSON as the response_model path."""
+        rows = [make_transaction(), make_transaction(with_card=True)]
+        pagination = PaginationParams(page=2, page_size=2)
+
+        response = paginated_response(rows, TransactionListResponse, 5, pagination)
+
+        expected = PaginatedResponse[TransactionListResponse](
+            data=[TransactionListResponse.model_validate(row) for row in rows],
+            meta=PaginationMeta(total=5, page=2, page_size=2),
+        )
+        assert json.loads(response.body) == jsonable_encoder(expected)
+        assert response.media_type == "application/json"
+
+    def test_empty_page(self) -> None:
+        """An empty page still carries pagination metadata."""
+        response = paginated_response(
+            [], TransactionListResponse, 0, PaginationParams()
+        )
+
+        body = json.loads(response.body)
+        assert body["data"] == []
+        assert body["meta"]["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_response_model_not_reapplied() -> None:
+    """FastAPI sends the response without validating it against response_model."""
+    app = FastAPI()
+
+    @app.get("/items", response_model=PaginatedResponse[TransactionListResponse])
+    async def list_items() -> PydanticJSONResponse:
+        # An extra key would be stripped by a response_model round trip
+        return PydanticJSONResponse({"data": [], "meta": {"total": 0}, "extra": 1})
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/items")
+
+    assert response.json()["extra"] == 1
+    assert "PaginatedResponse_TransactionListResponse_" in json.dumps(app.openapi())
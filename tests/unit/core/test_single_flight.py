@@ -0,0 +1,215 @@
+"""
+Unit tests for request coalescing.
+
+Tests cover:
+- Identical concurrent calls share one execution; others run separately
+- Exceptions fanned out to every waiting caller
+- A follower taking over when the leader is cancelled
+- No caching once a call has completed
+- Read keys (engine scoping, normalised parameter models)
+- Read-only services coalescing their reads
+- Followers still reading a coalesced account after the leader's session
+  is closed
+"""
+
+import asyncio
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from core.single_flight import SingleFlight, read_key
+from models import Account
+from schemas import (
+    FinancialInstitutionFilterParams,
+    FinancialInstitutionSortParams,
+    PaginationParams,
+)
+from services import AccountService, FinancialInstitutionService
+
+
+class Query:
+    """Slow query recording how often it ran."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> list[int]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return [self.calls]
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_execution() -> None:
+    """Concurrent calls with the same key run once and get the same result."""
+    flight = SingleFlight()
+    query = Query()
+
+    results = await asyncio.gather(*(flight.do("key", query) for _ in range(5)))
+
+    assert query.calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"executed": 1, "shared": 4, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately() -> None:
+    """Calls with different keys do not wait for each other."""
+    flight = SingleFlight()
+    query = Query()
+
+    await asyncio.gather(flight.do("a", query), flight.do("b", query))
+
+    assert query.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_exception_shared_with_followers() -> None:
+    """Every concurrent caller sees the leader's exception."""
+    flight = SingleFlight()
+
+    async def failing() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", failing), flight.do("key", failing), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert flight.stats()["executed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_from_cancelled_leader() -> None:
+    """If the leader is cancelled, a follower runs the call itself."""
+    flight = SingleFlight()
+    query = Query()
+
+    leader = asyncio.create_task(flight.do("key", query))
+    follower = asyncio.create_task(flight.do("key", query))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == [2]
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_completed_calls_not_cached() -> None:
+    """A call made after the previous one completed runs again."""
+    flight = SingleFlight()
+    query = Query()
+
+    await flight.do("key", query)
+    await flight.do("key", query)
+
+    assert query.calls == 2
+
+
+def test_read_key_scoped_by_engine_and_normalised() -> None:
+    """Equal parameter models give equal keys; engines give distinct keys."""
+    primary, replica = MagicMock(), MagicMock()
+
+    assert read_key(primary, "q", PaginationParams(page=2)) == read_key(
+        primary, "q", PaginationParams(page=2)
+    )
+    assert read_key(primary, "q", PaginationParams()) != read_key(
+        replica, "q", PaginationParams()
+    )
+    assert read_key(primary, "q", PaginationParams(page=1)) != read_key(
+        primary, "q", PaginationParams(page=2)
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_only_service_coalesces() -> None:
+    """Concurrent identical list calls on read services share one query."""
+    session = MagicMock()
+    services = [
+        FinancialInstitutionService(session, coalesce_reads=True) for _ in range(3)
+    ]
+
+    async def list_all(**kwargs: object) -> tuple[list[object], int]:
+        await asyncio.sleep(0.01)
+        return [], 0
+
+    query = AsyncMock(side_effect=list_all)
+    for service in services:
+        service.institution_repo.list_all = query
+
+    args = (
+        FinancialInstitutionFilterParams(),
+        PaginationParams(),
+        FinancialInstitutionSortParams(),
+    )
+    results = await asyncio.gather(
+        *(service.list_institutions(*args) for service in services)
+    )
+
+    assert query.await_count == 1
+    assert results == [([], 0)] * 3
+
+
+@pytest.mark.asyncio
+async def test_follower_reads_account_after_leader_session_closed() -> None:
+    """A follower serializing after the leader's request ended still reads."""
+    leader_session = Session()
+    # Every column loaded, as after a SELECT
+    columns = {column.key: None for column in inspect(Account).column_attrs}
+    account = Account(
+        **{
+            **columns,
+            "id": uuid.uuid4(),
+            "user_id": uuid.uuid4(),
+            "financial_institution_id": uuid.uuid4(),
+            "account_type_id": uuid.uuid4(),
+            "account_name": "Shared",
+            "currency": "EUR",
+            "opening_balance": Decimal("0"),
+            "current_balance": Decimal("10"),
+            "color_hex": "#000000",
+        }
+    )
+    make_transient_to_detached(account)
+    leader_session.add(account)  # Persistent in the leader's session
+
+    async def get_by_id(account_id: uuid.UUID) -> Account:
+        await asyncio.sleep(0.01)
+        return account
+
+    follower_checked = asyncio.Event()
+
+    async def get_user_permission(user_id: uuid.UUID, account_id: uuid.UUID):
+        if user_id == follower.id:
+            await follower_checked.wait()  # Leader finishes first
+        return object()
+
+    session = MagicMock()
+    leader, follower = MagicMock(id=uuid.uuid4()), MagicMock(id=uuid.uuid4())
+    services = [AccountService(session, coalesce_reads=True) for _ in range(2)]
+    for service in services:
+        service.account_repo.get_by_id = AsyncMock(side_effect=get_by_id)
+        service.permission_service.get_user_permission = get_user_permission
+
+    with patch("services.account_service.reference_catalog.ensure", AsyncMock()):
+        leader_task = asyncio.create_task(services[0].get_account(account.id, leader))
+        follower_task = asyncio.create_task(
+            services[1].get_account(account.id, follower)
+        )
+        await leader_task
+
+        # The leader's request ends: its session expires and drops the row
+        leader_session.expire_all()
+        leader_session.close()
+        follower_checked.set()
+        result = await follower_task
+
+    assert services[0].account_repo.get_by_id.await_count == 1
+    assert services[1].account_repo.get_by_id.await_count == 0
+    assert result.account_name == "Shared"
+    assert result.current_balance == Decimal("10")
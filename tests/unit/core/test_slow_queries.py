@@ -0,0 +1,120 @@
+"""
+Unit tests for slow-query capture.
+
+Tests cover:
+- Parameter type extraction (values are never stored)
+- Threshold filtering and request ID correlation
+- EXPLAIN sampling restricted to plain SELECT statements
+- Capture through engine events
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from core.logging import request_id_var
+from core.slow_queries import SlowQueryLog, parameter_types, slow_query_log
+
+
+@pytest.fixture(autouse=True)
+def log_path(tmp_path: Path) -> Iterator[Path]:
+    """Write captured slow queries under tmp_path instead of the real log."""
+    path = tmp_path / "slow_queries.jsonl"
+    with (
+        patch("core.slow_queries.settings.slow_query_log_path", str(path)),
+        patch.object(slow_query_log, "_file_handler", None),
+    ):
+        yield path
+        if slow_query_log._file_handler is not None:
+            slow_query_log._file_handler.close()
+
+
+@pytest.fixture
+def log() -> SlowQueryLog:
+    """Create an empty slow query log."""
+    return SlowQueryLog(max_entries=3)
+
+
+class TestParameterTypes:
+    """Tests for parameter_types."""
+
+    def test_positional(self) -> None:
+        """Positional parameters are described by type."""
+        assert parameter_types(("secret", 1, None)) == ["str", "int", "NoneType"]
+
+    def test_named(self) -> None:
+        """Named parameters keep their names."""
+        assert parameter_types({"email": "a@b.c"}) == {"email": "str"}
+
+    def test_executemany_uses_first_row(self) -> None:
+        """executemany parameter lists are described by their first row."""
+        assert parameter_types([(1, "a"), (2, "b")]) == ["int", "str"]
+
+
+class TestSlowQueryLog:
+    """Tests for SlowQueryLog."""
+
+    def test_ignores_fast_statements(self, log: SlowQueryLog) -> None:
+        """Statements under the threshold are not captured."""
+        with patch("core.slow_queries.settings.slow_query_threshold_ms", 500):
+            log.observe("SELECT ?", "SELECT 1", (), 0.1, MagicMock())
+        assert log.recent() == []
+
+    def test_captures_slow_statement_with_request_id(self, log: SlowQueryLog) -> None:
+        """Slow statements are captured with shape, types and request ID."""
+        token = request_id_var.set("req-1")
+        try:
+            with patch("core.slow_queries.settings.slow_query_threshold_ms", 500):
+                log.observe(
+                    "SELECT ? FROM t", "SELECT $1 FROM t", ("x",), 0.75, MagicMock()
+                )
+        finally:
+            request_id_var.reset(token)
+
+        [entry] = log.recent()
+        assert entry.request_id == "req-1"
+        assert entry.statement == "SELECT ? FROM t"
+        assert entry.parameter_types == ["str"]
+        assert entry.duration_ms == 750.0
+
+    def test_buffer_is_bounded_newest_first(self, log: SlowQueryLog) -> None:
+        """Only the most recent entries are kept, newest first."""
+        with patch("core.slow_queries.settings.slow_query_threshold_ms", 1):
+            for i in range(5):
+                log.observe(f"SELECT {i}", f"SELECT {i}", (), 1.0, MagicMock())
+        assert [entry.statement for entry in log.recent()] == [
+            "SELECT 4",
+            "SELECT 3",
+            "SELECT 2",
+        ]
+
+    def test_only_plain_selects_are_explained(self, log: SlowQueryLog) -> None:
+        """EXPLAIN ANALYZE is never sampled for writes or locking reads."""
+        engine = MagicMock()
+        log.enable_explain(engine)
+        sync_engine = engine.sync_engine
+
+        with patch("core.slow_queries.settings.slow_query_explain_sample_rate", 1.0):
+            assert log._should_explain("SELECT * FROM t", sync_engine) is True
+            assert log._should_explain("UPDATE t SET a = 1", sync_engine) is False
+            assert (
+                log._should_explain("SELECT * FROM t FOR UPDATE", sync_engine) is False
+            )
+            assert log._should_explain("SELECT 1", MagicMock()) is False
+
+
+def test_engine_events_feed_slow_query_log() -> None:
+    """Slow statements on any engine reach the process-wide log."""
+    engine = create_engine("sqlite://")
+    with (
+        patch("core.query_recorder.settings.slow_query_threshold_ms", 0),
+        patch("core.slow_queries.settings.slow_query_threshold_ms", 0),
+    ):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 42"))
+    engine.dispose()
+
+    assert slow_query_log.recent(1)[0].statement == "SELECT ?"
@@ -0,0 +1,114 @@
+"""
+Unit tests for the typeahead index.
+
+Tests cover:
+- Normalization (case, accents, punctuation)
+- Ranking by match quality, preference and length
+- Short queries matching word prefixes only
+- Trigram candidates that do not contain the query
+- Lookup latency on a large index (marked as a benchmark, run with
+  `pytest -m benchmark`)
+"""
+
+import time
+
+import pytest
+
+from core.typeahead import TypeaheadIndex, normalize
+
+BANKS = [
+    ("Deutsche Bank AG", "Deutsche Bank", "DE"),
+    ("Banco Santander S.A.", "Santander", "ES"),
+    ("Santander UK plc", "Santander UK", "GB"),
+    ("Crédit Agricole S.A.", "Crédit Agricole", "FR"),
+    ("Commerzbank AG", "Commerzbank", "DE"),
+]
+
+
+def make_index() -> TypeaheadIndex[tuple[str, str, str]]:
+    """Index the sample banks by name and short name."""
+    return TypeaheadIndex((bank, bank[:2]) for bank in BANKS)
+
+
+def names(results: list[tuple[str, str, str]]) -> list[str]:
+    """Short names of results."""
+    return [bank[1] for bank in results]
+
+
+def test_normalize() -> None:
+    """Case, accents and punctuation do not matter."""
+    assert normalize("  Crédit-Agricole S.A. ") == "credit agricole s a"
+
+
+def test_accent_insensitive_search() -> None:
+    """Queries with or without accents find the same institutions."""
+    index = make_index()
+
+    assert names(index.search("credit")) == ["Crédit Agricole"]
+    assert names(index.search("CRÉDIT")) == ["Crédit Agricole"]
+
+
+def test_ranked_by_match_quality() -> None:
+    """Whole-text and prefix matches rank before word prefixes and substrings."""
+    index = make_index()
+
+    assert names(index.search("bank")) == [
+        "Deutsche Bank",  # Word prefix
+        "Commerzbank",  # Substring
+    ]
+    assert names(index.search("santander")) == ["Santander", "Santander UK"]
+
+
+def test_preference_breaks_ties() -> None:
+    """Preferred values rank first among equally good matches."""
+    index = make_index()
+
+    results = index.search("santander u", prefer=lambda bank: bank[2] == "GB")
+    assert names(results) == ["Santander UK"]
+
+    results = index.search("sant", prefer=lambda bank: bank[2] == "GB")
+    assert names(results) == ["Santander UK", "Santander"]
+
+
+def test_short_query_matches_word_prefixes() -> None:
+    """One- and two-character queries match the start of words only."""
+    index = make_index()
+
+    assert set(names(index.search("co"))) == {"Commerzbank"}
+    assert set(names(index.search("ag"))) == {
+        "Deutsche Bank",
+        "Crédit Agricole",
+        "Commerzbank",
+    }
+    assert names(index.search("nk")) == []  # Inside a word
+
+
+def test_scattered_trigrams_not_matched() -> None:
+    """A value containing the query's trigrams apart is not a match."""
+    index = TypeaheadIndex([("x", ["abcd xbcde"])])
+
+    assert index.search("abcde") == []
+    assert index.search("bcde") == ["x"]
+
+
+def test_limit_and_empty_query() -> None:
+    """Results are capped at limit; blank queries match nothing."""
+    index = make_index()
+
+    assert len(index.search("a", limit=1)) == 1
+    assert index.search(" .,") == []
+
+
+@pytest.mark.benchmark
+def test_lookup_latency() -> None:
+    """Searches over ten thousand values stay well below 5 ms."""
+    index = TypeaheadIndex(
+        (i, [f"Institution {i} Savings Bank", f"ISB{i}"]) for i in range(10_000)
+    )
+
+    start = time.perf_counter()
+    for query in ("ins", "savings bank", "isb12", "9999", "s"):
+        index.search(query)
+    elapsed = (time.perf_counter() - start) / 5
+
+    assert elapsed < 0.005
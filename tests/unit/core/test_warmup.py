@@ -0,0 +1,178 @@
+"""
+Unit tests for startup warm-up.
+
+Tests cover:
+- Pool opening, mapper configuration and statement priming on every engine
+- Connections released when a pool checkout fails
+- Best-effort behavior when the database is unreachable
+- Readiness reporting 503 until warm-up finishes or while Redis is down
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Response
+
+from api.routes.health import readiness_check
+from core.warmup import _open_pool, warm_up
+
+
+def make_engine() -> MagicMock:
+    """Create a mock engine whose connect() is an async context manager."""
+    engine = MagicMock()
+    engine.url.host = "db"
+    engine.connect.return_value.__aenter__ = AsyncMock()
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    return engine
+
+
+def make_sessionmaker() -> MagicMock:
+    """Create a mock sessionmaker yielding an AsyncMock session."""
+    session = AsyncMock()
+    sessionmaker = MagicMock()
+    sessionmaker.return_value.__aenter__ = AsyncMock(return_value=session)
+    sessionmaker.return_value.__aexit__ = AsyncMock(return_value=False)
+    return sessionmaker
+
+
+class TestWarmUp:
+    """Tests for warm_up."""
+
+    @pytest.mark.asyncio
+    async def test_opens_pool_and_primes_statements(self) -> None:
+        """Every engine opens db_pool_size connections and is primed."""
+        primary, replica = make_engine(), make_engine()
+        sessionmaker = make_sessionmaker()
+
+        with (
+            patch("core.warmup.settings.db_pool_size", 3),
+            patch("core.warmup.configure_mappers") as configure,
+            patch(
+                "core.warmup.create_sessionmaker", return_value=sessionmaker
+            ) as create,
+            patch("core.warmup._prime_statements", new_callable=AsyncMock) as prime,
+        ):
+            await warm_up([primary, replica])
+
+        configure.assert_called_once()
+        assert primary.connect.call_count == 3
+        assert replica.connect.call_count == 3
+        assert [c.args[0] for c in create.call_args_list] == [primary, replica]
+        assert prime.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_checkout_releases_opened_connections(self) -> None:
+        """Connections opened alongside a failed checkout are all closed."""
+        opened, closed = [], []
+
+        class Connection:
+            def __init__(self, index: int) -> None:
+                self.index = index
+
+            async def __aenter__(self) -> "Connection":
+                if self.index == 0:
+                    raise OSError("connection refused")
+                if self.index == 2:
+                    await asyncio.sleep(0.01)  # Still opening when 0 fails
+                opened.append(self)
+                return self
+
+            async def __aexit__(self, *exc_info: object) -> bool:
+                closed.append(self)
+                return False
+
+        engine = make_engine()
+        engine.connect.side_effect = [Connection(i) for i in range(3)]
+
+        with pytest.raises(OSError):
+            await _open_pool(engine, 3)
+        await asyncio.sleep(0.05)
+
+        assert opened
+        assert sorted(c.index for c in closed) == sorted(c.index for c in opened)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_best_effort(self) -> None:
+        """Unreachable databases are logged, not raised."""
+        engine = make_engine()
+        engine.connect.side_effect = OSError("connection refused")
+        sessionmaker = MagicMock(side_effect=OSError("connection refused"))
+
+        with (
+            patch("core.warmup.create_sessionmaker", return_value=sessionmaker),
+            patch("core.warmup.logger") as mock_logger,
+        ):
+            await warm_up([engine])
+
+        assert mock_logger.warning.call_count == 2
+
+
+class TestReadiness:
+    """Tests for readiness during warm-up."""
+
+    @pytest.mark.asyncio
+    async def test_not_ready_during_warm_up(self) -> None:
+        """Readiness returns 503 until warm-up finishes."""
+        request = MagicMock()
+        request.app.state.ready = False
+        response = Response()
+        db = AsyncMock()
+
+        body = await readiness_check(request, response, db)
+
+        assert response.status_code == 503
+        assert body["status"] == "warming_up"
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_ready_after_warm_up(self) -> None:
+        """Readiness checks the database once warm-up is done."""
+        request = MagicMock()
+        request.app.state.ready = True
+        response = Response()
+        db = AsyncMock()
+
+        with patch("api.routes.health.redis_manager.ping", AsyncMock(return_value=1.0)):
+            body = await readiness_check(request, response, db)
+
+        assert body["status"] == "ready"
+        assert body["checks"]["redis"] == "ok"
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_degraded_without_redis(self) -> None:
+        """Readiness stays 200 but reports degraded when Redis is unreachable."""
+        request = MagicMock()
+        request.app.state.ready = True
+        response = Response()
+        db = AsyncMock()
+
+        with (
+            patch("api.routes.health.redis_manager.ping", AsyncMock(return_value=None)),
+            patch("api.routes.health.logger"),
+        ):
+            body = await readiness_check(request, response, db)
+
+        assert response.status_code == 200
+        assert body["status"] == "degraded"
+        assert body["checks"]["redis"] == "ko"
+
+    @pytest.mark.asyncio
+    async def test_not_ready_without_required_redis(self) -> None:
+        """Readiness returns 503 without Redis when REDIS_REQUIRED is set."""
+        request = MagicMock()
+        request.app.state.ready = True
+        response = Response()
+        db = AsyncMock()
+
+        with (
+            patch("api.routes.health.redis_manager.ping", AsyncMock(return_value=None)),
+            patch("api.routes.health.settings.redis_required", True),
+            patch("api.routes.health.logger"),
+        ):
+            body = await readiness_check(request, response, db)
+
+        assert response.status_code == 503
+        assert body["status"] == "degraded"
+        assert body["checks"]["redis"] == "ko"
@@ -0,0 +1,314 @@
+"""
+Unit tests for incrementally maintained account summaries.
+
+Tests cover:
+- Deltas recorded for create, update, delete, split and join
+- Month totals limited to the current month
+- Recomputing the last transaction date only when it may be stale
+- Summary upsert and rebuild statements (PostgreSQL), including month
+  totals recomputed on month rollover
+- Month totals of a previous month read as zero in responses
+"""
+
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from models import AccountSummary, Transaction, TransactionReviewStatus
+from repositories import AccountSummaryRepository
+from schemas import AccountListResponse, AccountSummaryResponse
+from services import AccountSummaryService, SummaryEntry
+
+ACCOUNT_ID = uuid.uuid4()
+THIS_MONTH = AccountSummary.current_month()
+LAST_MONTH = (THIS_MONTH - timedelta(days=1)).replace(day=1)
+TO_REVIEW = TransactionReviewStatus.to_review
+REVIEWED = TransactionReviewStatus.reviewed
+
+
+def entry(
+    amount: str,
+    day: date = THIS_MONTH,
+    status: TransactionReviewStatus = TO_REVIEW,
+    child: bool = False,
+) -> SummaryEntry:
+    """Create a summary snapshot of a transaction."""
+    return SummaryEntry(Decimal(amount), day, status, child)
+
+
+@pytest.fixture
+def mock_summary_repo():
+    """Create a mock AccountSummaryRepository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def summary_service(mock_summary_repo):
+    """Create AccountSummaryService with a mocked repository."""
+    with patch(
+        "services.account_summary_service.AccountSummaryRepository",
+        return_value=mock_summary_repo,
+    ):
+        service = AccountSummaryService(MagicMock())
+    return service
+
+
+def delta(summary_repo: AsyncMock) -> dict:
+    """Arguments of the recorded summary delta."""
+    summary_repo.apply_delta.assert_awaited_once()
+    return summary_repo.apply_delta.await_args.kwargs
+
+
+# ============================================================================
+# Recorded Deltas
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_create_adds_transaction(summary_service, mock_summary_repo) -> None:
+    """A new transaction counts, dates and adds to the month totals."""
+    transaction = Transaction(
+        account_id=ACCOUNT_ID,
+        transaction_date=THIS_MONTH,
+        amount=Decimal("-42.50"),
+        review_status=TO_REVIEW,
+    )
+
+    await summary_service.record(ACCOUNT_ID, added=[transaction])
+
+    assert delta(mock_summary_repo) == {
+        "account_id": ACCOUNT_ID,
+        "transaction_count": 1,
+        "to_review_count": 1,
+        "last_transaction_date": THIS_MONTH,
+        "month_start": THIS_MONTH,
+        "month_inflow": Decimal("0.00"),
+        "month_outflow": Decimal("42.50"),
+    }
+    mock_summary_repo.refresh_last_transaction_date.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_records_difference(summary_service, mock_summary_repo) -> None:
+    """An update removes the old values and adds the new ones."""
+    await summary_service.record(
+        ACCOUNT_ID,
+        added=[entry("100.00", status=REVIEWED)],
+        removed=[entry("-30.00")],
+    )
+
+    values = delta(mock_summary_repo)
+    assert values["transaction_count"] == 0
+    assert values["to_review_count"] == -1
+    assert values["month_inflow"] == Decimal("100.00")
+    assert values["month_outflow"] == Decimal("-30.00")
+    # The same date is still in use
+    mock_summary_repo.refresh_last_transaction_date.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_moving_date_back_refreshes_last_date(
+    summary_service, mock_summary_repo
+) -> None:
+    """Moving a transaction to an earlier date recomputes the latest date."""
+    later = THIS_MONTH + timedelta(days=5)
+
+    await summary_service.record(
+        ACCOUNT_ID, added=[entry("10.00", THIS_MONTH)], removed=[entry("10.00", later)]
+    )
+
+    mock_summary_repo.refresh_last_transaction_date.assert_awaited_once_with(
+        ACCOUNT_ID, later
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_parent_and_children(
+    summary_service, mock_summary_repo
+) -> None:
+    """Deleting a split parent removes it and its children's review state."""
+    await summary_service.record(
+        ACCOUNT_ID,
+        removed=[
+            entry("-50.00", status=REVIEWED),
+            entry("-20.00", child=True),
+            entry("-30.00", child=True),
+        ],
+    )
+
+    values = delta(mock_summary_repo)
+    assert values["transaction_count"] == -1
+    assert values["to_review_count"] == -2
+    assert values["month_outflow"] == Decimal("-50.00")
+    assert values["last_transaction_date"] is None
+    mock_summary_repo.refresh_last_transaction_date.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_split_children_only_count_for_review(
+    summary_service, mock_summary_repo
+) -> None:
+    """Split children change the to-review count only."""
+    await summary_service.record(
+        ACCOUNT_ID, added=[entry("-20.00", child=True), entry("-30.00", child=True)]
+    )
+
+    values = delta(mock_summary_repo)
+    assert values["transaction_count"] == 0
+    assert values["to_review_count"] == 2
+    assert values["month_outflow"] == Decimal("0.00")
+    assert values["last_transaction_date"] is None
+
+
+@pytest.mark.asyncio
+async def test_no_change_runs_no_query(summary_service, mock_summary_repo) -> None:
+    """Joining reviewed children changes nothing and runs no statement."""
+    await summary_service.record(
+        ACCOUNT_ID, removed=[entry("-20.00", status=REVIEWED, child=True)]
+    )
+
+    mock_summary_repo.apply_delta.assert_not_awaited()
+    mock_summary_repo.refresh_last_transaction_date.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_other_months_not_in_month_totals(
+    summary_service, mock_summary_repo
+) -> None:
+    """Transactions outside the current month do not change month totals."""
+    await summary_service.record(ACCOUNT_ID, added=[entry("75.00", LAST_MONTH)])
+
+    values = delta(mock_summary_repo)
+    assert values["transaction_count"] == 1
+    assert values["last_transaction_date"] == LAST_MONTH
+    assert values["month_inflow"] == Decimal("0.00")
+
+
+# ============================================================================
+# Statements
+# ============================================================================
+
+
+def compile_statement(statement: object) -> str:
+    """Render a statement for PostgreSQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_apply_delta_is_relative_upsert() -> None:
+    """Deltas are added to the stored row in a single upsert."""
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    await AccountSummaryRepository(session).apply_delta(
+        ACCOUNT_ID, 1, 1, THIS_MONTH, THIS_MONTH, Decimal("1"), Decimal("0")
+    )
+
+    sql = compile_statement(session.execute.await_args.args[0])
+    assert "ON CONFLICT (account_id) DO UPDATE" in sql
+    assert "account_summaries.transaction_count + excluded.transaction_count" in sql
+    assert "greatest(account_summaries.last_transaction_date" in sql
+
+
+@pytest.mark.asyncio
+async def test_apply_delta_recomputes_month_totals_on_rollover() -> None:
+    """A new month's totals come from its transactions, not from the delta."""
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    # Removing a transaction dated this month but recorded last month
+    await AccountSummaryRepository(session).apply_delta(
+        ACCOUNT_ID, -1, 0, None, THIS_MONTH, Decimal("-75.00"), Decimal("0")
+    )
+
+    sql = compile_statement(session.execute.await_args.args[0])
+    month_inflow = sql.split("month_inflow = ")[1].split("month_outflow = ")[0]
+    assert "ELSE excluded.month_inflow" not in month_inflow
+    assert "ELSE (SELECT coalesce(sum(transactions.amount)" in month_inflow
+    assert "transactions.deleted_at IS NULL" in month_inflow
+    assert "transactions.parent_transaction_id IS NULL" in month_inflow
+    assert "ELSE (SELECT coalesce(-sum(transactions.amount)" in sql
+
+
+@pytest.mark.asyncio
+async def test_rebuild_is_one_grouped_statement() -> None:
+    """The repair job recomputes all summaries with one GROUP BY."""
+    result = MagicMock()
+    result.scalar_one.return_value = 3
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+
+    written = await AccountSummaryRepository(session).rebuild_all(
+        THIS_MONTH, (THIS_MONTH + timedelta(days=32)).replace(day=1)
+    )
+
+    assert written == 3
+    session.execute.assert_awaited_once()
+    sql = compile_statement(session.execute.await_args.args[0])
+    assert "GROUP BY accounts.id" in sql
+    assert "LEFT OUTER JOIN transactions" in sql
+    assert "IS DISTINCT FROM" in sql
+
+
+# ============================================================================
+# Responses
+# ============================================================================
+
+
+def test_previous_month_totals_read_as_zero() -> None:
+    """Month totals stored for a previous month are not reported."""
+    summary = AccountSummary(
+        account_id=ACCOUNT_ID,
+        transaction_count=4,
+        to_review_count=1,
+        last_transaction_date=LAST_MONTH,
+        month_start=LAST_MONTH,
+        month_inflow=Decimal("10.00"),
+        month_outflow=Decimal("5.00"),
+    )
+
+    response = AccountSummaryResponse.model_validate(summary)
+
+    assert response.transaction_count == 4
+    assert response.month_inflow == Decimal("0.00")
+    assert response.month_outflow == Decimal("0.00")
+
+    summary.month_start = THIS_MONTH
+    assert AccountSummaryResponse.model_validate(summary).month_inflow == Decimal(
+        "10.00"
+    )
+
+
+def test_account_without_summary_reads_zeros() -> None:
+    """Accounts without a summary row list empty statistics."""
+    response = AccountListResponse.model_validate(
+        {
+            "id": ACCOUNT_ID,
+            "account_name": "Main",
+            "account_type": {
+                "id": uuid.uuid4(),
+                "key": "checking",
+                "name": "Checking",
+            },
+            "currency": "EUR",
+            "current_balance": Decimal("0.00"),
+            "color_hex": "#000000",
+            "icon_url": None,
+            "financial_institution": {
+                "id": uuid.uuid4(),
+                "name": "Bank",
+                "short_name": "BNK",
+                "country_code": "ES",
+                "institution_type": "bank",
+            },
+            "created_at": "2026-01-01T00:00:00Z",
+            "summary": None,
+        }
+    )
+
+    assert response.summary.transaction_count == 0
+    assert response.summary.last_transaction_date is None
@@ -5,13 +5,22 @@ All tests are fully mocked - no database or external dependencies.
 """
 
 import uuid
-from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from models import AuditAction, AuditLog, AuditStatus
+from models import (
+    AuditAction,
+    AuditLog,
+    AuditStatus,
+    Transaction,
+    TransactionReviewStatus,
+)
+from services import audit_service as audit_module
 from services.audit_service import AuditService
+from services.transaction_service import _audit_snapshot
 
 
 @pytest.fixture
@@ -19,6 +28,8 @@ def mock_session():
     """Create a mock AsyncSession."""
     session = AsyncMock()
     session.flush = AsyncMock()
+    session.expunge = MagicMock()
+    session.info = {}
     return session
 
 
@@ -620,3 +631,273 @@ class TestGetUserAuditLogs:
         # Verify
         assert logs == []
         assert total == 0
+
+
+class TestCompactEncoding:
+    """Test changed-fields-only diffs, user agent interning and reconstruction."""
+
+    def test_diff_values_keeps_only_changed_keys(self):
+        """Test that diff_values drops keys whose values did not change."""
+        old, new = AuditService.diff_values(
+            {"amount": "-50.00", "merchant": "Shop", "comments": None},
+            {"amount": "-60.00", "merchant": "Shop", "comments": "Lunch"},
+        )
+
+        assert old == {"amount": "-50.00", "comments": None}
+        assert new == {"amount": "-60.00", "comments": "Lunch"}
+
+    def test_diff_values_passes_through_missing_snapshots(self):
+        """Test that diff_values leaves one-sided snapshots untouched."""
+        assert AuditService.diff_values(None, {"a": 1}) == (None, {"a": 1})
+
+    def test_replay_history_rebuilds_full_snapshots(self):
+        """Test that compact rows are expanded against the accumulated state."""
+        entity_id = uuid.uuid4()
+        created = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.CREATE,
+            entity_type="transaction",
+            entity_id=entity_id,
+            new_values={"amount": "-50.00", "merchant": "Shop"},
+            is_compact=False,
+        )
+        first_update = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.UPDATE,
+            entity_type="transaction",
+            entity_id=entity_id,
+            old_values={"amount": "-50.00"},
+            new_values={"amount": "-60.00"},
+            is_compact=True,
+        )
+        second_update = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.UPDATE,
+            entity_type="transaction",
+            entity_id=entity_id,
+            old_values={"merchant": "Shop"},
+            new_values={"merchant": "Market"},
+            is_compact=True,
+        )
+
+        expanded = AuditService.replay_history([created, first_update, second_update])
+
+        assert created.id not in expanded
+        assert expanded[first_update.id] == (
+            {"amount": "-50.00", "merchant": "Shop"},
+            {"amount": "-60.00", "merchant": "Shop"},
+        )
+        assert expanded[second_update.id] == (
+            {"amount": "-60.00", "merchant": "Shop"},
+            {"amount": "-60.00", "merchant": "Market"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_log_event_compact_stores_diff_and_interned_user_agent(
+        self, audit_service, mock_audit_repo
+    ):
+        """Test that compact logging stores the diff and a user agent ID."""
+        user_agent_id = uuid.uuid4()
+        mock_audit_repo.intern_user_agent.return_value = (user_agent_id, False)
+        mock_audit_repo.add.side_effect = lambda log: log
+
+        result = await audit_service.log_event(
+            user_id=uuid.uuid4(),
+            action=AuditAction.UPDATE,
+            entity_type="account",
+            entity_id=uuid.uuid4(),
+            old_values={"account_name": "Old", "notes": None},
+            new_values={"account_name": "New", "notes": None},
+            user_agent="EmeraldMobile/2.1 (compact-test)",
+            compact=True,
+        )
+
+        assert result.is_compact is True
+        assert result.old_values == {"account_name": "Old"}
+        assert result.new_values == {"account_name": "New"}
+        assert result.user_agent_id == user_agent_id
+        assert result.user_agent_text is None
+
+    @pytest.mark.asyncio
+    async def test_expand_logs_round_trip_create_update_split(
+        self, audit_service, mock_audit_repo
+    ):
+        """Test that create, update and split rows expand to full snapshots."""
+        transaction = Transaction(
+            id=uuid.uuid4(),
+            account_id=uuid.uuid4(),
+            transaction_date=date(2025, 1, 15),
+            amount=Decimal("-50.00"),
+            currency="EUR",
+            original_description="GROCERY STORE",
+            user_description="GROCERY STORE",
+            merchant="Shop",
+            card_id=None,
+            comments=None,
+            review_status=TransactionReviewStatus.to_review,
+            value_date=date(2025, 1, 16),
+        )
+        now = datetime.now(UTC)
+
+        created_snapshot = _audit_snapshot(transaction)
+        created = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.CREATE,
+            entity_type="transaction",
+            entity_id=transaction.id,
+            new_values=created_snapshot,
+            is_compact=False,
+            created_at=now,
+        )
+
+        transaction.comments = "Weekly shopping"
+        updated_snapshot = _audit_snapshot(transaction)
+        old_diff, new_diff = AuditService.diff_values(
+            created_snapshot, updated_snapshot
+        )
+        updated = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.UPDATE,
+            entity_type="transaction",
+            entity_id=transaction.id,
+            old_values=old_diff,
+            new_values=new_diff,
+            is_compact=True,
+            created_at=now + timedelta(seconds=1),
+        )
+        split = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.SPLIT_TRANSACTION,
+            entity_type="transaction",
+            entity_id=transaction.id,
+            new_values={
+                "children": [str(uuid.uuid4())],
+                "split_details": [{"amount": "-50.00", "user_description": None}],
+            },
+            is_compact=False,
+            created_at=now + timedelta(seconds=2),
+        )
+
+        transaction.merchant = "Market"
+        final_snapshot = _audit_snapshot(transaction)
+        old_diff, new_diff = AuditService.diff_values(updated_snapshot, final_snapshot)
+        updated_after_split = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.UPDATE,
+            entity_type="transaction",
+            entity_id=transaction.id,
+            old_values=old_diff,
+            new_values=new_diff,
+            is_compact=True,
+            created_at=now + timedelta(seconds=3),
+        )
+
+        mock_audit_repo.list_entity_histories.return_value = [
+            created,
+            updated,
+            split,
+            updated_after_split,
+        ]
+
+        await audit_service.expand_logs([updated, split, updated_after_split])
+
+        assert (updated.old_values, updated.new_values) == (
+            created_snapshot,
+            updated_snapshot,
+        )
+        assert (updated_after_split.old_values, updated_after_split.new_values) == (
+            updated_snapshot,
+            final_snapshot,
+        )
+        assert "children" not in final_snapshot
+        assert split.new_values["children"]
+
+    def test_replay_history_ignores_partial_full_updates(self):
+        """Test that full UPDATE rows only refresh keys of the snapshot."""
+        entity_id = uuid.uuid4()
+        created = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.CREATE,
+            entity_type="account",
+            entity_id=entity_id,
+            new_values={"account_name": "Main", "notes": None},
+            is_compact=False,
+        )
+        repair = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.UPDATE,
+            entity_type="account",
+            entity_id=entity_id,
+            old_values={"current_balance": "10.00"},
+            new_values={"current_balance": "12.00"},
+            is_compact=False,
+        )
+        renamed = AuditLog(
+            id=uuid.uuid4(),
+            action=AuditAction.UPDATE,
+            entity_type="account",
+            entity_id=entity_id,
+            old_values={"account_name": "Main"},
+            new_values={"account_name": "Savings"},
+            is_compact=True,
+        )
+
+        expanded = AuditService.replay_history([created, repair, renamed])
+
+        assert expanded[renamed.id] == (
+            {"account_name": "Main", "notes": None},
+            {"account_name": "Savings", "notes": None},
+        )
+
+
+class TestUserAgentInterning:
+    """Test that only committed user agent IDs reach the process-wide cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty user agent cache."""
+        audit_module._interned_user_agents.clear()
+        yield
+        audit_module._interned_user_agents.clear()
+
+    @pytest.mark.asyncio
+    async def test_inserted_user_agent_cached_only_after_commit(
+        self, audit_service, mock_audit_repo, mock_session
+    ):
+        """Test that a newly inserted user agent is cached on COMMIT."""
+        user_agent_id = uuid.uuid4()
+        mock_audit_repo.intern_user_agent.return_value = (user_agent_id, False)
+
+        assert await audit_service._intern_user_agent("Agent/1.0") == user_agent_id
+        assert await audit_service._intern_user_agent("Agent/1.0") == user_agent_id
+        mock_audit_repo.intern_user_agent.assert_awaited_once()
+        assert "Agent/1.0" not in audit_module._interned_user_agents
+
+        audit_module._promote_pending_user_agents(mock_session)
+
+        assert audit_module._interned_user_agents["Agent/1.0"] == user_agent_id
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_user_agent_never_cached(
+        self, audit_service, mock_audit_repo, mock_session
+    ):
+        """Test that a rolled back insert leaves no dangling cached ID."""
+        mock_audit_repo.intern_user_agent.return_value = (uuid.uuid4(), False)
+
+        await audit_service._intern_user_agent("Agent/2.0")
+        audit_module._discard_pending_user_agents(mock_session)
+        audit_module._promote_pending_user_agents(mock_session)
+
+        assert "Agent/2.0" not in audit_module._interned_user_agents
+
+    @pytest.mark.asyncio
+    async def test_user_agent_committed_elsewhere_cached_immediately(
+        self, audit_service, mock_audit_repo
+    ):
+        """Test that a row found from a previous transaction is cached."""
+        user_agent_id = uuid.uuid4()
+        mock_audit_repo.intern_user_agent.return_value = (user_agent_id, True)
+
+        await audit_service._intern_user_agent("Agent/3.0")
+
+        assert audit_module._interned_user_agents["Agent/3.0"] == user_agent_id
@@ -0,0 +1,222 @@
+"""
+Unit tests for fleet-wide balance verification.
+
+Tests cover:
+- Mismatches fixed, reported with throughput and audited once
+- Dry runs reporting without writing
+- Accounts written during verification skipped (partial audit status)
+- Grouped comparison and UPDATE ... FROM unnest() statements (PostgreSQL),
+  with a fixed number of bind parameters
+- Ledger balances excluding split children
+"""
+
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from models import AuditAction, AuditStatus
+from repositories import AccountRepository, TransactionRepository
+from services import AccountService
+
+MISMATCHES = [
+    (uuid.uuid4(), Decimal("100.00"), Decimal("90.00")),
+    (uuid.uuid4(), Decimal("5.00"), Decimal("-5.00")),
+]
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock AsyncSession."""
+    session = MagicMock()
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def mock_account_repo():
+    """Create a mock AccountRepository finding MISMATCHES among 1000 accounts."""
+    repo = AsyncMock()
+    repo.find_balance_mismatches.return_value = (1000, MISMATCHES)
+    return repo
+
+
+@pytest.fixture
+def mock_audit_service():
+    """Create a mock AuditService."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def account_service(mock_session, mock_account_repo, mock_audit_service):
+    """Create AccountService with mocked dependencies."""
+    with (
+        patch(
+            "services.account_service.AccountRepository",
+            return_value=mock_account_repo,
+        ),
+        patch("services.account_service.AuditService", return_value=mock_audit_service),
+        patch("services.account_service.EncryptionService"),
+    ):
+        service = AccountService(mock_session)
+    return service
+
+
+def compile_statement(statement: object) -> str:
+    """Render a statement for PostgreSQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+# ============================================================================
+# Service
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_mismatches_fixed_and_audited_once(
+    account_service, mock_account_repo, mock_audit_service
+) -> None:
+    """Mismatches are fixed in one call and the run is one audit entry."""
+    mock_account_repo.fix_balances.return_value = [
+        account_id for account_id, _, _ in MISMATCHES
+    ]
+
+    result = await account_service.verify_all_balances()
+
+    mock_account_repo.fix_balances.assert_awaited_once_with(MISMATCHES)
+    assert (result.checked, result.mismatched, result.fixed) == (1000, 2, 2)
+    assert result.skipped == 0
+    assert result.accounts_per_second > 0
+    assert result.corrections[1].calculated_balance == Decimal("-5.00")
+
+    mock_audit_service.log_event.assert_awaited_once()
+    audit = mock_audit_service.log_event.await_args.kwargs
+    assert audit["action"] == AuditAction.VERIFY_ACCOUNT_BALANCES
+    assert audit["status"] == AuditStatus.SUCCESS
+    assert audit["extra_metadata"]["fixed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_dry_run_does_not_write(account_service, mock_account_repo) -> None:
+    """A dry run reports mismatches without updating balances."""
+    result = await account_service.verify_all_balances(fix=False)
+
+    mock_account_repo.fix_balances.assert_not_awaited()
+    assert result.dry_run
+    assert (result.mismatched, result.fixed, result.skipped) == (2, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_concurrently_written_accounts_skipped(
+    account_service, mock_account_repo, mock_audit_service
+) -> None:
+    """Accounts whose balance changed during verification are skipped."""
+    mock_account_repo.fix_balances.return_value = [MISMATCHES[0][0]]
+
+    result = await account_service.verify_all_balances()
+
+    assert (result.fixed, result.skipped) == (1, 1)
+    audit = mock_audit_service.log_event.await_args.kwargs
+    assert audit["status"] == AuditStatus.PARTIAL
+
+
+# ============================================================================
+# Statements
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_comparison_is_one_grouped_query() -> None:
+    """All accounts are compared in one grouped query returning one row."""
+    result = MagicMock()
+    result.one.return_value = (
+        3,
+        [MISMATCHES[0][0]],
+        [MISMATCHES[0][1]],
+        [MISMATCHES[0][2]],
+    )
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+
+    checked, mismatches = await AccountRepository(session).find_balance_mismatches()
+
+    assert (checked, mismatches) == (3, [MISMATCHES[0]])
+    session.execute.assert_awaited_once()
+    sql = compile_statement(session.execute.await_args.args[0])
+    assert "GROUP BY accounts.id" in sql
+    assert "transactions.parent_transaction_id IS NULL" in sql
+    assert "array_agg(ledger.id) FILTER" in sql
+
+
+@pytest.mark.asyncio
+async def test_no_mismatches_returns_empty_list() -> None:
+    """Aggregates over no mismatches (NULL arrays) read as an empty list."""
+    result = MagicMock()
+    result.one.return_value = (3, None, None, None)
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+
+    assert await AccountRepository(session).find_balance_mismatches() == (3, [])
+
+
+@pytest.mark.asyncio
+async def test_fix_is_one_update_from_arrays() -> None:
+    """Corrections are one UPDATE ... FROM guarded by the compared balance."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [MISMATCHES[0][0]]
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+
+    fixed = await AccountRepository(session).fix_balances(MISMATCHES)
+
+    assert fixed == [MISMATCHES[0][0]]
+    session.execute.assert_awaited_once()
+    sql = compile_statement(session.execute.await_args.args[0])
+    assert sql.startswith(
+        "UPDATE accounts SET current_balance=fixes.calculated_balance"
+    )
+    assert "FROM unnest(" in sql
+    assert "accounts.current_balance = fixes.cached_balance" in sql
+
+
+@pytest.mark.asyncio
+async def test_fix_parameter_count_independent_of_corrections() -> None:
+    """Any number of corrections binds three arrays (asyncpg caps at 32767)."""
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    corrections = [
+        (uuid.uuid4(), Decimal("1.00"), Decimal("2.00")) for _ in range(20_000)
+    ]
+
+    await AccountRepository(session).fix_balances(corrections)
+
+    statement = session.execute.await_args.args[0]
+    params = statement.compile(dialect=postgresql.asyncpg.dialect()).params
+    assert len(params) == 3
+    assert sorted(len(value) for value in params.values()) == [20_000] * 3
+
+
+@pytest.mark.asyncio
+async def test_fix_without_corrections_runs_no_query() -> None:
+    """Nothing to fix runs no statement."""
+    session = MagicMock()
+    session.execute = AsyncMock()
+
+    assert await AccountRepository(session).fix_balances([]) == []
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_single_account_balance_excludes_split_children() -> None:
+    """Per-account recalculation uses the same ledger as the fleet pass."""
+    result = MagicMock()
+    result.scalar_one.return_value = Decimal("0")
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+
+    await TransactionRepository(session).calculate_account_balance(uuid.uuid4())
+
+    sql = compile_statement(session.execute.await_args.args[0])
+    assert "transactions.parent_transaction_id IS NULL" in sql
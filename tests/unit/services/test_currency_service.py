@@ -9,6 +9,7 @@ Tests the CurrencyService and Currency model to ensure:
 
 import pytest
 
+from core.currencies import CURRENCIES
 from schemas import Currency
 from services.currency_service import CurrencyService
 
@@ -87,7 +88,7 @@ class TestCurrencyService:
         currencies = service.get_all()
 
         assert isinstance(currencies, list)
-        assert len(currencies) == 6  # Based on the 6 currencies in the service
+        assert len(currencies) == len(CURRENCIES)  # The whole ISO 4217 registry
         assert all(isinstance(c, Currency) for c in currencies)
 
     def test_get_all_returns_copy(self):
@@ -198,7 +199,7 @@ class TestCurrencyService:
         codes = service.get_supported_codes()
 
         assert isinstance(codes, list)
-        assert len(codes) == 6
+        assert len(codes) == len(CURRENCIES)
         assert "USD" in codes
         assert "EUR" in codes
         assert "GBP" in codes
@@ -0,0 +1,287 @@
+"""
+Unit tests for bulk financial institution imports.
+
+Tests cover:
+- CSV, JSON array and JSON Lines parsing (blank cells, line numbers)
+- Row validation and error reporting (nothing merged on invalid rows)
+- Batching of validated rows
+- Counts, single version bump and audit logging of a successful import
+- Conflicting codes reported as 409
+- Generated merge statements
+"""
+
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from core.exceptions import ConflictError, ValidationError
+from models import AuditAction
+from repositories.financial_institution_repository import (
+    IMPORT_COLUMNS,
+    _import_staging,
+    _merge_statement,
+)
+from schemas import ImportFormat
+from services import financial_institution_service
+from services.financial_institution_service import (
+    FinancialInstitutionService,
+    _read_rows,
+    _validate_batch,
+)
+
+CSV_FILE = (
+    "﻿name,short_name,swift_code,routing_number,country_code,institution_type\n"
+    "Deutsche Bank AG,Deutsche Bank,DEUTDEFF,,DE,bank\n"
+    "JPMorgan Chase Bank,Chase,,021000021,US,bank\n"
+)
+
+BANK_ROW = {
+    "name": "Commerzbank AG",
+    "short_name": "Commerzbank",
+    "swift_code": "COBADEFF",
+    "country_code": "DE",
+    "institution_type": "bank",
+}
+
+
+def read(content: str, file_format: ImportFormat) -> list:
+    """Parse an in-memory file."""
+    return list(_read_rows(io.BytesIO(content.encode()), file_format))
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock AsyncSession."""
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.info = {}
+    return session
+
+
+@pytest.fixture
+def staged() -> list:
+    """Records copied to the staging table."""
+    return []
+
+
+@pytest.fixture
+def mock_institution_repo(staged):
+    """Create a mock FinancialInstitutionRepository recording staged records."""
+
+    async def copy_to_staging(records):
+        staged.extend([record async for record in records])
+
+    repo = MagicMock()
+    repo.copy_to_staging = AsyncMock(side_effect=copy_to_staging)
+    repo.merge_staging = AsyncMock(return_value=(1, 0))
+    return repo
+
+
+@pytest.fixture
+def mock_audit_service():
+    """Create a mock AuditService."""
+    audit_service = MagicMock()
+    audit_service.log_event = AsyncMock()
+    return audit_service
+
+
+@pytest.fixture
+def institution_service(mock_session, mock_institution_repo, mock_audit_service):
+    """Create FinancialInstitutionService with mocked dependencies."""
+    with (
+        patch(
+            "services.financial_institution_service.FinancialInstitutionRepository",
+            return_value=mock_institution_repo,
+        ),
+        patch(
+            "services.financial_institution_service.AuditService",
+            return_value=mock_audit_service,
+        ),
+    ):
+        service = FinancialInstitutionService(mock_session)
+    return service
+
+
+# ============================================================================
+# Parsing
+# ============================================================================
+
+
+def test_read_csv() -> None:
+    """CSV rows keep their line numbers; blank cells are missing values."""
+    rows = read(CSV_FILE, ImportFormat.CSV)
+
+    assert [line for line, _ in rows] == [2, 3]
+    assert rows[0][1]["name"] == "Deutsche Bank AG"  # BOM stripped from header
+    assert rows[0][1]["routing_number"] is None
+    assert rows[1][1]["swift_code"] is None
+
+
+def test_read_json_array_and_lines() -> None:
+    """JSON arrays number records; JSON Lines number lines, skipping blanks."""
+    array = read('\n  [{"name": "A"},\n {"name": "B"}]', ImportFormat.JSON)
+    lines = read('{"name": "A"}\n\n{"name": "B"}\n', ImportFormat.JSON)
+
+    assert array == [(1, {"name": "A"}), (2, {"name": "B"})]
+    assert lines == [(1, {"name": "A"}), (3, {"name": "B"})]
+    assert read("  \n", ImportFormat.JSON) == []
+
+
+def test_read_malformed_json() -> None:
+    """Malformed JSON rejects the file with the failing line."""
+    with pytest.raises(ValidationError, match="line 2"):
+        read('{"name": "A"}\n{"name": \n', ImportFormat.JSON)
+
+    with pytest.raises(ValidationError, match="line 1"):
+        read('[{"name": "A"}', ImportFormat.JSON)
+
+
+def test_caller_file_left_open() -> None:
+    """Parsing does not close the uploaded file."""
+    stream = io.BytesIO(CSV_FILE.encode())
+
+    list(_read_rows(stream, ImportFormat.CSV))
+
+    assert not stream.closed
+
+
+# ============================================================================
+# Validation
+# ============================================================================
+
+
+def test_validate_batch() -> None:
+    """Valid rows become staging records; invalid rows are reported."""
+    rows = iter(
+        [
+            *read(CSV_FILE, ImportFormat.CSV),
+            (4, {**BANK_ROW, "swift_code": None}),
+            (5, {**BANK_ROW, "swift_code": "NOPE"}),
+            (6, ["not", "an", "object"]),
+        ]
+    )
+    errors: list = []
+
+    batch = _validate_batch(rows, errors)
+
+    assert len(batch[0]) == len(IMPORT_COLUMNS)
+    assert batch[0] == (
+        2,
+        "Deutsche Bank AG",
+        "Deutsche Bank",
+        "DEUTDEFF",
+        None,
+        "DE",
+        "bank",
+        None,
+        None,
+    )
+    assert [error["line"] for error in errors] == [4, 5, 6]
+    assert "swift_code or routing_number" in errors[0]["error"]
+    assert errors[1]["error"].startswith("swift_code:")
+    assert _validate_batch(rows, errors) == []
+
+
+def test_validate_batch_size() -> None:
+    """Rows are validated in batches of IMPORT_BATCH_SIZE."""
+    rows = iter([(line, BANK_ROW) for line in range(5)])
+
+    with patch.object(financial_institution_service, "IMPORT_BATCH_SIZE", 2):
+        sizes = [len(_validate_batch(rows, [])) for _ in range(4)]
+
+    assert sizes == [2, 2, 1, 0]
+
+
+# ============================================================================
+# Service
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_import_counts_bumps_once_and_audits(
+    institution_service, mock_session, mock_audit_service, staged
+) -> None:
+    """A valid file is staged, merged and bumped once, then audited."""
+    stream = io.BytesIO(CSV_FILE.encode())
+
+    result = await institution_service.import_institutions(stream, ImportFormat.CSV)
+
+    assert [record[0] for record in staged] == [2, 3]
+    assert result.model_dump() == {
+        "received": 2,
+        "inserted": 1,
+        "updated": 0,
+        "unchanged": 1,
+    }
+    bumps = [
+        call.args[1]["table"]
+        for call in mock_session.execute.await_args_list
+        if "table" in (call.args[1] if len(call.args) > 1 else {})
+    ]
+    assert bumps == ["financial_institutions"]
+    mock_session.commit.assert_awaited_once()
+    audit = mock_audit_service.log_event.await_args.kwargs
+    assert audit["action"] == AuditAction.IMPORT_FINANCIAL_INSTITUTIONS
+    assert audit["user_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_rows_import_nothing(
+    institution_service, mock_session, mock_institution_repo
+) -> None:
+    """Any invalid row rolls the import back before merging."""
+    content = CSV_FILE + "Bad Bank,Bad,XXXX,,DE,bank\n"
+
+    with pytest.raises(ValidationError) as exc_info:
+        await institution_service.import_institutions(
+            io.BytesIO(content.encode()), ImportFormat.CSV
+        )
+
+    assert exc_info.value.details["errors"][0]["line"] == 4
+    mock_institution_repo.merge_staging.assert_not_awaited()
+    mock_session.rollback.assert_awaited_once()
+    mock_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_conflicting_codes(
+    institution_service, mock_session, mock_institution_repo
+) -> None:
+    """Codes belonging to two institutions are reported as a conflict."""
+    mock_institution_repo.merge_staging.side_effect = IntegrityError(
+        "INSERT", {}, Exception("duplicate key")
+    )
+
+    with pytest.raises(ConflictError):
+        await institution_service.import_institutions(
+            io.BytesIO(CSV_FILE.encode()), ImportFormat.CSV
+        )
+
+    mock_session.rollback.assert_awaited_once()
+
+
+# ============================================================================
+# Merge Statements
+# ============================================================================
+
+
+@pytest.mark.parametrize("key", ["swift_code", "routing_number"])
+def test_merge_statement(key: str) -> None:
+    """Merges upsert on the partial unique index and skip unchanged rows."""
+    staged = _import_staging.c
+    sql = str(
+        _merge_statement(key, staged[key].isnot(None)).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert f"ON CONFLICT ({key}) WHERE {key} IS NOT NULL DO UPDATE" in sql
+    assert f"DISTINCT ON (financial_institutions_import.{key})" in sql
+    assert "IS DISTINCT FROM" in sql
+    assert "deleted_at = NULL" in sql
+    assert "created_at" not in sql.split("SELECT")[0]  # Server defaults